@@ -9,14 +9,20 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-def list_players(db_path: str):
-    """List all players in the database."""
+def open_backend(db_path: str):
+    """Open the SQLite storage backend for a database file."""
     from server.persistence.database import Database
+    from server.persistence.storage_backend import SQLiteStorageBackend
 
     db = Database(db_path)
     db.connect()
+    return db, SQLiteStorageBackend(db)
+
+def list_players(db_path: str):
+    """List all players in the database."""
+    db, backend = open_backend(db_path)
 
-    players = db.execute_query("SELECT id, name, email, created_at FROM players ORDER BY created_at")
+    players = backend.list_players()
 
     print(f"{'ID':<5} {'Name':<20} {'Email':<30} {'Created'}")
     print("-" * 70)
@@ -28,6 +34,46 @@ def list_players(db_path: str):
     print(f"\nTotal players: {len(players)}")
     db.disconnect()
 
+def find_item_holders(backend, item: str):
+    """Find every character carrying or wearing an item.
+
+    Streams characters from the backend, so memory use does not grow with
+    the number of players.
+
+    Args:
+        backend: A StorageBackend to scan
+        item: Item id or name (case-insensitive)
+
+    Yields:
+        (character name, number carried, number equipped)
+    """
+    item = item.lower()
+
+    def matches(entry):
+        return (isinstance(entry, dict) and
+                (str(entry.get('id', '')).lower() == item or str(entry.get('name', '')).lower() == item))
+
+    for name, character in backend.iter_characters():
+        carried = sum(entry.get('quantity', 1) or 1 for entry in character.get('inventory', []) if matches(entry))
+        equipped = sum(1 for entry in (character.get('equipped') or {}).values() if matches(entry))
+        if carried or equipped:
+            yield name, carried, equipped
+
+def find_item(db_path: str, item: str):
+    """Print every player holding an item."""
+    db, backend = open_backend(db_path)
+
+    print(f"{'Player':<20} {'Carried':<10} {'Equipped'}")
+    print("-" * 40)
+
+    total = 0
+    for name, carried, equipped in find_item_holders(backend, item):
+        print(f"{name:<20} {carried:<10} {equipped}")
+        total += 1
+
+    print(f"\nPlayers holding '{item}': {total}")
+    db.disconnect()
+
 def list_characters(db_path: str, player_name: str = None):
     """List characters, optionally filtered by player."""
     from server.persistence.database import Database
@@ -64,39 +110,18 @@ def list_characters(db_path: str, player_name: str = None):
 
 def delete_player(db_path: str, player_name: str, confirm: bool = False):
     """Delete a player and all their characters."""
-    from server.persistence.database import Database
-
     if not confirm:
         response = input(f"Are you sure you want to delete player '{player_name}' and all their characters? (y/N): ")
         if response.lower() != 'y':
             print("Operation cancelled.")
             return
 
-    db = Database(db_path)
-    db.connect()
+    db, backend = open_backend(db_path)
 
-    # Get player ID
-    player_result = db.execute_query("SELECT id FROM players WHERE name = ?", (player_name,))
-    if not player_result:
+    if backend.delete_player(player_name):
+        print(f"Deleted player '{player_name}' and all their data.")
+    else:
         print(f"Player '{player_name}' not found.")
-        db.disconnect()
-        return
-
-    player_id = player_result[0]['id']
-
-    # Delete character items
-    db.execute_update("""
-        DELETE FROM character_items
-        WHERE character_id IN (SELECT id FROM characters WHERE player_id = ?)
-    """, (player_id,))
-
-    # Delete characters
-    char_count = db.execute_update("DELETE FROM characters WHERE player_id = ?", (player_id,))
-
-    # Delete player
-    player_count = db.execute_update("DELETE FROM players WHERE id = ?", (player_id,))
-
-    print(f"Deleted player '{player_name}' and {char_count} characters.")
     db.disconnect()
 
 def backup_database(db_path: str, backup_path: str = None):
@@ -193,6 +218,10 @@ def main():
     delete_parser.add_argument('player_name', help='Name of player to delete')
     delete_parser.add_argument('--force', action='store_true', help='Skip confirmation')
 
+    # Find item holders command
+    find_parser = subparsers.add_parser('find-item', help='Find players holding an item')
+    find_parser.add_argument('item', help='Item id or name')
+
     # Backup database command
     backup_parser = subparsers.add_parser('backup', help='Backup database')
     backup_parser.add_argument('--output', help='Backup file path')
@@ -224,6 +253,9 @@ def main():
         elif args.command == 'delete-player':
             delete_player(args.db_path, args.player_name, args.force)
 
+        elif args.command == 'find-item':
+            find_item(args.db_path, args.item)
+
         elif args.command == 'backup':
             backup_database(args.db_path, args.output)
 
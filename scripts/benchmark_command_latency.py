@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Measure command round-trip latency while the game runs a deliberately heavy tick.
+
+A stand-in game answers "ping N" with "pong N" through the real connection
+manager and telnet server, while a tick burns --tick-ms of CPU every
+--tick-rate seconds. Clients run in a separate process, so their own timing
+doesn't wait on the server's event loop. Each mode is run in turn:
+
+- single: telnet server and game share one event loop (the default setup)
+- thread: the telnet server runs on its own thread (performance.network_thread)
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+HOST = '127.0.0.1'
+
+
+def run_clients(port: int, clients: int, commands: int, interval: float) -> list:
+    """Connect the clients, send pings and return the round trips in ms (runs in a child process)."""
+
+    async def client(index: int) -> list:
+        for _ in range(100):
+            try:
+                reader, writer = await asyncio.open_connection(HOST, port)
+                break
+            except OSError:
+                await asyncio.sleep(0.05)
+        else:
+            raise RuntimeError(f"Could not connect to {HOST}:{port}")
+        await asyncio.sleep(interval * index / clients)  # spread the clients out
+        round_trips = []
+        for seq in range(commands):
+            start = time.perf_counter()
+            writer.write(f"ping {index}-{seq}\r\n".encode('latin1'))
+            expected = f"pong {index}-{seq}".encode('latin1')
+            while expected not in await reader.readuntil(b'\n'):
+                pass
+            round_trips.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(interval)
+        writer.close()
+        return round_trips
+
+    async def run_all():
+        results = await asyncio.gather(*(client(i) for i in range(clients)))
+        return [ms for result in results for ms in result]
+
+    return asyncio.run(run_all())
+
+
+async def serve(mode: str, port: int, args) -> list:
+    """Run the stand-in game in one mode and return the clients' round trips."""
+    from server.core.timeslice import TimeSlicer
+    from server.networking.async_connection_manager import AsyncConnectionManager
+
+    slicer = TimeSlicer(slice_ms=args.slice_ms)
+    manager = AsyncConnectionManager()
+    manager.initialize(HOST, port, network_thread=(mode == 'thread'))
+
+    async def run_command(player_id: int, command: str, params: str):
+        slicer.command_started()
+        await manager.send_message(player_id, f"pong {params}")
+        await manager.flush(player_id)
+
+    async def handle_command(player_id: int, command: str, params: str):
+        asyncio.create_task(run_command(player_id, command, params))
+
+    async def handle_disconnect(player_id: int):
+        pass
+
+    manager.on_player_command = handle_command
+    manager.on_player_disconnect = handle_disconnect
+    manager.on_command_received = slicer.command_queued
+
+    async def heavy_ticks():
+        units = max(1, int(args.tick_ms / 0.1))
+        while True:
+            await asyncio.sleep(args.tick_rate)
+            slicer.begin()
+            if args.unsliced:
+                busy(args.tick_ms)
+            else:
+                async for _ in slicer.iterate(range(units), every=1):
+                    busy(0.1)
+
+    server_task = asyncio.create_task(manager.start_server(HOST, port))
+    tick_task = asyncio.create_task(heavy_ticks())
+    try:
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(1) as pool:
+            return await loop.run_in_executor(pool, run_clients, port, args.clients, args.commands, args.interval)
+    finally:
+        tick_task.cancel()
+        await manager.stop_server()
+        server_task.cancel()
+        await asyncio.gather(server_task, tick_task, return_exceptions=True)
+
+
+def busy(ms: float):
+    """Burn CPU for ms milliseconds."""
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    """Main function."""
+    from server.utils.logger import configure_logging
+
+    parser = argparse.ArgumentParser(description="Benchmark command round trips under a heavy tick")
+    parser.add_argument("--mode", choices=('single', 'thread', 'both'), default='both',
+                        help="Run the telnet server on the game loop, its own thread, or compare both")
+    parser.add_argument("--clients", type=int, default=20, help="Connected clients")
+    parser.add_argument("--commands", type=int, default=50, help="Pings each client sends")
+    parser.add_argument("--interval", type=float, default=0.05, help="Seconds between a client's pings")
+    parser.add_argument("--tick-rate", type=float, default=0.25, help="Seconds between ticks")
+    parser.add_argument("--tick-ms", type=float, default=150, help="CPU time each tick burns")
+    parser.add_argument("--slice-ms", type=float, default=20, help="Time slice of the tick (performance.slice_ms)")
+    parser.add_argument("--unsliced", action="store_true", help="Run each tick without yielding")
+    parser.add_argument("--port", type=int, default=4399, help="Port to listen on")
+    args = parser.parse_args()
+
+    configure_logging(level="WARNING", file=None)
+    print(f"{args.clients} clients x {args.commands} commands, tick {args.tick_ms:.0f}ms every "
+          f"{args.tick_rate * 1000:.0f}ms ({'unsliced' if args.unsliced else f'{args.slice_ms:.0f}ms slices'})")
+    modes = ('single', 'thread') if args.mode == 'both' else (args.mode,)
+    for offset, mode in enumerate(modes):
+        round_trips = asyncio.run(serve(mode, args.port + offset, args))
+        print(f"{mode:>6}: p50 {statistics.median(round_trips):7.2f}ms  p99 {percentile(round_trips, 0.99):7.2f}ms  "
+              f"max {max(round_trips):7.2f}ms  ({len(round_trips)} commands)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Compile the game content in data/ into the startup bundle."""
+
+import sys
+import os
+import argparse
+import time
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+def main():
+    """Main function."""
+    from server.persistence.content_bundle import ContentBundle
+
+    parser = argparse.ArgumentParser(description="Build the Forgotten Depths content bundle")
+    parser.add_argument("--data-dir", default="data",
+                        help="Content directory to compile")
+    parser.add_argument("--output", help="Bundle file path (default: <data-dir>/.build/content_bundle.pkl)")
+    parser.add_argument("--workers", type=int,
+                        help="Processes used to parse files (default: one per core, at most 8)")
+    parser.add_argument("--check", action="store_true",
+                        help="Only check whether the bundle is up to date (exit 1 if stale)")
+    args = parser.parse_args()
+
+    bundle = ContentBundle(args.data_dir, args.output, workers=args.workers)
+
+    if args.check:
+        if bundle.is_current():
+            print(f"Content bundle is up to date: {bundle.bundle_path}")
+            return
+        print(f"Content bundle is missing or stale: {bundle.bundle_path}")
+        sys.exit(1)
+
+    start = time.time()
+    source_hash = bundle.build()
+    size_kb = os.path.getsize(bundle.bundle_path) / 1024
+    print(f"Built {bundle.bundle_path}: {len(bundle.scan_sources())} files, {size_kb:.0f} KB, "
+          f"hash {source_hash[:12]} in {time.time() - start:.2f}s ({bundle.workers} workers)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Validate the world content in one pass (exits 1 if there are errors, for CI)."""
+
+import sys
+import os
+import argparse
+import json
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+def main():
+    """Main function."""
+    from server.persistence.content_bundle import get_content_bundle, default_parse_workers
+    from server.persistence.world_loader import WorldLoader
+    from server.game.world import world_lint
+    from server.utils.logger import configure_logging
+
+    parser = argparse.ArgumentParser(description="Lint the Forgotten Depths world content")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the full report as JSON")
+    parser.add_argument("--workers", type=int, default=default_parse_workers(),
+                        help="Processes used for the per-room checks (default: one per core, at most 8)")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail on warnings as well as errors")
+    parser.add_argument("--max-issues", type=int, default=50,
+                        help="Issues of each severity to print (text output)")
+    parser.add_argument("--no-stamp", action="store_true",
+                        help="Don't record the validation stamp the server checks at startup")
+    args = parser.parse_args()
+
+    if args.json:
+        # Server log lines go to stdout; keep it to the report
+        configure_logging(console=False)
+
+    # The bundle gives the source hash the stamp is keyed by
+    content = get_content_bundle()
+    content.load()
+    loader = WorldLoader()
+    report = world_lint.lint_content(loader, workers=args.workers)
+    if not args.no_stamp:
+        world_lint.write_stamp(world_lint.stamp_path(loader.data_dir), report)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for line in world_lint.format_issues(report['errors'], limit=args.max_issues):
+            print(f"ERROR   {line}")
+        for line in world_lint.format_issues(report['warnings'], limit=args.max_issues):
+            print(f"WARNING {line}")
+        print(f"{report['rooms']} rooms: {len(report['errors'])} errors, {len(report['warnings'])} warnings "
+              f"in {report['elapsed_ms']:.0f}ms")
+
+    if report['errors'] or (args.strict and report['warnings']):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
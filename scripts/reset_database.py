@@ -58,8 +58,8 @@ def create_test_data(db_path: str):
         test_char = Character("TestCharacter")
         test_char.room_id = "town_square"
 
-        char_id = player_storage.save_character(test_char, player_id)
-        print(f"Created test character with ID: {char_id}")
+        if player_storage.save_character_data("testuser", test_char.to_dict()):
+            print(f"Created test character {test_char.name}")
 
     except Exception as e:
         print(f"Error creating test data: {e}")
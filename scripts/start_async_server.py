@@ -25,8 +25,17 @@ def load_config(config_file: str) -> dict:
 
 def setup_logging(config: dict):
     """Setup logging based on configuration."""
-    from server.utils.logger import get_logger
-
+    from server.utils.logger import configure_logging, get_logger
+
+    log_config = config.get('logging', {}) or {}
+    configure_logging(
+        level=log_config.get('level', 'INFO'),
+        file=log_config.get('file', 'mud_server.log'),
+        max_size=log_config.get('max_size', '10MB'),
+        backup_count=log_config.get('backup_count', 5),
+        console=log_config.get('console', True),
+        levels=log_config.get('levels'),
+    )
     logger = get_logger()
     logger.info("Async logging initialized")
 
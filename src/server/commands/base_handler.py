@@ -18,6 +18,13 @@ class BaseCommandHandler:
         self.game_engine = game_engine
         self.logger = game_engine.logger
 
+    def register_commands(self, registry):
+        """Declare this module's commands in the command registry.
+
+        Args:
+            registry: CommandRegistry to add the commands to
+        """
+
     # Convenience properties for accessing game systems
     @property
     def connection_manager(self):
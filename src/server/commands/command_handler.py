@@ -10,6 +10,49 @@ from ..utils.colors import (
     info_message, success_message, announcement,
     Colors, wrap_color
 )
+from ..utils import tracing
+from ..utils.tracing import CommandTracer
+from .expander import CommandExpander
+from .registry import CommandRegistry, CommandSpec, LOGGED_IN, NOT_IN_COMBAT, ADMIN, RATE_FREE
+
+# Movement verbs and their one or two letter aliases
+DIRECTIONS = (
+    ('north', 'n'), ('south', 's'), ('east', 'e'), ('west', 'w'),
+    ('northeast', 'ne'), ('northwest', 'nw'), ('southeast', 'se'), ('southwest', 'sw'),
+    ('up', 'u'), ('down', 'd'),
+)
+
+# Help sections in display order (categories not listed here go last)
+HELP_SECTIONS = (
+    'Available Commands', 'Character Info', 'Items & Equipment', 'Traps & Locks',
+    'Vendors & Services', 'Combat Commands', 'Quests & NPCs', 'Movement', 'Party System',
+    'Class Abilities', 'System', 'Admin Commands (Debug)',
+)
+
+# Class abilities are looked up per character, so they are listed by hand
+CLASS_ABILITIES_HELP = [
+    "Rogue:",
+    "  picklock         - Pick a locked door",
+    "  backstab         - Next attack deals massive damage",
+    "  shadow_step      - Become harder to hit for a duration",
+    "  poison_blade     - Poison your weapon for multiple attacks",
+    "",
+    "Fighter:",
+    "  power_attack     - Next attack deals more damage but less accurate",
+    "  cleave           - Attack multiple enemies at once",
+    "  dual_wield       - Fight with two weapons",
+    "  shield_bash      - Bash with shield to stun enemy",
+    "  battle_cry       - Boost damage for a duration",
+    "",
+    "Ranger:",
+    "  track            - Track creatures in nearby rooms",
+    "  tame <creature>  - Tame a creature as a companion",
+    "  pathfind <dest>  - Find path to destination",
+    "  forage           - Search for food and supplies",
+    "  camouflage       - Hide from enemies",
+    "  multishot        - Fire arrows at multiple targets",
+    "  call_of_the_wild - Summon a wild companion",
+]
 
 
 class CommandHandler:
@@ -55,15 +98,42 @@ class CommandHandler:
         # Give ability_handler access to combat_handler for attack routing
         self.ability_handler.combat_handler = self.combat_handler
 
+        # Every handler module declares its verbs; dispatch goes through the registry
+        config_manager = game_engine.config_manager
+        self.registry = CommandRegistry(
+            min_abbreviation=int(config_manager.get_setting('commands', 'min_abbreviation', default=3))
+        )
+        self.rate_limits: Dict[str, float] = config_manager.get_setting('commands', 'rate_limits', default={}) or {}
+        self.open_admin_commands = config_manager.get_setting('admin', 'open_admin_commands', default=True)
+        self.admin_users = {name.lower() for name in config_manager.get_setting('admin', 'admin_users', default=[]) or []}
+        self._help_text: Dict[bool, str] = {}  # admin? -> rendered help
+        self.expander = CommandExpander(
+            separator=config_manager.get_setting('commands', 'separator', default=';'),
+            max_commands=int(config_manager.get_setting('commands', 'max_batch', default=20)),
+        )
+        self.max_aliases = int(config_manager.get_setting('commands', 'max_aliases', default=50))
+        self.tracer = CommandTracer(
+            self.logger,
+            slow_ms=float(config_manager.get_setting('commands', 'slow_command_ms', default=500)),
+            sample_rate=int(config_manager.get_setting('commands', 'trace_sample_rate', default=0) or 0),
+        )
+        self._register_core_commands()
+        for handler in (self.world_handler, self.map_handler, self.character_handler, self.inventory_handler,
+                        self.magic_handler, self.item_usage_handler, self.vendor_handler, self.combat_handler,
+                        self.quest_handler, self.party_handler, self.ability_handler, self.auth_handler,
+                        self.admin_handler):
+            handler.register_commands(self.registry)
+
     async def handle_player_command(self, player_id: int, command: str, params: str):
         """Handle a command from a player.
 
         Entry point for all player commands - routes to login, character creation, or game commands.
         """
         if not self.game_engine.player_manager.is_player_connected(player_id):
+            self.game_engine.timeslicer.command_started()  # nothing to run
             return
 
-        # Handle command asynchronously
+        # Handle command asynchronously (until it starts, long tick loops give way to it)
         asyncio.create_task(self._process_player_command(player_id, command, params))
 
     async def _process_player_command(self, player_id: int, command: str, params: str):
@@ -71,58 +141,76 @@ class CommandHandler:
 
         Routes commands based on player state (login, character creation, or in-game).
         """
-        cmd_start = time.time()
+        self.game_engine.timeslicer.command_started()
         player_data = self.game_engine.player_manager.get_player_data(player_id)
-
-        # Handle character creation (even if authenticated)
-        if player_data.get('creating_character'):
-            await self.auth_handler.handle_character_creation_input(player_id, command)
-            # Flush writes after character creation
-            connection = self.game_engine.connection_manager.telnet_server.connections.get(player_id)
-            if connection:
-                await connection.flush()
+        span = self.tracer.start('', player_id)  # named once the command is resolved
+        try:
+            # Handle character creation (even if authenticated)
+            if player_data.get('creating_character'):
+                span.verb, span.handler = 'create_character', 'auth'
+                await self._timed_game(span, self.auth_handler.handle_character_creation_input(player_id, command))
+            # Handle login process
+            elif not player_data.get('authenticated'):
+                span.verb, span.handler = 'login', 'auth'
+                await self._timed_game(span, self.auth_handler.handle_login_process(player_id, command, params))
+            # Handle game commands
+            else:
+                await self._timed_game(span, self._handle_game_line(player_id, player_data, command, params))
+                # Any game command may have changed the character
+                self.game_engine.snapshot_manager.mark_dirty(player_id)
+
+            # Flush the write buffer to send all batched messages
+            flush_start = time.perf_counter()
+            await self.game_engine.connection_manager.flush(player_id)
+            span.flush_ms = (time.perf_counter() - flush_start) * 1000
+        finally:
+            self.tracer.finish(span)
+
+    async def _timed_game(self, span, coroutine):
+        """Run a command's game logic, charging its time to the span."""
+        start = time.perf_counter()
+        try:
+            await coroutine
+        finally:
+            span.game_ms = (time.perf_counter() - start) * 1000
+
+    async def _handle_game_line(self, player_id: int, player_data: Dict[str, Any], command: str, params: str):
+        """Run one line of game input: a command, or the batch it expands to.
+
+        ';'-separated commands, speedwalks and the character's aliases run
+        strictly in order; the caller flushes the output once afterwards.
+        """
+        aliases = (player_data.get('character') or {}).get('aliases')
+        if not self.expander.needs_expansion(command, params, aliases):
+            await self._handle_game_command(player_id, command, params)
             return
 
-        # Handle login process
-        if not player_data.get('authenticated'):
-            await self.auth_handler.handle_login_process(player_id, command, params)
-            # Flush writes after login
-            connection = self.game_engine.connection_manager.telnet_server.connections.get(player_id)
-            if connection:
-                await connection.flush()
-            cmd_duration = time.time() - cmd_start
-            if cmd_duration > 0.5:
-                self.logger.warning(f"[CMD_PERF] Slow login command '{command}': {cmd_duration*1000:.0f}ms")
+        try:
+            commands = self.expander.expand(command, params, aliases,
+                                            lambda verb: self._takes_free_text(player_data, verb))
+        except ValueError as e:
+            await self.game_engine.connection_manager.send_message(player_id, error_message(str(e)))
             return
 
-        # Handle game commands
-        game_cmd_start = time.time()
-        await self._handle_game_command(player_id, command, params)
-        game_cmd_duration = time.time() - game_cmd_start
-
-        # Flush the write buffer to send all batched messages
-        flush_start = time.time()
-        connection = self.game_engine.connection_manager.telnet_server.connections.get(player_id)
-        if connection:
-            await connection.flush()
-        flush_duration = time.time() - flush_start
-
-        # Log all commands with timing breakdown
-        cmd_duration = time.time() - cmd_start
-        self.logger.info(f"[CMD_TIMING] '{command} {params}': total={cmd_duration*1000:.0f}ms (game={game_cmd_duration*1000:.0f}ms, flush={flush_duration*1000:.0f}ms)")
-
-        if cmd_duration > 0.5:
-            self.logger.warning(f"[CMD_PERF] Slow command '{command} {params}': {cmd_duration*1000:.0f}ms")
+        for index, (verb, args) in enumerate(commands):
+            # Stop if an earlier command (quit) ended the session
+            if index and not self.game_engine.player_manager.is_player_connected(player_id):
+                break
+            await self._handle_game_command(player_id, verb, args)
+        if len(commands) > 1:
+            self._trace_as('batch', 'expander')
 
     async def _handle_game_command(self, player_id: int, command: str, params: str):
-        """Handle a game command from an authenticated player."""
+        """Handle a game command from an authenticated player.
+
+        Exact verbs and aliases come first, then class abilities, then
+        abbreviations of registered verbs; anything else is speech.
+        """
         player_data = self.game_engine.player_manager.get_player_data(player_id)
         if not player_data or not player_data.get('character'):
             return
 
-        # Handle commands directly like the simple server
         original_command = f"{command} {params}".strip()
-        full_command = f"{command} {params}".strip().lower()
         character = player_data['character']
 
         # Empty command refreshes the basic UI
@@ -131,516 +219,192 @@ class CommandHandler:
             await self.game_engine._send_room_description(player_id, detailed=False)
             return
 
-        if command in ['quit', 'q']:
-            await self.game_engine.connection_manager.send_message(player_id, "Goodbye!")
-            await self.game_engine.connection_manager.disconnect_player(player_id)
+        spec, ability = self._resolve(player_data, command)
+        if ability:
+            # Execute the ability
+            self._trace_as(command, 'ability')
+            await self.ability_handler.handle_ability_command(player_id, character, ability, params)
             return
 
-        elif command in ['look', 'l']:
-            if params:
-                # Check if params is a direction first
-                await self.world_handler.handle_look_command(player_id, params)
-            else:
-                # Look around the room
-                await self.game_engine._send_room_description(player_id, detailed=True)
-
-        elif command == 'gaze' and params:
-            # Handle special room actions like "gaze mirror"
-            await self.world_handler.handle_special_action(player_id, command, params)
-
-        elif command in ['map', 'worldmap']:
-            # Show map of areas and rooms
-            await self.map_handler.handle_map_command(player_id, character, params)
-
-        elif command in ['help', '?']:
-            help_text = """
-Available Commands:
-==================
-look (l)           - Look around or examine target
-gaze <target>      - Gaze at a target for detailed examination
-help (?)           - Show this help
-exits (ex)         - Show exits
-map [area]         - Show world map or detailed area map
-
-Character Info:
-==============
-stats (st)         - Show character stats
-health (he)        - Show hit points, mana, and status
-experience (xp)    - Show level, experience, and rune
-inventory (inv,i)  - Show inventory
-spellbook (sb)     - Show learned spells
-unlearn <spell>    - Remove a spell from your spellbook (forget)
-reroll             - Reroll stats (level 1, 0 XP only)
-train              - Level up at a trainer
-
-Items & Equipment:
-=================
-get <item>         - Pick up an item
-drop <item>        - Drop an item
-eat <item>         - Eat food
-drink <item>       - Drink beverage (dr, quaff)
-read <item>        - Read a scroll to learn a spell (study)
-equip <item>       - Equip weapon or armor (eq)
-unequip <item>     - Unequip weapon or armor
-put <item>         - Put item in container (store, stow)
-ring <item>        - Manage rings (ri)
-light <item>       - Light a torch, lantern, or candle (ignite)
-extinguish <item>  - Extinguish a light source (douse, snuff)
-fill <item>        - Fill a lantern with lamp oil (refill)
-
-Traps & Locks:
-=============
-search             - Search for traps in current room (detect)
-disarm             - Disarm a detected trap (disable)
-
-Vendors & Services:
-==================
-list               - Show vendor wares (wares)
-buy <item>         - Buy from vendor (b)
-sell <item>        - Sell to vendor
-rent/rest          - Rent a room at inn (restores HP/MP, cost scales with level)
-heal               - Receive healing from healer (if available)
-
-Combat Commands:
-===============
-attack <target>    - Attack a target (att, a, kill)
-cast <spell>       - Cast a spell (c)
-shoot <target>     - Shoot with ranged weapon (fire, sh)
-retrieve           - Retrieve spent ammunition (recover, gather)
-flee               - Try to flee from combat (run)
-
-Quests & NPCs:
-=============
-quest              - Show quest log (quests, questlog)
-talk <npc>         - Talk to an NPC (speak)
-accept <quest>     - Accept a quest from NPC
-abandon <quest>    - Abandon a quest
-
-Movement:
-=========
-north (n)          - Go north
-south (s)          - Go south
-east (e)           - Go east
-west (w)           - Go west
-northeast (ne)     - Go northeast
-northwest (nw)     - Go northwest
-southeast (se)     - Go southeast
-southwest (sw)     - Go southwest
-up (u)             - Go up
-down (d)           - Go down
-buy passage        - Buy passage across the great lake (requires rune, 100 gold)
-
-Party System:
-============
-party              - Show party members and their status
-join <player>      - Request to join a player's party
-accept <player>    - Accept a player's join request
-leave              - Leave your current party
-add <player>       - Add a player to your party (leader only)
-remove <player>    - Remove a player from party (leader only)
-appoint <player>   - Transfer party leadership to another member
-disband            - Disband the party (leader only)
-follow <player>    - Follow a player's movements
-follow             - Stop following
-
-Class Abilities:
-===============
-Rogue:
-  picklock         - Pick a locked door
-  backstab         - Next attack deals massive damage
-  shadow_step      - Become harder to hit for a duration
-  poison_blade     - Poison your weapon for multiple attacks
-
-Fighter:
-  power_attack     - Next attack deals more damage but less accurate
-  cleave           - Attack multiple enemies at once
-  dual_wield       - Fight with two weapons
-  shield_bash      - Bash with shield to stun enemy
-  battle_cry       - Boost damage for a duration
-
-Ranger:
-  track            - Track creatures in nearby rooms
-  tame <creature>  - Tame a creature as a companion
-  pathfind <dest>  - Find path to destination
-  forage           - Search for food and supplies
-  camouflage       - Hide from enemies
-  multishot        - Fire arrows at multiple targets
-  call_of_the_wild - Summon a wild companion
-
-System:
-======
-quit (q)           - Quit the game
-
-Admin Commands (Debug):
-======================
-givegold <amt>     - Give yourself gold
-giveitem <id>      - Give yourself an item
-givexp <amt>       - Give yourself experience
-setstat <stat> <n> - Set a stat (str/dex/con/vit/int/wis/cha)
-setlevel <level>   - Set your level (auto-adjusts HP/mana)
-sethealth <hp>     - Set health (or 'sethealth full')
-setmana <mana>     - Set mana (or 'setmana full')
-godmode            - Toggle god mode (99 stats, level 50, 9999 HP/mana)
-condition <type>   - Apply condition: poison, hungry, thirsty, starving, dehydrated, paralyzed
-mobstatus          - Show all mobs and their flags
-teleport <room>    - Teleport to a room (or 'teleport <player> <room>')
-respawnnpc <id>    - Respawn an NPC
-completequest <id> - Mark a quest as complete
-"""
-            await self.game_engine.connection_manager.send_message(player_id, help_text)
-
-        elif command in ['exits', 'ex']:
-            exits = self.game_engine.world_manager.get_exits_from_room(character['room_id'])
-            if exits:
-                await self.game_engine.connection_manager.send_message(player_id, f"Available exits: {', '.join(exits.keys())}")
-            else:
-                await self.game_engine.connection_manager.send_message(player_id, "No exits available.")
-
-        elif command in ['stats', 'score', 'st']:
-            await self.character_handler.handle_stats_command(player_id, character)
-
-        elif command in ['health', 'he']:
-            await self.character_handler.handle_health_command(player_id, character)
-
-        elif command in ['experience', 'xp']:
-            await self.character_handler.handle_experience_command(player_id, character)
-
-        elif command == 'reroll':
-            await self.character_handler.handle_reroll_command(player_id, character)
-
-        elif command == 'train':
-            await self.character_handler.handle_train_command(player_id, character)
-
-        elif command in ['inventory', 'inv', 'i']:
-            await self.inventory_handler.handle_inventory_command(player_id, character)
-
-        elif command in ['spellbook', 'spells', 'sb']:
-            await self.magic_handler.handle_spellbook_command(player_id, character)
-
-        elif command in ['unlearn', 'forget'] and params:
-            await self.magic_handler.handle_unlearn_spell_command(player_id, character, params)
-
-        elif command in ['unlearn', 'forget']:
-            await self.game_engine.connection_manager.send_message(player_id, "Unlearn what spell? Use 'spellbook' to see your spells.")
-
-        elif command in ['cast', 'c'] and params:
-            await self.magic_handler.handle_cast_command(player_id, character, params)
-
-        elif command in ['cast', 'c']:
-            await self.game_engine.connection_manager.send_message(player_id, "Cast what spell? Use 'spellbook' to see your spells.")
-
-        elif command == 'get' and params:
-            # Pick up an item from the room
-            await self.inventory_handler.handle_get_item(player_id, params)
-
-        elif command == 'get':
-            # Get command without parameters
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to get?")
-
-        elif command == 'drop' and params:
-            # Drop an item from inventory
-            await self.inventory_handler.handle_drop_item(player_id, params)
-
-        elif command == 'drop':
-            # Drop command without parameters
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to drop?")
-
-        elif command in ['eat', 'consume'] and params:
-            # Eat food to restore hunger
-            await self.item_usage_handler.handle_eat_command(player_id, params)
-
-        elif command in ['eat', 'consume']:
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to eat?")
+        if spec is None:
+            # Treat unknown commands as speech/chat messages
+            self._trace_as('say', 'speech')
+            username = player_data.get('username', 'Someone')
+            room_id = character.get('room_id')
 
-        elif command in ['drink', 'dr', 'quaff'] and params:
-            # Drink to restore thirst
-            await self.item_usage_handler.handle_drink_command(player_id, params)
+            # Broadcast message to others in the room
+            await self.game_engine._notify_room_except_player(room_id, player_id, f"From {username}: {original_command}\n")
 
-        elif command in ['drink', 'dr', 'quaff']:
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to drink?")
-
-        elif command in ['read', 'study'] and params:
-            # Read a scroll to learn a spell
-            await self.item_usage_handler.handle_read_command(player_id, params)
-
-        elif command in ['read', 'study']:
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to read?")
-
-        elif command in ['equip', 'eq'] and params:
-            # Equip an item from inventory
-            await self.inventory_handler.handle_equip_item(player_id, params)
-
-        elif command in ['equip', 'eq']:
-            # Equip command without parameters
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to equip?")
-
-        elif command == 'unequip' and params:
-            # Unequip an item to inventory
-            await self.inventory_handler.handle_unequip_item(player_id, params)
-
-        elif command == 'unequip':
-            # Unequip command without parameters
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to unequip?")
-
-        elif command in ['light', 'ignite'] and params:
-            # Light a light source (torch, lantern, etc.)
-            await self.item_usage_handler.handle_light_command(player_id, params)
-
-        elif command in ['light', 'ignite']:
-            # Light command without parameters
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to light?")
-
-        elif command in ['extinguish', 'douse', 'snuff'] and params:
-            # Extinguish a lit light source
-            await self.item_usage_handler.handle_extinguish_command(player_id, params)
-
-        elif command in ['extinguish', 'douse', 'snuff']:
-            # Extinguish command without parameters
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to extinguish?")
-
-        elif command in ['fill', 'refill'] and params:
-            # Fill/refill a lantern with oil
-            await self.item_usage_handler.handle_fill_command(player_id, params)
-
-        elif command in ['fill', 'refill']:
-            # Fill command without parameters
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to fill?")
-
-        elif command in ['search', 'detect']:
-            # Search for traps in current room
-            await self.world_handler.handle_search_traps_command(player_id, character)
-
-        elif command in ['disarm', 'disable']:
-            # Disarm a detected trap
-            await self.world_handler.handle_disarm_trap_command(player_id, character)
-
-        elif command in ['buy', 'b'] and params and params.lower() in ['passage']:
-            # Handle buying passage across the great lake
-            await self.world_handler.handle_buy_passage(player_id, character)
-
-        elif command in ['buy', 'b', 'sell'] and params:
-            # Handle buying/selling with vendors
-            await self.vendor_handler.handle_trade_command(player_id, command, params)
-
-        elif command in ['list', 'wares']:
-            # Show vendor inventory if in vendor room
-            # Support "list" or "list <vendor_name>"
-            await self.vendor_handler.handle_list_vendor_items(player_id, params if params else None)
-
-        elif command in ['rent', 'rest', 'sleep']:
-            # Rent a room at the inn to restore HP/MP
-            await self.world_handler.handle_rent_room(player_id, character)
-
-        elif command in ['heal', 'healing'] and params:
-            # Handle healing at a temple/healer
-            await self.vendor_handler.handle_heal_command(player_id, params)
-
-        elif command in ['heal', 'healing']:
-            # Show healing options
-            await self.vendor_handler.handle_heal_command(player_id, "list")
+            # Confirm to sender
+            await self.game_engine.connection_manager.send_message(player_id, "-- Message sent --")
+            return
 
-        elif command in ['ring', 'ri'] and params:
-            # Handle ring command for special items like the gong
-            await self.world_handler.handle_ring_command(player_id, params)
+        await self._run_command(spec, player_id, player_data, params)
 
-        elif command in ['ring', 'ri'] and not params:
-            await self.game_engine.connection_manager.send_message(player_id, "What would you like to ring?")
+    def _resolve(self, player_data: Dict[str, Any], command: str) -> Tuple[Optional[CommandSpec], Optional[Dict[str, Any]]]:
+        """Find what a verb runs.
 
-        elif command in ['put', 'store', 'stow'] and params:
-            # Put item in container
-            await self.inventory_handler.handle_put_command(player_id, character, params)
+        Returns:
+            (spec, ability): the command, or the class ability, or (None, None) for speech
+        """
+        spec = self.registry.resolve(command)
+        if spec is None:
+            # Check if this is a class ability command
+            ability = self.game_engine.ability_system.get_ability_by_command(player_data['character'], command)
+            if ability:
+                return None, ability
+            spec = self.registry.resolve_abbreviation(command)
+        if spec is not None and ADMIN in spec.requires and not self.is_admin(player_data):
+            spec = None
+        return spec, None
+
+    def _takes_free_text(self, player_data: Dict[str, Any], verb: str) -> bool:
+        """Check if a verb takes the rest of the line whole: speech, or a free_text command."""
+        spec, ability = self._resolve(player_data, verb)
+        return ability is None and (spec is None or spec.free_text)
+
+    async def _run_command(self, spec: CommandSpec, player_id: int, player_data: Dict[str, Any], params: str):
+        """Check a command's state, arity and rate requirements, then run and time it."""
+        send = self.game_engine.connection_manager.send_message
+        self._trace_as(spec.name, getattr(spec.handler, '__qualname__', spec.name))
+
+        if NOT_IN_COMBAT in spec.requires and self.game_engine.combat_system.is_player_fatigued(player_id):
+            remaining = self.game_engine.combat_system.get_player_fatigue_remaining(player_id)
+            await send(player_id, f"You are too exhausted from combat to do that! Wait {remaining:.1f} more seconds.")
+            return
 
-        elif command in ['put', 'store', 'stow']:
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: put <item> in <container>")
+        if spec.min_args and len(params.split()) < spec.min_args:
+            await send(player_id, spec.usage or f"Usage: {spec.syntax}")
+            return
 
-        # Combat commands
-        elif command in ['attack', 'att', 'a', 'kill']:
-            if not params:
-                await self.game_engine.connection_manager.send_message(player_id, "Attack what?")
+        interval = self.rate_limits.get(spec.rate_class, 0)
+        if interval:
+            now = time.time()
+            last_used = player_data.setdefault('command_last_used', {})  # rate class -> time
+            wait = last_used.get(spec.rate_class, 0) + interval - now
+            if wait > 0:
+                await send(player_id, f"Slow down! Wait {wait:.1f} more seconds.")
+                return
+            last_used[spec.rate_class] = now
+
+        start = time.perf_counter()
+        try:
+            result = await spec.handler(player_id, player_data['character'], params)
+            if spec.render and result is not None:
+                output = await self.game_engine.offloader.run(spec.render, result)
+                if output:
+                    await send(player_id, output)
+        finally:
+            self.registry.record(spec, time.perf_counter() - start)
+
+    def _trace_as(self, verb: str, handler: str):
+        """Name the current command's span after what it resolved to."""
+        span = tracing.current_span()
+        if span is not None:
+            span.verb, span.handler = verb, handler
+
+    def is_admin(self, player_data: Dict[str, Any]) -> bool:
+        """Check if a player may use admin commands.
+
+        Admin commands are open to everyone while admin.open_admin_commands is
+        set (the default, for debugging); otherwise only to admin.admin_users.
+        """
+        if self.open_admin_commands:
+            return True
+        return (player_data.get('username') or '').lower() in self.admin_users
+
+    async def _help(self, player_id: int, character: Dict[str, Any], params: str):
+        """Show the command list, or the details of one command."""
+        player_data = self.game_engine.player_manager.get_player_data(player_id) or {}
+        admin = self.is_admin(player_data)
+        send = self.game_engine.connection_manager.send_message
+
+        if params:
+            verb = params.split()[0].lower()
+            spec = self.registry.resolve(verb) or self.registry.resolve_abbreviation(verb)
+            if spec is None or (ADMIN in spec.requires and not admin):
+                await send(player_id, f"No help for '{verb}'.")
             else:
-                await self.combat_handler.handle_attack_command(player_id, params)
+                await send(player_id, self.registry.describe(spec))
+            return
 
-        elif command in ['shoot', 'fire', 'sh']:
-            if not params:
-                await self.game_engine.connection_manager.send_message(player_id, "Shoot what?")
+        if admin not in self._help_text:
+            self._help_text[admin] = self._build_help({LOGGED_IN, ADMIN} if admin else {LOGGED_IN})
+        await send(player_id, self._help_text[admin])
+
+    def _build_help(self, states) -> str:
+        """Render the help text from the registry (plus the class ability list)."""
+        sections = dict(self.registry.help_sections(states))
+        sections['Class Abilities'] = CLASS_ABILITIES_HELP
+        order = [title for title in HELP_SECTIONS if title in sections]
+        order += [title for title in sections if title not in HELP_SECTIONS]
+
+        parts = []
+        for title in order:
+            heading = f"{title}:"
+            parts.append("\n".join([heading, "=" * len(heading)] + sections[title]))
+        return "\n" + "\n\n".join(parts) + "\n"
+
+    def _register_core_commands(self):
+        """Declare the commands handled here rather than in a handler module."""
+        self.registry.add('help', self._help,
+                          aliases=('?',), rate_class=RATE_FREE,
+                          syntax="help [command]", help="Show this help", category='Available Commands')
+        self.registry.add('alias', self._alias, rate_class=RATE_FREE, free_text=True,
+                          syntax="alias [name text]", category='System',
+                          help="List, show or define aliases ($* = arguments, ; separates commands)")
+        self.registry.add('unalias', self._unalias, min_args=1, usage="Usage: unalias <name>",
+                          rate_class=RATE_FREE, syntax="unalias <name>", help="Remove an alias", category='System')
+        self.registry.add('quit', self._quit,
+                          aliases=('q',), help="Quit the game", category='System')
+        for direction, short in DIRECTIONS:
+            self.registry.add(direction, self._mover(direction),
+                              aliases=(short,), help=f"Go {direction}", category='Movement')
+
+    async def _alias(self, player_id: int, character: Dict[str, Any], params: str):
+        """List aliases, show one, or define one ('alias k kill $*')."""
+        send = self.game_engine.connection_manager.send_message
+        aliases = character.get('aliases') or {}
+        name, _, text = params.strip().partition(' ')
+        name, text = name.lower(), text.strip()
+
+        if not name:
+            if not aliases:
+                await send(player_id, "You have no aliases. Usage: alias <name> <commands>")
             else:
-                await self.combat_handler.handle_shoot_command(player_id, params)
-
-        elif command in ['retrieve', 'recover', 'gather']:
-            # Retrieve spent ammunition (arrows, bolts, etc.)
-            await self.combat_handler.handle_retrieve_ammo(player_id)
-
-        elif command in ['flee', 'run']:
-            await self.combat_handler.handle_flee_command(player_id)
-
-        elif command in ['north', 'n', 'south', 's', 'east', 'e', 'west', 'w',
-                        'northeast', 'ne', 'northwest', 'nw', 'southeast', 'se',
-                        'southwest', 'sw', 'up', 'u', 'down', 'd']:
-            await self.game_engine._move_player(player_id, command)
-
-        # Quest commands
-        elif command in ['quest', 'quests', 'questlog']:
-            await self.quest_handler.handle_quest_log(player_id, character)
-
-        elif command in ['talk', 'speak'] and params:
-            await self.quest_handler.handle_talk_to_npc(player_id, character, params)
-
-        elif command in ['talk', 'speak']:
-            await self.game_engine.connection_manager.send_message(player_id, "Who would you like to talk to?")
-
-        elif command == 'accept' and params:
-            # Check if this is a party join request first
-            if 'party_join_requests' in character and character['party_join_requests']:
-                # Try to accept as party request
-                await self.party_handler.handle_accept_command(player_id, character, params)
+                await send(player_id, "Your aliases:\n" + "\n".join(
+                    f"  {alias:<10} {expansion}" for alias, expansion in sorted(aliases.items())))
+            return
+        if not text:
+            if name in aliases:
+                await send(player_id, f"  {name:<10} {aliases[name]}")
             else:
-                # Fall back to quest acceptance
-                await self.quest_handler.handle_accept_quest(player_id, character, params)
-
-        elif command == 'accept':
-            await self.game_engine.connection_manager.send_message(player_id, "What quest or party join request would you like to accept?")
-
-        elif command in ['abandon', 'drop'] and params:
-            await self.quest_handler.handle_abandon_quest(player_id, character, params)
-
-        elif command in ['abandon', 'drop']:
-            await self.game_engine.connection_manager.send_message(player_id, "What quest would you like to abandon? Usage: abandon <quest_id>")
-
-        # Party commands
-        elif command == 'party':
-            await self.party_handler.handle_party_command(player_id, character)
-
-        elif command == 'join' and params:
-            await self.party_handler.handle_join_command(player_id, character, params)
-
-        elif command == 'join':
-            await self.game_engine.connection_manager.send_message(player_id, "Who do you want to join? Usage: join <player_name>")
-
-        elif command == 'leave':
-            await self.party_handler.handle_leave_command(player_id, character)
-
-        elif command == 'add' and params:
-            await self.party_handler.handle_add_command(player_id, character, params)
-
-        elif command == 'add':
-            await self.game_engine.connection_manager.send_message(player_id, "Who do you want to add to your party? Usage: add <player_name>")
-
-        elif command == 'remove' and params:
-            await self.party_handler.handle_remove_command(player_id, character, params)
-
-        elif command == 'remove':
-            await self.game_engine.connection_manager.send_message(player_id, "Who do you want to remove from your party? Usage: remove <player_name>")
-
-        elif command == 'appoint' and params:
-            await self.party_handler.handle_appoint_command(player_id, character, params)
-
-        elif command == 'appoint':
-            await self.game_engine.connection_manager.send_message(player_id, "Who do you want to appoint as party leader? Usage: appoint <player_name>")
-
-        elif command == 'disband':
-            await self.party_handler.handle_disband_command(player_id, character)
-
-        elif command == 'follow' and params:
-            await self.party_handler.handle_follow_command(player_id, character, params)
-
-        elif command == 'follow':
-            await self.party_handler.handle_follow_command(player_id, character, None)
-
-        # Admin commands
-        elif command == 'givegold' and params:
-            await self.admin_handler.handle_admin_give_gold(player_id, character, params)
-
-        elif command == 'givegold':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: givegold <amount>")
-
-        elif command == 'giveitem' and params:
-            await self.admin_handler.handle_admin_give_item(player_id, character, params)
-
-        elif command == 'giveitem':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: giveitem <item_id>")
-
-        elif command == 'givexp' and params:
-            await self.admin_handler.handle_admin_give_xp(player_id, character, params)
-
-        elif command == 'givexp':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: givexp <amount>")
-
-        elif command == 'respawnnpc' and params:
-            await self.admin_handler.handle_admin_respawn_npc(player_id, character, params)
-
-        elif command == 'respawnnpc':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: respawnnpc <npc_id>")
-
-        elif command == 'mobstatus':
-            await self.admin_handler.handle_admin_mob_status(player_id)
-
-        elif command == 'teleport' and params:
-            await self.admin_handler.handle_admin_teleport(player_id, character, params)
-
-        elif command == 'teleport':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: teleport <room_id> OR teleport <player_name> <room_id>")
-
-        elif command == 'setstat' and params:
-            await self.admin_handler.handle_admin_set_stat(player_id, character, params)
-
-        elif command == 'setstat':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: setstat <stat_name> <value>\nStats: strength, dexterity, constitution, vitality, intellect, wisdom, charisma")
-
-        elif command == 'setlevel' and params:
-            await self.admin_handler.handle_admin_set_level(player_id, character, params)
-
-        elif command == 'setlevel':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: setlevel <level>")
-
-        elif command == 'setmana' and params:
-            await self.admin_handler.handle_admin_set_mana(player_id, character, params)
-
-        elif command == 'setmana':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: setmana <current> [max] OR setmana full")
-
-        elif command == 'sethealth' and params:
-            await self.admin_handler.handle_admin_set_health(player_id, character, params)
-
-        elif command == 'sethealth':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: sethealth <current> [max] OR sethealth full")
-
-        elif command in ['godmode', 'god']:
-            await self.admin_handler.handle_admin_god_mode(player_id, character)
-
-        elif command == 'condition' and params:
-            await self.admin_handler.handle_admin_condition_command(player_id, character, params)
-
-        elif command == 'condition':
-            await self.game_engine.connection_manager.send_message(player_id, "Usage: condition <type>\nTypes: poison, hungry, thirsty, starving, dehydrated, paralyzed")
+                await send(player_id, f"You have no alias '{name}'.")
+            return
 
+        if name in ('alias', 'unalias') or self.expander.separator in name:
+            await send(player_id, error_message(f"You can't use '{name}' as an alias."))
+            return
+        if name not in aliases and len(aliases) >= self.max_aliases:
+            await send(player_id, error_message(f"You can't have more than {self.max_aliases} aliases."))
+            return
+        character.setdefault('aliases', {})[name] = text
+        await send(player_id, f"Alias '{name}' set to: {text}")
+
+    async def _unalias(self, player_id: int, character: Dict[str, Any], params: str):
+        """Remove an alias."""
+        name = params.split()[0].lower()
+        if (character.get('aliases') or {}).pop(name, None) is None:
+            await self.game_engine.connection_manager.send_message(player_id, f"You have no alias '{name}'.")
         else:
-            # Check if this is a class ability command
-            ability = self.game_engine.ability_system.get_ability_by_command(character, command)
-            if ability:
-                # Execute the ability
-                await self.ability_handler.handle_ability_command(player_id, character, ability, params)
-            else:
-                # Treat unknown commands as speech/chat messages
-                username = player_data.get('username', 'Someone')
-                room_id = character.get('room_id')
-
-                # Broadcast message to others in the room
-                await self.game_engine._notify_room_except_player(room_id, player_id, f"From {username}: {original_command}\n")
-
-                # Confirm to sender
-                await self.game_engine.connection_manager.send_message(player_id, "-- Message sent --")
-
-
-
-
-
-
-
-
-
-
-
-
-
+            await self.game_engine.connection_manager.send_message(player_id, f"Alias '{name}' removed.")
 
+    async def _quit(self, player_id: int, character: Dict[str, Any], params: str):
+        self.game_engine.player_manager.mark_player_quitting(player_id)
+        await self.game_engine.connection_manager.send_message(player_id, "Goodbye!")
+        await self.game_engine.connection_manager.disconnect_player(player_id)
 
+    def _mover(self, direction: str):
+        async def move(player_id: int, character: Dict[str, Any], params: str):
+            await self.game_engine._move_player(player_id, direction)
+        return move
@@ -0,0 +1,134 @@
+"""Expansion of one input line into the commands it stands for.
+
+A line may hold several commands separated by ';' ("get all;n;n;e"), a
+speedwalk ("3n2e" is north, north, north, east, east) and the character's
+own aliases ("alias k kill $*", then "k rat"). The expanded commands run in
+order as one batch, and the player's output is flushed once at the end.
+
+Aliases are expanded once: an alias's text may use ';' and speedwalks but
+not other aliases, so aliases can't loop.
+
+Some commands take free text, where ';' is just punctuation: speech, and
+'alias' itself, which stores its text as typed so it is expanded only when
+the alias is used. From a segment whose verb takes free text, the rest of
+the line is one command.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Speedwalk steps: an optional count and a direction alias
+SPEEDWALK_STEP = re.compile(r'(\d{0,3})(ne|nw|se|sw|n|s|e|w|u|d)')
+SPEEDWALK_DIRECTIONS = {
+    'n': 'north', 's': 'south', 'e': 'east', 'w': 'west',
+    'ne': 'northeast', 'nw': 'northwest', 'se': 'southeast', 'sw': 'southwest',
+    'u': 'up', 'd': 'down',
+}
+
+
+def parse_speedwalk(token: str, max_steps: Optional[int] = None) -> Optional[List[str]]:
+    """Expand a speedwalk token into directions.
+
+    Only tokens with a count are speedwalks, so words that happen to be
+    spelled with direction letters ("news", "dune") are left alone.
+
+    Args:
+        token: A single word, e.g. "3n2e" or "2nu"
+        max_steps: Most directions allowed
+
+    Returns:
+        The directions in order, or None if the token isn't a speedwalk
+
+    Raises:
+        ValueError: If the speedwalk is longer than max_steps
+    """
+    token = token.lower()
+    if not any(char.isdigit() for char in token):
+        return None
+    steps = []
+    position = 0
+    while position < len(token):
+        match = SPEEDWALK_STEP.match(token, position)
+        if not match:
+            return None
+        steps.append((int(match.group(1)) if match.group(1) else 1, SPEEDWALK_DIRECTIONS[match.group(2)]))
+        position = match.end()
+    if max_steps is not None and sum(count for count, _ in steps) > max_steps:
+        raise ValueError(f"That's more than {max_steps} steps at once.")
+    return [direction for count, direction in steps for _ in range(count)] or None
+
+
+class CommandExpander:
+    """Turns an input line into (command, params) pairs."""
+
+    def __init__(self, separator: str = ';', max_commands: int = 20):
+        """Initialize the expander.
+
+        Args:
+            separator: Character that separates commands on one line
+            max_commands: Most commands one line may expand to
+        """
+        self.separator = separator
+        self.max_commands = max_commands
+
+    def needs_expansion(self, command: str, params: str, aliases: Optional[Dict[str, str]]) -> bool:
+        """Quick check for the common case of a plain command."""
+        return (self.separator in command or self.separator in params
+                or bool(aliases and command in aliases)
+                or (not params and any(char.isdigit() for char in command)))
+
+    def expand(self, command: str, params: str, aliases: Optional[Dict[str, str]] = None,
+               free_text: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, str]]:
+        """Expand a line (already split into command and params by the server).
+
+        Args:
+            command: First word of the line, lowercased
+            params: Rest of the line
+            aliases: The character's aliases (name -> text, '$*' marks where arguments go)
+            free_text: Tells whether a verb takes free text (see the module docstring)
+
+        Returns:
+            (command, params) pairs in the order they should run
+
+        Raises:
+            ValueError: If the line expands to more than max_commands commands
+        """
+        commands: List[Tuple[str, str]] = []
+        for segment in self._segments(f"{command} {params}".strip(), aliases, free_text):
+            verb, _, args = segment.strip().partition(' ')
+            verb, args = verb.lower(), args.strip()
+            if aliases and verb in aliases:
+                text = aliases[verb]
+                text = text.replace('$*', args) if '$*' in text else f"{text} {args}"
+                pieces = self._segments(text, None, free_text)
+            else:
+                pieces = [segment]
+            for piece in pieces:
+                self._add(commands, piece)
+        return commands
+
+    def _segments(self, text: str, aliases: Optional[Dict[str, str]],
+                  free_text: Optional[Callable[[str], bool]]) -> List[str]:
+        segments = text.split(self.separator)
+        if free_text is None:
+            return segments
+        for index, segment in enumerate(segments):
+            verb = segment.strip().partition(' ')[0].lower()
+            if not verb or (aliases and verb in aliases) or parse_speedwalk(verb) is not None:
+                continue
+            if free_text(verb):
+                return segments[:index] + [self.separator.join(segments[index:])]
+        return segments
+
+    def _add(self, commands: List[Tuple[str, str]], piece: str):
+        verb, _, args = piece.strip().partition(' ')
+        if not verb:
+            return
+        directions = None if args else parse_speedwalk(verb, self.max_commands)
+        if directions:
+            expanded = [(direction, '') for direction in directions]
+        else:
+            expanded = [(verb.lower(), args.strip())]
+        if len(commands) + len(expanded) > self.max_commands:
+            raise ValueError(f"That's more than {self.max_commands} commands at once.")
+        commands.extend(expanded)
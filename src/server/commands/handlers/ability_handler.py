@@ -420,7 +420,7 @@ class AbilityCommandHandler(BaseCommandHandler):
 
         # Search for room by name or partial name
         for room in self.game_engine.world_manager.rooms.values():
-            room_name = room.name.lower()
+            room_name = room.title.lower()
             if target_location in room_name or room_name in target_location:
                 target_room = room
                 break
@@ -434,7 +434,7 @@ class AbilityCommandHandler(BaseCommandHandler):
 
         # Use world graph to find path
         try:
-            path = self.game_engine.world_manager.world_graph.find_path(room_id, target_room.room_id)
+            path = self.game_engine.world_manager.find_path(room_id, target_room.room_id, character)
             if path:
                 # Convert room IDs to directions
                 directions = []
@@ -443,7 +443,7 @@ class AbilityCommandHandler(BaseCommandHandler):
                     current_room = self.game_engine.world_manager.get_room(current_id)
                     # Find which exit leads to next_id
                     for exit_name, exit_data in current_room.exits.items():
-                        if exit_data.get('target') == next_id:
+                        if exit_data.destination_room_id == next_id:
                             directions.append(exit_name)
                             break
                     current_id = next_id
@@ -452,7 +452,7 @@ class AbilityCommandHandler(BaseCommandHandler):
                     path_str = " -> ".join(directions)
                     await self.game_engine.connection_manager.send_message(
                         player_id,
-                        success_message(f"Path to {target_room.name}: {path_str}")
+                        success_message(f"Path to {target_room.title}: {path_str}")
                     )
                 else:
                     await self.game_engine.connection_manager.send_message(
@@ -2,12 +2,55 @@
 
 import uuid
 from ...utils.colors import error_message
+from ...utils.logger import get_log_levels, set_log_level
 from ..base_handler import BaseCommandHandler
+from ..registry import ADMIN, RATE_FREE, RATE_HEAVY
 
 
 class AdminCommandHandler(BaseCommandHandler):
     """Handles admin/debug commands."""
 
+    def register_commands(self, registry):
+        """Declare the admin commands (all need the ADMIN state)."""
+        def add(name, handler, help, syntax=None, usage=None, **metadata):
+            registry.add(name, handler, requires=(ADMIN,), min_args=1 if usage else 0, usage=usage,
+                         syntax=syntax, help=help, category='Admin Commands (Debug)', **metadata)
+
+        add('givegold', self.handle_admin_give_gold, "Give yourself gold",
+            syntax="givegold <amt>", usage="Usage: givegold <amount>")
+        add('giveitem', self.handle_admin_give_item, "Give yourself an item",
+            syntax="giveitem <id>", usage="Usage: giveitem <item_id>")
+        add('givexp', self.handle_admin_give_xp, "Give yourself experience",
+            syntax="givexp <amt>", usage="Usage: givexp <amount>")
+        add('setstat', self.handle_admin_set_stat, "Set a stat (str/dex/con/vit/int/wis/cha)",
+            syntax="setstat <stat> <n>",
+            usage="Usage: setstat <stat_name> <value>\nStats: strength, dexterity, constitution, vitality, intellect, wisdom, charisma")
+        add('setlevel', self.handle_admin_set_level, "Set your level (auto-adjusts HP/mana)",
+            syntax="setlevel <level>", usage="Usage: setlevel <level>")
+        add('sethealth', self.handle_admin_set_health, "Set health (or 'sethealth full')",
+            syntax="sethealth <hp>", usage="Usage: sethealth <current> [max] OR sethealth full")
+        add('setmana', self.handle_admin_set_mana, "Set mana (or 'setmana full')",
+            syntax="setmana <mana>", usage="Usage: setmana <current> [max] OR setmana full")
+        add('godmode', lambda player_id, character, params: self.handle_admin_god_mode(player_id, character),
+            "Toggle god mode (99 stats, level 50, 9999 HP/mana)", aliases=('god',))
+        add('condition', self.handle_admin_condition_command,
+            "Apply condition: poison, hungry, thirsty, starving, dehydrated, paralyzed", syntax="condition <type>",
+            usage="Usage: condition <type>\nTypes: poison, hungry, thirsty, starving, dehydrated, paralyzed")
+        add('mobstatus', lambda player_id, character, params: self.handle_admin_mob_status(player_id),
+            "Show all mobs and their flags", rate_class=RATE_FREE)
+        add('teleport', self.handle_admin_teleport, "Teleport to a room (or 'teleport <player> <room>')",
+            syntax="teleport <room>", usage="Usage: teleport <room_id> OR teleport <player_name> <room_id>",
+            rate_class=RATE_HEAVY)
+        add('respawnnpc', self.handle_admin_respawn_npc, "Respawn an NPC",
+            syntax="respawnnpc <id>", usage="Usage: respawnnpc <npc_id>")
+        add('reload', lambda player_id, character, params: self.handle_admin_reload(player_id, params),
+            "Hot-reload changed content (monsters, items, vendors, spells, traps, rooms)",
+            syntax="reload [domain]", rate_class=RATE_HEAVY)
+        add('cmdstats', lambda player_id, character, params: self.handle_admin_command_stats(player_id, params),
+            "Show per-command call counts and timings", syntax="cmdstats [n]", rate_class=RATE_FREE)
+        add('loglevel', lambda player_id, character, params: self.handle_admin_log_level(player_id, params),
+            "Show or set log levels ('loglevel vendors debug')", syntax="loglevel [sub] [lvl]", rate_class=RATE_FREE)
+
     async def _handle_admin_give_gold(self, player_id: int, character: dict, params: str):
         """Admin command to give gold to the current player."""
         try:
@@ -138,7 +181,7 @@ class AdminCommandHandler(BaseCommandHandler):
 
         status_msg = "[ADMIN] Mob Status Report\n" + "=" * 50 + "\n\n"
 
-        for room_id, mobs in self.game_engine.room_mobs.items():
+        async for room_id, mobs in self.game_engine.timeslicer.iterate(self.game_engine.room_mobs.items()):
             if not mobs:
                 continue
 
@@ -191,6 +234,89 @@ class AdminCommandHandler(BaseCommandHandler):
 
         await self.game_engine.connection_manager.send_message(player_id, status_msg)
 
+    async def _handle_admin_reload(self, player_id: int, params: str):
+        """Admin command to hot-reload content files that changed on disk.
+
+        Usage: reload [domain ...]  (monsters, items, vendors, spells, traps, rooms; default all)
+        """
+        reloader = self.game_engine.content_reloader
+        domains = params.lower().split() if params and params.strip().lower() != 'all' else None
+
+        try:
+            results = reloader.reload(domains)
+        except ValueError as e:
+            await self.game_engine.connection_manager.send_message(
+                player_id,
+                error_message(f"{e}. Domains: {', '.join(reloader.DOMAINS)}")
+            )
+            return
+
+        if not results:
+            await self.game_engine.connection_manager.send_message(player_id, "[ADMIN] No content changes to reload.")
+            return
+
+        lines = ["[ADMIN] Content reloaded:"]
+        for domain, counts in results.items():
+            lines.append(f"  {domain}: {counts['added']} added, {counts['changed']} changed, {counts['removed']} removed")
+        await self.game_engine.connection_manager.send_message(player_id, "\n".join(lines))
+
+    async def _handle_admin_command_stats(self, player_id: int, params: str):
+        """Admin command to show the busiest commands since startup.
+
+        Usage: cmdstats [n]  (default 15)
+        """
+        try:
+            limit = int(params) if params else 15
+        except ValueError:
+            await self.game_engine.connection_manager.send_message(player_id, "Usage: cmdstats [n]")
+            return
+
+        stats = self.game_engine.command_handler.registry.get_stats()
+        if not stats:
+            await self.game_engine.connection_manager.send_message(player_id, "[ADMIN] No commands recorded yet.")
+            return
+
+        tracer = self.game_engine.command_handler.tracer
+        lines = ["[ADMIN] Command stats (by total time):",
+                 f"  {'command':<12} {'calls':>7} {'avg ms':>8} {'p95 ms':>8} {'max ms':>8} {'total ms':>10}  rate"]
+        for name, entry in list(stats.items())[:limit]:
+            # p95 is of the whole command (including the flush), from the tracer's histogram
+            traced = tracer.verb_summary(name)
+            p95 = f"{traced['p95_ms']:>8.1f}" if traced else f"{'-':>8}"
+            lines.append(f"  {name:<12} {entry['calls']:>7} {entry['avg_ms']:>8.1f} {p95} {entry['max_ms']:>8.1f} "
+                         f"{entry['total_ms']:>10.0f}  {entry['rate_class']}")
+        lines.append("  Phases (all commands):")
+        for phase, summary in tracer.summary().items():
+            lines.append(f"  {phase:<12} p50 {summary['p50_ms']:.1f}ms  p95 {summary['p95_ms']:.1f}ms  "
+                         f"p99 {summary['p99_ms']:.1f}ms  max {summary['max_ms']:.1f}ms")
+        await self.game_engine.connection_manager.send_message(player_id, "\n".join(lines))
+
+    async def _handle_admin_log_level(self, player_id: int, params: str):
+        """Admin command to show or change log levels at runtime.
+
+        Usage: loglevel                      (show levels)
+               loglevel <level>              (everything)
+               loglevel <subsystem> <level>  (e.g. vendors, follow, spawns, abilities; 'default' follows the root)
+        """
+        args = params.split()
+        if len(args) > 2:
+            await self.game_engine.connection_manager.send_message(player_id, "Usage: loglevel [subsystem] [level]")
+            return
+
+        if args:
+            subsystem, level = (None, args[0]) if len(args) == 1 else args
+            try:
+                name = set_log_level(subsystem, level)
+            except ValueError as e:
+                await self.game_engine.connection_manager.send_message(player_id, error_message(str(e)))
+                return
+            player_data = self.game_engine.player_manager.get_player_data(player_id) or {}
+            self.game_engine.logger.admin_action(player_data.get('username', '?'), f"set log level {level.upper()}", name)
+
+        lines = ["[ADMIN] Log levels:"]
+        lines += [f"  {name:<32} {level}" for name, level in get_log_levels().items()]
+        await self.game_engine.connection_manager.send_message(player_id, "\n".join(lines))
+
     async def handle_admin_give_gold(self, player_id: int, character: dict, params: str):
         """Public wrapper for admin give gold command."""
         await self._handle_admin_give_gold(player_id, character, params)
@@ -207,6 +333,18 @@ class AdminCommandHandler(BaseCommandHandler):
         """Public wrapper for admin mob status command."""
         await self._handle_admin_mob_status(player_id)
 
+    async def handle_admin_reload(self, player_id: int, params: str):
+        """Public wrapper for admin reload command."""
+        await self._handle_admin_reload(player_id, params)
+
+    async def handle_admin_command_stats(self, player_id: int, params: str):
+        """Public wrapper for admin command stats command."""
+        await self._handle_admin_command_stats(player_id, params)
+
+    async def handle_admin_log_level(self, player_id: int, params: str):
+        """Public wrapper for admin log level command."""
+        await self._handle_admin_log_level(player_id, params)
+
     async def handle_admin_respawn_npc(self, player_id: int, character: dict, params: str):
         """Public wrapper for admin respawn NPC command."""
         await self._handle_admin_respawn_npc(player_id, character, params)
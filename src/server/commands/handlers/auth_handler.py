@@ -12,6 +12,7 @@ import random
 from ..base_handler import BaseCommandHandler
 from ...utils.colors import error_message
 from ...game.player.stats_utils import get_stamina_hp_bonus
+from ...persistence.static_data import get_static_data
 
 
 class AuthCommandHandler(BaseCommandHandler):
@@ -48,12 +49,47 @@ class AuthCommandHandler(BaseCommandHandler):
                 player_data['login_state'] = 'username_prompt'
                 return
 
-            if self.game_engine.player_manager.authenticate_player(username, password):
+            # Accounts with recent failed attempts must wait before retrying
+            player_manager = self.game_engine.player_manager
+            backoff = player_manager.get_login_backoff_remaining(username)
+            if backoff > 0:
+                await self.game_engine.connection_manager.send_message(
+                    player_id,
+                    error_message(f"Too many failed attempts. Try again in {int(backoff) + 1} seconds.")
+                )
+                await self.game_engine.connection_manager.send_message(player_id, "\nUsername: ", add_newline=False)
+                player_data['login_state'] = 'username_prompt'
+                return
+
+            # Password hashing runs off the game loop; ignore input until it finishes
+            player_data['login_state'] = 'authenticating'
+            authenticated = await player_manager.authenticate_player_async(username, password)
+
+            # The connection may have dropped, or the same account logged in elsewhere,
+            # while we were waiting on the auth pool
+            if player_manager.get_player_data(player_id) is not player_data:
+                return
+            if authenticated and player_manager.is_user_already_logged_in(username):
+                await self.game_engine.connection_manager.send_message(
+                    player_id,
+                    error_message(f"User '{username}' is already logged in!")
+                )
+                await self.game_engine.connection_manager.send_message(player_id, "\nUsername: ", add_newline=False)
+                player_data['login_state'] = 'username_prompt'
+                return
+
+            if authenticated:
                 player_data['authenticated'] = True
                 player_data['login_state'] = 'authenticated'
 
+                # Re-attach to a link-dead session if the connection dropped recently
+                if await player_manager.resume_link_dead_session(player_id, username):
+                    await self.game_engine.connection_manager.send_message(player_id, f"Welcome back, {username}! Reconnected to your session.")
+                    await self.game_engine._send_room_description(player_id, detailed=True)
+                    return
+
                 # Track this user as logged in
-                self.game_engine.player_manager.logged_in_usernames[username] = player_id
+                player_manager.logged_in_usernames[username] = player_id
                 self.game_engine.logger.info(f"User '{username}' logged in successfully")
 
                 # Load character or prompt for character creation
@@ -67,6 +103,10 @@ class AuthCommandHandler(BaseCommandHandler):
                 await self.game_engine.connection_manager.send_message(player_id, "\nUsername: ", add_newline=False)
                 player_data['login_state'] = 'username_prompt'
 
+        elif login_state == 'authenticating':
+            # Still waiting on the password check
+            return
+
     def migrate_character_data(self, character: dict):
         """Migrate old character data to new format.
 
@@ -118,12 +158,20 @@ class AuthCommandHandler(BaseCommandHandler):
         if 'active_effects' not in character:
             character['active_effects'] = []
 
+        # Explored rooms used to be a list of room IDs; they are now a bitset over room indices
+        if 'visited_rooms' in character:
+            room_index = self.game_engine.world_manager.room_index
+            visited_mask = room_index.mask(character.pop('visited_rooms') or [])
+            character['explored_rooms'] = room_index.from_mask(
+                room_index.to_mask(character.get('explored_rooms', '')) | visited_mask)
+            print("[MIGRATION] Converted visited_rooms to explored_rooms bitset")
+
     async def handle_character_selection(self, player_id: int, username: str):
         """Handle character selection/creation."""
         # Try to load existing character data first
         if self.game_engine.player_storage:
             print(f"[DEBUG] Attempting to load character for '{username}'")
-            existing_character = self.game_engine.player_storage.load_character_data(username)
+            existing_character = await self.game_engine.player_manager.load_character_data_async(username)
             if existing_character:
                 # Migrate old character data to new format
                 self.migrate_character_data(existing_character)
@@ -180,7 +228,7 @@ What will you become?
 
     async def show_race_selection(self, player_id: int):
         """Show race selection menu."""
-        races = self.load_races()
+        races = get_static_data().races
         message = "\n=== Choose Your Race ===\n\n"
         for i, (race_id, race_data) in enumerate(races.items(), 1):
             message += f"{i}. {race_data['name']}\n   {race_data['description']}\n\n"
@@ -189,42 +237,20 @@ What will you become?
 
     async def show_class_selection(self, player_id: int):
         """Show class selection menu."""
-        classes = self.load_classes()
+        classes = get_static_data().classes
         message = "\n=== Choose Your Class ===\n\n"
         for i, (class_id, class_data) in enumerate(classes.items(), 1):
             message += f"{i}. {class_data['name']}\n   {class_data['description']}\n\n"
         message += "Enter the number of your choice: "
         await self.game_engine.connection_manager.send_message(player_id, message, add_newline=False)
 
-    def load_races(self):
-        """Load race definitions from JSON."""
-        import json
-        import os
-        try:
-            with open('data/player/races.json', 'r') as f:
-                return json.load(f)
-        except:
-            # Fallback to default
-            return {"human": {"name": "Human", "description": "Versatile humans", "base_stats": {"strength": 10, "dexterity": 10, "constitution": 10, "intellect": 10, "wisdom": 10, "charisma": 10}}}
-
-    def load_classes(self):
-        """Load class definitions from JSON."""
-        import json
-        import os
-        try:
-            with open('data/player/classes.json', 'r') as f:
-                return json.load(f)
-        except:
-            # Fallback to default
-            return {"fighter": {"name": "Fighter", "description": "Martial warrior", "stat_modifiers": {}, "hp_modifier": 1.0, "mana_modifier": 1.0}}
-
     async def handle_character_creation_input(self, player_id: int, user_input: str):
         """Handle input during character creation."""
         player_data = self.game_engine.player_manager.get_player_data(player_id)
         step = player_data.get('char_creation_step')
 
         if step == 'race':
-            races = self.load_races()
+            races = get_static_data().races
             race_list = list(races.keys())
             try:
                 choice = int(user_input) - 1
@@ -243,7 +269,7 @@ What will you become?
                 await self.show_race_selection(player_id)
 
         elif step == 'class':
-            classes = self.load_classes()
+            classes = get_static_data().classes
             class_list = list(classes.keys())
             try:
                 choice = int(user_input) - 1
@@ -271,8 +297,8 @@ What will you become?
         player_data['creating_character'] = False
         player_data['char_creation_step'] = None
 
-        races = self.load_races()
-        classes = self.load_classes()
+        static_data = get_static_data()
+        races, classes = static_data.races, static_data.classes
         race_data = races.get(selected_race, races['human'])
         class_data = classes.get(selected_class, classes['fighter'])
 
@@ -377,7 +403,7 @@ What will you become?
             'active_effects': [],  # Active buffs/debuffs
 
             # Map exploration
-            'visited_rooms': [starting_room],  # Track visited rooms for map (list for JSON serialization)
+            'explored_rooms': self.game_engine.world_manager.room_index.encode_explored([starting_room]),  # Bitset over room indices
         })
 
         # Give starting spells based on class
@@ -1,16 +1,30 @@
 """Character command handler for character info and progression commands."""
 
 import random
-import json
-from pathlib import Path
 from ..base_handler import BaseCommandHandler
+from ..registry import NOT_IN_COMBAT, RATE_FREE
 from ...utils.colors import wrap_color, Colors
 from ...game.player.stats_utils import get_stamina_hp_bonus
+from ...persistence.static_data import get_static_data
 
 
 class CharacterCommandHandler(BaseCommandHandler):
     """Handles character information and progression commands."""
 
+    def register_commands(self, registry):
+        """Declare the character commands."""
+        category = 'Character Info'
+        registry.add('stats', lambda player_id, character, params: self.handle_stats_command(player_id, character),
+                     aliases=('score', 'st'), rate_class=RATE_FREE, help="Show character stats", category=category)
+        registry.add('health', lambda player_id, character, params: self.handle_health_command(player_id, character),
+                     aliases=('he',), rate_class=RATE_FREE, help="Show hit points, mana, and status", category=category)
+        registry.add('experience', lambda player_id, character, params: self.handle_experience_command(player_id, character),
+                     aliases=('xp',), rate_class=RATE_FREE, help="Show level, experience, and rune", category=category)
+        registry.add('reroll', lambda player_id, character, params: self.handle_reroll_command(player_id, character),
+                     requires=(NOT_IN_COMBAT,), help="Reroll stats (level 1, 0 XP only)", category=category)
+        registry.add('train', lambda player_id, character, params: self.handle_train_command(player_id, character),
+                     requires=(NOT_IN_COMBAT,), help="Level up at a trainer", category=category)
+
     async def handle_health_command(self, player_id: int, character: dict):
         """Display health, mana, and status.
 
@@ -223,8 +237,8 @@ class CharacterCommandHandler(BaseCommandHandler):
             return
 
         # Get race and class data
-        races = self._load_races()
-        classes = self._load_classes()
+        static_data = get_static_data()
+        races, classes = static_data.races, static_data.classes
 
         # Find race key from name
         race_key = None
@@ -416,8 +430,8 @@ HP: {max_hp}  Mana: {max_mana}
         stat_points = self.config_manager.get_setting('player', 'leveling', 'stat_points_per_level', default=2)
 
         # Load race and class data for modifiers
-        races = self._load_races()
-        classes = self._load_classes()
+        static_data = get_static_data()
+        races, classes = static_data.races, static_data.classes
         player_race = character.get('species', 'human').lower()
         player_class = character.get('class', 'fighter').lower()
         race_data = races.get(player_race, races.get('human', {}))
@@ -554,18 +568,7 @@ Congratulations, {character['name']}! You feel stronger and more capable!
         Returns:
             True if the class uses magic, False otherwise
         """
-        try:
-            classes_file = Path("data/player/classes.json")
-            with open(classes_file, 'r') as f:
-                classes_data = json.load(f)
-                class_key = class_name.lower()
-                if class_key in classes_data:
-                    return classes_data[class_key].get('uses_magic', False)
-        except Exception as e:
-            self.logger.warning(f"Could not load class data: {e}")
-
-        # Default: assume non-magic class
-        return False
+        return get_static_data().class_uses_magic(class_name)
 
     def _distribute_stat_points(self, character: dict, points_to_distribute: int) -> dict:
         """Automatically distribute stat points across character stats up to their maximums.
@@ -577,17 +580,8 @@ Congratulations, {character['name']}! You feel stronger and more capable!
         Returns:
             Dictionary of stat name -> amount increased
         """
-        # Load race data to get modifiers
-        races_file = Path("data/player/races.json")
-        race_modifiers = {}
-        try:
-            with open(races_file, 'r') as f:
-                races_data = json.load(f)
-                player_race = character.get('race', 'human')
-                if player_race in races_data:
-                    race_modifiers = races_data[player_race].get('stat_modifiers', {})
-        except Exception as e:
-            self.logger.warning(f"Could not load race modifiers: {e}")
+        # Race modifiers raise the stat maximums
+        race_modifiers = get_static_data().race_modifiers(character.get('race', 'human'))
 
         # Get base stat maximums from config
         starting_stats = self.config_manager.get_setting('player', 'starting_stats', default={})
@@ -631,21 +625,3 @@ Congratulations, {character['name']}! You feel stronger and more capable!
             stat_increases[chosen_stat] += 1
 
         return stat_increases
-
-    def _load_races(self):
-        """Load race definitions from JSON."""
-        try:
-            with open('data/player/races.json', 'r') as f:
-                return json.load(f)
-        except:
-            # Fallback to default
-            return {"human": {"name": "Human", "description": "Versatile humans", "base_stats": {"strength": 10, "dexterity": 10, "constitution": 10, "intellect": 10, "wisdom": 10, "charisma": 10}}}
-
-    def _load_classes(self):
-        """Load class definitions from JSON."""
-        try:
-            with open('data/player/classes.json', 'r') as f:
-                return json.load(f)
-        except:
-            # Fallback to default
-            return {"fighter": {"name": "Fighter", "description": "Martial warrior", "stat_modifiers": {}, "hp_modifier": 1.0, "mana_modifier": 1.0}}
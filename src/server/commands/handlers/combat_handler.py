@@ -14,6 +14,20 @@ from ..base_handler import BaseCommandHandler
 class CombatCommandHandler(BaseCommandHandler):
     """Handler for combat commands."""
 
+    def register_commands(self, registry):
+        """Declare the combat commands."""
+        category = 'Combat Commands'
+        registry.add('attack', lambda player_id, character, params: self.handle_attack_command(player_id, params),
+                     aliases=('att', 'a', 'kill'), min_args=1, usage="Attack what?",
+                     syntax="attack <target>", help="Attack a target", category=category)
+        registry.add('shoot', lambda player_id, character, params: self.handle_shoot_command(player_id, params),
+                     aliases=('fire', 'sh'), min_args=1, usage="Shoot what?",
+                     syntax="shoot <target>", help="Shoot with ranged weapon", category=category)
+        registry.add('retrieve', lambda player_id, character, params: self.handle_retrieve_ammo(player_id),
+                     aliases=('recover', 'gather'), help="Retrieve spent ammunition", category=category)
+        registry.add('flee', lambda player_id, character, params: self.handle_flee_command(player_id),
+                     aliases=('run',), help="Try to flee from combat", category=category)
+
     async def handle_attack_command(self, player_id: int, target_name: str):
         """Handle attack command."""
         await self.game_engine.combat_system.handle_attack_command(player_id, target_name)
@@ -1,12 +1,34 @@
 """Inventory command handler for inventory management commands."""
 
 from ..base_handler import BaseCommandHandler
+from ..registry import RATE_FREE
 from ...utils.colors import wrap_color, Colors, error_message, success_message, item_found
 
 
 class InventoryCommandHandler(BaseCommandHandler):
     """Handles inventory management commands."""
 
+    def register_commands(self, registry):
+        """Declare the inventory commands."""
+        category = 'Items & Equipment'
+        registry.add('inventory', lambda player_id, character, params: self.handle_inventory_command(player_id, character),
+                     aliases=('inv', 'i'), rate_class=RATE_FREE, help="Show inventory", category='Character Info')
+        registry.add('get', lambda player_id, character, params: self.handle_get_item(player_id, params),
+                     min_args=1, usage="What would you like to get?",
+                     syntax="get <item>", help="Pick up an item", category=category)
+        registry.add('drop', lambda player_id, character, params: self.handle_drop_item(player_id, params),
+                     min_args=1, usage="What would you like to drop?",
+                     syntax="drop <item>", help="Drop an item", category=category)
+        registry.add('equip', lambda player_id, character, params: self.handle_equip_item(player_id, params),
+                     aliases=('eq',), min_args=1, usage="What would you like to equip?",
+                     syntax="equip <item>", help="Equip weapon or armor", category=category)
+        registry.add('unequip', lambda player_id, character, params: self.handle_unequip_item(player_id, params),
+                     min_args=1, usage="What would you like to unequip?",
+                     syntax="unequip <item>", help="Unequip weapon or armor", category=category)
+        registry.add('put', self.handle_put_command,
+                     aliases=('store', 'stow'), min_args=1, usage="Usage: put <item> in <container>",
+                     syntax="put <item>", help="Put item in container", category=category)
+
     async def handle_inventory_command(self, player_id: int, character: dict):
         """Display player inventory.
 
@@ -11,12 +11,35 @@ Handles commands for consuming and using items:
 """
 
 from ..base_handler import BaseCommandHandler
+from ...persistence.static_data import get_static_data
 from ...utils.colors import error_message, success_message, announcement, info_message
 
 
 class ItemUsageCommandHandler(BaseCommandHandler):
     """Handler for item usage commands."""
 
+    def register_commands(self, registry):
+        """Declare the item usage commands."""
+        category = 'Items & Equipment'
+        registry.add('eat', lambda player_id, character, params: self.handle_eat_command(player_id, params),
+                     aliases=('consume',), min_args=1, usage="What would you like to eat?",
+                     syntax="eat <item>", help="Eat food", category=category)
+        registry.add('drink', lambda player_id, character, params: self.handle_drink_command(player_id, params),
+                     aliases=('dr', 'quaff'), min_args=1, usage="What would you like to drink?",
+                     syntax="drink <item>", help="Drink beverage", category=category)
+        registry.add('read', lambda player_id, character, params: self.handle_read_command(player_id, params),
+                     aliases=('study',), min_args=1, usage="What would you like to read?",
+                     syntax="read <item>", help="Read a scroll to learn a spell", category=category)
+        registry.add('light', lambda player_id, character, params: self.handle_light_command(player_id, params),
+                     aliases=('ignite',), min_args=1, usage="What would you like to light?",
+                     syntax="light <item>", help="Light a torch, lantern, or candle", category=category)
+        registry.add('extinguish', lambda player_id, character, params: self.handle_extinguish_command(player_id, params),
+                     aliases=('douse', 'snuff'), min_args=1, usage="What would you like to extinguish?",
+                     syntax="extinguish <item>", help="Extinguish a light source", category=category)
+        registry.add('fill', lambda player_id, character, params: self.handle_fill_command(player_id, params),
+                     aliases=('refill',), min_args=1, usage="What would you like to fill?",
+                     syntax="fill <item>", help="Fill a lantern with lamp oil", category=category)
+
     async def handle_eat_command(self, player_id: int, item_name: str):
         """Handle eating food to restore hunger."""
         player_data = self.game_engine.player_manager.get_player_data(player_id)
@@ -600,7 +623,7 @@ class ItemUsageCommandHandler(BaseCommandHandler):
         spell_level = spell.get('level', 1)
 
         # Get max spell level from class data
-        classes_data = self.game_engine.config_manager.game_data.get('classes', {})
+        classes_data = get_static_data().classes
         class_info = classes_data.get(player_class, {})
         max_spell_level = class_info.get('max_spell_level', 99)  # Default to 99 (no restriction)
 
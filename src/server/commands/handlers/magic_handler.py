@@ -10,169 +10,185 @@ Handles commands for spell management and casting:
 import time
 import random
 from ..base_handler import BaseCommandHandler
+from ...persistence.static_data import get_static_data
+from ..registry import RATE_FREE
 from ...utils.colors import error_message, success_message, colorize, Colors
 
 
+def render_spellbook(entries) -> str:
+    """Format a spellbook (run off the event loop).
+
+    Args:
+        entries: ((spell ID, spell definition or None, cooldown rounds left), ...)
+    """
+    if not entries:
+        return "Your spellbook is empty. You haven't learned any spells yet."
+
+    lines = ["=== Your Spellbook ===\n"]
+
+    for spell_id, spell, cooldown_remaining in entries:
+        if not spell:
+            lines.append(f"{spell_id} (spell data not found)")
+            lines.append("")
+            continue
+
+        # Format spell entry - with safe defaults
+        name = spell.get('name', spell_id)
+        level = spell.get('level', '?')
+        mana = spell.get('mana_cost', '?')
+        spell_type = spell.get('type', 'unknown')
+
+        # Type-specific info
+        type_info = ""
+        if spell_type == 'damage':
+            damage = spell.get('damage', '?')
+            damage_type = spell.get('damage_type', 'physical')
+            type_info = f"Damage: {damage} ({damage_type})"
+            # Add area of effect if applicable
+            aoe = spell.get('area_of_effect', 'Single')
+            if aoe == 'Area':
+                type_info += " [AOE]"
+        elif spell_type == 'heal':
+            effect = spell.get('effect', 'heal_hit_points')
+            if effect == 'heal_hit_points':
+                heal = spell.get('heal_amount', '?')
+                type_info = f"Healing: {heal} HP"
+            elif effect == 'cure_poison':
+                type_info = "Cures poison"
+            elif effect == 'cure_hunger':
+                type_info = "Cures hunger"
+            elif effect == 'cure_thirst':
+                type_info = "Quenches thirst"
+            elif effect == 'cure_paralysis':
+                type_info = "Cures paralysis"
+            elif effect == 'cure_drain':
+                type_info = "Restores drained stats"
+            elif effect == 'regeneration':
+                type_info = "Regeneration over time"
+            # Add area of effect if applicable
+            aoe = spell.get('area_of_effect', 'Single')
+            if aoe == 'Area':
+                type_info += " [AOE]"
+        elif spell_type == 'buff':
+            effect = spell.get('effect', 'unknown')
+            duration = spell.get('duration', 0)
+            bonus = spell.get('bonus_amount', 0)
+            if effect == 'ac_bonus':
+                type_info = f"Armor Class +{bonus} ({duration} seconds)"
+            elif effect == 'invisible':
+                type_info = f"Invisibility ({duration} seconds)"
+            else:
+                type_info = f"Effect: {effect} ({duration} seconds)"
+            # Add area of effect if applicable
+            aoe = spell.get('area_of_effect', 'Single')
+            if aoe == 'Area':
+                type_info += " [AOE]"
+        elif spell_type == 'enhancement':
+            effect = spell.get('effect', 'unknown')
+            effect_amount = spell.get('effect_amount', '?')
+            effect_map = {
+                'enhance_agility': 'Dexterity',
+                'enhance_dexterity': 'Dexterity',
+                'enhance_strength': 'Strength',
+                'enhance_constitution': 'Constitution',
+                'enhance_physique': 'Constitution',
+                'enhance_vitality': 'Vitality',
+                'enhance_stamina': 'Vitality',
+                'enhance_mental': 'INT/WIS/CHA',
+                'enhance_body': 'STR/DEX/CON'
+            }
+            stat_name = effect_map.get(effect, effect)
+            type_info = f"Enhances {stat_name} by {effect_amount}"
+            # Add area of effect if applicable
+            aoe = spell.get('area_of_effect', 'Single')
+            if aoe == 'Area':
+                type_info += " [AOE]"
+        elif spell_type == 'drain':
+            damage = spell.get('damage', '?')
+            damage_type = spell.get('damage_type', 'force')
+            effect = spell.get('effect', None)
+            type_info = f"Damage: {damage} ({damage_type})"
+            if effect:
+                effect_amount = spell.get('effect_amount', '?')
+                duration = spell.get('effect_duration', '?')
+                effect_map = {
+                    'drain_mana': 'Mana',
+                    'drain_health': 'Health',
+                    'drain_agility': 'Dexterity',
+                    'drain_physique': 'Constitution',
+                    'drain_stamina': 'Vitality',
+                    'drain_mental': 'INT/WIS/CHA',
+                    'drain_body': 'STR/DEX/CON'
+                }
+                drain_name = effect_map.get(effect, effect)
+                type_info += f" + Drains {drain_name} by {effect_amount} ({duration} rounds)"
+            # Add area of effect if applicable
+            aoe = spell.get('area_of_effect', 'Single')
+            if aoe == 'Area':
+                type_info += " [AOE]"
+        elif spell_type == 'debuff':
+            effect = spell.get('effect', 'unknown')
+            duration = spell.get('effect_duration', '?')
+            damage = spell.get('damage', None)
+            if effect == 'paralyze':
+                type_info = f"Paralyzes target ({duration} rounds)"
+            elif effect == 'charm':
+                type_info = f"Charms target, preventing attacks ({duration} rounds)"
+            else:
+                type_info = f"Effect: {effect} ({duration} rounds)"
+            if damage:
+                damage_type = spell.get('damage_type', 'force')
+                type_info += f" + Damage: {damage} ({damage_type})"
+            # Add area of effect if applicable
+            aoe = spell.get('area_of_effect', 'Single')
+            if aoe == 'Area':
+                type_info += " [AOE]"
+        elif spell_type == 'summon':
+            type_info = "Summons a creature"
+
+        cooldown_text = ""
+        if cooldown_remaining > 0:
+            cooldown_text = f" [COOLDOWN: {cooldown_remaining} rounds]"
+
+        lines.append(f"{name} (Level {level}) - {mana} mana{cooldown_text}")
+        lines.append(f"  {spell['description']}")
+        if type_info:
+            lines.append(f"  {type_info}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
 class MagicCommandHandler(BaseCommandHandler):
     """Handler for magic and spellcasting commands."""
 
-    async def handle_spellbook_command(self, player_id: int, character: dict):
-        """Display the player's spellbook with all known spells."""
-        spellbook = character.get('spellbook', [])
+    def register_commands(self, registry):
+        """Declare the spellbook and casting commands."""
+        registry.add('spellbook', lambda player_id, character, params: self.handle_spellbook_command(player_id, character),
+                     render=render_spellbook, aliases=('spells', 'sb'), rate_class=RATE_FREE, help="Show learned spells", category='Character Info')
+        registry.add('unlearn', self.handle_unlearn_spell_command,
+                     aliases=('forget',), min_args=1, usage="Unlearn what spell? Use 'spellbook' to see your spells.",
+                     syntax="unlearn <spell>", help="Remove a spell from your spellbook", category='Character Info')
+        registry.add('cast', self.handle_cast_command,
+                     aliases=('c',), min_args=1, usage="Cast what spell? Use 'spellbook' to see your spells.",
+                     syntax="cast <spell>", help="Cast a spell", category='Combat Commands')
 
-        if not spellbook:
-            await self.game_engine.connection_manager.send_message(
-                player_id,
-                "Your spellbook is empty. You haven't learned any spells yet."
-            )
-            return
+    async def handle_spellbook_command(self, player_id: int, character: dict):
+        """Display the player's spellbook with all known spells.
 
-        # Load spell data
+        Returns:
+            Snapshot of the known spells for render_spellbook
+        """
         spell_data = self.game_engine.config_manager.game_data.get('spells', {})
+        cooldowns = character.get('spell_cooldowns', {})
 
-        # Build spellbook display
-        lines = ["=== Your Spellbook ===\n"]
-
-        for spell_id in spellbook:
+        entries = []
+        for spell_id in character.get('spellbook', []):
             spell = spell_data.get(spell_id)
             if not spell:
                 self.game_engine.logger.warning(f"Spell '{spell_id}' not found in spell_data for spellbook display")
-                lines.append(f"{spell_id} (spell data not found)")
-                lines.append("")
-                continue
-
-            # Get cooldown info
-            cooldowns = character.get('spell_cooldowns', {})
-            cooldown_remaining = cooldowns.get(spell_id, 0)
-
-            # Format spell entry - with safe defaults
-            name = spell.get('name', spell_id)
-            level = spell.get('level', '?')
-            mana = spell.get('mana_cost', '?')
-            spell_type = spell.get('type', 'unknown')
-
-            # Type-specific info
-            type_info = ""
-            if spell_type == 'damage':
-                damage = spell.get('damage', '?')
-                damage_type = spell.get('damage_type', 'physical')
-                type_info = f"Damage: {damage} ({damage_type})"
-                # Add area of effect if applicable
-                aoe = spell.get('area_of_effect', 'Single')
-                if aoe == 'Area':
-                    type_info += " [AOE]"
-            elif spell_type == 'heal':
-                effect = spell.get('effect', 'heal_hit_points')
-                if effect == 'heal_hit_points':
-                    heal = spell.get('heal_amount', '?')
-                    type_info = f"Healing: {heal} HP"
-                elif effect == 'cure_poison':
-                    type_info = "Cures poison"
-                elif effect == 'cure_hunger':
-                    type_info = "Cures hunger"
-                elif effect == 'cure_thirst':
-                    type_info = "Quenches thirst"
-                elif effect == 'cure_paralysis':
-                    type_info = "Cures paralysis"
-                elif effect == 'cure_drain':
-                    type_info = "Restores drained stats"
-                elif effect == 'regeneration':
-                    type_info = "Regeneration over time"
-                # Add area of effect if applicable
-                aoe = spell.get('area_of_effect', 'Single')
-                if aoe == 'Area':
-                    type_info += " [AOE]"
-            elif spell_type == 'buff':
-                effect = spell.get('effect', 'unknown')
-                duration = spell.get('duration', 0)
-                bonus = spell.get('bonus_amount', 0)
-                if effect == 'ac_bonus':
-                    type_info = f"Armor Class +{bonus} ({duration} seconds)"
-                elif effect == 'invisible':
-                    type_info = f"Invisibility ({duration} seconds)"
-                else:
-                    type_info = f"Effect: {effect} ({duration} seconds)"
-                # Add area of effect if applicable
-                aoe = spell.get('area_of_effect', 'Single')
-                if aoe == 'Area':
-                    type_info += " [AOE]"
-            elif spell_type == 'enhancement':
-                effect = spell.get('effect', 'unknown')
-                effect_amount = spell.get('effect_amount', '?')
-                effect_map = {
-                    'enhance_agility': 'Dexterity',
-                    'enhance_dexterity': 'Dexterity',
-                    'enhance_strength': 'Strength',
-                    'enhance_constitution': 'Constitution',
-                    'enhance_physique': 'Constitution',
-                    'enhance_vitality': 'Vitality',
-                    'enhance_stamina': 'Vitality',
-                    'enhance_mental': 'INT/WIS/CHA',
-                    'enhance_body': 'STR/DEX/CON'
-                }
-                stat_name = effect_map.get(effect, effect)
-                type_info = f"Enhances {stat_name} by {effect_amount}"
-                # Add area of effect if applicable
-                aoe = spell.get('area_of_effect', 'Single')
-                if aoe == 'Area':
-                    type_info += " [AOE]"
-            elif spell_type == 'drain':
-                damage = spell.get('damage', '?')
-                damage_type = spell.get('damage_type', 'force')
-                effect = spell.get('effect', None)
-                type_info = f"Damage: {damage} ({damage_type})"
-                if effect:
-                    effect_amount = spell.get('effect_amount', '?')
-                    duration = spell.get('effect_duration', '?')
-                    effect_map = {
-                        'drain_mana': 'Mana',
-                        'drain_health': 'Health',
-                        'drain_agility': 'Dexterity',
-                        'drain_physique': 'Constitution',
-                        'drain_stamina': 'Vitality',
-                        'drain_mental': 'INT/WIS/CHA',
-                        'drain_body': 'STR/DEX/CON'
-                    }
-                    drain_name = effect_map.get(effect, effect)
-                    type_info += f" + Drains {drain_name} by {effect_amount} ({duration} rounds)"
-                # Add area of effect if applicable
-                aoe = spell.get('area_of_effect', 'Single')
-                if aoe == 'Area':
-                    type_info += " [AOE]"
-            elif spell_type == 'debuff':
-                effect = spell.get('effect', 'unknown')
-                duration = spell.get('effect_duration', '?')
-                damage = spell.get('damage', None)
-                if effect == 'paralyze':
-                    type_info = f"Paralyzes target ({duration} rounds)"
-                elif effect == 'charm':
-                    type_info = f"Charms target, preventing attacks ({duration} rounds)"
-                else:
-                    type_info = f"Effect: {effect} ({duration} rounds)"
-                if damage:
-                    damage_type = spell.get('damage_type', 'force')
-                    type_info += f" + Damage: {damage} ({damage_type})"
-                # Add area of effect if applicable
-                aoe = spell.get('area_of_effect', 'Single')
-                if aoe == 'Area':
-                    type_info += " [AOE]"
-            elif spell_type == 'summon':
-                type_info = "Summons a creature"
-
-            cooldown_text = ""
-            if cooldown_remaining > 0:
-                cooldown_text = f" [COOLDOWN: {cooldown_remaining} rounds]"
-
-            lines.append(f"{name} (Level {level}) - {mana} mana{cooldown_text}")
-            lines.append(f"  {spell['description']}")
-            if type_info:
-                lines.append(f"  {type_info}")
-            lines.append("")
-
-        await self.game_engine.connection_manager.send_message(
-            player_id,
-            "\n".join(lines)
-        )
+            entries.append((spell_id, spell, cooldowns.get(spell_id, 0)))
+        return tuple(entries)
 
     async def handle_unlearn_spell_command(self, player_id: int, character: dict, spell_input: str):
         """Handle unlearning/forgetting a spell."""
@@ -335,7 +351,7 @@ class MagicCommandHandler(BaseCommandHandler):
         spell_level = spell.get('level', 1)
 
         # Get max spell level from class data
-        classes_data = self.game_engine.config_manager.game_data.get('classes', {})
+        classes_data = get_static_data().classes
         class_info = classes_data.get(player_class, {})
         max_spell_level = class_info.get('max_spell_level', 99)  # Default to 99 (no restriction)
 
@@ -12,12 +12,37 @@ Handles commands for party management and cooperation:
 """
 
 from ..base_handler import BaseCommandHandler
+from ..registry import RATE_FREE
 from ...utils.colors import error_message, success_message, info_message
 
 
 class PartyCommandHandler(BaseCommandHandler):
     """Handler for party and group commands."""
 
+    def register_commands(self, registry):
+        """Declare the party commands."""
+        category = 'Party System'
+        registry.add('party', lambda player_id, character, params: self.handle_party_command(player_id, character),
+                     rate_class=RATE_FREE, help="Show party members and their status", category=category)
+        registry.add('join', self.handle_join_command,
+                     min_args=1, usage="Who do you want to join? Usage: join <player_name>",
+                     syntax="join <player>", help="Request to join a player's party", category=category)
+        registry.add('leave', lambda player_id, character, params: self.handle_leave_command(player_id, character),
+                     help="Leave your current party", category=category)
+        registry.add('add', self.handle_add_command,
+                     min_args=1, usage="Who do you want to add to your party? Usage: add <player_name>",
+                     syntax="add <player>", help="Add a player to your party (leader only)", category=category)
+        registry.add('remove', self.handle_remove_command,
+                     min_args=1, usage="Who do you want to remove from your party? Usage: remove <player_name>",
+                     syntax="remove <player>", help="Remove a player from party (leader only)", category=category)
+        registry.add('appoint', self.handle_appoint_command,
+                     min_args=1, usage="Who do you want to appoint as party leader? Usage: appoint <player_name>",
+                     syntax="appoint <player>", help="Transfer party leadership to another member", category=category)
+        registry.add('disband', lambda player_id, character, params: self.handle_disband_command(player_id, character),
+                     help="Disband the party (leader only)", category=category)
+        registry.add('follow', lambda player_id, character, params: self.handle_follow_command(player_id, character, params or None),
+                     syntax="follow [player]", help="Follow a player's movements (no name: stop following)", category=category)
+
     async def handle_party_command(self, player_id: int, character: dict):
         """Display current party composition and member stats.
 
@@ -1,11 +1,34 @@
 """Quest command handler for quest-related commands."""
 
 from ..base_handler import BaseCommandHandler
+from ..registry import RATE_FREE
 
 
 class QuestCommandHandler(BaseCommandHandler):
     """Handles quest-related commands."""
 
+    def register_commands(self, registry):
+        """Declare the quest and NPC commands."""
+        category = 'Quests & NPCs'
+        registry.add('quest', lambda player_id, character, params: self.handle_quest_log(player_id, character),
+                     aliases=('quests', 'questlog'), rate_class=RATE_FREE, help="Show quest log", category=category)
+        registry.add('talk', self.handle_talk_to_npc,
+                     aliases=('speak',), min_args=1, usage="Who would you like to talk to?",
+                     syntax="talk <npc>", help="Talk to an NPC", category=category)
+        registry.add('accept', self._accept,
+                     min_args=1, usage="What quest or party join request would you like to accept?",
+                     syntax="accept <quest>", help="Accept a quest from NPC (or a party join request)", category=category)
+        registry.add('abandon', self.handle_abandon_quest,
+                     min_args=1, usage="What quest would you like to abandon? Usage: abandon <quest_id>",
+                     syntax="abandon <quest>", help="Abandon a quest", category=category)
+
+    async def _accept(self, player_id: int, character: dict, params: str):
+        """Accept a pending party join request if there is one, otherwise a quest."""
+        if character.get('party_join_requests'):
+            await self.game_engine.command_handler.party_handler.handle_accept_command(player_id, character, params)
+        else:
+            await self.handle_accept_quest(player_id, character, params)
+
     async def handle_quest_log(self, player_id: int, character: dict):
         """Display the player's quest log.
 
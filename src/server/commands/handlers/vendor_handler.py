@@ -10,12 +10,50 @@ Handles commands for trading with NPCs:
 """
 
 from ..base_handler import BaseCommandHandler
+from ..registry import RATE_FREE
 from ...utils.colors import error_message, success_message, info_message, service_message
 
 
+def render_vendor_list(snapshot) -> str:
+    """Format a vendor's wares (run off the event loop).
+
+    Args:
+        snapshot: (vendor name, ((item ID, item name or None, price), ...))
+    """
+    vendor_name, wares = snapshot
+    lines = [f"{vendor_name} has the following items for sale:"]
+    for i, (item_id, item_name, price) in enumerate(wares, 1):
+        if item_name is not None:
+            lines.append(f"  {i}. {item_name} - {price} gold")
+        else:
+            lines.append(f"  {i}. {item_id} (unknown item) - {price} gold")
+    return "\n".join(lines) + "\n"
+
+
 class VendorCommandHandler(BaseCommandHandler):
     """Handler for vendor/trading commands."""
 
+    def register_commands(self, registry):
+        """Declare the trading and service commands."""
+        category = 'Vendors & Services'
+        registry.add('list', lambda player_id, character, params: self.handle_list_vendor_items(player_id, params or None),
+                     render=render_vendor_list, aliases=('wares',), rate_class=RATE_FREE, help="Show vendor wares", category=category)
+        registry.add('buy', self._buy,
+                     aliases=('b',), min_args=1, usage="What would you like to buy?",
+                     syntax="buy <item>", help="Buy from vendor ('buy passage' to cross the great lake)", category=category)
+        registry.add('sell', lambda player_id, character, params: self.handle_trade_command(player_id, 'sell', params),
+                     min_args=1, usage="What would you like to sell?",
+                     syntax="sell <item>", help="Sell to vendor", category=category)
+        registry.add('heal', lambda player_id, character, params: self.handle_heal_command(player_id, params or "list"),
+                     aliases=('healing',), help="Receive healing from healer (if available)", category=category)
+
+    async def _buy(self, player_id: int, character: dict, params: str):
+        """Buy from a vendor, or buy passage across the great lake."""
+        if params.lower() == 'passage':
+            await self.game_engine.command_handler.world_handler.handle_buy_passage(player_id, character)
+        else:
+            await self.handle_trade_command(player_id, 'buy', params)
+
     async def handle_trade_command(self, player_id: int, action: str, params: str):
         """Handle buy/sell commands with vendors.
 
@@ -84,6 +122,9 @@ class VendorCommandHandler(BaseCommandHandler):
         Args:
             player_id: The player requesting the list
             vendor_name: Optional name of specific vendor to list. If None, lists first vendor.
+
+        Returns:
+            Snapshot of the wares for render_vendor_list, or None if there is no vendor to list
         """
         player_data = self.game_engine.player_manager.get_player_data(player_id)
         if not player_data or not player_data.get('character'):
@@ -119,23 +160,20 @@ class VendorCommandHandler(BaseCommandHandler):
                 )
                 return
 
-        inventory_text = f"{vendor['name']} has the following items for sale:\n"
-        for i, item_entry in enumerate(vendor['inventory'], 1):
+        wares = []
+        for item_entry in vendor['inventory']:
             item_id = item_entry['item_id']
             item_config = self.game_engine.config_manager.get_item(item_id)
             if item_config:
-                item_name = item_config['name']
                 # Calculate price from base_value and vendor's sell_markup
                 base_value = item_config.get('base_value', 0)
                 sell_markup = vendor.get('sell_markup', 1.2)
-                price = int(base_value * sell_markup)
-                inventory_text += f"  {i}. {item_name} - {price} gold\n"
+                wares.append((item_id, item_config['name'], int(base_value * sell_markup)))
             else:
                 # Try to get price from item_entry, fallback to 0
-                price = item_entry.get('price', 0)
-                inventory_text += f"  {i}. {item_id} (unknown item) - {price} gold\n"
+                wares.append((item_id, None, item_entry.get('price', 0)))
 
-        await self.game_engine.connection_manager.send_message(player_id, inventory_text)
+        return vendor['name'], tuple(wares)
 
     async def handle_buy_item(self, player_id: int, vendor: dict, item_name: str, quantity: int = 1):
         """Handle buying an item from a vendor.
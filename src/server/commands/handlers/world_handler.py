@@ -10,12 +10,50 @@ Handles commands for world interaction and observation:
 """
 
 from ..base_handler import BaseCommandHandler
+from ..registry import NOT_IN_COMBAT, RATE_FREE
+from ...game.name_index import resolve
 from ...utils.colors import error_message, service_message, info_message, success_message
 
 
 class WorldCommandHandler(BaseCommandHandler):
     """Handler for world interaction commands."""
 
+    def register_commands(self, registry):
+        """Declare the room and world interaction commands."""
+        registry.add('look', self._look,
+                     aliases=('l',), rate_class=RATE_FREE,
+                     syntax="look", help="Look around or examine target", category='Available Commands')
+        registry.add('gaze', lambda player_id, character, params: self.handle_special_action(player_id, 'gaze', params),
+                     min_args=1, usage="Gaze at what?", rate_class=RATE_FREE,
+                     syntax="gaze <target>", help="Gaze at a target for detailed examination", category='Available Commands')
+        registry.add('exits', self._show_exits,
+                     aliases=('ex',), rate_class=RATE_FREE, help="Show exits", category='Available Commands')
+        registry.add('ring', lambda player_id, character, params: self.handle_ring_command(player_id, params),
+                     aliases=('ri',), min_args=1, usage="What would you like to ring?",
+                     syntax="ring <item>", help="Ring a bell or gong", category='Items & Equipment')
+        registry.add('search', lambda player_id, character, params: self.handle_search_traps_command(player_id, character),
+                     aliases=('detect',), help="Search for traps in current room", category='Traps & Locks')
+        registry.add('disarm', lambda player_id, character, params: self.handle_disarm_trap_command(player_id, character),
+                     aliases=('disable',), help="Disarm a detected trap", category='Traps & Locks')
+        registry.add('rent', lambda player_id, character, params: self.handle_rent_room(player_id, character),
+                     aliases=('rest', 'sleep'), requires=(NOT_IN_COMBAT,),
+                     help="Rent a room at inn (restores HP/MP, cost scales with level)", category='Vendors & Services')
+
+    async def _look(self, player_id: int, character: dict, params: str):
+        """Look at a direction or target, or around the room."""
+        if params:
+            await self.handle_look_command(player_id, params)
+        else:
+            await self.game_engine._send_room_description(player_id, detailed=True)
+
+    async def _show_exits(self, player_id: int, character: dict, params: str):
+        """List the exits of the player's room."""
+        exits = self.world_manager.get_exits_from_room(character['room_id'])
+        if exits:
+            await self.send_message(player_id, f"Available exits: {', '.join(exits.keys())}")
+        else:
+            await self.send_message(player_id, "No exits available.")
+
     async def handle_look_command(self, player_id: int, params: str):
         """Handle look command - check if it's a direction or a target."""
         player_data = self.game_engine.player_manager.get_player_data(player_id)
@@ -73,91 +111,87 @@ class WorldCommandHandler(BaseCommandHandler):
         room_id = character.get('room_id')
 
         # First check if it's a player in the room
-        target_lower = target_name.lower()
-        for other_player_id, other_player_data in self.game_engine.player_manager.get_all_connected_players().items():
-            if other_player_id == player_id:
-                continue
-            other_character = other_player_data.get('character')
-            if other_character and other_character.get('room_id') == room_id:
-                other_name = other_character.get('name', '').lower()
-                if target_lower in other_name or other_name in target_lower:
-                    # Check if the target player is invisible
-                    active_effects = other_character.get('active_effects', [])
-                    is_invisible = any(
-                        effect.get('effect') in ['invisible', 'invisibility']
-                        for effect in active_effects
-                    )
-                    if is_invisible:
-                        # Can't see invisible players
-                        await self.game_engine.connection_manager.send_message(
-                            player_id,
-                            error_message("You don't see that here.")
-                        )
-                        return
-                    # Found a visible player - generate detailed description
-                    description = self.generate_player_description(other_character)
-                    await self.game_engine.connection_manager.send_message(player_id, description)
-                    await self.game_engine.connection_manager.send_message(other_player_id, f"{character['name']} looks at you.")
-                    return
+        others = [
+            (other_player_id, other_player_data['character'])
+            for other_player_id, other_player_data in self.game_engine.player_manager.get_all_connected_players().items()
+            if other_player_id != player_id and other_player_data.get('character')
+            and other_player_data['character'].get('room_id') == room_id
+        ]
+        other, _, _ = resolve(others, target_name, names=lambda other: (other[1].get('name', ''),))
+        if other:
+            other_player_id, other_character = other
+            # Check if the target player is invisible
+            active_effects = other_character.get('active_effects', [])
+            is_invisible = any(
+                effect.get('effect') in ['invisible', 'invisibility']
+                for effect in active_effects
+            )
+            if is_invisible:
+                # Can't see invisible players
+                await self.game_engine.connection_manager.send_message(
+                    player_id,
+                    error_message("You don't see that here.")
+                )
+                return
+            # Found a visible player - generate detailed description
+            description = self.generate_player_description(other_character)
+            await self.game_engine.connection_manager.send_message(player_id, description)
+            await self.game_engine.connection_manager.send_message(other_player_id, f"{character['name']} looks at you.")
+            return
 
         # Check for items on the floor
-        room_items = self.game_engine.item_manager.get_room_items(room_id)
-        for item in room_items:
-            if target_lower in item['name'].lower():
-                description = item.get('description', f"A {item['name'].lower()}.")
-                await self.game_engine.connection_manager.send_message(player_id, f"You examine the {item['name']}: {description}")
-                return
+        item, _, _ = resolve(self.game_engine.item_manager.get_room_items(room_id), target_name)
+        if item:
+            description = item.get('description', f"A {item['name'].lower()}.")
+            await self.game_engine.connection_manager.send_message(player_id, f"You examine the {item['name']}: {description}")
+            return
 
         # Check for mobs
-        if room_id in self.game_engine.room_mobs:
-            for mob in self.game_engine.room_mobs[room_id]:
-                if target_lower in mob['name'].lower():
-                    description = mob.get('description', f"A {mob['name'].lower()}.")
-                    health_status = ""
-
-                    # Get current and max health (mobs use 'health' and 'max_health')
-                    current_health = mob.get('health', mob.get('current_hit_points', 100))
-                    max_health = mob.get('max_health', mob.get('max_hit_points', 100))
-
-                    # Show health status if mob is damaged
-                    if current_health < max_health:
-                        health_percent = (current_health / max_health) * 100
-                        if health_percent > 75:
-                            health_status = " It looks slightly wounded."
-                        elif health_percent > 50:
-                            health_status = " It looks moderately wounded."
-                        elif health_percent > 25:
-                            health_status = " It looks badly wounded."
-                        else:
-                            health_status = " It looks near death."
-
-                    await self.game_engine.connection_manager.send_message(player_id, f"You look at the {mob['name']}: {description}{health_status}")
-                    return
+        mob, _, _ = resolve(self.game_engine.room_mobs.get(room_id, []), target_name)
+        if mob:
+            description = mob.get('description', f"A {mob['name'].lower()}.")
+            health_status = ""
+
+            # Get current and max health (mobs use 'health' and 'max_health')
+            current_health = mob.get('health', mob.get('current_hit_points', 100))
+            max_health = mob.get('max_health', mob.get('max_hit_points', 100))
+
+            # Show health status if mob is damaged
+            if current_health < max_health:
+                health_percent = (current_health / max_health) * 100
+                if health_percent > 75:
+                    health_status = " It looks slightly wounded."
+                elif health_percent > 50:
+                    health_status = " It looks moderately wounded."
+                elif health_percent > 25:
+                    health_status = " It looks badly wounded."
+                else:
+                    health_status = " It looks near death."
+
+            await self.game_engine.connection_manager.send_message(player_id, f"You look at the {mob['name']}: {description}{health_status}")
+            return
 
         # Check for NPCs
         room = self.game_engine.world_manager.get_room(room_id)
         if room and room.npcs:
-            for npc in room.npcs:
-                if target_lower in npc.name.lower() or target_lower in npc.npc_id.lower():
-                    description = npc.description
-                    await self.game_engine.connection_manager.send_message(player_id, f"You look at {npc.name}: {description}")
-                    return
+            npc, _, _ = resolve(room.npcs, target_name, names=lambda npc: (npc.name, npc.npc_id))
+            if npc:
+                await self.game_engine.connection_manager.send_message(player_id, f"You look at {npc.name}: {npc.description}")
+                return
 
         # Check for vendors
-        vendors = self.game_engine.vendor_system.get_vendors_in_room(room_id)
-        for vendor in vendors:
-            if target_lower in vendor['name'].lower():
-                description = vendor.get('description', f"A merchant named {vendor['name']}.")
-                await self.game_engine.connection_manager.send_message(player_id, f"You look at {vendor['name']}: {description}")
-                return
+        vendor, _, _ = resolve(self.game_engine.vendor_system.get_vendors_in_room(room_id), target_name)
+        if vendor:
+            description = vendor.get('description', f"A merchant named {vendor['name']}.")
+            await self.game_engine.connection_manager.send_message(player_id, f"You look at {vendor['name']}: {description}")
+            return
 
         # Check player's inventory
-        inventory = character.get('inventory', [])
-        for item in inventory:
-            if target_lower in item['name'].lower():
-                description = item.get('description', f"A {item['name'].lower()}.")
-                await self.game_engine.connection_manager.send_message(player_id, f"You examine your {item['name']}: {description}")
-                return
+        item, _, _ = resolve(character.get('inventory', []), target_name)
+        if item:
+            description = item.get('description', f"A {item['name'].lower()}.")
+            await self.game_engine.connection_manager.send_message(player_id, f"You examine your {item['name']}: {description}")
+            return
 
         # Nothing found
         await self.game_engine.connection_manager.send_message(
@@ -180,8 +214,7 @@ class WorldCommandHandler(BaseCommandHandler):
             return
 
         # Check if room has special_actions defined
-        room_data = self.game_engine.world_manager.rooms_data.get(room_id, {})
-        special_actions = room_data.get('special_actions', {})
+        special_actions = self.game_engine.world_manager.rooms_data.get_field(room_id, 'special_actions', {})
 
         # Build the full action string
         action_key = f"{command} {params}".strip()
@@ -0,0 +1,210 @@
+"""Command registry: verbs, their metadata and the dispatch lookup.
+
+Each handler module declares its commands in register_commands(). A command
+is a canonical verb plus its aliases, the handler to call, how many words
+of arguments it needs, the player state it requires and a rate class. The
+registry resolves typed verbs through a dict of exact names and aliases,
+then through a prefix trie for unambiguous abbreviations ("inve" for
+inventory), and the same metadata drives help text, permission checks and
+per-verb timing stats.
+
+Handlers are called as handler(player_id, character, params). A command
+with a render function is offloadable: its handler returns a snapshot of
+the data it needs, and render(snapshot) builds the output off the event
+loop (see core.offload).
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Player states a command can require
+LOGGED_IN = 'logged_in'          # playing a character (every registered game command)
+NOT_IN_COMBAT = 'not_in_combat'  # not exhausted from combat
+ADMIN = 'admin'                  # allowed to use admin commands
+
+# Rate classes, for throttling and for grouping metrics
+RATE_FREE = 'free'      # read-only information (look, stats, help)
+RATE_NORMAL = 'normal'  # ordinary actions
+RATE_HEAVY = 'heavy'    # expensive or world-changing (reload, teleport)
+
+# Width of the command column in the help text
+HELP_COLUMN = 18
+
+CommandFunc = Callable[[int, dict, str], Awaitable[None]]
+
+
+class CommandSpec:
+    """One command and its metadata."""
+
+    __slots__ = ('name', 'handler', 'aliases', 'min_args', 'usage', 'requires',
+                 'rate_class', 'help', 'category', 'syntax', 'abbreviate', 'render', 'free_text')
+
+    def __init__(self, name: str, handler: CommandFunc, aliases: Iterable[str] = (),
+                 min_args: int = 0, usage: Optional[str] = None, requires: Iterable[str] = (),
+                 rate_class: str = RATE_NORMAL, help: str = '', category: str = 'General',
+                 syntax: Optional[str] = None, abbreviate: Optional[bool] = None,
+                 render: Optional[Callable[[Any], Optional[str]]] = None, free_text: bool = False):
+        """Initialize a command.
+
+        Args:
+            name: Canonical verb
+            handler: Coroutine function called as handler(player_id, character, params)
+            aliases: Other verbs for the command
+            min_args: Words of arguments the command needs
+            usage: Message sent when it is given fewer arguments
+            requires: States the player must be in besides LOGGED_IN (NOT_IN_COMBAT, ADMIN)
+            rate_class: RATE_FREE, RATE_NORMAL or RATE_HEAVY
+            help: One-line description for the help text ('' hides the command from help)
+            category: Help section
+            syntax: How the command is typed, for help (default: the name)
+            abbreviate: Whether prefixes of the name resolve to it (default: unless admin-only)
+            render: Module-level function turning the handler's snapshot into the text to send,
+                run off the event loop (the handler returns None when it has nothing to render)
+            free_text: The rest of the line is passed on whole, ';' included, instead of
+                being split into several commands
+        """
+        self.name = name
+        self.handler = handler
+        self.aliases = tuple(aliases)
+        self.min_args = min_args
+        self.usage = usage
+        self.requires = frozenset(requires) | {LOGGED_IN}
+        self.rate_class = rate_class
+        self.help = help
+        self.category = category
+        self.syntax = syntax or name
+        self.abbreviate = ADMIN not in self.requires if abbreviate is None else abbreviate
+        self.render = render
+        self.free_text = free_text
+
+
+class _TrieNode:
+    __slots__ = ('children', 'commands')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.commands: set = set()  # names of the commands with a verb under this node
+
+
+class CommandRegistry:
+    """Registered commands, looked up by verb, alias or abbreviation."""
+
+    def __init__(self, min_abbreviation: int = 3):
+        """Initialize an empty registry.
+
+        Args:
+            min_abbreviation: Shortest prefix that resolves as an abbreviation (0 disables them)
+        """
+        self.min_abbreviation = min_abbreviation
+        self.commands: Dict[str, CommandSpec] = {}  # canonical name -> spec, in registration order
+        self._verbs: Dict[str, CommandSpec] = {}    # name or alias -> spec
+        self._trie = _TrieNode()
+        # name -> [calls, total seconds, slowest seconds]
+        self.stats: Dict[str, List[float]] = {}
+
+    def add(self, name: str, handler: CommandFunc, **metadata) -> CommandSpec:
+        """Register a command (see CommandSpec for the metadata).
+
+        Raises:
+            ValueError: If the name or an alias is already registered
+        """
+        spec = CommandSpec(name, handler, **metadata)
+        for verb in (name,) + spec.aliases:
+            if verb in self._verbs:
+                raise ValueError(f"Command verb '{verb}' is already registered for '{self._verbs[verb].name}'")
+        self.commands[name] = spec
+        for verb in (name,) + spec.aliases:
+            self._verbs[verb] = spec
+        if spec.abbreviate:
+            node = self._trie
+            for char in name:
+                node = node.children.setdefault(char, _TrieNode())
+                node.commands.add(name)
+        return spec
+
+    def resolve(self, verb: str) -> Optional[CommandSpec]:
+        """Find the command for an exact verb or alias."""
+        return self._verbs.get(verb)
+
+    def resolve_abbreviation(self, verb: str) -> Optional[CommandSpec]:
+        """Find the only command whose name starts with a typed prefix.
+
+        Returns:
+            The command, or None if the prefix is too short, matches nothing or is ambiguous
+        """
+        if not self.min_abbreviation or len(verb) < self.min_abbreviation:
+            return None
+        node = self._trie
+        for char in verb:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        if len(node.commands) != 1:
+            return None
+        return self.commands[next(iter(node.commands))]
+
+    def record(self, spec: CommandSpec, seconds: float):
+        """Add a call's duration to the command's stats."""
+        entry = self.stats.get(spec.name)
+        if entry is None:
+            self.stats[spec.name] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-command call counts and timings, busiest first.
+
+        Returns:
+            name -> {calls, total_ms, avg_ms, max_ms, rate_class}
+        """
+        stats = {}
+        for name, (calls, total, slowest) in sorted(self.stats.items(), key=lambda item: -item[1][1]):
+            stats[name] = {
+                'calls': int(calls),
+                'total_ms': total * 1000,
+                'avg_ms': total * 1000 / calls,
+                'max_ms': slowest * 1000,
+                'rate_class': self.commands[name].rate_class,
+            }
+        return stats
+
+    def help_sections(self, states: Iterable[str] = (LOGGED_IN,)) -> List[Tuple[str, List[str]]]:
+        """Build the help text sections for a player.
+
+        Args:
+            states: States the player is in; commands needing others are left out
+                (except NOT_IN_COMBAT, which only matters when the command is used)
+
+        Returns:
+            (category, lines) in registration order of the categories
+        """
+        states = frozenset(states) | {NOT_IN_COMBAT}
+        sections: Dict[str, List[str]] = {}
+        for spec in self.commands.values():
+            if not spec.help or not spec.requires <= states:
+                continue
+            syntax, text = spec.syntax, spec.help
+            if spec.aliases:
+                # Aliases go next to the verb if they fit the column, else after the description
+                with_aliases = f"{syntax} ({','.join(spec.aliases)})"
+                if len(with_aliases) <= HELP_COLUMN:
+                    syntax = with_aliases
+                else:
+                    text = f"{text} ({', '.join(spec.aliases)})"
+            sections.setdefault(spec.category, []).append(f"{syntax:<{HELP_COLUMN}} - {text}")
+        return list(sections.items())
+
+    def describe(self, spec: CommandSpec) -> str:
+        """Describe one command for 'help <command>'."""
+        lines = [f"{spec.syntax} - {spec.help}" if spec.help else spec.syntax]
+        if spec.aliases:
+            lines.append(f"Aliases: {', '.join(spec.aliases)}")
+        if spec.abbreviate and self.min_abbreviation:
+            lines.append(f"May be abbreviated to {self.min_abbreviation} or more letters if unambiguous.")
+        if NOT_IN_COMBAT in spec.requires:
+            lines.append("Not usable while exhausted from combat.")
+        if ADMIN in spec.requires:
+            lines.append("Admin only.")
+        return "\n".join(lines)
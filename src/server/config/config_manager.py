@@ -2,10 +2,12 @@
 
 import os
 import yaml
-import json
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+from ..persistence.content_bundle import get_content_bundle
+from ..persistence.static_data import get_static_data, reload_static_data
+
 
 class ConfigManager:
     """Manages loading and caching of configuration data."""
@@ -35,32 +37,30 @@ class ConfigManager:
     def load_items(self) -> Dict[str, Any]:
         """Load items configuration from JSON files (by type)."""
         if self._items_cache is None:
+            content = get_content_bundle()
             items_dir = Path("data/items")
             all_items = {}
 
             # Load items from type-specific JSON files
-            if items_dir.exists():
-                for item_file in items_dir.glob("*.json"):
-                    # Skip items.json if it exists (legacy file)
-                    if item_file.name == "items.json":
-                        continue
-
-                    try:
-                        with open(item_file, 'r', encoding='utf-8') as f:
-                            config = json.load(f)
-                            type_items = config.get('items', {})
-                            all_items.update(type_items)
-                    except Exception as e:
-                        print(f"Warning: Could not load items from {item_file}: {e}")
+            for item_file in content.list_json_files(items_dir):
+                # Skip items.json if it exists (legacy file)
+                if os.path.basename(item_file) == "items.json":
+                    continue
+
+                try:
+                    config = content.get_json(item_file)
+                    type_items = config.get('items', {})
+                    all_items.update(type_items)
+                except Exception as e:
+                    print(f"Warning: Could not load items from {item_file}: {e}")
 
             # Fallback to legacy items.json if no type files found
             if not all_items:
                 items_file_json = Path("data/items/items.json")
                 items_file_yaml = self.config_dir / "items.yaml"
 
-                if items_file_json.exists():
-                    with open(items_file_json, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
+                if content.exists(items_file_json):
+                    config = content.get_json(items_file_json)
                     all_items = config.get('items', {})
                 elif items_file_yaml.exists():
                     with open(items_file_yaml, 'r', encoding='utf-8') as f:
@@ -196,62 +196,65 @@ class ConfigManager:
         buy_rate = vendor.get('buy_rate', 0.5)
         return int(item_value * buy_rate)
 
+    def reload_items(self) -> Dict[str, Any]:
+        """Re-read the item definitions (for hot reloads of game content).
+
+        Returns:
+            The new item definitions
+        """
+        self._items_cache = None
+        return self.load_items()
+
+    def reload_game_data(self):
+        """Re-read races, classes and spells (for hot reloads of game content)."""
+        self._load_game_data(reload=True)
+
     def reload_config(self):
         """Clear cache and force reload of configuration files."""
         self._items_cache = None
         self._vendors_cache = None
         self._vendors_by_location = None
-        self._load_game_data()
+        self._load_game_data(reload=True)
+
+    def _load_game_data(self, reload: bool = False):
+        """Load game data files (races, classes, spells).
 
-    def _load_game_data(self):
-        """Load game data files (races, classes, spells)."""
+        Args:
+            reload: Re-read races and classes too, instead of using the loaded static data
+        """
         project_root = Path(__file__).parent.parent.parent.parent
         data_dir = project_root / "data"
-        player_dir = data_dir / "player"
-
-        # Load races (try new location first, then fall back to old)
-        races_file = player_dir / "races.json"
-        if not races_file.exists():
-            races_file = data_dir / "races.json"
-        if races_file.exists():
-            with open(races_file, 'r', encoding='utf-8') as f:
-                self.game_data['races'] = json.load(f)
-
-        # Load classes (try new location first, then fall back to old)
-        classes_file = player_dir / "classes.json"
-        if not classes_file.exists():
-            classes_file = data_dir / "classes.json"
-        if classes_file.exists():
-            with open(classes_file, 'r', encoding='utf-8') as f:
-                self.game_data['classes'] = json.load(f)
+        content = get_content_bundle()
+
+        # Races and classes come from the shared static data
+        static_data = reload_static_data() if reload else get_static_data()
+        self.game_data['races'] = static_data.races
+        self.game_data['classes'] = static_data.classes
 
         # Load spells from school-specific JSON files
         spells_dir = data_dir / "spells"
         all_spells = {}
 
         # Load spells from school-specific files
-        if spells_dir.exists():
-            for spell_file in spells_dir.glob("*.json"):
-                # Skip backup and legacy files
-                if spell_file.name in ['spells.json', 'spells.json.backup']:
-                    continue
-
-                try:
-                    with open(spell_file, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                        school_spells = config.get('spells', {})
-                        all_spells.update(school_spells)
-                except Exception as e:
-                    print(f"Warning: Could not load spells from {spell_file}: {e}")
+        for spell_file in content.list_json_files(spells_dir):
+            # Skip backup and legacy files
+            if os.path.basename(spell_file) in ['spells.json', 'spells.json.backup']:
+                continue
+
+            try:
+                config = content.get_json(spell_file)
+                school_spells = config.get('spells', {})
+                all_spells.update(school_spells)
+            except Exception as e:
+                print(f"Warning: Could not load spells from {spell_file}: {e}")
 
         # Fallback to legacy spells.json if no school files found
         if not all_spells:
             legacy_file = spells_dir / "spells.json"
-            if not legacy_file.exists():
+            if not content.exists(legacy_file):
                 legacy_file = data_dir / "spells.json"
-            if legacy_file.exists():
-                with open(legacy_file, 'r', encoding='utf-8') as f:
-                    all_spells = json.load(f)
+            if content.exists(legacy_file):
+                all_spells = content.get_json(legacy_file)
 
         self.game_data['spells'] = all_spells
 
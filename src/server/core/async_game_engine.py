@@ -1,16 +1,20 @@
 """Async game engine that coordinates all game systems."""
 
 import asyncio
+import logging
 import random
 import time
-import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 
 from ..networking.async_connection_manager import AsyncConnectionManager
 from ..game.world.world_manager import WorldManager
 from ..game.world.barrier_system import BarrierSystem
-from .event_system import EventSystem
+from .event_bus import EventBus
+from .events import MobKilled, PlayerConnected, PlayerDisconnected
+from .content_reloader import ContentReloader
+from .timeslice import TimeSlicer
+from .offload import Offloader
 from ..commands.command_handler import CommandHandler
 from ..game.vendors.vendor_system import VendorSystem
 from ..game.combat.combat_system import CombatSystem
@@ -18,6 +22,9 @@ from ..game.items.item_manager import ItemManager
 from ..game.player.player_manager import PlayerManager
 from ..persistence.database import Database
 from ..persistence.player_storage import PlayerStorage
+from ..persistence.snapshot import SnapshotManager
+from ..persistence.content_bundle import get_content_bundle
+from ..persistence.static_data import get_static_data, reload_static_data, to_mutable
 from ..config.config_manager import ConfigManager
 from ..utils.logger import get_logger
 from ..game.npcs.mob import Mob
@@ -34,14 +41,36 @@ class AsyncGameEngine:
     def __init__(self):
         """Initialize the game engine."""
         self.logger = get_logger()
+        self.spawn_logger = get_logger('spawns')
         self.running = False
         self.tick_rate = GAME_TICK_RATE
+        self.startup_began = time.time()
+        self.startup_timings: Dict[str, float] = {}  # Startup stage -> seconds
+
+        # Compiled game content; loaded (or rebuilt if data/ changed) before any system reads it
+        t0 = time.time()
+        self.content_bundle = get_content_bundle()
+        self.content_bundle.load()
+        # Races, classes, weapons and armor, shared read-only by every command
+        reload_static_data()
+        self.startup_timings['content'] = time.time() - t0
+        t0 = time.time()
 
         # Core systems
-        self.event_system = EventSystem()
+        self.event_bus = EventBus(max_queue=1000)
         self.connection_manager = AsyncConnectionManager()
         self.world_manager = WorldManager(self)
         self.config_manager = ConfigManager()
+        # Long loops yield to the event loop through this, and give way to player commands
+        self.timeslicer = TimeSlicer(
+            slice_ms=self.config_manager.get_setting('performance', 'slice_ms', default=20),
+            max_deferrals=self.config_manager.get_setting('performance', 'max_deferrals', default=50)
+        )
+        # Pool that offloadable commands render their output on
+        self.offloader = Offloader(
+            mode=self.config_manager.get_setting('performance', 'offload', default='thread'),
+            workers=self.config_manager.get_setting('performance', 'offload_workers', default=2)
+        )
         self.barrier_system = BarrierSystem(self.world_manager, self.connection_manager)
         self.barrier_system.game_engine = self  # Set game_engine reference for room notifications
         self.command_handler = CommandHandler(self)
@@ -52,11 +81,16 @@ class AsyncGameEngine:
         self.quest_manager = QuestManager(self)
         self.trap_system = TrapSystem(self)
         self.ability_system = ClassAbilitySystem(self)
+        self.content_reloader = ContentReloader(self)
 
         # Database and persistence
         self.database: Optional[Database] = None
         self.player_storage: Optional[PlayerStorage] = None
 
+        # Snapshots let auto-save serialize characters off the game loop
+        self.snapshot_manager = SnapshotManager()
+        self.persistence_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persistence")
+        self._pending_save: Optional[asyncio.Future] = None
 
         # Cached game data (loaded once at initialization)
         self.monsters_data: Dict[str, Any] = {}  # Cached monster definitions
@@ -92,24 +126,30 @@ class AsyncGameEngine:
         self.perf_report_interval = 60.0  # Report every 1 minute
         self.tick_count = 0
         self.slow_tick_count = 0
+        self.kill_count = 0  # mobs killed since the last report (counted off the event bus)
 
         # Health check server for Kubernetes probes
         self.health_server = HealthServer(self)
 
         # Setup system connections
         self._setup_connections()
+        self.startup_timings['systems'] = time.time() - t0
 
     def _setup_connections(self):
         """Setup connections between systems."""
         # Connect connection manager to game events
         self.connection_manager.on_player_connect = self.player_manager.handle_player_connect
         self.connection_manager.on_player_disconnect = self.player_manager.handle_player_disconnect
+        self.connection_manager.on_player_quit = self.player_manager.mark_player_quitting
         self.connection_manager.on_player_command = self.command_handler.handle_player_command
+        self.connection_manager.on_command_received = self.timeslicer.command_queued
 
         # Subscribe to events
-        self.event_system.subscribe('player_connected', self.player_manager.on_player_connected)
-        self.event_system.subscribe('player_disconnected', self.player_manager.on_player_disconnected)
-        self.event_system.subscribe('player_command', self.player_manager.on_player_command)
+        self.event_bus.subscribe(PlayerConnected, self.player_manager.on_player_connected)
+        self.event_bus.subscribe(PlayerDisconnected, self.player_manager.on_player_disconnected)
+        # Quest progress is saved with the character, so no kill may be dropped
+        self.event_bus.subscribe(MobKilled, self.quest_manager.on_mob_killed, max_queue=0)
+        self.event_bus.subscribe(MobKilled, self._count_kills, batched=True)
 
     def _load_all_monsters(self) -> Dict[str, Any]:
         """Load all monsters from type-specific JSON files.
@@ -117,41 +157,25 @@ class AsyncGameEngine:
         Returns:
             Dictionary mapping monster IDs to monster data
         """
-        from pathlib import Path
-
-        monsters = {}
-        mobs_dir = Path("data/mobs")
-
-        # Load monsters from type-specific files
-        if mobs_dir.exists():
-            for monster_file in mobs_dir.glob("*.json"):
-                try:
-                    with open(monster_file, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                        type_monsters = config.get('monsters', [])
-                        for monster in type_monsters:
-                            monsters[monster['id']] = monster
-                except Exception as e:
-                    self.logger.error(f"Failed to load monsters from {monster_file}: {e}")
-
-        # Fallback to legacy monsters.json if no type files found
-        if not monsters:
-            legacy_file = Path("data/npcs/monsters.json")
-            if legacy_file.exists():
-                try:
-                    with open(legacy_file, 'r', encoding='utf-8') as f:
-                        monsters_data = json.load(f)
-                        monsters = {m['id']: m for m in monsters_data}
-                except Exception as e:
-                    self.logger.error(f"Failed to load monsters from {legacy_file}: {e}")
-
-        return monsters
+        return self.world_manager.world_loader.load_monsters()
 
     def initialize_database(self, database: Database):
         """Initialize database connection."""
         self.database = database
-        self.player_storage = PlayerStorage(database)
-        self.logger.info("Database initialized")
+
+        # Journal mode appends small deltas, so saves can run much more often
+        journal_mode = self.config_manager.get_setting('persistence', 'journal_mode', default=False)
+        self.player_storage = PlayerStorage(
+            database,
+            journal_mode=journal_mode,
+            compaction_interval=self.config_manager.get_setting('persistence', 'compaction_interval', default=300),
+            compaction_max_entries=self.config_manager.get_setting('persistence', 'compaction_max_entries', default=200)
+        )
+        if journal_mode:
+            self.auto_save_interval = float(self.config_manager.get_setting('persistence', 'journal_save_interval', default=5))
+        else:
+            self.auto_save_interval = float(self.config_manager.get_setting('persistence', 'auto_save_interval', default=60))
+        self.logger.info(f"Database initialized (journal_mode={journal_mode}, save_interval={self.auto_save_interval:.0f}s)")
 
     async def start(self, host: str = "localhost", port: int = 4000):
         """Start the async game engine."""
@@ -164,21 +188,30 @@ class AsyncGameEngine:
 
         try:
             # Initialize world
+            t0 = time.time()
             self.world_manager.load_world()
+            self.startup_timings['world'] = time.time() - t0
 
             # Load monsters data once (cached for later use)
             self.logger.info("Loading world data...")
+            t0 = time.time()
             self.monsters_data = self._load_all_monsters()
+            self.startup_timings['monsters'] = time.time() - t0
             self.logger.info(f"Loaded {len(self.monsters_data)} monster definitions")
 
             # Initialize lair spawns
+            t0 = time.time()
             self._initialize_lairs()
+            self.startup_timings['lairs'] = time.time() - t0
 
             # Load vendor and item data
+            t0 = time.time()
             self.vendor_system.load_vendors_and_items()
+            self.startup_timings['vendors'] = time.time() - t0
 
-            # Start connection manager
-            self.connection_manager.initialize(host, port, self.event_system)
+            # Start connection manager (optionally with the telnet server on its own thread)
+            network_thread = self.config_manager.get_setting('performance', 'network_thread', default=False)
+            self.connection_manager.initialize(host, port, self.event_bus, network_thread=network_thread)
 
             # Start background tasks
             self.game_loop_task = asyncio.create_task(self._game_loop())
@@ -189,6 +222,13 @@ class AsyncGameEngine:
             # Log initial performance monitoring status
             self.logger.info("[PERFORMANCE] Monitoring enabled: slow_tick_threshold=100ms, report_interval=1min")
 
+            content_stats = self.content_bundle.stats
+            content_source = (f"content {content_stats['origin']} in {content_stats['load_time']:.3f}s"
+                              if content_stats else "content read from files")
+            self.logger.info(f"[STARTUP] Server ready in {time.time() - self.startup_began:.2f}s ({content_source})")
+            self.logger.info("[STARTUP] Stage timings: " +
+                             ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in self.startup_timings.items()))
+
             # Start the server (this will run until stopped)
             await self.connection_manager.start_server(host, port)
 
@@ -207,11 +247,24 @@ class AsyncGameEngine:
         self.logger.info("Stopping async game engine")
         self.running = False
 
+        # Let an in-flight auto-save finish before the final synchronous save
+        if self._pending_save and not self._pending_save.done():
+            try:
+                await self._pending_save
+            except Exception as e:
+                self.logger.error(f"Error in pending auto-save during shutdown: {e}")
+
+        # Finish the deferred logouts of link-dead sessions
+        try:
+            await self.player_manager.expire_link_dead_sessions(force=True)
+        except Exception as e:
+            self.logger.error(f"Error ending link-dead sessions during shutdown: {e}")
+
         # Save all player data FIRST (before canceling anything)
         try:
             if self.database and self.database.connection:
                 self.logger.info("Saving all players before shutdown...")
-                self.player_manager.save_all_players()
+                await self.player_manager.save_all_players_async(self.timeslicer)
                 self.logger.info("All players saved")
         except Exception as e:
             self.logger.error(f"Error saving players during shutdown: {e}")
@@ -233,6 +286,10 @@ class AsyncGameEngine:
         # Give a moment for any pending disconnect saves to complete
         await asyncio.sleep(0.1)
 
+        self.persistence_executor.shutdown(wait=True)
+        self.offloader.shutdown()
+        self.player_manager.auth_executor.shutdown(wait=True)
+
         # Disconnect database LAST (after all saves are complete)
         if self.database:
             try:
@@ -265,6 +322,7 @@ class AsyncGameEngine:
         """Process one async game tick."""
         tick_start = time.time()
         timings = {}
+        self.timeslicer.begin()
 
         try:
             # Update world
@@ -340,6 +398,21 @@ class AsyncGameEngine:
             await self.vendor_system.replenish_vendor_stock()
             timings['vendor_stock'] = time.time() - t0
 
+            # End link-dead sessions whose reconnect grace period ran out
+            t0 = time.time()
+            await self.player_manager.expire_link_dead_sessions()
+            timings['link_dead'] = time.time() - t0
+
+            # Hot-reload content files that changed on disk (if the watcher is enabled)
+            t0 = time.time()
+            self.content_reloader.check_for_changes()
+            timings['content_watch'] = time.time() - t0
+
+            # Deliver this tick's events to batched subscribers
+            t0 = time.time()
+            await self.event_bus.flush()
+            timings['events'] = time.time() - t0
+
             # Auto-save check
             current_time = time.time()
             if current_time - self.last_auto_save >= self.auto_save_interval:
@@ -375,6 +448,7 @@ class AsyncGameEngine:
                 import asyncio
                 all_tasks = asyncio.all_tasks()
                 task_count = len(all_tasks)
+                slices = self.timeslicer.stats(reset=True)
 
                 self.logger.info(
                     f"[PERFORMANCE] 1min report: {self.tick_count} ticks, {self.slow_tick_count} slow "
@@ -382,15 +456,22 @@ class AsyncGameEngine:
                     f"players={active_players}, mobs={total_mobs} (wandering={wandering_mobs}), "
                     f"combats={active_combats}, fatigue_entries={len(self.mob_fatigue)}, "
                     f"room_mobs_tracked={len(self.room_mobs)}, "
-                    f"asyncio_tasks={task_count}"
+                    f"asyncio_tasks={task_count}, yields={slices['yields']} "
+                    f"(deferred to commands {slices['deferrals']}x), kills={self.kill_count}, "
+                    f"events_dropped={sum(self.event_bus.stats()['dropped'].values())}"
                 )
                 self.last_perf_report = current_time
                 self.tick_count = 0
                 self.slow_tick_count = 0
+                self.kill_count = 0
 
         except Exception as e:
             self.logger.error(f"Error in game tick: {e}")
 
+    def _count_kills(self, events):
+        """Count this tick's mob kills for the performance report."""
+        self.kill_count += len(events)
+
     async def _update_npcs(self):
         """Update all NPCs asynchronously."""
         await self.combat_system.process_mob_ai()
@@ -408,6 +489,10 @@ class AsyncGameEngine:
             if not character:
                 continue
 
+            # Only a character whose vitals change below needs saving
+            before = (character.get('current_hit_points'), character.get('current_mana'),
+                      character.get('hunger'), character.get('thirst'))
+
             # Get stats
             constitution = character.get('constitution', 10)
             intellect = character.get('intellect', 10)
@@ -524,9 +609,14 @@ class AsyncGameEngine:
                 new_mana = min(current_mana + mana_regen, max_mana)
                 character['current_mana'] = new_mana
 
+            after = (character.get('current_hit_points'), character.get('current_mana'),
+                     character.get('hunger'), character.get('thirst'))
+            if after != before:
+                self.snapshot_manager.mark_dirty(player_id)
+
     async def _regenerate_mobs(self):
         """Regenerate health and mana for all mobs."""
-        for room_id, mobs in self.room_mobs.items():
+        async for room_id, mobs in self.timeslicer.iterate(self.room_mobs.items()):
             for mob in mobs:
                 if not isinstance(mob, dict):
                     continue
@@ -906,21 +996,38 @@ class AsyncGameEngine:
             character['constitution'] = character.get('constitution', 10) + amount
 
     async def _auto_save_players(self):
-        """Auto-save all connected players with characters."""
+        """Auto-save all connected players with characters.
+
+        Snapshots of the dirty characters are taken here, at the tick boundary,
+        and written by the persistence worker so the tick never waits on JSON
+        encoding or disk I/O.
+        """
         try:
-            saved_count = 0
-            for player_id, player_data in self.player_manager.connected_players.items():
-                if player_data.get('character') and player_data.get('authenticated'):
-                    self.player_manager.save_player_character(player_id, player_data['character'])
-                    saved_count += 1
+            if self._pending_save and not self._pending_save.done():
+                self.logger.warning("Previous auto-save still running, skipping this cycle")
+                return
+
+            snapshots = self.snapshot_manager.capture_dirty(self.player_manager.connected_players)
+            if not snapshots:
+                return
 
+            loop = asyncio.get_running_loop()
+            self._pending_save = loop.run_in_executor(
+                self.persistence_executor, self.player_manager.persist_snapshots, snapshots
+            )
+            self._pending_save.add_done_callback(self._on_auto_save_done)
+        except Exception as e:
+            self.logger.error(f"Error during auto-save: {e}")
+
+    def _on_auto_save_done(self, future: asyncio.Future):
+        """Log the outcome of a background auto-save."""
+        try:
+            saved_count = future.result()
             if saved_count > 0:
                 self.logger.info(f"Auto-saved {saved_count} player(s)")
         except Exception as e:
             self.logger.error(f"Error during auto-save: {e}")
 
-
-
     async def _move_player(self, player_id: int, direction: str):
         """Move a player in a direction - delegates to player_manager."""
         await self.player_manager.move_player(player_id, direction)
@@ -1155,9 +1262,9 @@ class AsyncGameEngine:
                     # Single placeholder, just weapon
                     spawned_mob['description'] = spawned_mob['description'].format(weapon_desc)
 
-        # Build log message
-        log_extras = ", ".join(f"{k}={v}" for k, v in kwargs.items()) if kwargs else "no flags"
-        self.logger.info(f"[MOB_SPAWN] Spawned {mob_name} (level {level}) in {room_id} ({log_extras})")
+        if self.spawn_logger.is_enabled(logging.DEBUG):
+            log_extras = ", ".join(f"{k}={v}" for k, v in kwargs.items()) if kwargs else "no flags"
+            self.spawn_logger.debug("[MOB_SPAWN] Spawned %s (level %s) in %s (%s)", mob_name, level, room_id, log_extras)
 
         return spawned_mob
 
@@ -1206,40 +1313,6 @@ class AsyncGameEngine:
 
         return stats
 
-    def _load_item_definitions(self):
-        """Load weapon and armor definitions from JSON files."""
-        if hasattr(self, '_weapons_cache') and hasattr(self, '_armor_cache'):
-            return self._weapons_cache, self._armor_cache
-
-        weapons = {}
-        armor = {}
-
-        # Load weapons
-        weapon_file = Path('data/items/weapon.json')
-        if weapon_file.exists():
-            try:
-                with open(weapon_file, 'r', encoding='utf-8') as f:
-                    weapon_data = json.load(f)
-                    weapons = weapon_data.get('items', {})
-            except Exception as e:
-                self.logger.error(f"Error loading weapon data: {e}")
-
-        # Load armor
-        armor_file = Path('data/items/armor.json')
-        if armor_file.exists():
-            try:
-                with open(armor_file, 'r', encoding='utf-8') as f:
-                    armor_data = json.load(f)
-                    armor = armor_data.get('items', {})
-            except Exception as e:
-                self.logger.error(f"Error loading armor data: {e}")
-
-        # Cache for future use
-        self._weapons_cache = weapons
-        self._armor_cache = armor
-
-        return weapons, armor
-
     def _equip_humanoid_mob(self, spawned_mob: dict, monster_data: dict):
         """Equip a humanoid mob with appropriate weapons and armor."""
         mob_level = spawned_mob.get('level', 1)
@@ -1248,8 +1321,9 @@ class AsyncGameEngine:
         # Get mob's class from data (with fallback to fighter)
         mob_class = monster_data.get('class', 'fighter')
 
-        # Load item definitions
-        weapons, armor = self._load_item_definitions()
+        # Weapon and armor definitions (shared, read-only)
+        static_data = get_static_data()
+        weapons, armor = static_data.weapons, static_data.armor
 
         # Filter weapons by level and class
         eligible_weapons = []
@@ -1304,7 +1378,7 @@ class AsyncGameEngine:
                 'weight': weapon_data.get('weight', 1),
                 'base_value': weapon_data.get('base_value', 0),
                 'description': weapon_data.get('description', ''),
-                'properties': weapon_data.get('properties', {})
+                'properties': to_mutable(weapon_data.get('properties', {}))
             }
             # Update mob's damage from weapon
             damage = weapon_data['properties'].get('damage', '1d4')
@@ -1321,7 +1395,7 @@ class AsyncGameEngine:
                 'weight': armor_data.get('weight', 1),
                 'base_value': armor_data.get('base_value', 0),
                 'description': armor_data.get('description', ''),
-                'properties': armor_data.get('properties', {})
+                'properties': to_mutable(armor_data.get('properties', {}))
             }
             # Update mob's armor class from armor
             armor_class = armor_data['properties'].get('armor_class', 0)
@@ -1346,7 +1420,7 @@ class AsyncGameEngine:
             return
 
         # Check each lair room
-        for room_id, room in self.world_manager.rooms.items():
+        async for room_id, room in self.timeslicer.iterate(self.world_manager.rooms.items(), every=64):
             # Support old format: is_lair + lair_monster
             if hasattr(room, 'is_lair') and room.is_lair:
                 lair_monster_id = getattr(room, 'lair_monster', None)
@@ -1441,6 +1515,7 @@ class AsyncGameEngine:
                 continue
 
             await self._check_area_spawn(area_id, config, current_time)
+            await self.timeslicer.checkpoint()
 
     async def _check_area_spawn(self, area_id: str, config: dict, current_time: float):
         """Check and spawn wandering mobs for a specific area."""
@@ -1448,7 +1523,7 @@ class AsyncGameEngine:
 
         # Count current wandering mobs in this area
         wandering_count = 0
-        for room_id, room_mobs in self.room_mobs.items():
+        async for room_id, room_mobs in self.timeslicer.iterate(self.room_mobs.items(), every=64):
             room = self.world_manager.get_room(room_id)
             if room and hasattr(room, 'area_id') and room.area_id == area_id:
                 for mob in room_mobs:
@@ -1497,7 +1572,7 @@ class AsyncGameEngine:
 
         # Get all rooms for this area
         area_rooms = []
-        for room_id, room in self.world_manager.rooms.items():
+        async for room_id, room in self.timeslicer.iterate(self.world_manager.rooms.items(), every=64):
             if hasattr(room, 'area_id') and room.area_id == area_id:
                 area_rooms.append(room_id)
 
@@ -1542,7 +1617,7 @@ class AsyncGameEngine:
 
 
         # Iterate through all rooms
-        for room_id in list(self.room_mobs.keys()):
+        async for room_id in self.timeslicer.iterate(self.room_mobs.keys()):
             if room_id not in self.room_mobs:
                 continue
 
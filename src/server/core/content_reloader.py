@@ -0,0 +1,187 @@
+"""Hot reload of game content.
+
+Reloading a mob, item, spell or room definition used to need a restart,
+which disconnects everybody and respawns every lair. The ContentReloader
+refreshes the content bundle (which re-parses only the files that changed),
+then swaps the new definitions into the affected registries and updates
+their dependent indexes (world graph, vendor room map) in place.
+
+Reloads run from the admin 'reload' command, or from the game loop when
+content.watch_interval is set and the content files changed on disk.
+"""
+
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..game.magic.spell_system import SpellType
+from ..game.traps.trap_system import TrapType
+from ..persistence.static_data import reload_static_data
+from ..utils.logger import get_logger
+
+
+class ContentReloader:
+    """Reloads changed content files into a running game engine."""
+
+    # Domain -> data-relative path prefixes of the files it is loaded from
+    DOMAINS = {
+        'monsters': ('mobs/', 'npcs/monsters.json'),
+        'items': ('items/',),
+        'vendors': ('npcs/',),
+        'spells': ('spells/', 'player/'),
+        'traps': ('traps/',),
+        'rooms': ('world/rooms/',),
+    }
+
+    def __init__(self, game_engine):
+        """Initialize the reloader.
+
+        Args:
+            game_engine: The running AsyncGameEngine
+        """
+        self.game_engine = game_engine
+        self.content = game_engine.content_bundle
+        self.logger = get_logger()
+
+        # Changed files not yet reloaded, e.g. rooms edited while only items were reloaded
+        self._pending: Set[str] = set()
+
+        self.watch_interval = float(game_engine.config_manager.get_setting('content', 'watch_interval', default=0))
+        self.last_watch_check = time.time()
+
+    def reload(self, domains: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+        """Reload the domains whose content files changed.
+
+        Args:
+            domains: Domains to reload (default: all). Changes to other
+                domains are remembered and applied when those are reloaded.
+
+        Returns:
+            Domain -> counts of added, changed and removed definitions, for
+            each domain that had changed files
+
+        Raises:
+            ValueError: If a domain name is unknown
+        """
+        domains = list(self.DOMAINS) if domains is None else list(domains)
+        unknown = [domain for domain in domains if domain not in self.DOMAINS]
+        if unknown:
+            raise ValueError(f"Unknown content domain: {', '.join(unknown)}")
+
+        self._pending.update(self.content.refresh())
+
+        results = {}
+        for domain in domains:
+            files = [relpath for relpath in self._pending if self._in_domain(domain, relpath)]
+            if not files:
+                continue
+            start = time.time()
+            results[domain] = getattr(self, f'_reload_{domain}')(files)
+            self._pending.difference_update(files)
+            self.logger.info(f"[RELOAD] {domain}: {self._format_counts(results[domain])} "
+                             f"from {len(files)} files in {time.time() - start:.3f}s")
+        return results
+
+    def check_for_changes(self) -> Dict[str, Dict[str, int]]:
+        """Reload everything if the content files changed (polled from the game loop).
+
+        Only stats the files unless something changed. Does nothing when the
+        watcher is disabled or the poll interval has not elapsed.
+        """
+        if self.watch_interval <= 0 or time.time() - self.last_watch_check < self.watch_interval:
+            return {}
+        self.last_watch_check = time.time()
+        if not self._pending and not self.content.changed_sources():
+            return {}
+        return self.reload()
+
+    def _in_domain(self, domain: str, relpath: str) -> bool:
+        """Check if a content file belongs to a domain."""
+        return any(relpath.startswith(prefix) for prefix in self.DOMAINS[domain])
+
+    def _reload_monsters(self, files: List[str]) -> Dict[str, int]:
+        """Swap in new monster definitions; mobs already spawned keep their stats."""
+        engine = self.game_engine
+        monsters = engine._load_all_monsters()
+        counts = self._diff(engine.monsters_data, monsters)
+        engine.monsters_data = monsters
+        return self._counts(counts)
+
+    def _reload_items(self, files: List[str]) -> Dict[str, int]:
+        """Swap in new item definitions for vendors, commands and room placement."""
+        engine = self.game_engine
+        old_items = engine.vendor_system.items_data
+        items = engine.config_manager.reload_items()
+        reload_static_data()  # weapons and armor for mob equipment
+        engine.vendor_system.items_data = items
+        engine.world_manager.items = engine.world_manager.world_loader.load_items()
+        return self._counts(self._diff(old_items, items))
+
+    def _reload_vendors(self, files: List[str]) -> Dict[str, int]:
+        """Swap in new NPC definitions and rebuild the vendors and room NPCs that changed."""
+        engine = self.game_engine
+        world_manager = engine.world_manager
+        npcs = world_manager.world_loader.load_npcs()
+        added, changed, removed = self._diff(world_manager.npcs, npcs)
+        changed_ids = added | changed | removed
+
+        world_manager.update_npc_definitions(npcs, changed_ids)
+        engine.vendor_system.reload_vendors(changed_ids)
+        return self._counts((added, changed, removed))
+
+    def _reload_spells(self, files: List[str]) -> Dict[str, int]:
+        """Re-read player spells, races and classes, and mob spells."""
+        config_manager = self.game_engine.config_manager
+        old_spells = config_manager.game_data.get('spells', {})
+        config_manager.reload_game_data()
+        SpellType.reload()
+        return self._counts(self._diff(old_spells, config_manager.game_data.get('spells', {})))
+
+    def _reload_traps(self, files: List[str]) -> Dict[str, int]:
+        """Re-read trap definitions; armed and disarmed trap states are kept."""
+        old_traps = TrapType.get_all_traps()
+        TrapType.reload()
+        return self._counts(self._diff(old_traps, TrapType.get_all_traps()))
+
+    def _reload_rooms(self, files: List[str]) -> Dict[str, int]:
+        """Apply changed room files to the loaded world and its indexes."""
+        engine = self.game_engine
+        world_manager = engine.world_manager
+        rooms_data = world_manager.world_loader.load_rooms()
+
+        # Rooms are keyed by the 'id' inside the file; rooms whose file was
+        # removed (or whose id changed) show up as missing from the new data
+        changed_ids = set()
+        for relpath in files:
+            path = os.path.join(self.content.data_dir, relpath)
+            if self.content.exists(path):
+                try:
+                    changed_ids.add(self.content.get_json(path).get('id', os.path.basename(relpath)[:-5]))
+                except Exception as e:
+                    self.logger.error(f"[RELOAD] Could not read room file {relpath}: {e}")
+        changed_ids.update(room_id for room_id in world_manager.rooms_data if room_id not in rooms_data)
+
+        counts = world_manager.apply_room_changes(rooms_data, changed_ids, self.content.source_hash)
+
+        engine.vendor_system.update_vendor_locations(changed_ids)
+        for room_id in changed_ids:
+            # Trap layouts may have changed; states are rebuilt on next entry
+            engine.trap_system.room_trap_states.pop(room_id, None)
+        return counts
+
+    @staticmethod
+    def _diff(old: Dict[str, Any], new: Dict[str, Any]) -> Tuple[Set[str], Set[str], Set[str]]:
+        """Compare two registries: (added, changed, removed) keys."""
+        added = set(new) - set(old)
+        removed = set(old) - set(new)
+        changed = {key for key in new if key in old and old[key] != new[key]}
+        return added, changed, removed
+
+    @staticmethod
+    def _counts(diff: Tuple[Set[str], Set[str], Set[str]]) -> Dict[str, int]:
+        added, changed, removed = diff
+        return {'added': len(added), 'changed': len(changed), 'removed': len(removed)}
+
+    @staticmethod
+    def _format_counts(counts: Dict[str, int]) -> str:
+        return f"{counts['added']} added, {counts['changed']} changed, {counts['removed']} removed"
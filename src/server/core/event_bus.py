@@ -0,0 +1,174 @@
+"""Typed, asynchronous event bus.
+
+Publishers post event objects (see core.events), and the event's class is
+the topic. publish() never runs a subscriber itself: the event is appended
+to each subscriber's queue and delivered later on the event loop, so a slow
+subscriber can't stall combat or the network code that published it.
+
+- Subscribers may be plain functions or coroutine functions.
+- Immediate subscribers get each event on the next turn of the event loop.
+- Batched subscribers (batched=True) get a list of the events once per
+  tick, when the engine calls flush() at the end of the tick.
+- Each subscriber's queue is bounded. When one is full, the oldest event is
+  dropped and counted, so a subscriber that falls behind loses old events
+  instead of holding memory or blocking publishers. Subscribers that must
+  see every event (bookkeeping saved with the character, like quest
+  progress) subscribe with max_queue=0 for an unbounded queue.
+- Publishing a topic nobody subscribes to costs a dict lookup. Publishers on
+  hot paths check wants() first and don't even build the event:
+
+    if bus.wants(PlayerCommand):
+        bus.publish(PlayerCommand(player_id, command, params, time.time()))
+"""
+
+import asyncio
+import inspect
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..utils.logger import get_logger
+
+
+class Subscription:
+    """One subscriber to one topic, with its queue of undelivered events."""
+
+    __slots__ = ('handler', 'batched', 'max_queue', 'is_async', 'queue', 'dropped')
+
+    def __init__(self, handler: Callable, batched: bool, max_queue: int):
+        self.handler = handler
+        self.batched = batched
+        self.max_queue = max_queue
+        self.is_async = inspect.iscoroutinefunction(handler)
+        self.queue: deque = deque()
+        self.dropped = 0
+
+
+class EventBus:
+    """Delivers typed events from publishers to queued subscribers."""
+
+    def __init__(self, max_queue: int = 1000):
+        """Initialize the bus.
+
+        Args:
+            max_queue: Most undelivered events a subscriber may have before old ones are dropped
+        """
+        self.max_queue = max_queue
+        self.logger = get_logger('events')
+        self._subscriptions: Dict[type, List[Subscription]] = {}
+        self._drain_scheduled = False
+        self._drain_tasks: Set[asyncio.Task] = set()  # referenced until done, so they can't be garbage-collected
+        # One delivery at a time keeps each subscriber's events in order (created on first
+        # use, inside the event loop)
+        self._delivering: Optional[asyncio.Lock] = None
+        self.published: Dict[str, int] = {}  # topic name -> events published
+
+    def subscribe(self, event_type: type, handler: Callable, batched: bool = False,
+                  max_queue: Optional[int] = None):
+        """Subscribe to a topic.
+
+        Args:
+            event_type: Event class to receive
+            handler: Called (or awaited) with each event, or with a list of events if batched
+            batched: Deliver once per tick instead of as soon as possible
+            max_queue: Most undelivered events before old ones are dropped (default: the
+                bus's max_queue; 0: unbounded, nothing is ever dropped)
+        """
+        max_queue = self.max_queue if max_queue is None else max_queue
+        self._subscriptions.setdefault(event_type, []).append(Subscription(handler, batched, max_queue))
+
+    def unsubscribe(self, event_type: type, handler: Callable):
+        """Remove a subscriber (its undelivered events are discarded)."""
+        subscriptions = [s for s in self._subscriptions.get(event_type, []) if s.handler != handler]
+        if subscriptions:
+            self._subscriptions[event_type] = subscriptions
+        else:
+            self._subscriptions.pop(event_type, None)
+
+    def wants(self, event_type: type) -> bool:
+        """Check if anyone subscribes to a topic (to skip building unwanted events)."""
+        return event_type in self._subscriptions
+
+    def publish(self, event: Any):
+        """Queue an event for its topic's subscribers."""
+        subscriptions = self._subscriptions.get(type(event))
+        if not subscriptions:
+            return
+        name = type(event).__name__
+        self.published[name] = self.published.get(name, 0) + 1
+
+        immediate = False
+        for subscription in subscriptions:
+            if subscription.max_queue and len(subscription.queue) >= subscription.max_queue:
+                subscription.queue.popleft()
+                subscription.dropped += 1
+                if subscription.dropped == 1 or subscription.dropped % subscription.max_queue == 0:
+                    self.logger.warning("Subscriber %s to %s is falling behind: %d events dropped",
+                                        getattr(subscription.handler, '__qualname__', subscription.handler),
+                                        name, subscription.dropped)
+            subscription.queue.append(event)
+            immediate = immediate or not subscription.batched
+
+        if immediate and not self._drain_scheduled:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return  # no event loop (e.g. startup): delivered at the next flush()
+            self._drain_scheduled = True
+            task = loop.create_task(self._drain_soon())
+            self._drain_tasks.add(task)
+            task.add_done_callback(self._drain_tasks.discard)
+
+    def _lock(self) -> asyncio.Lock:
+        if self._delivering is None:
+            self._delivering = asyncio.Lock()
+        return self._delivering
+
+    async def _drain_soon(self):
+        try:
+            async with self._lock():
+                # Events published by the handlers themselves are delivered in the same pass
+                while await self._deliver(batched=False):
+                    pass
+        finally:
+            self._drain_scheduled = False
+
+    async def flush(self):
+        """Deliver everything queued, batched subscribers included (called at the end of each tick)."""
+        async with self._lock():
+            await self._deliver(batched=False)
+            await self._deliver(batched=True)
+
+    async def _deliver(self, batched: bool) -> bool:
+        delivered = False
+        for event_type, subscriptions in list(self._subscriptions.items()):
+            for subscription in subscriptions:
+                if subscription.batched != batched or not subscription.queue:
+                    continue
+                delivered = True
+                events = list(subscription.queue)
+                subscription.queue.clear()
+                if batched:
+                    await self._call(subscription, events, event_type)
+                else:
+                    for event in events:
+                        await self._call(subscription, event, event_type)
+        return delivered
+
+    async def _call(self, subscription: Subscription, argument: Any, event_type: type):
+        try:
+            if subscription.is_async:
+                await subscription.handler(argument)
+            else:
+                subscription.handler(argument)
+        except Exception as e:
+            self.logger.error("Error in %s handler %s: %s", event_type.__name__,
+                              getattr(subscription.handler, '__qualname__', subscription.handler), e, exc_info=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Events published and dropped per topic since startup."""
+        dropped = {}
+        for event_type, subscriptions in self._subscriptions.items():
+            count = sum(s.dropped for s in subscriptions)
+            if count:
+                dropped[event_type.__name__] = count
+        return {'published': dict(self.published), 'dropped': dropped}
@@ -0,0 +1,46 @@
+"""Event types published on the event bus.
+
+Each event is a small frozen dataclass, and its class is the topic
+subscribers listen to (see core.event_bus). Slots are declared by hand
+(dataclass(slots=True) needs Python 3.10).
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PlayerConnected:
+    """A client connected (before login)."""
+    __slots__ = ('player_id',)
+
+    player_id: int
+
+
+@dataclass(frozen=True)
+class PlayerDisconnected:
+    """A client's connection closed."""
+    __slots__ = ('player_id', 'session_duration')
+
+    player_id: int
+    session_duration: float
+
+
+@dataclass(frozen=True)
+class PlayerCommand:
+    """A command line was read from a client."""
+    __slots__ = ('player_id', 'command', 'params', 'timestamp')
+
+    player_id: int
+    command: str
+    params: str
+    timestamp: float
+
+
+@dataclass(frozen=True)
+class MobKilled:
+    """A mob was killed by (or while fighting) a player."""
+    __slots__ = ('player_id', 'mob_id', 'room_id')
+
+    player_id: int
+    mob_id: str
+    room_id: str
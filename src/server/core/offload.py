@@ -0,0 +1,63 @@
+"""Running CPU-heavy, read-only command output off the event loop.
+
+A command registered with a render function (see CommandSpec) is split in
+two. Its handler runs on the game loop as usual, checks its arguments and
+returns a snapshot of the data it needs. The render function then turns the
+snapshot into the text to send, on the Offloader's pool, while the game loop
+goes on serving other players.
+
+Render functions are plain module-level functions of the snapshot and must
+not touch the game engine. A snapshot is a copy: tuples of values, or
+content that is never changed in place (such as spell definitions), so the
+render can run while the game changes the originals. In the "process" mode
+both are pickled to a worker process.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+OFFLOAD_MODES = ('thread', 'process', 'off')
+
+
+class Offloader:
+    """Runs render functions on a thread or process pool."""
+
+    def __init__(self, mode: str = 'thread', workers: int = 2):
+        """Initialize the offloader (the pool is started on first use).
+
+        Args:
+            mode: 'thread', 'process', or 'off' to render on the event loop
+            workers: Threads or processes in the pool
+
+        Raises:
+            ValueError: If the mode is not one of OFFLOAD_MODES
+        """
+        if mode not in OFFLOAD_MODES:
+            raise ValueError(f"Unknown offload mode '{mode}' (expected one of {', '.join(OFFLOAD_MODES)})")
+        self.mode = mode
+        self.workers = workers
+        self._executor: Optional[Executor] = None
+        self.calls = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='offload')
+        return self._executor
+
+    async def run(self, render: Callable[..., Any], *args) -> Any:
+        """Call render(*args) on the pool and wait for its result."""
+        self.calls += 1
+        if self.mode == 'off':
+            return render(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), render, *args)
+
+    def shutdown(self):
+        """Stop the pool's workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,107 @@
+"""Cooperative time-slicing for long loops on the event loop.
+
+Everything in the server shares one asyncio loop, so a loop over every mob or
+every room runs to completion while other connections' input waits. Long
+loops instead iterate through a TimeSlicer, which hands control back to the
+event loop once the current slice of time is used up:
+
+    async for room_id, mobs in self.timeslicer.iterate(self.room_mobs.items()):
+        ...
+
+It also gives player commands priority over background simulation work.
+The connection manager counts command lines as they are read and the command
+handler counts them as they start. While any are waiting, a checkpoint
+yields straight away and keeps yielding (up to max_deferrals times) until
+they have started, so a command typed during a long tick runs before the
+rest of the tick.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Iterable
+
+
+class TimeSlicer:
+    """Budgets how long background work runs before yielding to the event loop."""
+
+    def __init__(self, slice_ms: float = 20.0, max_deferrals: int = 50):
+        """Initialize the slicer.
+
+        Args:
+            slice_ms: Longest time background work runs between yields
+            max_deferrals: Most extra yields a checkpoint makes while commands wait
+        """
+        self.slice_seconds = slice_ms / 1000.0
+        self.max_deferrals = max_deferrals
+        # Each counter has one writer (the thread reading input, and the game
+        # loop), so they can be kept without a lock
+        self.commands_queued = 0
+        self.commands_started = 0
+        self.slice_start = time.perf_counter()
+
+        # Counters for the performance report
+        self.yields = 0
+        self.deferrals = 0
+
+    def begin(self):
+        """Start a new slice (called at the start of each tick)."""
+        self.slice_start = time.perf_counter()
+
+    @property
+    def pending_commands(self) -> int:
+        """Player commands that have arrived but not started."""
+        return self.commands_queued - self.commands_started
+
+    def command_queued(self):
+        """Note a player command that has arrived (may be called from the network thread)."""
+        self.commands_queued += 1
+
+    def command_started(self):
+        """Note that a queued player command has started running."""
+        if self.commands_started < self.commands_queued:
+            self.commands_started += 1
+
+    def should_yield(self) -> bool:
+        """Check if background work should give way now."""
+        return self.pending_commands > 0 or time.perf_counter() - self.slice_start >= self.slice_seconds
+
+    async def checkpoint(self):
+        """Yield to the event loop if the slice is used up or commands are waiting."""
+        if not self.should_yield():
+            return
+        await asyncio.sleep(0)
+        deferrals = 0
+        while self.pending_commands > 0 and deferrals < self.max_deferrals:
+            await asyncio.sleep(0)
+            deferrals += 1
+        self.yields += 1
+        self.deferrals += deferrals
+        self.slice_start = time.perf_counter()
+
+    async def iterate(self, items: Iterable[Any], every: int = 16) -> AsyncIterator[Any]:
+        """Iterate over a snapshot of items, checkpointing between chunks.
+
+        The items are copied first, so the underlying dict or list may change
+        while the loop is suspended; callers should re-check anything that
+        may have been removed meanwhile.
+
+        Args:
+            items: Items to iterate over
+            every: Items to process between checkpoints (the clock isn't read per item)
+        """
+        for index, item in enumerate(list(items)):
+            if index and index % every == 0:
+                await self.checkpoint()
+            yield item
+
+    def stats(self, reset: bool = False) -> Dict[str, int]:
+        """Yield counters since the last reset.
+
+        Args:
+            reset: Clear the counters after reading them
+        """
+        result = {'yields': self.yields, 'deferrals': self.deferrals, 'pending': self.pending_commands}
+        if reset:
+            self.yields = 0
+            self.deferrals = 0
+        return result
@@ -20,7 +20,7 @@ class MobAbility(ABC):
         self.use_chance = ability_data.get('use_chance', 0.3)  # 30% chance to use when available
         self.min_level = ability_data.get('min_level', 1)  # Minimum mob level to use this ability
         self.data = ability_data
-        self.logger = get_logger()
+        self.logger = get_logger('abilities')
 
     @abstractmethod
     async def execute(self, attacker: dict, target: dict, combat_system, room_id: str) -> Dict[str, Any]:
@@ -87,7 +87,8 @@ class BreathWeaponAbility(MobAbility):
         # Apply damage to target
         target['health'] = max(0, target['health'] - damage)
 
-        self.logger.info(f"[ABILITY] {attacker_name} used breath weapon ({self.damage_type}) on {target_name} for {damage} damage")
+        self.logger.debug("[ABILITY] %s used breath weapon (%s) on %s for %s damage",
+                          attacker_name, self.damage_type, target_name, damage)
 
         result = {
             'success': True,
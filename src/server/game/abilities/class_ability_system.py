@@ -1,9 +1,9 @@
 """Class-specific ability system for players."""
 
-import json
 import time
 import os
 from typing import Dict, Any, Optional, List
+from ...persistence.content_bundle import get_content_bundle
 from ...utils.logger import get_logger
 
 
@@ -45,14 +45,14 @@ class ClassAbilitySystem:
             'data', 'classes', 'abilities', f'{class_name.lower()}_abilities.json'
         )
 
-        if not os.path.exists(ability_file):
+        content = get_content_bundle()
+        if not content.exists(ability_file):
             self.logger.warning(f"[ABILITIES] No ability file found for class: {class_name}")
             self.class_abilities[class_name] = []
             return False
 
         try:
-            with open(ability_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = content.get_json(ability_file)
 
             abilities = data.get('abilities', [])
             self.class_abilities[class_name] = abilities
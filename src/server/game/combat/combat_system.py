@@ -9,6 +9,9 @@ from ...utils.colors import (
     error_message, announcement, death_message
 )
 from ..magic.spell_system import MobSpellcasting, SpellType
+from ..name_index import resolve
+from ...core.events import MobKilled
+from ...utils.logger import get_logger
 
 
 class CombatSystem:
@@ -22,6 +25,7 @@ class CombatSystem:
         """
         self.game_engine = game_engine
         self.logger = game_engine.logger
+        self.ability_logger = get_logger('abilities')
 
         # Combat management - tracks active combat encounters
         self.active_combats: Dict[str, Any] = {}  # room_id -> AsyncCombat
@@ -107,12 +111,13 @@ class CombatSystem:
                 mob_level = mob.get('level', 1)
                 if ability.can_use(mob_level):
                     self.mob_abilities[mob_id][ability.name] = ability
-                    self.logger.info(f"[ABILITY] Loaded ability '{ability.name}' for {mob.get('name')} (id: {mob_id})")
+                    self.ability_logger.debug("[ABILITY] Loaded ability '%s' for %s (id: %s)", ability.name, mob.get('name'), mob_id)
                 else:
-                    self.logger.debug(f"[ABILITY] Skipping ability '{ability.name}' for {mob.get('name')} - level {mob_level} < required {ability.min_level}")
+                    self.ability_logger.debug("[ABILITY] Skipping ability '%s' for %s - level %s < required %s",
+                                            ability.name, mob.get('name'), mob_level, ability.min_level)
             else:
                 ability_type = ability_data.get('type', 'unknown')
-                self.logger.warning(f"[ABILITY] Unknown ability type '{ability_type}' for {mob.get('name')}")
+                self.ability_logger.warning("[ABILITY] Unknown ability type '%s' for %s", ability_type, mob.get('name'))
 
     def check_and_use_ability(self, mob: dict, mob_id: str, target: dict, room_id: str) -> Optional[Dict[str, Any]]:
         """Check if mob should use a special ability and execute it if so.
@@ -185,26 +190,23 @@ class CombatSystem:
             target_is_player = 'experience_reward' not in target
             target_player_id = None
 
-            self.logger.info(f"[ABILITY] message='{message}', room_message='{room_message}'")
-            self.logger.info(f"[ABILITY] target_is_player={target_is_player}, target keys: {list(target.keys())}")
+            self.ability_logger.debug("[ABILITY] message='%s', room_message='%s', target_is_player=%s",
+                                      message, room_message, target_is_player)
 
             if target_is_player:
                 # For player targets, we need to find their player_id
                 target_name = target.get('name')
-                self.logger.info(f"[ABILITY] Looking for player with name '{target_name}'")
                 for pid, pdata in self.game_engine.player_manager.connected_players.items():
                     char = pdata.get('character')
                     if char and char.get('name') == target_name:
                         target_player_id = pid
-                        self.logger.info(f"[ABILITY] Found player_id {pid} for name '{target_name}'")
                         break
 
                 if target_player_id is None:
-                    self.logger.warning(f"[ABILITY] Could not find player_id for target '{target_name}'")
+                    self.ability_logger.warning("[ABILITY] Could not find player_id for target '%s'", target_name)
 
             # Send message to target if they're a player
             if message and target_is_player and target_player_id is not None:
-                self.logger.info(f"[ABILITY] Sending message to player {target_player_id}: {message}")
                 await self.game_engine.connection_manager.send_message(
                     target_player_id,
                     damage_to_player(message)
@@ -226,7 +228,7 @@ class CombatSystem:
             mob_name = mob.get('name', 'Unknown creature')
             target_name = target.get('name', 'Unknown target')
             damage = result.get('damage', 0)
-            self.logger.info(f"[ABILITY] {mob_name} used {ability_name} on {target_name} for {damage} damage")
+            self.ability_logger.debug("[ABILITY] %s used %s on %s for %s damage", mob_name, ability_name, target_name, damage)
 
         except Exception as e:
             self.logger.error(f"[ABILITY] Error executing ability {ability_name}: {e}")
@@ -1012,30 +1014,28 @@ class CombatSystem:
         return ""
 
     async def find_combat_target(self, room_id: str, target_name: str):
-        """Find a valid combat target in the room."""
+        """Find a valid combat target in the room ("2.goblin" picks the second goblin)."""
         # Check spawned mobs first
-        room_mobs = self.game_engine.room_mobs.get(room_id, [])
-        for mob in room_mobs:
-            mob_name = mob.get('name', '')
-            if self.game_engine.world_manager._matches_target(target_name.lower(), mob_name.lower()):
-                return mob
+        mob, _, _ = resolve(self.game_engine.room_mobs.get(room_id, []), target_name)
+        if mob:
+            return mob
 
         # Check NPCs (but exclude quest-givers and non-hostile NPCs)
         room = self.game_engine.world_manager.get_room(room_id)
         if room and hasattr(room, 'npcs'):
-            for npc in room.npcs:
-                if self.game_engine.world_manager._matches_target(target_name.lower(), npc.name.lower()):
-                    # Get NPC data to check type
-                    npc_data = self.game_engine.world_manager.get_npc_data(npc.npc_id)
-                    if npc_data:
-                        npc_type = npc_data.get('type', '')
-                        # Block attacking quest-givers and non-hostile NPCs
-                        if npc_type in ['quest_giver', 'vendor', 'trainer']:
-                            return None
-                        # Only allow attacking if explicitly hostile
-                        if npc_data.get('hostile', False):
-                            return npc_data
-                    return None
+            npc, _, _ = resolve(room.npcs, target_name, names=lambda npc: (npc.name,))
+            if npc:
+                # Get NPC data to check type
+                npc_data = self.game_engine.world_manager.get_npc_data(npc.npc_id)
+                if npc_data:
+                    npc_type = npc_data.get('type', '')
+                    # Block attacking quest-givers and non-hostile NPCs
+                    if npc_type in ['quest_giver', 'vendor', 'trainer']:
+                        return None
+                    # Only allow attacking if explicitly hostile
+                    if npc_data.get('hostile', False):
+                        return npc_data
+                return None
 
         # Could also check for other players here if PvP is enabled
         return None
@@ -1202,41 +1202,12 @@ class CombatSystem:
             if not alive_mobs and room_id in self.game_engine.room_mobs:
                 del self.game_engine.room_mobs[room_id]
 
-        # Track quest progress for players in combat
-        for player_id, combat_room in self.player_combats.items():
-            if combat_room == room_id:
-                player_data = self.game_engine.player_manager.connected_players.get(player_id)
-                if player_data and player_data.get('character'):
-                    character = player_data['character']
-
-                    # Note: XP is now awarded per damage dealt in execute_seamless_attack
-
-                    # Track quest progress for killing this mob
-                    if dead_mob and dead_mob_id:
-                        # Check all active quests for kill objectives
-                        player_quests = character.get('quests', {})
-                        self.logger.info(f"[QUEST] Player killed {dead_mob_id} in {room_id}, checking {len(player_quests)} quests")
-                        for quest_id in player_quests:
-                            # Skip completed quests
-                            quest_status = player_quests[quest_id]
-                            if quest_status.get('completed'):
-                                self.logger.info(f"[QUEST] Skipping {quest_id} - already completed")
-                                continue
-
-                            self.logger.info(f"[QUEST] Checking {quest_id} for kill_monster objective: {dead_mob_id}")
-                            quest_completed = self.game_engine.quest_manager.check_objective_completion(
-                                character,
-                                quest_id,
-                                'kill_monster',
-                                dead_mob_id,
-                                room_id
-                            )
-
-                            if quest_completed:
-                                quest = self.game_engine.quest_manager.get_quest(quest_id)
-                                if quest:
-                                    completion_msg = quest.get('completed_message', 'Quest objective completed!')
-                                    await self.game_engine.connection_manager.send_message(player_id, f"\n{completion_msg}\n")
+        # Tell quests (and metrics) about the kill, for each player in combat here
+        # Note: XP is now awarded per damage dealt in execute_seamless_attack
+        if dead_mob and dead_mob_id:
+            for player_id, combat_room in self.player_combats.items():
+                if combat_room == room_id:
+                    self.game_engine.event_bus.publish(MobKilled(player_id, dead_mob_id, room_id))
 
     async def end_async_combat(self, room_id: str):
         """End async combat in a room."""
@@ -1512,16 +1483,13 @@ class CombatSystem:
                 self.logger.debug(f"[MOB_MOVE] {mob_name} has no exits to move through")
                 return False
 
-            # Use pathfinding to find best direction
-            path = self.game_engine.world_manager.world_graph.find_path(current_room_id, target_room_id)
+            # Next room on the way, from the precomputed routing tables
+            next_room_id = self.game_engine.world_manager.next_hop(current_room_id, target_room_id)
 
-            if not path or len(path) < 2:
-                # No path or already at destination
+            if not next_room_id:
+                # No route or already at destination
                 return False
 
-            # Next room in path
-            next_room_id = path[1]
-
             # Find which direction leads to next room
             chosen_direction = None
             for direction in all_exits:
@@ -2955,32 +2923,10 @@ class CombatSystem:
                 if mob_id in self.mob_damage_tracking:
                     del self.mob_damage_tracking[mob_id]
 
-                # Check quest progress for killing this mob (seamless combat)
+                # Tell quests (and metrics) about the kill (seamless combat)
                 dead_mob_id = target.get('id')
                 if dead_mob_id:
-                    player_quests = character.get('quests', {})
-                    self.logger.info(f"[QUEST] Player killed {dead_mob_id} in {room_id} (seamless), checking {len(player_quests)} quests")
-                    for quest_id in player_quests:
-                        # Skip completed quests
-                        quest_status = player_quests[quest_id]
-                        if quest_status.get('completed'):
-                            self.logger.info(f"[QUEST] Skipping {quest_id} - already completed")
-                            continue
-
-                        self.logger.info(f"[QUEST] Checking {quest_id} for kill_monster objective: {dead_mob_id}")
-                        quest_completed = self.game_engine.quest_manager.check_objective_completion(
-                            character,
-                            quest_id,
-                            'kill_monster',
-                            dead_mob_id,
-                            room_id
-                        )
-
-                        if quest_completed:
-                            quest = self.game_engine.quest_manager.get_quest(quest_id)
-                            if quest:
-                                completion_msg = quest.get('completed_message', 'Quest objective completed!')
-                                await self.game_engine.connection_manager.send_message(player_id, f"\n{completion_msg}\n")
+                    self.game_engine.event_bus.publish(MobKilled(player_id, dead_mob_id, room_id))
 
                 # Handle mob death (removes from room)
                 mob_participant_id = self.get_mob_identifier(target)
@@ -3127,11 +3073,10 @@ class CombatSystem:
         dropped_items = []
 
         # Check if this is a lair mob and room has lair loot
-        room_data = self.game_engine.world_manager.rooms_data.get(room_id)
+        lair_loot = self.game_engine.world_manager.rooms_data.get_field(room_id, 'lair_loot')
         is_lair_mob = not mob.get('is_wandering', False)
 
-        if is_lair_mob and room_data and 'lair_loot' in room_data:
-            lair_loot = room_data.get('lair_loot', [])
+        if is_lair_mob and lair_loot:
             print(f"[LOOT DEBUG] Processing lair loot for lair mob '{mob.get('name')}': {lair_loot}")
 
             for item_id in lair_loot:
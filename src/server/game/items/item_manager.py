@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Tuple, Any, Optional
 from ...utils.colors import Colors, RGBColors, wrap_color
+from ..name_index import EXACT, parse_ordinal, rank_matches
 
 
 class ItemManager:
@@ -52,6 +53,9 @@ class ItemManager:
         """
         Find an item by partial name matching.
 
+        Matches are ranked exact, whole word, word prefix, then substring
+        (earlier items first on ties); "2.potion" picks the second match.
+
         Args:
             item_list: List of items to search
             partial_name: Partial name to match
@@ -62,37 +66,22 @@ class ItemManager:
             - index: The index of the item in the list or -1
             - match_type: 'exact', 'unique', 'multiple', or 'none'
         """
-        partial_lower = partial_name.lower()
-        exact_matches = []
-        partial_matches = []
-
-        for i, item in enumerate(item_list):
-            item_name_lower = item['name'].lower()
-
-            # Check for exact match first
-            if item_name_lower == partial_lower:
-                exact_matches.append((item, i))
-            # Check for partial match (substring)
-            elif partial_lower in item_name_lower:
-                partial_matches.append((item, i))
-
-        # Return exact match if found
-        if exact_matches:
-            item, index = exact_matches[0]
-            return item, index, 'exact'
-
-        # Return partial match if unique
-        if len(partial_matches) == 1:
-            item, index = partial_matches[0]
-            return item, index, 'unique'
-        elif len(partial_matches) > 1:
-            # Multiple matches - return the first match but indicate multiple
-            item, index = partial_matches[0]
-            return item, index, 'multiple'
-        else:
-            # No matches
+        ordinal, name = parse_ordinal(partial_name)
+        matches = rank_matches(item_list, name)
+        if ordinal > len(matches):
             return None, -1, 'none'
 
+        rank, index = matches[ordinal - 1]
+        if rank == EXACT:
+            match_type = 'exact'
+        elif len(matches) == 1 or ordinal > 1:
+            # The only match, or the one the player picked by number
+            match_type = 'unique'
+        else:
+            # Several match - return the best one but say so
+            match_type = 'multiple'
+        return item_list[index], index, match_type
+
     def get_room_items_description(self, room_id: str, dim_factor: float = 1.0) -> str:
         """Get description of items on the floor in a room.
 
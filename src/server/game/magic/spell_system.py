@@ -1,9 +1,9 @@
 """Spell system for managing mob spellcasting."""
 
-import json
 import random
 from pathlib import Path
 from typing import Dict, Any, Optional, List
+from ...persistence.content_bundle import get_content_bundle
 from ...utils.logger import get_logger
 
 
@@ -21,7 +21,8 @@ class SpellType:
             return
 
         spell_file = Path("data/spells/mob_spells.json")
-        if not spell_file.exists():
+        content = get_content_bundle()
+        if not content.exists(spell_file):
             logger = get_logger()
             logger.error(f"Spell data file not found: {spell_file}")
             cls._spell_data = {}
@@ -30,13 +31,12 @@ class SpellType:
             return
 
         try:
-            with open(spell_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                cls._spell_data = data.get('spells', {})
-                cls._mob_spell_lists = data.get('mob_spell_lists', {})
-                cls._loaded = True
-                logger = get_logger()
-                logger.info(f"Loaded {len(cls._spell_data)} spells from {spell_file}")
+            data = content.get_json(spell_file)
+            cls._spell_data = data.get('spells', {})
+            cls._mob_spell_lists = data.get('mob_spell_lists', {})
+            cls._loaded = True
+            logger = get_logger()
+            logger.info(f"Loaded {len(cls._spell_data)} spells from {spell_file}")
         except Exception as e:
             logger = get_logger()
             logger.error(f"Error loading spell data: {e}")
@@ -44,6 +44,18 @@ class SpellType:
             cls._mob_spell_lists = {}
             cls._loaded = True
 
+    @classmethod
+    def reload(cls):
+        """Re-read the spell definitions (for hot reloads of game content)."""
+        cls._loaded = False
+        cls._load_spells()
+
+    @classmethod
+    def get_all_spells(cls) -> Dict[str, Any]:
+        """Get every spell definition, keyed by ID."""
+        cls._load_spells()
+        return cls._spell_data
+
     @classmethod
     def get_spell(cls, spell_id: str) -> Optional[Dict[str, Any]]:
         """Get spell definition by ID."""
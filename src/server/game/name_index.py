@@ -0,0 +1,234 @@
+"""Name resolution for everything a player can refer to by name.
+
+Items, mobs, NPCs, vendors and players are all found the same way: the
+typed name is compared against each candidate's lowercased name and its
+words, and matches are ranked
+
+    exact  >  whole word  >  word prefix  >  substring
+
+with ties going to the candidate listed (or indexed) first. "2.sword" picks
+the second match in that order.
+
+Global catalogs (the item definitions vendors sell from) are kept in a
+NameIndex, which looks up exact names, words and word prefixes in dicts and
+only scans for substrings when nothing better matches. The contents of a
+room or an inventory are short lists that many systems change in place, so
+they are ranked in one pass with the lowercased name and words of each
+distinct name computed once and cached.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Match ranks, best first
+EXACT = 0
+WORD = 1
+PREFIX = 2
+SUBSTRING = 3
+
+
+def parse_ordinal(query: str) -> Tuple[int, str]:
+    """Split an ordinal off a typed name.
+
+    Args:
+        query: What the player typed, e.g. "2.sword" or "sword"
+
+    Returns:
+        (ordinal, lowercased name); the ordinal is 1 when none is given
+    """
+    query = query.strip().lower()
+    number, dot, rest = query.partition('.')
+    if dot and number.isdigit() and rest and int(number) > 0:
+        return int(number), rest.strip()
+    return 1, query
+
+
+@lru_cache(maxsize=16384)
+def name_terms(name: str) -> Tuple[str, Tuple[str, ...]]:
+    """Lowercased name and its words (cached per distinct name)."""
+    lower = name.lower().strip()
+    return lower, tuple(lower.split())
+
+
+def match_rank(query: str, names: Iterable[str]) -> Optional[int]:
+    """Rank how well a lowercased query matches the best of a candidate's names.
+
+    Args:
+        query: Lowercased name typed by the player (no ordinal)
+        names: The candidate's names (display name, keywords, ID)
+
+    Returns:
+        EXACT, WORD, PREFIX or SUBSTRING, or None if no name matches
+    """
+    best = None
+    for name in names:
+        if not name:
+            continue
+        lower, words = name_terms(name)
+        if query == lower:
+            return EXACT
+        if query in words:
+            rank = WORD
+        elif lower.startswith(query) or any(word.startswith(query) for word in words):
+            rank = PREFIX
+        elif query in lower:
+            rank = SUBSTRING
+        else:
+            continue
+        if best is None or rank < best:
+            best = rank
+    return best
+
+
+def item_names(candidate: Dict[str, Any]) -> Tuple[str, ...]:
+    """Names of an item, mob or vendor dict."""
+    return (candidate.get('name', ''),)
+
+
+def rank_matches(candidates: Sequence[Any], query: str,
+                 names: Callable[[Any], Iterable[str]] = item_names) -> List[Tuple[int, int]]:
+    """Rank the candidates a lowercased query matches.
+
+    Args:
+        candidates: Items, mobs, NPCs... in their listed order
+        query: Lowercased name typed by the player (no ordinal)
+        names: Gives a candidate's names
+
+    Returns:
+        (rank, position in candidates) for every match, best first
+    """
+    if not query:
+        return []
+    matches = []
+    for position, candidate in enumerate(candidates):
+        rank = match_rank(query, names(candidate))
+        if rank is not None:
+            matches.append((rank, position))
+    matches.sort()
+    return matches
+
+
+def resolve(candidates: Sequence[Any], query: str,
+            names: Callable[[Any], Iterable[str]] = item_names) -> Tuple[Optional[Any], int, int]:
+    """Find the candidate a typed name (with optional "N." ordinal) refers to.
+
+    Args:
+        candidates: Items, mobs, NPCs... in their listed order
+        query: What the player typed
+        names: Gives a candidate's names
+
+    Returns:
+        (candidate, position, rank), or (None, -1, None) if there is no such match
+    """
+    ordinal, name = parse_ordinal(query)
+    matches = rank_matches(candidates, name, names)
+    if ordinal > len(matches):
+        return None, -1, None
+    rank, position = matches[ordinal - 1]
+    return candidates[position], position, rank
+
+
+class NameIndex:
+    """Keyword index over a catalog that changes rarely (item definitions).
+
+    Entries are added with one or more names; lookups go through dicts of
+    exact names, words and word prefixes, so they don't depend on the size
+    of the catalog unless they fall back to a substring scan.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._entries: Dict[Hashable, Tuple[int, Tuple[str, ...]]] = {}  # key -> (order, names)
+        self._exact: Dict[str, Set[Hashable]] = {}
+        self._words: Dict[str, Set[Hashable]] = {}
+        self._prefixes: Dict[str, Set[Hashable]] = {}  # every prefix of every word
+        self._order = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _terms(self, names: Tuple[str, ...]):
+        # (map, term) pairs an entry is filed under
+        for name in names:
+            lower, words = name_terms(name)
+            yield self._exact, lower
+            for word in words:
+                yield self._words, word
+                for end in range(1, len(word) + 1):
+                    yield self._prefixes, word[:end]
+
+    def add(self, key: Hashable, names: Iterable[str]):
+        """Index an entry (replacing any entry with the same key).
+
+        Args:
+            key: The entry's ID
+            names: Names it can be found by
+        """
+        if key in self._entries:
+            self.remove(key)
+        names = tuple(name for name in names if name)
+        self._entries[key] = (self._order, names)
+        self._order += 1
+        for terms, term in self._terms(names):
+            terms.setdefault(term, set()).add(key)
+
+    def remove(self, key: Hashable):
+        """Drop an entry (no-op if it isn't indexed)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for terms, term in self._terms(entry[1]):
+            keys = terms.get(term)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del terms[term]
+
+    def clear(self):
+        """Drop every entry."""
+        self._entries.clear()
+        self._exact.clear()
+        self._words.clear()
+        self._prefixes.clear()
+        self._order = 0
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, Hashable]]:
+        """Rank the entries a lowercased query matches.
+
+        Args:
+            query: Lowercased name (no ordinal)
+            limit: Stop looking for substring matches once this many better ones are found
+
+        Returns:
+            (rank, key) best first, ties in the order the entries were added
+        """
+        query = query.strip()
+        if not query:
+            return []
+        words = query.split()
+        # Anything ranked above a substring match has the query's first word as a word prefix
+        found = set(self._exact.get(query, ())) | self._words.get(query, set())
+        found |= self._prefixes.get(words[0], set())
+        matches = []
+        for key in found:
+            rank = match_rank(query, self._entries[key][1])
+            if rank is not None and rank < SUBSTRING:
+                matches.append((rank, self._entries[key][0], key))
+        if limit is None or len(matches) < limit:
+            matched = {key for _, _, key in matches}
+            for key, (order, names) in self._entries.items():
+                if key not in matched and match_rank(query, names) is not None:
+                    matches.append((SUBSTRING, order, key))
+        matches.sort()
+        return [(rank, key) for rank, _, key in matches]
+
+    def find(self, query: str) -> Optional[Hashable]:
+        """Find the key a typed name (with optional "N." ordinal) refers to."""
+        ordinal, name = parse_ordinal(query)
+        matches = self.search(name, limit=ordinal)
+        if ordinal > len(matches):
+            return None
+        return matches[ordinal - 1][1]
@@ -1,10 +1,15 @@
 """Player management system for handling player connections, authentication, and data persistence."""
 
 import asyncio
+import json
+import logging
 import time
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 
 from ...persistence.player_storage import PlayerStorage
+from ...persistence.snapshot import CharacterSnapshot
 from ...utils.logger import get_logger
 
 
@@ -20,6 +25,27 @@ class PlayerManager:
         self.connected_players: Dict[int, Any] = {}
         self.logged_in_usernames: Dict[str, int] = {}  # username -> player_id mapping
 
+        # Login work (password KDF, account lookups) runs on a small thread pool
+        # so a burst of logins never blocks the game tick
+        config = game_engine.config_manager
+        self.auth_executor = ThreadPoolExecutor(
+            max_workers=config.get_setting('security', 'auth_workers', default=2),
+            thread_name_prefix="auth"
+        )
+        self.max_concurrent_logins = config.get_setting('security', 'max_concurrent_logins', default=8)
+        self.login_backoff_base = float(config.get_setting('security', 'login_backoff_base', default=1.0))
+        self.login_backoff_max = float(config.get_setting('security', 'login_backoff_max', default=60.0))
+        self._login_semaphore: Optional[asyncio.Semaphore] = None
+        self._login_failures: Dict[str, Tuple[int, float]] = {}  # username -> (failures, retry_after)
+        self._password_hashes: Dict[str, str] = {}  # username -> stored hash, for logged-in accounts
+
+        # Link-dead sessions: when a connection drops, the session and character
+        # stay resident for a grace period so a reconnect re-attaches without
+        # reloading from the database or breaking up parties
+        self.link_dead_grace = float(config.get_setting('sessions', 'link_dead_grace', default=300))
+        self.link_dead_max_sessions = config.get_setting('sessions', 'link_dead_max_sessions', default=100)
+        self.link_dead_sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # username -> entry
+
     @property
     def player_storage(self) -> Optional[PlayerStorage]:
         """Get the player storage instance from the game engine."""
@@ -58,6 +84,11 @@ class PlayerManager:
         if player_id in self.connected_players:
             player_data = self.connected_players[player_id]
 
+            # A dropped connection (not a quit) keeps the session around for a reconnect
+            if self._should_go_link_dead(player_data):
+                await self._enter_link_dead(player_id, player_data)
+                return
+
             # Notify others in the room that this player has left
             if (player_data.get('character') and
                 player_data.get('authenticated') and
@@ -71,6 +102,7 @@ class PlayerManager:
                 if username in self.logged_in_usernames:
                     del self.logged_in_usernames[username]
                     self.logger.info(f"User '{username}' logged out")
+                self._password_hashes.pop(username, None)
 
                 # Clean up summoned creatures if this player is a party leader
                 character = player_data.get('character')
@@ -85,10 +117,165 @@ class PlayerManager:
 
             # Save character if authenticated
             if player_data.get('character') and player_data.get('authenticated'):
-                self.save_player_character(player_id, player_data['character'])
+                await self.save_player_character_async(player_id, player_data['character'])
 
             # Clean up
             del self.connected_players[player_id]
+            self.game_engine.snapshot_manager.forget(player_id)
+
+    def mark_player_quitting(self, player_id: int):
+        """Flag a player as leaving on purpose, so their disconnect skips the link-dead grace period."""
+        player_data = self.connected_players.get(player_id)
+        if player_data:
+            player_data['quitting'] = True
+
+    def _should_go_link_dead(self, player_data: Dict[str, Any]) -> bool:
+        """Check if a disconnecting session should be kept for a reconnect."""
+        return (self.link_dead_grace > 0 and
+                self.game_engine.running and
+                not player_data.get('quitting') and
+                not player_data.get('creating_character') and
+                player_data.get('authenticated') and
+                bool(player_data.get('character')) and
+                bool(player_data.get('username')))
+
+    async def _enter_link_dead(self, player_id: int, player_data: Dict[str, Any]):
+        """Park a dropped session in the link-dead cache.
+
+        The character leaves the world but keeps its party and follow links.
+        It is still saved now, so a crash during the grace period loses nothing.
+
+        Args:
+            player_id: The dropped connection's ID
+            player_data: The player's session dict
+        """
+        username = player_data['username']
+        character = player_data['character']
+        room_id = character.get('room_id')
+
+        if room_id:
+            await self.game_engine._notify_room_except_player(room_id, player_id, f"{username} has lost their link.")
+        self.logged_in_usernames.pop(username, None)
+
+        # Summons cannot follow a leader who is not in the world
+        await self._despawn_player_summons(player_id, character, room_id)
+
+        # Park the session before awaiting the save so a quick reconnect finds it
+        del self.connected_players[player_id]
+        self.link_dead_sessions[username] = {
+            'player_id': player_id,
+            'session': player_data,
+            'password_hash': self._password_hashes.pop(username, None),
+            'expires_at': time.time() + self.link_dead_grace
+        }
+        self.logger.info(f"User '{username}' is link-dead (grace {self.link_dead_grace:.0f}s)")
+
+        await self._persist_character_async(player_id, username, character)
+        self.game_engine.snapshot_manager.forget(player_id)
+
+        # Evict the least recently dropped sessions beyond the cache limit
+        while len(self.link_dead_sessions) > self.link_dead_max_sessions:
+            evicted_name, evicted = self.link_dead_sessions.popitem(last=False)
+            await self._end_link_dead_session(evicted_name, evicted)
+
+    async def resume_link_dead_session(self, player_id: int, username: str) -> bool:
+        """Re-attach a reconnecting player to their link-dead session.
+
+        Args:
+            player_id: The new connection's ID
+            username: The authenticated account name
+
+        Returns:
+            True if a session was resumed, False if there was none to resume
+        """
+        entry = self.link_dead_sessions.pop(username, None)
+        if not entry:
+            return False
+
+        old_id = entry['player_id']
+        session = entry['session']
+        session['player_id'] = player_id
+        session['connection_time'] = time.time()
+        session['login_state'] = 'authenticated'
+        self.connected_players[player_id] = session
+        self.logged_in_usernames[username] = player_id
+        if entry.get('password_hash'):
+            self._password_hashes[username] = entry['password_hash']
+
+        # Party and follow links refer to connection IDs; point them at the new one
+        self._remap_player_id(old_id, player_id)
+        character = session['character']
+        self._prune_stale_party_links(player_id, character)
+        self.game_engine.snapshot_manager.mark_dirty(player_id)
+
+        room_id = character.get('room_id')
+        if room_id:
+            await self.game_engine._notify_room_except_player(room_id, player_id, f"{username} has reconnected.")
+        self.logger.info(f"User '{username}' resumed link-dead session ({old_id} -> {player_id})")
+        return True
+
+    async def expire_link_dead_sessions(self, force: bool = False):
+        """End link-dead sessions whose grace period has run out.
+
+        Args:
+            force: End every link-dead session (used at shutdown)
+        """
+        now = time.time()
+        while self.link_dead_sessions:
+            username, entry = next(iter(self.link_dead_sessions.items()))
+            if not force and entry['expires_at'] > now:
+                break
+            del self.link_dead_sessions[username]
+            await self._end_link_dead_session(username, entry)
+
+    async def _end_link_dead_session(self, username: str, entry: Dict[str, Any]):
+        """Finish the logout that was deferred when a session went link-dead."""
+        player_id = entry['player_id']
+        character = entry['session']['character']
+        self.logger.info(f"Link-dead session for '{username}' ended")
+
+        room_id = character.get('room_id')
+        if room_id:
+            await self.game_engine._notify_room_except_player(room_id, player_id, f"{username} has left the game.")
+        await self._disband_party_on_leader_disconnect(player_id, character)
+        await self._clear_following_on_disconnect(player_id, character, username)
+
+        # Save again so the party/follow cleanup is persisted
+        await self._persist_character_async(player_id, username, character)
+        self.game_engine.snapshot_manager.forget(player_id)
+
+    def _remap_player_id(self, old_id: int, new_id: int):
+        """Replace a connection ID in every party and follow link."""
+        characters = [data.get('character') for data in self.connected_players.values()]
+        characters += [entry['session'].get('character') for entry in self.link_dead_sessions.values()]
+        for character in characters:
+            if not character:
+                continue
+            if character.get('party_leader') == old_id:
+                character['party_leader'] = new_id
+            if character.get('following') == old_id:
+                character['following'] = new_id
+            for key in ('party_members', 'followers'):
+                ids = character.get(key)
+                if ids and old_id in ids:
+                    character[key] = [new_id if member_id == old_id else member_id for member_id in ids]
+
+    def _prune_stale_party_links(self, player_id: int, character: Dict[str, Any]):
+        """Drop links to players who fully logged out while this one was link-dead."""
+        present = set(self.connected_players)
+        present.update(entry['player_id'] for entry in self.link_dead_sessions.values())
+
+        party_leader = character.get('party_leader', player_id)
+        if party_leader not in present:
+            character['party_leader'] = player_id
+            character.pop('party_members', None)
+        elif 'party_members' in character:
+            character['party_members'] = [m for m in character['party_members'] if m in present]
+
+        if character.get('following') is not None and character['following'] not in present:
+            character['following'] = None
+        if character.get('followers'):
+            character['followers'] = [f for f in character['followers'] if f in present]
 
     def is_user_already_logged_in(self, username: str) -> bool:
         """Check if a user is already logged in."""
@@ -97,6 +284,9 @@ class PlayerManager:
     def authenticate_player(self, username: str, password: str) -> bool:
         """Authenticate a player or create new account.
 
+        Blocks on password hashing; the async server calls this through
+        authenticate_player_async.
+
         Returns True if authentication successful or new account created.
         Returns False if wrong password for existing account.
         """
@@ -116,10 +306,7 @@ class PlayerManager:
         self.logger.debug(f"Authentication failed for '{username}', checking if user exists")
 
         # Authentication failed - check if this is a new user or wrong password
-        # Try to load character data to see if user exists
-        existing_char = self.player_storage.load_character_data(username)
-
-        if existing_char is not None:
+        if self.player_storage.player_exists(username):
             # User exists but wrong password
             self.logger.warning(f"Failed login attempt for user '{username}' - wrong password")
             return False
@@ -137,6 +324,81 @@ class PlayerManager:
             traceback.print_exc()
             return False
 
+    async def authenticate_player_async(self, username: str, password: str) -> bool:
+        """Authenticate a player or create a new account without blocking the game loop.
+
+        The password check and database lookups run on the auth thread pool,
+        with at most max_concurrent_logins in flight; further logins wait
+        their turn. Failed attempts put the account into exponential backoff.
+        A player reconnecting to a link-dead session is checked against the
+        hash cached with that session, without a database round trip.
+
+        Args:
+            username: The account name
+            password: The password as typed
+
+        Returns:
+            True if authentication succeeded or a new account was created
+        """
+        if self._login_semaphore is None:
+            self._login_semaphore = asyncio.Semaphore(self.max_concurrent_logins)
+
+        async with self._login_semaphore:
+            loop = asyncio.get_running_loop()
+            entry = self.link_dead_sessions.get(username)
+            if entry and entry.get('password_hash') and self.player_storage:
+                # Reconnecting to a link-dead session: no database round trip needed
+                password_hash = entry['password_hash']
+                success = await loop.run_in_executor(
+                    self.auth_executor, self.player_storage.verify_password, password, password_hash
+                )
+            else:
+                success, password_hash = await loop.run_in_executor(
+                    self.auth_executor, self._authenticate_blocking, username, password
+                )
+
+        if success:
+            self._login_failures.pop(username, None)
+            if password_hash:
+                self._password_hashes[username] = password_hash
+        else:
+            failures, _ = self._login_failures.get(username, (0, 0.0))
+            failures += 1
+            delay = min(self.login_backoff_base * (2 ** (failures - 1)), self.login_backoff_max)
+            self._login_failures[username] = (failures, time.time() + delay)
+        return success
+
+    def _authenticate_blocking(self, username: str, password: str) -> Tuple[bool, Optional[str]]:
+        """Authenticate on an auth worker thread and fetch the account's stored hash."""
+        if not self.authenticate_player(username, password):
+            return False, None
+        if not self.player_storage:
+            return True, None
+        return True, self.player_storage.get_password_hash(username)
+
+    def get_login_backoff_remaining(self, username: str) -> float:
+        """Get the seconds left before an account may attempt another login."""
+        entry = self._login_failures.get(username)
+        if not entry:
+            return 0.0
+        return max(0.0, entry[1] - time.time())
+
+    async def load_character_data_async(self, username: str) -> Optional[Dict[str, Any]]:
+        """Load a character's saved data on the auth thread pool.
+
+        Args:
+            username: The account name the character is saved under
+
+        Returns:
+            The character dict, or None if there is no saved character
+        """
+        if not self.player_storage:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.auth_executor, self.player_storage.load_character_data, username
+        )
+
     def save_player_character(self, player_id: int, character: Dict[str, Any]):
         """Save a player's character to the database.
 
@@ -159,41 +421,120 @@ class PlayerManager:
                 return
 
             # Save the character data
-            import json
-            char_json = json.dumps(character)
-            char_size_kb = len(char_json) / 1024
-            num_inventory = len(character.get('inventory', []))
-            num_effects = len(character.get('active_effects', []))
-            num_cooldowns = len(character.get('spell_cooldowns', {}))
-            print(f"[DEBUG] Saving character for '{username}': level {character.get('level')}, gold {character.get('gold')}, room {character.get('room_id')}, size={char_size_kb:.1f}KB, inv={num_inventory}, effects={num_effects}, cooldowns={num_cooldowns}")
+            if self.logger.is_enabled(logging.DEBUG):
+                self.logger.debug(
+                    "Saving character for '%s': level %s, gold %s, room %s, size=%.1fKB, inv=%d, effects=%d, cooldowns=%d",
+                    username, character.get('level'), character.get('gold'), character.get('room_id'),
+                    len(json.dumps(character)) / 1024, len(character.get('inventory', [])),
+                    len(character.get('active_effects', [])), len(character.get('spell_cooldowns', {})))
             success = self.player_storage.save_character_data(username, character)
             if success:
-                self.logger.info(f"Successfully saved character data for {username}")
-                print(f"[DEBUG] Save confirmed for '{username}'")
+                self.logger.info("Saved character data for %s", username)
             else:
-                self.logger.error(f"Failed to save character data for {username}")
-                print(f"[DEBUG] Save FAILED for '{username}'")
+                self.logger.error("Failed to save character data for %s", username)
 
         except Exception as e:
             self.logger.error(f"Failed to save character for player {player_id}: {e}")
 
+    async def save_player_character_async(self, player_id: int, character: Dict[str, Any]):
+        """Save a player's character through the persistence worker.
+
+        The write is queued behind any in-flight auto-save, so an older
+        snapshot can never overwrite this one.
+
+        Args:
+            player_id: The player's connection ID
+            character: The character data dict to save
+        """
+        if not self.player_storage:
+            return
+
+        player_data = self.connected_players.get(player_id)
+        username = player_data.get('username') if player_data else None
+        if not username:
+            self.logger.warning(f"Cannot save character for player {player_id}: no username")
+            return
+
+        await self._persist_character_async(player_id, username, character)
+
+    async def _persist_character_async(self, player_id: int, username: str, character: Dict[str, Any]):
+        """Snapshot a character and write it in full on the persistence worker."""
+        if not self.player_storage:
+            return
+
+        snapshot = self.game_engine.snapshot_manager.capture(player_id, username, character)
+        loop = asyncio.get_running_loop()
+        saved = await loop.run_in_executor(
+            self.game_engine.persistence_executor, self.persist_snapshots, [snapshot], True
+        )
+        if saved:
+            self.logger.info(f"Successfully saved character data for {username}")
+        self.player_storage.release_journal_state(username)
+
+    def persist_snapshots(self, snapshots: List[CharacterSnapshot], compact: bool = False) -> int:
+        """Write character snapshots to storage.
+
+        Runs on the persistence worker thread: snapshots are private copies,
+        so encoding and writing them never touches live game state. In journal
+        mode only the changes since the last save are appended, and the whole
+        batch is flushed with a single commit.
+
+        Args:
+            snapshots: Snapshots captured at a tick boundary
+            compact: Force a full save instead of a journal append
+
+        Returns:
+            Number of characters saved successfully
+        """
+        storage = self.player_storage
+        if not storage:
+            return 0
+
+        saved = 0
+        for snapshot in snapshots:
+            try:
+                if compact:
+                    success = storage.save_character_data(snapshot.username, snapshot.data)
+                else:
+                    success = storage.journal_character_data(snapshot.username, snapshot.data)
+                if success:
+                    saved += 1
+                else:
+                    self.logger.error(f"Failed to save character snapshot for {snapshot.username}")
+            except Exception as e:
+                self.logger.error(f"Failed to save character snapshot for {snapshot.username}: {e}")
+
+        if storage.journal_mode:
+            try:
+                storage.flush_journal()
+            except Exception as e:
+                self.logger.error(f"Failed to flush character journal: {e}")
+                return 0
+        return saved
+
     def save_all_players(self):
         """Save all connected players."""
         for player_id, player_data in self.connected_players.items():
             if player_data.get('character') and player_data.get('authenticated'):
                 self.save_player_character(player_id, player_data['character'])
 
-    def on_player_connected(self, data):
+    async def save_all_players_async(self, timeslicer):
+        """Save all connected players, yielding to the event loop between saves.
+
+        Args:
+            timeslicer: The engine's TimeSlicer
+        """
+        async for player_id, player_data in timeslicer.iterate(self.connected_players.items(), every=1):
+            if player_data.get('character') and player_data.get('authenticated'):
+                self.save_player_character(player_id, player_data['character'])
+
+    def on_player_connected(self, event):
         """Event handler for player connection."""
-        self.logger.debug(f"Player connected event: {data}")
+        self.logger.debug("Player connected event: %s", event)
 
-    def on_player_disconnected(self, data):
+    def on_player_disconnected(self, event):
         """Event handler for player disconnection."""
-        self.logger.debug(f"Player disconnected event: {data}")
-
-    def on_player_command(self, data):
-        """Event handler for player command."""
-        self.logger.debug(f"Player command event: {data}")
+        self.logger.debug("Player disconnected event: %s", event)
 
     def get_connected_player_count(self) -> int:
         """Get the number of connected players."""
@@ -399,12 +740,9 @@ class PlayerManager:
                     if trap_result.get('trap_config', {}).get('type') == 'pit':
                         return
 
-            # Track visited rooms for map functionality
-            if 'visited_rooms' not in character:
-                character['visited_rooms'] = []
-            # Keep as list for JSON serialization
-            if new_room not in character['visited_rooms']:
-                character['visited_rooms'].append(new_room)
+            # Track explored rooms for map functionality (bitset over room indices)
+            room_index = self.game_engine.world_manager.room_index
+            character['explored_rooms'] = room_index.mark_explored(character.get('explored_rooms', ''), new_room)
 
             # Check if any wandering mobs should follow the player
             t0 = time.time()
@@ -483,40 +821,40 @@ class PlayerManager:
         """
         import random
         from ...utils.logger import get_logger
-        logger = get_logger()
+        logger = get_logger('follow')
 
         # Get follow chance from config
         follow_chance = self.game_engine.config_manager.get_setting('combat', 'mob_follow', 'follow_chance', default=0.4)
 
-        logger.info(f"[FOLLOW] Checking mob following from {old_room_id} to {new_room_id}, follow_chance={follow_chance}")
+        logger.debug("[FOLLOW] Checking mob following from %s to %s, follow_chance=%s", old_room_id, new_room_id, follow_chance)
 
         # Check if there are any mobs in the old room
         if old_room_id not in self.game_engine.room_mobs:
-            logger.debug(f"[FOLLOW] No mobs in room {old_room_id}")
+            logger.debug("[FOLLOW] No mobs in room %s", old_room_id)
             return
 
-        logger.info(f"[FOLLOW] Found {len(self.game_engine.room_mobs[old_room_id])} mobs in old room")
+        logger.debug("[FOLLOW] Found %d mobs in old room", len(self.game_engine.room_mobs[old_room_id]))
 
         mobs_to_follow = []
 
         for mob in self.game_engine.room_mobs[old_room_id][:]:  # Copy to avoid modification during iteration
             # Only wandering mobs can follow
             if not mob.get('is_wandering'):
-                logger.debug(f"[FOLLOW] {mob.get('name')} is not a wandering mob, is_wandering={mob.get('is_wandering')}")
+                logger.debug("[FOLLOW] %s is not a wandering mob, is_wandering=%s", mob.get('name'), mob.get('is_wandering'))
                 continue
 
             # Skip if mob is dead
             if mob.get('health', 0) <= 0:
-                logger.debug(f"[FOLLOW] {mob.get('name')} is dead")
+                logger.debug("[FOLLOW] %s is dead", mob.get('name'))
                 continue
 
             # Roll for follow chance
             roll = random.random()
             if roll >= follow_chance:
-                logger.debug(f"[FOLLOW] {mob.get('name')} failed follow roll: {roll:.2f} >= {follow_chance}")
+                logger.debug("[FOLLOW] %s failed follow roll: %.2f >= %s", mob.get('name'), roll, follow_chance)
                 continue
 
-            logger.info(f"[FOLLOW] {mob.get('name')} passed follow roll: {roll:.2f} < {follow_chance}")
+            logger.debug("[FOLLOW] %s passed follow roll: %.2f < %s", mob.get('name'), roll, follow_chance)
 
             # Get the exit from old room
             old_room = self.game_engine.world_manager.get_room(old_room_id)
@@ -526,22 +864,22 @@ class PlayerManager:
             # Check if mob can follow through this exit
             exit_obj = old_room.exits.get(direction)
             if not exit_obj:
-                logger.debug(f"[FOLLOW] No exit {direction} found in room")
+                logger.debug("[FOLLOW] No exit %s found in room", direction)
                 continue
 
             # Check if exit is locked
             if old_room.is_exit_locked(direction):
-                logger.debug(f"[FOLLOW] {mob.get('name')} cannot follow - exit {direction} is locked")
+                logger.debug("[FOLLOW] %s cannot follow - exit %s is locked", mob.get('name'), direction)
                 continue
 
             # Check if destination is a safe room
             dest_room = self.game_engine.world_manager.get_room(new_room_id)
             if dest_room and hasattr(dest_room, 'is_safe') and dest_room.is_safe:
-                logger.debug(f"[FOLLOW] {mob.get('name')} cannot follow - destination is a safe room")
+                logger.debug("[FOLLOW] %s cannot follow - destination is a safe room", mob.get('name'))
                 continue
 
             # This mob will follow
-            logger.info(f"[FOLLOW] {mob.get('name')} will follow")
+            logger.debug("[FOLLOW] %s will follow", mob.get('name'))
             mobs_to_follow.append(mob)
 
         # Move the mobs that are following
@@ -573,7 +911,7 @@ class PlayerManager:
                         f"{mob_name} follows you into the room!"
                     )
 
-            logger.info(f"[FOLLOW] {mob_name} followed player from {old_room_id} to {new_room_id} via {direction}")
+            logger.info("[FOLLOW] %s followed player from %s to %s via %s", mob_name, old_room_id, new_room_id, direction)
 
     async def _move_followers(self, leader_id: int, old_room_id: str, new_room_id: str, direction: str, leader_name: str):
         """Move any players who are following this player.
@@ -664,12 +1002,9 @@ class PlayerManager:
             # Move follower to new room
             follower_char['room_id'] = new_room_id
 
-            # Track visited rooms
-            if 'visited_rooms' not in follower_char:
-                follower_char['visited_rooms'] = []
-            # Keep as list for JSON serialization
-            if new_room_id not in follower_char['visited_rooms']:
-                follower_char['visited_rooms'].append(new_room_id)
+            # Track explored rooms
+            room_index = self.game_engine.world_manager.room_index
+            follower_char['explored_rooms'] = room_index.mark_explored(follower_char.get('explored_rooms', ''), new_room_id)
 
             # Notify follower
             await self.connection_manager.send_message(
@@ -931,7 +1266,7 @@ class PlayerManager:
                         leader_id,
                         f"{username} has stopped following you (disconnected)."
                     )
-                    logger.info(f"[FOLLOW] Player {player_id} stopped following {leader_id} due to disconnect")
+                    logger.info("[FOLLOW] Player %s stopped following %s due to disconnect", player_id, leader_id)
 
         # Case 2: This player has followers - notify them all
         if character.get('followers'):
@@ -946,7 +1281,7 @@ class PlayerManager:
                         follower_id,
                         f"{username} has left the game. You stop following."
                     )
-                    logger.info(f"[FOLLOW] Player {follower_id} stopped following {player_id} due to leader disconnect")
+                    logger.info("[FOLLOW] Player %s stopped following %s due to leader disconnect", follower_id, player_id)
 
             # Clear followers list
             character['followers'] = []
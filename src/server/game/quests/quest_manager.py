@@ -1,8 +1,8 @@
 """Quest management system."""
 
-import json
 import os
 from typing import Dict, List, Optional, Any, Tuple
+from ...persistence.content_bundle import get_content_bundle
 from ...utils.logger import get_logger
 
 
@@ -20,18 +20,18 @@ class QuestManager:
         """Load all quests from quests.json."""
         # Try new location first, then fall back to old
         quests_file = os.path.join('data', 'quests', 'quests.json')
-        if not os.path.exists(quests_file):
+        content = get_content_bundle()
+        if not content.exists(quests_file):
             quests_file = os.path.join('data', 'quests.json')
 
-        if not os.path.exists(quests_file):
+        if not content.exists(quests_file):
             self.logger.warning(f"Quests file not found: {quests_file}")
             return
 
         try:
-            with open(quests_file, 'r') as f:
-                quests_list = json.load(f)
-                for quest in quests_list:
-                    self.quests[quest['id']] = quest
+            quests_list = content.get_json(quests_file)
+            for quest in quests_list:
+                self.quests[quest['id']] = quest
             self.logger.info(f"Loaded {len(self.quests)} quests")
         except Exception as e:
             self.logger.error(f"Error loading quests: {e}")
@@ -161,6 +161,29 @@ class QuestManager:
 
         return False
 
+    async def on_mob_killed(self, event):
+        """Advance kill_monster objectives when a player kills a mob (MobKilled event)."""
+        player_data = self.game_engine.player_manager.connected_players.get(event.player_id)
+        if not player_data or not player_data.get('character'):
+            return
+        character = player_data['character']
+
+        # Check all active quests for kill objectives
+        player_quests = character.get('quests', {})
+        self.logger.info(f"[QUEST] Player killed {event.mob_id} in {event.room_id}, checking {len(player_quests)} quests")
+        for quest_id in list(player_quests):
+            # Skip completed quests
+            if player_quests[quest_id].get('completed'):
+                self.logger.info(f"[QUEST] Skipping {quest_id} - already completed")
+                continue
+
+            self.logger.info(f"[QUEST] Checking {quest_id} for kill_monster objective: {event.mob_id}")
+            if self.check_objective_completion(character, quest_id, 'kill_monster', event.mob_id, event.room_id):
+                quest = self.get_quest(quest_id)
+                if quest:
+                    completion_msg = quest.get('completed_message', 'Quest objective completed!')
+                    await self.game_engine.connection_manager.send_message(event.player_id, f"\n{completion_msg}\n")
+
     def give_quest_reward(self, character: Dict, quest_id: str):
         """Give quest rewards to player."""
         quest = self.get_quest(quest_id)
@@ -1,10 +1,10 @@
 """Trap system for handling room traps and their effects."""
 
 import random
-import json
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List
+from ...persistence.content_bundle import get_content_bundle
 from ...utils.logger import get_logger
 
 
@@ -21,7 +21,8 @@ class TrapType:
             return
 
         trap_file = Path("data/traps/traps.json")
-        if not trap_file.exists():
+        content = get_content_bundle()
+        if not content.exists(trap_file):
             logger = get_logger()
             logger.error(f"Trap data file not found: {trap_file}")
             cls._trap_data = {}
@@ -29,18 +30,29 @@ class TrapType:
             return
 
         try:
-            with open(trap_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                cls._trap_data = data.get('traps', {})
-                cls._loaded = True
-                logger = get_logger()
-                logger.info(f"Loaded {len(cls._trap_data)} trap types from {trap_file}")
+            data = content.get_json(trap_file)
+            cls._trap_data = data.get('traps', {})
+            cls._loaded = True
+            logger = get_logger()
+            logger.info(f"Loaded {len(cls._trap_data)} trap types from {trap_file}")
         except Exception as e:
             logger = get_logger()
             logger.error(f"Error loading trap data: {e}")
             cls._trap_data = {}
             cls._loaded = True
 
+    @classmethod
+    def reload(cls):
+        """Re-read the trap definitions (for hot reloads of game content)."""
+        cls._loaded = False
+        cls._load_traps()
+
+    @classmethod
+    def get_all_traps(cls) -> Dict[str, Any]:
+        """Get every trap definition, keyed by ID."""
+        cls._load_traps()
+        return cls._trap_data
+
     @classmethod
     def get_trap(cls, trap_type: str) -> Optional[Dict[str, Any]]:
         """Get trap definition by type."""
@@ -64,8 +76,7 @@ class TrapSystem:
         if not room:
             return []
 
-        room_data = self.game_engine.world_manager.rooms_data.get(room_id, {})
-        return room_data.get('traps', [])
+        return self.game_engine.world_manager.rooms_data.get_field(room_id, 'traps', [])
 
     def initialize_room_traps(self, room_id: str):
         """Initialize trap states for a room if not already initialized."""
@@ -1,14 +1,11 @@
 """Vendor System - handles all vendor-related functionality."""
 
-import json
-import yaml
-import os
-import glob
 import random
 import time
 from typing import Optional, Dict, Any, List
 from ...utils.logger import get_logger
 from ...utils.colors import service_message, error_message, info_message
+from ..name_index import NameIndex, resolve
 
 
 class VendorSystem:
@@ -17,12 +14,14 @@ class VendorSystem:
     def __init__(self, game_engine):
         """Initialize the vendor system."""
         self.game_engine = game_engine
-        self.logger = get_logger()
+        self.logger = get_logger('vendors')
 
         # Vendor management - tracks vendor data and inventory
         self.vendors: Dict[str, Dict[str, Any]] = {}  # vendor_id -> vendor data
         self.vendor_locations: Dict[str, List[str]] = {}  # room_id -> vendor_ids
         self.items_data: Dict[str, Dict[str, Any]] = {}  # item_id -> item data
+        self._item_index = NameIndex()  # item names, rebuilt when items_data is replaced
+        self._item_index_source = None
 
         # Stock replenishment tracking
         self.vendor_initial_stock: Dict[str, Dict[str, int]] = {}  # vendor_id -> {item_id -> initial_stock}
@@ -42,19 +41,11 @@ class VendorSystem:
             # Use cached NPC data from WorldManager instead of loading from files
             if hasattr(self.game_engine, 'world_manager') and self.game_engine.world_manager.npcs:
                 for npc_id, npc_data in self.game_engine.world_manager.npcs.items():
-                    # Check if this NPC has vendor/shop services or shop data
-                    services = npc_data.get('services', [])
-                    # Check for any vendor-related service
-                    vendor_service_keywords = ['shop', 'vendor', 'weapon_shop', 'armor_shop', 'blacksmith',
-                                               'potion_shop', 'magic_shop', 'equipment_shop', 'repair',
-                                               'forge', 'tavern', 'inn']
-                    has_vendor_service = any(keyword in services for keyword in vendor_service_keywords)
-
-                    if has_vendor_service or npc_data.get('shop'):
-                        self.logger.info(f"[VENDOR DEBUG] Processing NPC as vendor: {npc_id} with services: {services}")
+                    if self._is_vendor_npc(npc_data):
+                        self.logger.debug("[VENDOR] Processing NPC as vendor: %s with services: %s", npc_id, npc_data.get('services', []))
                         self._process_npc_vendor(npc_data)
                 self.logger.info(f"Loaded {len(self.vendors)} vendors from cached NPC data")
-                self.logger.info(f"[VENDOR DEBUG] Vendors loaded: {list(self.vendors.keys())}")
+                self.logger.debug("[VENDOR] Vendors loaded: %s", self.vendors.keys())
             else:
                 self.logger.warning("WorldManager NPCs not available, no vendors loaded")
 
@@ -64,6 +55,62 @@ class VendorSystem:
         except Exception as e:
             self.logger.error(f"Error loading vendor data: {e}")
 
+    def reload_vendors(self, changed_npc_ids) -> int:
+        """Rebuild the vendors for NPCs whose definitions changed.
+
+        Other vendors keep their current stock; changed vendors start again
+        from the stock in their definitions.
+
+        Args:
+            changed_npc_ids: IDs of NPCs that were added, modified or removed
+
+        Returns:
+            Number of vendors rebuilt or removed
+        """
+        npcs = self.game_engine.world_manager.npcs
+        updated = 0
+        for npc_id in changed_npc_ids:
+            was_vendor = self.vendors.pop(npc_id, None) is not None
+            self.vendor_initial_stock.pop(npc_id, None)
+            npc_data = npcs.get(npc_id)
+            if npc_data and self._is_vendor_npc(npc_data):
+                self._process_npc_vendor(npc_data)
+                updated += 1
+            elif was_vendor:
+                updated += 1
+
+        # Vendors may have been added or removed, so remap the rooms that have NPCs
+        self.update_vendor_locations()
+        return updated
+
+    def update_vendor_locations(self, room_ids=None):
+        """Remap vendors to rooms after room or vendor changes.
+
+        Args:
+            room_ids: Rooms to remap (default: every room with NPCs)
+        """
+        rooms_data = self.game_engine.world_manager.rooms_data
+        if room_ids is None:
+            self.vendor_locations.clear()
+            room_ids = rooms_data
+
+        for room_id in room_ids:
+            self.vendor_locations.pop(room_id, None)
+            npc_ids = rooms_data.get_field(room_id, 'npcs', [])
+            vendor_ids = [npc_id for npc_id in npc_ids if isinstance(npc_id, str) and npc_id in self.vendors]
+            if vendor_ids:
+                self.vendor_locations[room_id] = vendor_ids
+
+    def _is_vendor_npc(self, npc_data: dict) -> bool:
+        """Check if an NPC has vendor/shop services or shop data."""
+        services = npc_data.get('services', [])
+        # Check for any vendor-related service
+        vendor_service_keywords = ['shop', 'vendor', 'weapon_shop', 'armor_shop', 'blacksmith',
+                                   'potion_shop', 'magic_shop', 'equipment_shop', 'repair',
+                                   'forge', 'tavern', 'inn']
+        has_vendor_service = any(keyword in services for keyword in vendor_service_keywords)
+        return has_vendor_service or bool(npc_data.get('shop'))
+
     def _process_yaml_vendors(self, vendors_config: dict):
         """Process vendors from YAML configuration."""
         for vendor_id, vendor_data in vendors_config.items():
@@ -115,50 +162,21 @@ class VendorSystem:
                     self.vendor_initial_stock[vendor_id][item_id] = stock
 
     def _load_vendor_locations_from_world(self):
-        """Load vendor location mappings from world room data."""
+        """Load vendor location mappings from world room data.
+
+        Reads each room's NPC list from the room store WorldManager already
+        loaded; rooms without NPCs are skipped without being decoded.
+        """
         try:
-            # Clear existing location mappings to rebuild from world data
-            self.vendor_locations.clear()
-            self.logger.info(f"[VENDOR DEBUG] Starting vendor location loading from world data")
-            self.logger.info(f"[VENDOR DEBUG] Available vendors before mapping: {list(self.vendors.keys())}")
-
-            # Load room data from world/rooms directory
-            rooms_dir = os.path.join('data', 'world', 'rooms')
-            self.logger.info(f"[VENDOR DEBUG] Looking for rooms in directory: {rooms_dir}")
-
-            if os.path.exists(rooms_dir):
-                room_files = glob.glob(os.path.join(rooms_dir, '**', '*.json'), recursive=True)
-                self.logger.info(f"[VENDOR DEBUG] Found {len(room_files)} room files: {[os.path.basename(f) for f in room_files]}")
-
-                for room_file in room_files:
-                    try:
-                        with open(room_file, 'r') as f:
-                            room_data = json.load(f)
-                            room_id = room_data.get('id')
-                            npcs = room_data.get('npcs', [])
-
-                            self.logger.info(f"[VENDOR DEBUG] Processing room file {os.path.basename(room_file)}: room_id='{room_id}', npcs={npcs}")
-
-                            if room_id and npcs:
-                                # Check each NPC to see if it's a vendor
-                                for npc_id in npcs:
-                                    if npc_id in self.vendors:
-                                        # Map this vendor to this room
-                                        if room_id not in self.vendor_locations:
-                                            self.vendor_locations[room_id] = []
-                                        self.vendor_locations[room_id].append(npc_id)
-                                        self.logger.info(f"[VENDOR DEBUG] Mapped vendor '{npc_id}' to room '{room_id}'")
-                                    else:
-                                        self.logger.info(f"[VENDOR DEBUG] NPC '{npc_id}' in room '{room_id}' is not a vendor")
-
-                    except Exception as e:
-                        self.logger.error(f"Error loading room file {room_file}: {e}")
-
-                self.logger.info(f"Loaded vendor locations for {len(self.vendor_locations)} rooms from world data")
-                self.logger.info(f"[VENDOR DEBUG] Final vendor_locations mapping: {dict(self.vendor_locations)}")
+            rooms_data = self.game_engine.world_manager.rooms_data
+            if not rooms_data:
+                self.vendor_locations.clear()
+                self.logger.warning("World room data not loaded, no vendor locations mapped")
+                return
 
-            else:
-                self.logger.warning(f"World rooms directory not found at {rooms_dir}")
+            self.update_vendor_locations()
+
+            self.logger.info(f"Loaded vendor locations for {len(self.vendor_locations)} rooms from world data")
 
         except Exception as e:
             self.logger.error(f"Error loading vendor locations from world data: {e}")
@@ -177,37 +195,21 @@ class VendorSystem:
 
     def find_vendor_by_name(self, room_id: str, vendor_name: str) -> dict:
         """Find a vendor by name in the specified room."""
-        vendors = self.get_vendors_in_room(room_id)
-
-        vendor_name_lower = vendor_name.lower()
-        for vendor in vendors:
-            name = vendor.get('name', '').lower()
-            if vendor_name_lower in name or name in vendor_name_lower:
-                return vendor
-
-        return None
+        vendor, _, _ = resolve(self.get_vendors_in_room(room_id), vendor_name)
+        return vendor
 
     def get_vendor_in_room(self, room_id: str):
         """Get vendor data for the current room from loaded NPCs."""
-        self.logger.info(f"[VENDOR DEBUG] get_vendor_in_room called with room_id: '{room_id}'")
-        self.logger.info(f"[VENDOR DEBUG] Current vendor_locations mapping: {dict(self.vendor_locations)}")
-        self.logger.info(f"[VENDOR DEBUG] Available vendors: {list(self.vendors.keys())}")
-
         # Use the room-based vendor location mapping
         vendors_in_room = self.get_vendors_in_room(room_id)
-        self.logger.info(f"[VENDOR DEBUG] Vendors found in room '{room_id}': {[v.get('name', 'unnamed') for v in vendors_in_room]}")
 
         # Return the first vendor that has a shop (for backwards compatibility)
         for vendor in vendors_in_room:
-            self.logger.info(f"[VENDOR DEBUG] Checking vendor {vendor.get('name', 'unnamed')}")
-            self.logger.info(f"[VENDOR DEBUG] Vendor keys: {list(vendor.keys())}")
-            self.logger.info(f"[VENDOR DEBUG] Has inventory: {bool(vendor.get('inventory'))}")
             if vendor.get('inventory'):
-                self.logger.info(f"[VENDOR DEBUG] Inventory: {vendor.get('inventory')}")
-                self.logger.info(f"[VENDOR DEBUG] Returning vendor with shop: {vendor.get('name', 'unnamed')}")
+                self.logger.debug("[VENDOR] Vendor with shop in room '%s': %s", room_id, vendor.get('name', 'unnamed'))
                 return vendor
 
-        self.logger.info(f"[VENDOR DEBUG] No vendors with shops found in room '{room_id}'")
+        self.logger.debug("[VENDOR] No vendors with shops found in room '%s' (%d vendors)", room_id, len(vendors_in_room))
         return None
 
     def calculate_charisma_modifier(self, charisma: int, buying: bool = True) -> float:
@@ -306,46 +308,21 @@ class VendorSystem:
     def find_item_by_name(self, item_name: str) -> str:
         """Find an item ID by searching item names.
 
-        Uses a multi-pass approach:
-        1. Try exact match on item ID
-        2. Try exact match on display name
-        3. Try exact word match (for "Scroll of X" style names)
-        4. Try word boundary match (word starts with search term)
-        5. Fall back to substring match as last resort
+        An exact item ID wins; otherwise display names are ranked exact, whole
+        word ("novadi" for "Scroll of Novadi"), word prefix, then substring,
+        and "2.scroll" picks the second match.
         """
-        item_name_lower = item_name.lower()
-
-        # First pass: Try exact match on item ID
+        item_name_lower = item_name.lower().strip()
         if item_name_lower in self.items_data:
             return item_name_lower
 
-        # Second pass: Try exact match on display names
-        for item_id, item_data in self.items_data.items():
-            display_name = item_data.get('name', item_id).lower()
-            if item_name_lower == display_name:
-                return item_id
-
-        # Third pass: Try exact word match (for "Scroll of Novadi" matching "novadi")
-        for item_id, item_data in self.items_data.items():
-            display_name = item_data.get('name', item_id).lower()
-            words = display_name.split()
-            if item_name_lower in words:
-                return item_id
-
-        # Fourth pass: Try word boundary match (word starts with search term)
-        for item_id, item_data in self.items_data.items():
-            display_name = item_data.get('name', item_id).lower()
-            words = display_name.split()
-            if any(word.startswith(item_name_lower) for word in words):
-                return item_id
-
-        # Fifth pass: Substring match as last resort
-        for item_id, item_data in self.items_data.items():
-            display_name = item_data.get('name', item_id).lower()
-            if item_name_lower in display_name or display_name in item_name_lower:
-                return item_id
-
-        return None
+        # Index the item definitions once per (re)load
+        if self._item_index_source is not self.items_data:
+            self._item_index = NameIndex()
+            for item_id, item_data in self.items_data.items():
+                self._item_index.add(item_id, (item_data.get('name', item_id),))
+            self._item_index_source = self.items_data
+        return self._item_index.find(item_name_lower)
 
     async def handle_trade_command(self, player_id: int, action: str, item_name: str):
         """Handle buy/sell commands with vendors."""
@@ -206,6 +206,7 @@ class BarrierSystem:
         if barrier_type != 'obstacle':
             # Doors stay unlocked once opened
             barrier_info['locked'] = False
+            self.world_manager.exit_state_changed(room.room_id)
         # Obstacles (like pits) don't unlock - you just pass through this time
 
         unlock_msg = barrier_def.get('unlock_message', 'You unlock the way forward.')
@@ -1,6 +1,7 @@
 """Graph-based navigation system for MUD world."""
 
 import heapq
+from collections import deque
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
@@ -105,6 +106,25 @@ class WorldGraph:
             self.reverse_edges[to_room] = [e for e in self.reverse_edges[to_room]
                                          if e.from_room != from_room]
 
+    def remove_edges_from(self, room_id: str):
+        """Remove every edge leaving a room."""
+        for edge in self.edges.get(room_id, []):
+            if edge.to_room in self.reverse_edges:
+                self.reverse_edges[edge.to_room] = [e for e in self.reverse_edges[edge.to_room]
+                                                    if e is not edge]
+        if room_id in self.edges:
+            self.edges[room_id] = []
+
+    def remove_room(self, room_id: str):
+        """Remove a room and every edge leading to or from it."""
+        self.remove_edges_from(room_id)
+        for edge in self.reverse_edges.get(room_id, []):
+            if edge.from_room in self.edges:
+                self.edges[edge.from_room] = [e for e in self.edges[edge.from_room] if e is not edge]
+        self.edges.pop(room_id, None)
+        self.reverse_edges.pop(room_id, None)
+        self.rooms.discard(room_id)
+
     def get_neighbors(self, room_id: str, character: 'Character' = None) -> List[GraphEdge]:
         """Get all traversable neighbors from a room."""
         if room_id not in self.edges:
@@ -129,8 +149,8 @@ class WorldGraph:
         if start not in self.rooms or goal not in self.rooms:
             return None
 
-        distances = {room: float('inf') for room in self.rooms}
-        distances[start] = 0
+        # Only rooms the search reaches get an entry
+        distances = {start: 0}
         previous = {}
         unvisited = [(0, start)]
         visited = set()
@@ -156,13 +176,17 @@ class WorldGraph:
                 neighbor = edge.to_room
                 distance = current_distance + edge.weight
 
-                if distance < distances[neighbor]:
+                if distance < distances.get(neighbor, float('inf')):
                     distances[neighbor] = distance
                     previous[neighbor] = current
                     heapq.heappush(unvisited, (distance, neighbor))
 
         return None
 
+    def find_path(self, start: str, goal: str, character: 'Character' = None) -> Optional[List[str]]:
+        """Find the shortest path between two rooms."""
+        return self.find_path_dijkstra(start, goal, character)
+
     def find_path_astar(self, start: str, goal: str, character: 'Character' = None,
                        heuristic_func=None) -> Optional[List[str]]:
         """Find shortest path using A* algorithm with heuristic."""
@@ -175,10 +199,7 @@ class WorldGraph:
 
         open_set = [(0, start)]
         came_from = {}
-        g_score = {room: float('inf') for room in self.rooms}
-        g_score[start] = 0
-        f_score = {room: float('inf') for room in self.rooms}
-        f_score[start] = heuristic_func(start, goal)
+        g_score = {start: 0}
 
         while open_set:
             current = heapq.heappop(open_set)[1]
@@ -196,11 +217,10 @@ class WorldGraph:
                 neighbor = edge.to_room
                 tentative_g_score = g_score[current] + edge.weight
 
-                if tentative_g_score < g_score[neighbor]:
+                if tentative_g_score < g_score.get(neighbor, float('inf')):
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = g_score[neighbor] + heuristic_func(neighbor, goal)
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                    heapq.heappush(open_set, (tentative_g_score + heuristic_func(neighbor, goal), neighbor))
 
         return None
 
@@ -211,10 +231,10 @@ class WorldGraph:
             return {}
 
         distances = {start: 0}
-        queue = [(start, 0)]
+        queue = deque([(start, 0)])
 
         while queue:
-            current_room, current_distance = queue.pop(0)
+            current_room, current_distance = queue.popleft()
 
             if max_distance is not None and current_distance >= max_distance:
                 continue
@@ -0,0 +1,334 @@
+"""Hierarchical (area-level) pathfinding.
+
+Rooms have no coordinates, so A* on the world graph has no useful heuristic
+and a long route searches most of the world. Areas already partition the
+rooms, so long routes are solved in two levels instead, as in HPA*:
+
+- The abstract graph has one node per boundary room (a room with an exit
+  into, or an entrance from, another area). Boundary rooms of the same area
+  are joined by their shortest distance inside the area, and boundary rooms
+  of different areas by the exits between them.
+- A query searches inside the start and goal areas only, then across the
+  abstract graph, and finally expands each step between two boundary rooms
+  of one area into rooms, from paths stored when the area was built.
+
+Area data is built on first use and rebuilt only for areas whose rooms
+changed. Routes are shortest under the abstract graph; they can be a few
+rooms longer than the true shortest path when a shortcut leaves and re-enters
+an area.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ...utils.logger import get_logger
+
+
+class _AreaLevel:
+    """Boundary rooms of one area and the shortest paths between them."""
+
+    def __init__(self, boundary: Set[str]):
+        self.boundary = boundary
+        # boundary room -> boundary room -> distance inside the area
+        self.costs: Dict[str, Dict[str, float]] = {}
+        # boundary room -> search tree (room -> previous room) inside the area
+        self.trees: Dict[str, Dict[str, str]] = {}
+
+
+class HierarchicalPathfinder:
+    """Finds routes through the world graph at the area level first."""
+
+    def __init__(self, world_manager):
+        """Initialize the pathfinder.
+
+        Args:
+            world_manager: WorldManager owning the rooms and the world graph
+        """
+        self.world_manager = world_manager
+        self.logger = get_logger()
+
+        self._levels: Dict[Optional[str], _AreaLevel] = {}
+        self._room_areas: Optional[Dict[str, Optional[str]]] = None
+        self._area_rooms: Dict[Optional[str], Set[str]] = {}
+
+        self.area_builds = 0
+        self.queries = 0
+        self.fallbacks = 0
+
+    def find_path(self, start: str, goal: str, character: 'Character' = None) -> Optional[List[str]]:
+        """Find a route between two rooms.
+
+        Args:
+            start: Starting room ID
+            goal: Destination room ID
+            character: Character whose abilities limit the exits used (None: any exit)
+
+        Returns:
+            Room IDs from start to goal (inclusive), or None if there is no route
+        """
+        graph = self.world_manager.world_graph
+        if start not in graph.rooms or goal not in graph.rooms:
+            return None
+        if start == goal:
+            return [start]
+        self.queries += 1
+
+        start_area, goal_area = self._area_of(start), self._area_of(goal)
+        if start_area == goal_area:
+            dist, prev = self._search(start, self._members(start_area), character, target=goal)
+            if goal in dist:
+                return self._unwind(prev, goal, start)
+
+        route = self._abstract_route(start, goal, character)
+        if route is None:
+            return None
+        path = self._refine(start, route, character)
+        if path is None:
+            # Refining failed inside an area the character can't cross the way the
+            # abstract graph assumed; search the whole graph for this one
+            self.fallbacks += 1
+            dist, prev = self._search(start, graph.rooms, character, target=goal)
+            return self._unwind(prev, goal, start) if goal in dist else None
+        return path
+
+    def invalidate_rooms(self, room_ids: Iterable[str]):
+        """Rebuild the area data that depends on rooms whose exits changed.
+
+        Args:
+            room_ids: IDs of the changed rooms (including added and removed ones)
+        """
+        graph = self.world_manager.world_graph
+        room_areas = self._room_areas or {}
+        areas = set()
+        for room_id in room_ids:
+            if room_id in room_areas:
+                areas.add(room_areas[room_id])
+            room = self.world_manager.rooms.get(room_id)
+            if room is not None:
+                areas.add(getattr(room, 'area_id', None))
+            # Neighbours in other areas may have gained or lost boundary rooms
+            for edge in graph.edges.get(room_id, ()):
+                areas.add(self._current_area(edge.to_room))
+            for edge in graph.reverse_edges.get(room_id, ()):
+                areas.add(self._current_area(edge.from_room))
+
+        for area_id in areas:
+            self._levels.pop(area_id, None)
+        self._room_areas = None
+
+    def invalidate_all(self):
+        """Drop all area data, e.g. after the world was reloaded."""
+        self._levels.clear()
+        self._room_areas = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get abstract graph and query statistics."""
+        return {
+            'areas_built': len(self._levels),
+            'boundary_rooms': sum(len(level.boundary) for level in self._levels.values()),
+            'area_builds': self.area_builds,
+            'queries': self.queries,
+            'fallbacks': self.fallbacks
+        }
+
+    # Abstract level
+
+    def _abstract_route(self, start: str, goal: str, character) -> Optional[List[Tuple[str, List[str]]]]:
+        """Search the abstract graph from start to goal.
+
+        Returns:
+            The route as (room, rooms walked to reach it) steps, from start to
+            goal, or None if there is none
+        """
+        graph = self.world_manager.world_graph
+        start_area, goal_area = self._area_of(start), self._area_of(goal)
+        start_dist, start_prev = self._search(start, self._members(start_area), character)
+        goal_dist, goal_prev = self._search(goal, self._members(goal_area), character, reverse=True)
+
+        # Entries are (cost, room); the goal is reached from a boundary room of its area
+        best: Dict[str, float] = {}
+        came_from: Dict[str, Tuple[str, List[str]]] = {}
+        queue = []
+        for room_id in self._level(start_area).boundary:
+            if room_id in start_dist:
+                best[room_id] = start_dist[room_id]
+                came_from[room_id] = (start, self._unwind(start_prev, room_id, start)[1:])
+                heapq.heappush(queue, (start_dist[room_id], room_id))
+
+        visited = set()
+        while queue:
+            cost, room_id = heapq.heappop(queue)
+            if room_id in visited:
+                continue
+            visited.add(room_id)
+            if room_id == goal:
+                break
+
+            area_id = self._area_of(room_id)
+            steps = []
+            if area_id == goal_area and room_id in goal_dist:
+                steps.append((goal, goal_dist[room_id], self._unwind_reverse(goal_prev, room_id, goal)[1:]))
+            level = self._level(area_id)
+            for other, distance in level.costs.get(room_id, {}).items():
+                steps.append((other, distance, None))
+            for edge in graph.edges.get(room_id, ()):
+                if self._area_of(edge.to_room) != area_id and self._can_traverse(edge, character):
+                    steps.append((edge.to_room, edge.weight, [edge.to_room]))
+
+            for other, distance, walked in steps:
+                new_cost = cost + distance
+                if new_cost < best.get(other, float('inf')):
+                    best[other] = new_cost
+                    came_from[other] = (room_id, walked)
+                    heapq.heappush(queue, (new_cost, other))
+
+        if goal not in visited:
+            return None
+
+        route = []
+        room_id = goal
+        while room_id != start:
+            previous, walked = came_from[room_id]
+            route.append((room_id, walked))
+            room_id = previous
+        route.reverse()
+        return route
+
+    def _refine(self, start: str, route: List[Tuple[str, List[str]]], character) -> Optional[List[str]]:
+        """Expand an abstract route into rooms."""
+        path = [start]
+        current = start
+        for room_id, walked in route:
+            if walked is None:
+                # A step between two boundary rooms of one area
+                walked = self._inner_path(current, room_id, character)
+                if walked is None:
+                    return None
+            path.extend(walked)
+            current = room_id
+        return path
+
+    def _inner_path(self, source: str, target: str, character) -> Optional[List[str]]:
+        """Rooms walked from one boundary room to another of the same area (excluding source)."""
+        if character is None:
+            tree = self._level(self._area_of(source)).trees.get(source, {})
+            if target in tree:
+                return self._unwind(tree, target, source)[1:]
+            return None
+        dist, prev = self._search(source, self._members(self._area_of(source)), character, target=target)
+        if target not in dist:
+            return None
+        return self._unwind(prev, target, source)[1:]
+
+    def _level(self, area_id: Optional[str]) -> _AreaLevel:
+        """Get (building if needed) the boundary rooms and inner paths of an area."""
+        level = self._levels.get(area_id)
+        if level is not None:
+            return level
+
+        graph = self.world_manager.world_graph
+        members = self._members(area_id)
+        boundary = set()
+        for room_id in members:
+            if (any(self._area_of(edge.to_room) != area_id for edge in graph.edges.get(room_id, ())) or
+                    any(self._area_of(edge.from_room) != area_id for edge in graph.reverse_edges.get(room_id, ()))):
+                boundary.add(room_id)
+
+        level = _AreaLevel(boundary)
+        for room_id in boundary:
+            dist, prev = self._search(room_id, members)
+            level.costs[room_id] = {other: dist[other] for other in boundary
+                                    if other != room_id and other in dist}
+            level.trees[room_id] = prev
+        self._levels[area_id] = level
+        self.area_builds += 1
+        return level
+
+    # Searches inside one area
+
+    def _search(self, source: str, members: Set[str], character=None, reverse: bool = False,
+                target: Optional[str] = None) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """Dijkstra from a room, restricted to a set of rooms.
+
+        Args:
+            source: Room the search starts from
+            members: Rooms the search may visit
+            character: Character whose abilities limit the exits used
+            reverse: Follow exits backwards (distances are then to the source)
+            target: Stop once this room is settled
+
+        Returns:
+            (distances, previous room on the search tree) for every room reached
+        """
+        graph = self.world_manager.world_graph
+        dist = {source: 0}
+        prev: Dict[str, str] = {}
+        queue = [(0, source)]
+        settled = set()
+        while queue:
+            cost, room_id = heapq.heappop(queue)
+            if room_id in settled:
+                continue
+            settled.add(room_id)
+            if room_id == target:
+                break
+            edges = graph.reverse_edges.get(room_id, ()) if reverse else graph.edges.get(room_id, ())
+            for edge in edges:
+                other = edge.from_room if reverse else edge.to_room
+                if other not in members:
+                    continue
+                if not self._can_traverse(edge, character):
+                    continue
+                new_cost = cost + edge.weight
+                if new_cost < dist.get(other, float('inf')):
+                    dist[other] = new_cost
+                    prev[other] = room_id
+                    heapq.heappush(queue, (new_cost, other))
+        return dist, prev
+
+    def _can_traverse(self, edge, character) -> bool:
+        """Check an exit against a character's keys and abilities (any exit without one)."""
+        return character is None or self.world_manager.can_traverse_exit(edge, character)
+
+    @staticmethod
+    def _unwind(prev: Dict[str, str], room_id: str, source: str) -> List[str]:
+        """Path from the source of a search tree to a room (inclusive)."""
+        path = [room_id]
+        while room_id != source:
+            room_id = prev[room_id]
+            path.append(room_id)
+        path.reverse()
+        return path
+
+    @staticmethod
+    def _unwind_reverse(prev: Dict[str, str], room_id: str, source: str) -> List[str]:
+        """Path from a room to the source of a reverse search tree (inclusive)."""
+        path = [room_id]
+        while room_id != source:
+            room_id = prev[room_id]
+            path.append(room_id)
+        return path
+
+    # Area membership
+
+    def _area_of(self, room_id: str) -> Optional[str]:
+        return self._membership().get(room_id)
+
+    def _members(self, area_id: Optional[str]) -> Set[str]:
+        self._membership()
+        return self._area_rooms.get(area_id, set())
+
+    def _current_area(self, room_id: str) -> Optional[str]:
+        room = self.world_manager.rooms.get(room_id)
+        return getattr(room, 'area_id', None) if room is not None else None
+
+    def _membership(self) -> Dict[str, Optional[str]]:
+        """Map every room in the graph to its area, rebuilding the index after an invalidation."""
+        if self._room_areas is None:
+            self._room_areas = {}
+            self._area_rooms = {}
+            for room_id in self.world_manager.world_graph.rooms:
+                area_id = self._current_area(room_id)
+                self._room_areas[room_id] = area_id
+                self._area_rooms.setdefault(area_id, set()).add(room_id)
+        return self._room_areas
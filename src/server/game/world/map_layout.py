@@ -0,0 +1,206 @@
+"""Precomputed ASCII map layouts for areas.
+
+The map command used to lay an area out from scratch on every call: a BFS
+over the explored rooms with an O(n) collision scan per room, then a fresh
+character grid. Layouts are now computed once per area (at world load, and
+again only when the area's rooms change) over all of its rooms, and the fully
+revealed map is rendered once. A map request only hides the cells of rooms
+the player hasn't explored and adds the '@' marker.
+
+Every drawn cell remembers which rooms it belongs to (a room marker belongs
+to its room, a connection to both of its ends), so hiding unexplored rooms
+never needs the layout again.
+"""
+
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+# Grid offset of a room's neighbour in each direction (x, y)
+DIRECTION_OFFSETS = {
+    'north': (0, -2),
+    'south': (0, 2),
+    'east': (3, 0),
+    'west': (-3, 0),
+    'northeast': (3, -2),
+    'northwest': (-3, -2),
+    'southeast': (3, 2),
+    'southwest': (-3, 2),
+    'up': (0, 0),  # Special handling needed
+    'down': (0, 0),  # Special handling needed
+}
+
+# Columns left of the leftmost room on a rendered map
+MAP_MARGIN = 5
+
+
+class AreaMapLayout:
+    """Room positions and drawn cells of one area's map."""
+
+    def __init__(self, area, rooms_data, room_index=None):
+        """Lay out an area.
+
+        Args:
+            area: The Area to lay out
+            rooms_data: RoomStore with the rooms' exits
+            room_index: RoomIndex to build the area's room mask with
+        """
+        self.area_id = area.area_id
+        self.room_ids: Set[str] = set(area.rooms)
+        # Bitmask of the area's rooms, to intersect with explored-room bitsets
+        self.room_mask = room_index.mask(self.room_ids) if room_index is not None else 0
+        self.positions: Dict[str, Tuple[int, int]] = {}
+
+        # (x, y) -> layers of (char, rooms the char belongs to), in drawing order
+        self._cells: Dict[Tuple[int, int], List[Tuple[str, Tuple[str, ...]]]] = {}
+
+        self._place_rooms(area, rooms_data)
+        self._draw(area, rooms_data)
+        self._ordered_cells = sorted(self._cells.items(), key=lambda cell: (cell[0][1], cell[0][0]))
+
+        self.base_lines, self._line_index, self._col_offset = self._render_cells(None)
+
+    def render(self, visible: Optional[Set[str]] = None, current_room_id: Optional[str] = None) -> List[str]:
+        """Render the map lines.
+
+        Args:
+            visible: Rooms to show (None: all of them)
+            current_room_id: Room to mark with '@', if it is shown
+
+        Returns:
+            Map lines, without blank rows or trailing spaces
+        """
+        if visible is not None and self.room_ids <= visible:
+            visible = None
+        if visible is None:
+            lines = list(self.base_lines)
+            line_index, col_offset = self._line_index, self._col_offset
+        else:
+            lines, line_index, col_offset = self._render_cells(visible)
+
+        if current_room_id in self.positions and (visible is None or current_room_id in visible):
+            x, y = self.positions[current_room_id]
+            row, col = line_index[y], x + col_offset
+            lines[row] = lines[row][:col] + '@' + lines[row][col + 1:]
+        return lines
+
+    def _render_cells(self, visible: Optional[Set[str]]) -> Tuple[List[str], Dict[int, int], int]:
+        """Render the cells whose rooms are all visible.
+
+        Returns:
+            (lines, row y -> line index, column offset added to x)
+        """
+        rows: List[Tuple[int, List[Tuple[int, str]]]] = []
+        for (x, y), layers in self._ordered_cells:
+            char = None
+            for layer_char, owners in reversed(layers):
+                if visible is None or all(room_id in visible for room_id in owners):
+                    char = layer_char
+                    break
+            if char is None:
+                continue
+            if not rows or rows[-1][0] != y:
+                rows.append((y, []))
+            rows[-1][1].append((x, char))
+
+        if not rows:
+            return [], {}, 0
+
+        col_offset = MAP_MARGIN - min(cells[0][0] for _, cells in rows)
+        lines, line_index = [], {}
+        for y, cells in rows:
+            parts, column = [], 0
+            for x, char in cells:
+                col = x + col_offset
+                parts.append(' ' * (col - column))
+                parts.append(char)
+                column = col + 1
+            line_index[y] = len(lines)
+            lines.append(''.join(parts))
+        return lines, line_index, col_offset
+
+    def _place_rooms(self, area, rooms_data):
+        """Assign grid positions by walking exits from the best connected room."""
+        occupied: Set[Tuple[int, int]] = set()
+        remaining = list(area.rooms)
+        start = max(remaining, key=lambda room_id: len(rooms_data.get_exits(room_id)), default=None)
+        origin_x = 0
+
+        while start is not None:
+            self._place_component(start, (origin_x, 0), rooms_data, occupied)
+            # Disconnected parts of the area go to the right of what is placed
+            origin_x = max(x for x, _ in occupied) + 6
+            start = next((room_id for room_id in remaining if room_id not in self.positions), None)
+
+    def _place_component(self, start: str, origin: Tuple[int, int], rooms_data,
+                         occupied: Set[Tuple[int, int]]):
+        """BFS from a room, offsetting rooms that would land on an occupied spot."""
+        self.positions[start] = origin
+        occupied.add(origin)
+        queue = deque([start])
+        while queue:
+            room_id = queue.popleft()
+            x, y = self.positions[room_id]
+            for direction, dest_id in rooms_data.get_exits(room_id).items():
+                if dest_id not in self.room_ids or dest_id in self.positions:
+                    continue
+
+                dx, dy = DIRECTION_OFFSETS.get(direction.lower(), (0, 0))
+                new_x, new_y = original = (x + dx, y + dy)
+                conflict_count = 0
+                while (new_x, new_y) in occupied and conflict_count < 10:
+                    # Offset slightly to avoid overlap
+                    new_x = original[0] + (conflict_count % 3) - 1
+                    new_y = original[1] + (conflict_count // 3)
+                    conflict_count += 1
+
+                self.positions[dest_id] = (new_x, new_y)
+                occupied.add((new_x, new_y))
+                queue.append(dest_id)
+
+    def _draw(self, area, rooms_data):
+        """Record connection cells, then room markers on top of them."""
+        for room_id, (x, y) in self.positions.items():
+            for direction, dest_id in rooms_data.get_exits(room_id).items():
+                if dest_id in self.positions:
+                    self._draw_connection(room_id, dest_id, direction.lower(), (x, y), self.positions[dest_id])
+
+        for room_id, position in self.positions.items():
+            room = area.rooms[room_id]
+            exits = rooms_data.get_exits(room_id)
+            if getattr(room, 'is_lair', False):
+                marker = 'L'
+            elif 'up' in exits or 'down' in exits:
+                marker = '^'
+            else:
+                marker = '*'
+            self._put(position, marker, (room_id,))
+
+    def _draw_connection(self, room_id: str, dest_id: str, direction: str,
+                         start: Tuple[int, int], end: Tuple[int, int]):
+        """Record the cells of the line drawn for one exit."""
+        (x, y), (dest_x, dest_y) = start, end
+        owners = (room_id, dest_id)
+        if direction == 'north' and dest_y < y:
+            cells = [((x, i), '|') for i in range(dest_y + 1, y)]
+        elif direction == 'south' and dest_y > y:
+            cells = [((x, i), '|') for i in range(y + 1, dest_y)]
+        elif direction == 'east' and dest_x > x:
+            cells = [((i, y), '-') for i in range(x + 1, dest_x)]
+        elif direction == 'west' and dest_x < x:
+            cells = [((i, y), '-') for i in range(dest_x + 1, x)]
+        elif direction == 'northeast' and dest_x > x and dest_y < y:
+            cells = [((x + i, y - i), '/') for i in range(1, min(dest_x - x, y - dest_y))]
+        elif direction == 'southeast' and dest_x > x and dest_y > y:
+            cells = [((x + i, y + i), '\\') for i in range(1, min(dest_x - x, dest_y - y))]
+        elif direction == 'southwest' and dest_x < x and dest_y > y:
+            cells = [((x - i, y + i), '/') for i in range(1, min(x - dest_x, dest_y - y))]
+        elif direction == 'northwest' and dest_x < x and dest_y < y:
+            cells = [((x - i, y - i), '\\') for i in range(1, min(x - dest_x, y - dest_y))]
+        else:
+            cells = []
+        for position, char in cells:
+            self._put(position, char, owners)
+
+    def _put(self, position: Tuple[int, int], char: str, owners: Tuple[str, ...]):
+        self._cells.setdefault(position, []).append((char, owners))
+
@@ -0,0 +1,126 @@
+"""Path cache keyed by what a character can get through.
+
+Which exits a character can use depends on the keys they carry and how well
+they spot hidden exits, so a route found for one character can't simply be
+reused for another. Routes are cached under (start, goal, fingerprint), where
+the fingerprint holds only those capabilities; characters carrying the same
+keys share entries, and picking up loot that isn't a key doesn't miss the
+cache.
+
+Entries are stamped with an epoch that is bumped whenever a door or barrier
+changes state or rooms are reloaded, so stale routes are ignored without
+walking the cache.
+"""
+
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Hashable, List, Optional, Set
+
+from ...utils.logger import get_logger
+
+
+def held_item_ids(character) -> Set[str]:
+    """Normalized IDs of the items a character carries (as barriers compare them).
+
+    Args:
+        character: Character dict or object with an inventory (None: carries nothing)
+    """
+    if character is None:
+        return set()
+    inventory = character.get('inventory', []) if isinstance(character, dict) else getattr(character, 'inventory', [])
+    item_ids = set()
+    for item in inventory or []:
+        if isinstance(item, dict):
+            item_id = item.get('id') or item.get('item_id') or item.get('name', '')
+        else:
+            item_id = item if isinstance(item, str) else getattr(item, 'item_id', '')
+        if item_id:
+            item_ids.add(item_id.lower().replace(' ', '_'))
+    return item_ids
+
+
+class PathCache:
+    """LRU cache of routes per (start, goal, capability fingerprint)."""
+
+    def __init__(self, world_manager, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            world_manager: WorldManager whose pathfinder computes missing routes
+            max_entries: Maximum number of cached routes
+        """
+        self.world_manager = world_manager
+        self.max_entries = max(1, int(max_entries))
+        self.logger = get_logger()
+
+        self.epoch = 0
+        self._entries: OrderedDict = OrderedDict()  # key -> (epoch, route tuple or None)
+        self._key_items: Optional[FrozenSet[str]] = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def find_path(self, start: str, goal: str, character=None) -> Optional[List[str]]:
+        """Get a route, from the cache if this kind of character already asked for it.
+
+        Args:
+            start: Starting room ID
+            goal: Destination room ID
+            character: Character whose keys and abilities limit the exits used (None: any exit)
+
+        Returns:
+            Room IDs from start to goal (inclusive), or None if there is no route
+        """
+        key = (start, goal, self.fingerprint(character))
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == self.epoch:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[1]) if entry[1] is not None else None
+
+        self.misses += 1
+        path = self.world_manager.pathfinder.find_path(start, goal, character)
+        self._entries[key] = (self.epoch, tuple(path) if path is not None else None)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return path
+
+    def fingerprint(self, character) -> Hashable:
+        """Get what decides which exits a character can use, as a cache key.
+
+        That is the keys they hold (items that open a door or barrier
+        somewhere) and their detection ability (wisdom) and level, which
+        hidden exits and barrier requirements check.
+
+        Args:
+            character: Character dict or object (None: no character)
+        """
+        if character is None:
+            return None
+        keys = held_item_ids(character) & self._known_keys()
+        if isinstance(character, dict):
+            detection, level = character.get('wisdom', 10), character.get('level', 1)
+        else:
+            detection, level = getattr(character, 'wisdom', 10), getattr(character, 'level', 1)
+        return (frozenset(keys), detection, level)
+
+    def bump_epoch(self):
+        """Mark every cached route stale (a door, barrier or room changed)."""
+        self.epoch += 1
+        self._key_items = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache size and hit statistics."""
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'epoch': self.epoch,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def _known_keys(self) -> FrozenSet[str]:
+        """Items that open some door or barrier in the world."""
+        if self._key_items is None:
+            self._key_items = frozenset(self.world_manager.get_exit_keys())
+        return self._key_items
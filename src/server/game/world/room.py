@@ -1,22 +1,61 @@
 """Room class representing locations in the game world."""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 class Room:
     """Represents a location in the game world."""
 
-    def __init__(self, room_id: str, title: str, description: str):
-        """Initialize a room."""
+    def __init__(self, room_id: str, title: str, description: Optional[str], store=None):
+        """Initialize a room.
+
+        Args:
+            room_id: The room ID
+            title: Room title
+            description: Room description, or None to read it from the store when needed
+            store: RoomStore holding this room's raw data (cold fields are read from it)
+        """
         self.room_id = room_id
         self.title = title
-        self.description = description
+        self.store = store
+        self._description = description
+        self._lairs = None
         self.exits: Dict[str, 'Exit'] = {}
         self.locked_exits: Dict[str, Dict] = {}  # direction -> {required_key, description} (legacy)
         self.barriers: Dict[str, Dict] = {}  # direction -> {barrier_id, locked, unlocked_by} (new system)
+        self.on_exits_changed = None  # Called with the room ID when an exit is unlocked
         self.players: List['Character'] = []
         self.npcs: List['NPC'] = []
         self.items: List['Item'] = []
 
+    @property
+    def description(self) -> str:
+        """Room description (read from the store if it was not given)."""
+        if self._description is None and self.store is not None:
+            return self.store.get_field(self.room_id, 'description', 'A mysterious place.')
+        return self._description
+
+    @description.setter
+    def description(self, value: str):
+        self._description = value
+
+    @property
+    def lairs(self) -> List[Dict]:
+        """Lair spawn definitions (read from the store if they were not set)."""
+        if self._lairs is None and self.store is not None:
+            return self.store.get_field(self.room_id, 'lairs', [])
+        return self._lairs or []
+
+    @lairs.setter
+    def lairs(self, value: List[Dict]):
+        self._lairs = value
+
+    @property
+    def raw_data(self) -> Dict[str, Any]:
+        """The room's raw data from the world files (shared; don't mutate it)."""
+        if self.store is None:
+            return {}
+        return self.store.get(self.room_id, {})
+
     def add_exit(self, direction: str, exit_obj: 'Exit'):
         """Add an exit to the room."""
         self.exits[direction] = exit_obj
@@ -137,6 +176,8 @@ class Room:
 
         if direction in self.locked_exits:
             del self.locked_exits[direction]
+            if self.on_exits_changed is not None:
+                self.on_exits_changed(self.room_id)
             logger.info(f"[DOOR] Exit '{direction}' unlocked successfully")
             logger.info(f"[DOOR] locked_exits AFTER unlock: {list(self.locked_exits.keys())}")
         else:
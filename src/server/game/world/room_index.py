@@ -0,0 +1,161 @@
+"""Dense room indices and explored-room bitsets.
+
+Characters used to track exploration as a list of room IDs, so every step
+did an O(rooms visited) membership scan and every save wrote the whole list.
+Every room now has a small integer index, and a character's explored rooms
+are a bitset over those indices.
+
+Character data must stay JSON-shaped and immutable at the leaves (saves,
+journal deltas and snapshots rely on it), so the bitset is kept as a string
+of base64 digits, each holding six bits, least significant first. Membership
+reads one character; marking a new room rewrites the short string. A world
+of 500 rooms fits in 84 characters.
+
+Indices are kept in an append-only registry file next to the world data, so
+a saved bitset stays valid when rooms are added or removed.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from ...utils.logger import get_logger
+
+_DIGITS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_'
+_DIGIT_VALUES = {digit: value for value, digit in enumerate(_DIGITS)}
+_BITS = 6
+
+
+class RoomIndex:
+    """Stable dense integer indices for room IDs."""
+
+    def __init__(self, path: str):
+        """Initialize an empty index.
+
+        Args:
+            path: Registry file (one room ID per line; the line number is the index)
+        """
+        self.path = path
+        self.logger = get_logger()
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def load(self, room_ids: Iterable[str]):
+        """Read the registry and give rooms it doesn't list yet the next free indices.
+
+        The registry is rewritten when rooms were added. If it can't be
+        written the new indices only last until the next restart.
+
+        Args:
+            room_ids: IDs of every room in the world
+        """
+        ids = []
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                ids = [line.strip() for line in f if line.strip()]
+        except OSError:
+            pass
+        self._ids = ids
+        self._index = {room_id: i for i, room_id in enumerate(ids)}
+
+        new_ids = sorted(room_id for room_id in room_ids if room_id not in self._index)
+        for room_id in new_ids:
+            self._index[room_id] = len(self._ids)
+            self._ids.append(room_id)
+
+        if new_ids:
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.writelines(f"{room_id}\n" for room_id in new_ids)
+            except OSError as e:
+                self.logger.warning(f"Could not update room index {self.path}: {e}")
+            self.logger.info(f"Room index: {len(new_ids)} new rooms, {len(self._ids)} total")
+
+    def index_of(self, room_id: str) -> Optional[int]:
+        """Get a room's index (None for rooms that aren't indexed)."""
+        return self._index.get(room_id)
+
+    def room_id_at(self, index: int) -> Optional[str]:
+        """Get the room ID at an index."""
+        return self._ids[index] if 0 <= index < len(self._ids) else None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # Explored-room bitsets
+
+    def is_explored(self, explored: str, room_id: str) -> bool:
+        """Check whether a room is in an explored-rooms bitset."""
+        index = self._index.get(room_id)
+        if index is None:
+            return False
+        digit = index // _BITS
+        if digit >= len(explored):
+            return False
+        return bool(_DIGIT_VALUES[explored[digit]] >> (index % _BITS) & 1)
+
+    def mark_explored(self, explored: str, room_id: str) -> str:
+        """Add a room to an explored-rooms bitset.
+
+        Returns:
+            The updated bitset (the same string if the room was already in it)
+        """
+        index = self._index.get(room_id)
+        if index is None:
+            return explored
+        digit, bit = divmod(index, _BITS)
+        if digit >= len(explored):
+            explored = explored + 'A' * (digit + 1 - len(explored))
+        value = _DIGIT_VALUES[explored[digit]]
+        if value >> bit & 1:
+            return explored
+        return explored[:digit] + _DIGITS[value | 1 << bit] + explored[digit + 1:]
+
+    def encode_explored(self, room_ids: Iterable[str]) -> str:
+        """Build an explored-rooms bitset from room IDs (unknown rooms are skipped)."""
+        return self.from_mask(self.mask(room_ids))
+
+    def explored_in(self, explored: str, area_mask: int) -> Set[str]:
+        """Get the explored rooms among a set of rooms.
+
+        Args:
+            explored: Explored-rooms bitset
+            area_mask: Mask of the rooms to check (see mask())
+
+        Returns:
+            IDs of the rooms in both
+        """
+        return self.room_ids_of(self.to_mask(explored) & area_mask)
+
+    def mask(self, room_ids: Iterable[str]) -> int:
+        """Build an integer bitmask of rooms (unknown rooms are skipped)."""
+        mask = 0
+        for room_id in room_ids:
+            index = self._index.get(room_id)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    def room_ids_of(self, mask: int) -> Set[str]:
+        """Get the room IDs whose bits are set in a mask."""
+        room_ids = set()
+        while mask:
+            low = mask & -mask
+            room_ids.add(self._ids[low.bit_length() - 1])
+            mask ^= low
+        return room_ids
+
+    @staticmethod
+    def to_mask(explored: str) -> int:
+        """Decode a bitset string into an integer mask."""
+        mask = 0
+        for digit in reversed(explored):
+            mask = mask << _BITS | _DIGIT_VALUES[digit]
+        return mask
+
+    @staticmethod
+    def from_mask(mask: int) -> str:
+        """Encode an integer mask as a bitset string."""
+        digits = []
+        while mask:
+            digits.append(_DIGITS[mask & 0x3F])
+            mask >>= _BITS
+        return ''.join(digits)
@@ -0,0 +1,226 @@
+"""Precomputed next-hop routing for mob movement.
+
+Chasing mobs used to run a shortest-path search over the whole world graph
+for every step they took. The routing service instead keeps next-hop tables:
+for every pair of rooms in an area, the room to step into next. They are
+built by one breadth-first search per target room over the reversed edges of
+the area, the first time anything routes inside that area, so a chase step is
+a pair of dict lookups.
+
+Routes between areas (or inside an area whose rooms only connect through
+another area) use per-target tables over the whole graph, built on demand and
+kept in a bounded LRU cache.
+
+Tables only contain moves a mob can make: no locked doors, no locked barriers
+and no entering safe rooms. When one of those changes (a door or barrier is
+unlocked, rooms are reloaded) the tables of the affected areas are dropped
+and rebuilt on next use; the tables of other areas are kept.
+"""
+
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional, Set
+
+from ...utils.logger import get_logger
+
+
+class RoutingService:
+    """Next-hop lookups over the world graph, for movement that ignores who is moving."""
+
+    def __init__(self, world_manager, cache_size: int = 256):
+        """Initialize the routing service.
+
+        Args:
+            world_manager: WorldManager owning the rooms and the world graph
+            cache_size: Maximum number of cross-area target tables kept in memory
+        """
+        self.world_manager = world_manager
+        self.cache_size = max(1, int(cache_size))
+        self.logger = get_logger()
+
+        # area ID -> target room ID -> source room ID -> next room ID
+        self._area_tables: Dict[Optional[str], Dict[str, Dict[str, str]]] = {}
+        # target room ID -> source room ID -> next room ID, over the whole graph
+        self._global_tables: OrderedDict = OrderedDict()
+        # Area membership the current tables were built from
+        self._room_areas: Optional[Dict[str, Optional[str]]] = None
+        self._area_rooms: Dict[Optional[str], Set[str]] = {}
+
+        self.area_builds = 0
+        self.global_builds = 0
+        self.lookups = 0
+
+    def next_hop(self, start: str, goal: str) -> Optional[str]:
+        """Get the room to move into next on the way from start to goal.
+
+        Args:
+            start: Current room ID
+            goal: Destination room ID
+
+        Returns:
+            The next room ID, or None if start is the goal or the goal can't be reached
+        """
+        if start == goal:
+            return None
+        self.lookups += 1
+        rooms = self.world_manager.rooms
+        if start not in rooms or goal not in rooms:
+            return None
+
+        area_id = self._area_of(start)
+        if area_id == self._area_of(goal):
+            hop = self._area_table(area_id).get(goal, {}).get(start)
+            if hop is not None:
+                return hop
+        return self._global_table(goal).get(start)
+
+    def find_path(self, start: str, goal: str) -> Optional[List[str]]:
+        """Get the full route from start to goal by following next hops.
+
+        Returns:
+            Room IDs from start to goal (inclusive), or None if the goal can't be reached
+        """
+        if start == goal:
+            return [start] if start in self.world_manager.rooms else None
+        path = [start]
+        current = start
+        while current != goal:
+            current = self.next_hop(current, goal)
+            if current is None or len(path) > len(self.world_manager.rooms):
+                return None
+            path.append(current)
+        return path
+
+    def precompute(self, area_ids: Optional[Iterable[Optional[str]]] = None):
+        """Build the next-hop tables of areas ahead of their first use.
+
+        Args:
+            area_ids: Areas to build (default: every area)
+        """
+        self._membership()
+        if area_ids is None:
+            area_ids = list(self._area_rooms)
+        for area_id in area_ids:
+            self._area_table(area_id)
+
+    def invalidate_rooms(self, room_ids: Iterable[str]):
+        """Drop the tables that depend on rooms whose exits, locks or safety changed.
+
+        Args:
+            room_ids: IDs of the changed rooms (including added and removed ones)
+        """
+        room_areas = self._room_areas or {}
+        areas = set()
+        for room_id in room_ids:
+            # Both the area the tables were built with and the room's current one
+            if room_id in room_areas:
+                areas.add(room_areas[room_id])
+            room = self.world_manager.rooms.get(room_id)
+            if room is not None:
+                areas.add(getattr(room, 'area_id', None))
+
+        for area_id in areas:
+            self._area_tables.pop(area_id, None)
+        self._global_tables.clear()
+        self._room_areas = None
+
+    def invalidate_all(self):
+        """Drop every table, e.g. after the world was reloaded."""
+        self._area_tables.clear()
+        self._global_tables.clear()
+        self._room_areas = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get table and lookup statistics."""
+        return {
+            'area_tables': len(self._area_tables),
+            'area_entries': sum(len(table) for tables in self._area_tables.values()
+                                for table in tables.values()),
+            'global_tables': len(self._global_tables),
+            'area_builds': self.area_builds,
+            'global_builds': self.global_builds,
+            'lookups': self.lookups
+        }
+
+    # Internals
+
+    def _area_of(self, room_id: str) -> Optional[str]:
+        return self._membership().get(room_id)
+
+    def _membership(self) -> Dict[str, Optional[str]]:
+        """Map every room to its area, rebuilding the index after an invalidation."""
+        if self._room_areas is None:
+            self._room_areas = {}
+            self._area_rooms = {}
+            for room_id, room in self.world_manager.rooms.items():
+                area_id = getattr(room, 'area_id', None)
+                self._room_areas[room_id] = area_id
+                self._area_rooms.setdefault(area_id, set()).add(room_id)
+        return self._room_areas
+
+    def _area_table(self, area_id: Optional[str]) -> Dict[str, Dict[str, str]]:
+        """Get (building if needed) the all-pairs next-hop table of an area."""
+        tables = self._area_tables.get(area_id)
+        if tables is None:
+            self._membership()
+            members = self._area_rooms.get(area_id, set())
+            tables = {target: self._search(target, members) for target in members}
+            self._area_tables[area_id] = tables
+            self.area_builds += 1
+        return tables
+
+    def _global_table(self, goal: str) -> Dict[str, str]:
+        """Get (building if needed) the next-hop table toward a room over the whole graph."""
+        table = self._global_tables.get(goal)
+        if table is not None:
+            self._global_tables.move_to_end(goal)
+            return table
+
+        table = self._search(goal)
+        self._global_tables[goal] = table
+        self.global_builds += 1
+        if len(self._global_tables) > self.cache_size:
+            self._global_tables.popitem(last=False)
+        return table
+
+    def _search(self, goal: str, members: Optional[Set[str]] = None) -> Dict[str, str]:
+        """Breadth-first search backwards from a goal.
+
+        Args:
+            goal: Destination room ID
+            members: Rooms the search may visit (default: all)
+
+        Returns:
+            Source room ID -> next room ID on a shortest route to the goal
+        """
+        reverse_edges = self.world_manager.world_graph.reverse_edges
+        table: Dict[str, str] = {}
+        queue = deque([goal])
+        while queue:
+            current = queue.popleft()
+            if not self._can_enter(current):
+                continue
+            for edge in reverse_edges.get(current, ()):
+                source = edge.from_room
+                if (source == goal or source in table or
+                        (members is not None and source not in members)):
+                    continue
+                if not self._is_open(source, edge.direction):
+                    continue
+                table[source] = current
+                queue.append(source)
+        return table
+
+    def _can_enter(self, room_id: str) -> bool:
+        """Check whether mobs may move into a room (mobs stay out of safe rooms)."""
+        room = self.world_manager.rooms.get(room_id)
+        return room is not None and not getattr(room, 'is_safe', False)
+
+    def _is_open(self, room_id: str, direction: str) -> bool:
+        """Check whether an exit is free of locked doors and locked barriers."""
+        room = self.world_manager.rooms.get(room_id)
+        if room is None:
+            return False
+        if direction in room.locked_exits:
+            return False
+        barrier = room.barriers.get(direction)
+        return barrier is None or not barrier.get('locked', True)
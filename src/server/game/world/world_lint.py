@@ -0,0 +1,303 @@
+"""World lint: one-pass validation of the world content.
+
+Builds the room graph once from the room files and runs every check over
+it, instead of each tool (create_world.py --validate, the teleporter and
+zone scripts, WorldGraph.validate_graph at boot) deriving its own graph.
+
+Per-room checks only read the room itself and a few shared lookup tables,
+so they are split into chunks and run in a process pool for large worlds.
+Checks that need the whole graph (reachability) run once afterwards.
+
+The result is a JSON-friendly report keyed by the content source hash. The
+server stores it as a validation stamp and skips the lint at startup while
+the content is unchanged.
+
+Checks:
+    dangling_exit      error    exit to a room that doesn't exist
+    asymmetric_exit    warning  exit whose destination has no exit back
+    unreachable_room   warning  room that can't be walked to from a starting room
+    missing_key        error    locked exit with no key, or a key item that doesn't exist
+    unknown_barrier    error    barrier ID not in barriers.json
+    unknown_lair_mob   error    lair spawning a monster missing from the monster registry
+"""
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from ...utils.logger import get_logger
+
+# Bump when checks change so existing validation stamps are redone
+LINT_VERSION = 1
+
+# Fewer rooms than this are checked serially; a pool costs more than it saves
+PARALLEL_MIN_ROOMS = 2000
+
+# Rooms sent to a worker at a time
+LINT_CHUNK_SIZE = 256
+
+# Severity of each check
+CHECKS = {
+    'dangling_exit': 'error',
+    'asymmetric_exit': 'warning',
+    'unreachable_room': 'warning',
+    'missing_key': 'error',
+    'unknown_barrier': 'error',
+    'unknown_lair_mob': 'error',
+}
+
+Issue = Dict[str, str]
+
+# Lookup tables for lint_rooms() in pool workers (set by the pool initializer)
+_worker_context: Optional[Dict[str, Any]] = None
+
+
+def normalize_item_id(name: str) -> str:
+    """Turn a key name as written in room data ('Iron Key') into an item ID."""
+    return name.lower().replace(' ', '_')
+
+
+def build_context(rooms: Mapping[str, Dict], items: Dict[str, Any], barriers: Dict[str, Any],
+                  monsters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the lookup tables the per-room checks share.
+
+    Only plain sets and dicts, so it can be sent to pool workers.
+
+    Args:
+        rooms: Room ID -> room data
+        items: Item ID -> item data
+        barriers: Barrier ID -> barrier definition
+        monsters: Monster ID -> monster data
+
+    Returns:
+        Context for lint_rooms()
+    """
+    barrier_keys = {}
+    for barrier_id, barrier in barriers.items():
+        methods = barrier.get('unlock_methods', {})
+        barrier_keys[barrier_id] = sorted(
+            methods[name]['required_item']
+            for name in ('key', 'rune', 'rope')
+            if methods.get(name, {}).get('enabled') and methods[name].get('required_item')
+        )
+    return {
+        'destinations': {room_id: set(_exit_targets(room).values()) for room_id, room in rooms.items()},
+        'items': set(items),
+        'barrier_keys': barrier_keys,
+        'monsters': set(monsters),
+    }
+
+
+def lint_rooms(chunk: Iterable[Tuple[str, Dict]], context: Optional[Dict[str, Any]] = None) -> List[Issue]:
+    """Run the per-room checks over some rooms.
+
+    Args:
+        chunk: (room ID, room data) pairs
+        context: Tables from build_context() (default: the pool worker's)
+
+    Returns:
+        Issues found, in room order
+    """
+    context = context if context is not None else _worker_context
+    destinations = context['destinations']
+    items = context['items']
+    barrier_keys = context['barrier_keys']
+    monsters = context['monsters']
+
+    issues = []
+    for room_id, room in chunk:
+        for direction, dest_id in _exit_targets(room).items():
+            if dest_id not in destinations:
+                issues.append(_issue('dangling_exit', room_id, f"exit {direction} leads to missing room {dest_id}"))
+            elif room_id not in destinations[dest_id]:
+                issues.append(_issue('asymmetric_exit', room_id, f"exit {direction} to {dest_id} has no way back"))
+
+        exits = room.get('exits', {})
+        for direction, lock in room.get('locked_exits', {}).items():
+            if direction not in exits:
+                issues.append(_issue('missing_key', room_id, f"locked exit {direction} is not an exit"))
+            key = lock.get('required_key') if isinstance(lock, dict) else None
+            if not key:
+                issues.append(_issue('missing_key', room_id, f"locked exit {direction} has no required_key"))
+            elif normalize_item_id(key) not in items:
+                issues.append(_issue('missing_key', room_id, f"locked exit {direction} needs unknown item {key}"))
+
+        for direction, barrier in room.get('barriers', {}).items():
+            barrier_id = barrier.get('barrier_id')
+            if barrier_id not in barrier_keys:
+                issues.append(_issue('unknown_barrier', room_id, f"exit {direction} has unknown barrier {barrier_id}"))
+                continue
+            for key in barrier_keys[barrier_id]:
+                if normalize_item_id(key) not in items:
+                    issues.append(_issue('missing_key', room_id,
+                                         f"barrier {barrier_id} on exit {direction} needs unknown item {key}"))
+
+        for direction, special in room.get('special_exits', {}).items():
+            item = special.get('requires_item')
+            if item and normalize_item_id(item) not in items:
+                issues.append(_issue('missing_key', room_id, f"special exit {direction} needs unknown item {item}"))
+
+        lair_mobs = [lair.get('mob_id') for lair in room.get('lairs') or []]
+        if room.get('lair_monster'):
+            lair_mobs.append(room['lair_monster'])
+        for mob_id in lair_mobs:
+            if mob_id not in monsters:
+                issues.append(_issue('unknown_lair_mob', room_id, f"lair spawns unknown monster {mob_id}"))
+    return issues
+
+
+def find_unreachable(rooms: Mapping[str, Dict], destinations: Dict[str, Set[str]]) -> List[Issue]:
+    """Find rooms that can't be walked to from any starting room.
+
+    Rooms flagged is_starting_room are the roots (every room, if none is).
+    """
+    roots = [room_id for room_id, room in rooms.items() if room.get('is_starting_room')] or list(rooms)
+    seen = set(roots)
+    queue = deque(roots)
+    while queue:
+        for dest_id in destinations.get(queue.popleft(), ()):
+            if dest_id in destinations and dest_id not in seen:
+                seen.add(dest_id)
+                queue.append(dest_id)
+    return [_issue('unreachable_room', room_id, "not reachable from a starting room")
+            for room_id in rooms if room_id not in seen]
+
+
+def _chunks(pairs: Iterable[Tuple[str, Dict]], size: int) -> Iterator[List[Tuple[str, Dict]]]:
+    pairs = iter(pairs)
+    while True:
+        chunk = list(islice(pairs, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def lint_world(rooms: Mapping[str, Dict], items: Dict[str, Any], barriers: Dict[str, Any],
+               monsters: Dict[str, Any], source_hash: Optional[str] = None,
+               workers: int = 1) -> Dict[str, Any]:
+    """Run every check over the world.
+
+    Args:
+        rooms: Room ID -> room data (a dict or a RoomStore; rooms are read as the checks go,
+            not copied)
+        items: Item ID -> item data
+        barriers: Barrier ID -> barrier definition
+        monsters: Monster ID -> monster data
+        source_hash: Content source hash to record in the report
+        workers: Processes for the per-room checks (1: serial)
+
+    Returns:
+        Report dict with source_hash, counts, errors and warnings (each issue
+        has check, room_id and message)
+    """
+    start = time.perf_counter()
+    context = build_context(rooms, items, barriers, monsters)
+
+    issues = None
+    if workers > 1 and len(rooms) >= PARALLEL_MIN_ROOMS:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(context,)) as pool:
+                chunks = _chunks(rooms.items(), LINT_CHUNK_SIZE)
+                issues = [issue for chunk_issues in pool.map(lint_rooms, chunks) for issue in chunk_issues]
+        except Exception as e:
+            # e.g. no working multiprocessing in a restricted sandbox
+            get_logger().warning(f"Parallel world lint failed, checking serially: {e}")
+            issues = None
+    if issues is None:
+        issues = lint_rooms(rooms.items(), context)
+    issues.extend(find_unreachable(rooms, context['destinations']))
+
+    errors = [issue for issue in issues if CHECKS[issue['check']] == 'error']
+    warnings = [issue for issue in issues if CHECKS[issue['check']] == 'warning']
+    counts = {check: 0 for check in CHECKS}
+    for issue in issues:
+        counts[issue['check']] += 1
+    return {
+        'lint_version': LINT_VERSION,
+        'source_hash': source_hash,
+        'rooms': len(rooms),
+        'counts': counts,
+        'errors': errors,
+        'warnings': warnings,
+        'elapsed_ms': round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+def lint_content(world_loader, workers: int = 1) -> Dict[str, Any]:
+    """Load the world content through a WorldLoader and lint it."""
+    return lint_world(
+        world_loader.load_rooms(),
+        world_loader.load_items(),
+        world_loader.load_barriers(),
+        world_loader.load_monsters(),
+        source_hash=world_loader.content.source_hash,
+        workers=workers,
+    )
+
+
+def stamp_path(data_dir: str) -> str:
+    """Path of the validation stamp for a data directory."""
+    return os.path.join(data_dir, '.build', 'validation.json')
+
+
+def read_stamp(path: str, source_hash: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Read a validation stamp if it was made for this content and lint version.
+
+    Returns:
+        The stored report, or None if it is missing, unreadable or stale
+    """
+    if not source_hash:
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(report, dict) or report.get('source_hash') != source_hash
+            or report.get('lint_version') != LINT_VERSION):
+        return None
+    return report
+
+
+def write_stamp(path: str, report: Dict[str, Any]) -> bool:
+    """Write a report as the validation stamp (atomically).
+
+    Returns:
+        False if the stamp couldn't be written
+    """
+    tmp_path = path + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        return False
+    return True
+
+
+def format_issues(issues: Iterable[Issue], limit: Optional[int] = None) -> List[str]:
+    """Format issues as 'check room_id: message' lines."""
+    lines = [f"{issue['check']} {issue['room_id']}: {issue['message']}" for issue in issues]
+    if limit is not None and len(lines) > limit:
+        lines = lines[:limit] + [f"... and {len(lines) - limit} more"]
+    return lines
+
+
+def _exit_targets(room: Dict) -> Dict[str, str]:
+    """Exit direction -> destination room ID, skipping malformed exits."""
+    return {direction: dest for direction, dest in room.get('exits', {}).items() if isinstance(dest, str)}
+
+
+def _issue(check: str, room_id: str, message: str) -> Issue:
+    return {'check': check, 'room_id': room_id, 'message': message}
+
+
+def _init_worker(context: Dict[str, Any]):
+    global _worker_context
+    _worker_context = context
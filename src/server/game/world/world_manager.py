@@ -1,12 +1,21 @@
 """Manages the game world state and updates."""
 
 import asyncio
-from typing import Dict, Optional, List
+import os
+from typing import Dict, Iterable, Optional, List
 
 from ...persistence.world_loader import WorldLoader
+from ...persistence.room_store import RoomStore
 from .room import Room
 from .area import Area
 from .graph import WorldGraph, GraphEdge, EdgeType
+from .routing import RoutingService
+from .hierarchy import HierarchicalPathfinder
+from .path_cache import PathCache, held_item_ids
+from .map_layout import AreaMapLayout
+from .room_index import RoomIndex
+from . import world_lint
+from ..name_index import match_rank
 from ...utils.logger import get_logger
 from ...utils.colors import (
     announcement, monster_spawn, error_message, info_message,
@@ -25,10 +34,15 @@ class WorldManager:
         self.items: Dict[str, 'Item'] = {}
         self.barriers: Dict[str, Dict] = {}  # Store barrier definitions
         self.world_graph = WorldGraph()
+        self.routing = RoutingService(self)  # Next-hop tables for mob movement
+        self.pathfinder = HierarchicalPathfinder(self)  # Area-level routes for long paths
+        self.path_cache = PathCache(self)  # Routes per start, goal and character capabilities
+        self.map_layouts: Dict[str, AreaMapLayout] = {}  # area_id -> laid out map
         self.logger = get_logger()
         self.world_loader = WorldLoader()
         self.game_engine = game_engine
-        self.rooms_data: Dict = {}  # Store raw room data for admin commands
+        self.rooms_data = RoomStore(os.path.join(self.world_loader.data_dir, ".build", "rooms.dat"))  # Raw room data
+        self.room_index = RoomIndex(os.path.join(self.world_loader.data_dir, "world", "room_index.txt"))  # Dense room numbers
 
     def load_world(self):
         """Load the world data from files."""
@@ -37,16 +51,17 @@ class WorldManager:
         try:
             # Load raw data from JSON files
             areas_data = self.world_loader.load_areas()
-            rooms_data = self.world_loader.load_rooms()
+            rooms_data = self._open_room_store()
             items_data = self.world_loader.load_items()
             npcs_data = self.world_loader.load_npcs()
             barriers_data = self.world_loader.load_barriers()
 
-            # Store rooms_data for later use (e.g., admin commands)
+            # Keep the room store for later use (e.g., admin and map commands)
             self.rooms_data = rooms_data
 
             # Create room objects
             self._create_rooms(rooms_data)
+            self.room_index.load(self.rooms)
 
             # Create area objects
             self._create_areas(areas_data)
@@ -56,6 +71,13 @@ class WorldManager:
 
             # Build world graph from room exit data
             self._build_world_graph_from_rooms(rooms_data)
+            if self.game_engine and hasattr(self.game_engine, 'config_manager'):
+                config_manager = self.game_engine.config_manager
+                self.routing.cache_size = max(1, int(config_manager.get_setting('world', 'route_cache_size', default=256)))
+                self.path_cache.max_entries = max(1, int(config_manager.get_setting('world', 'path_cache_size', default=1024)))
+            self.routing.invalidate_all()
+            self.pathfinder.invalidate_all()
+            self.path_cache.bump_epoch()
 
             # Load items, NPCs, and barriers
             self._load_items(items_data)
@@ -68,10 +90,12 @@ class WorldManager:
             # Initialize room NPCs (place NPCs from room JSON into rooms)
             self._initialize_room_npcs(rooms_data)
 
-            # Validate graph
-            issues = self.world_graph.validate_graph()
-            if issues:
-                self.logger.warning(f"Graph validation issues: {issues}")
+            # Lay out area maps for the map command
+            self.map_layouts = {area_id: AreaMapLayout(area, rooms_data, self.room_index)
+                                for area_id, area in self.areas.items()}
+
+            # Lint the content, unless this content already passed through the linter
+            self._validate_world(rooms_data, items_data, barriers_data)
 
             graph_stats = self.world_graph.get_graph_stats()
             self.logger.info(f"World loaded: {len(self.areas)} areas, {len(self.rooms)} rooms, {graph_stats['edges']} connections")
@@ -83,72 +107,111 @@ class WorldManager:
             # Create a basic default world
             self._create_default_world()
 
-    def _create_rooms(self, rooms_data: Dict):
-        """Create room objects from data."""
-        self.logger.info(f"[DOOR] WorldManager: Creating rooms from {len(rooms_data)} room data entries")
+    def _validate_world(self, rooms_data: RoomStore, items_data: Dict, barriers_data: Dict):
+        """Run the world lint, or reuse its stamp if the content hasn't changed since.
 
-        # Check if dungeon1_1 is in the data
-        if 'dungeon1_1' in rooms_data:
-            self.logger.info(f"[DOOR] WorldManager: dungeon1_1 found in rooms_data")
-            if 'locked_exits' in rooms_data['dungeon1_1']:
-                self.logger.info(f"[DOOR] WorldManager: dungeon1_1 locked_exits in data: {rooms_data['dungeon1_1']['locked_exits']}")
-            else:
-                self.logger.info(f"[DOOR] WorldManager: dungeon1_1 MISSING locked_exits in rooms_data!")
+        The report is stamped with the content source hash, so a restart with
+        the same content (or content already checked by scripts/lint_world.py)
+        skips the checks.
+        """
+        content = self.world_loader.content
+        path = world_lint.stamp_path(self.world_loader.data_dir)
+        report = world_lint.read_stamp(path, content.source_hash if content.loaded else None)
+        if report is not None:
+            origin = 'stamp'
+        else:
+            report = world_lint.lint_world(rooms_data, items_data, barriers_data,
+                                           self.world_loader.load_monsters(),
+                                           source_hash=content.source_hash if content.loaded else None)
+            if content.loaded and not world_lint.write_stamp(path, report):
+                self.logger.warning(f"Could not write validation stamp {path}")
+            origin = f"{report['elapsed_ms']:.0f}ms"
+
+        self.logger.info(f"World lint ({origin}): {len(report['errors'])} errors, {len(report['warnings'])} warnings")
+        for line in world_lint.format_issues(report['errors'], limit=20):
+            self.logger.warning(f"World lint: {line}")
+
+    def _open_room_store(self) -> RoomStore:
+        """Open the room store, rebuilding it from the room files if the content changed.
+
+        Returns:
+            The opened RoomStore
+        """
+        content = self.world_loader.content
+        store = self.rooms_data
+        if self.game_engine and hasattr(self.game_engine, 'config_manager'):
+            store.cache_size = max(1, int(self.game_engine.config_manager.get_setting('world', 'room_cache_size', default=512)))
+
+        if content.loaded and store.open(content.source_hash):
+            origin = 'loaded'
+        else:
+            store.build(self.world_loader.load_rooms(), content.source_hash)
+            origin = 'rebuilt'
+        # The store serves the rooms from here on, so the bundle needn't hold them too
+        content.release(os.path.join(self.world_loader.data_dir, "world", "rooms"))
+
+        stats = store.get_stats()
+        self.logger.info(f"Room store {origin}: {stats['rooms']} rooms, {stats['file_bytes'] / 1024:.0f} KB mapped, "
+                         f"cache {stats['cache_size']}")
+        return store
+
+    def _create_rooms(self, rooms_data: RoomStore):
+        """Create room objects from data.
+
+        Descriptions and lair definitions are left in the store and read on demand.
+        """
+        self.logger.info(f"[DOOR] WorldManager: Creating rooms from {len(rooms_data)} room data entries")
 
         for room_id, room_data in rooms_data.items():
             room = Room(
                 room_id=room_data.get('id', room_id),
                 title=room_data.get('title', 'Unknown Room'),
-                description=room_data.get('description', 'A mysterious place.')
+                description=None,
+                store=rooms_data
             )
-
-            # Set additional properties
-            if 'area_id' in room_data:
-                room.area_id = room_data['area_id']
-            if 'is_safe' in room_data:
-                room.is_safe = room_data['is_safe']
-            if 'is_starting_room' in room_data:
-                room.is_starting_room = room_data['is_starting_room']
-            if 'light_level' in room_data:
-                room.light_level = room_data['light_level']
-
-            # Set lair properties - support both old and new formats
-            # Old format: is_lair, lair_monster, respawn_time
-            if 'is_lair' in room_data:
-                room.is_lair = room_data['is_lair']
-            if 'lair_monster' in room_data:
-                room.lair_monster = room_data['lair_monster']
-            if 'respawn_time' in room_data:
-                room.respawn_time = room_data['respawn_time']
-
-            # New format: lairs array with multiple spawns
-            if 'lairs' in room_data:
-                room.lairs = room_data['lairs']
-
-            # NPCs will be populated later in _initialize_room_npcs
-            # (don't set room.npcs here, it will be replaced with actual NPC objects)
-
-            # Load locked exits (legacy system)
-            if 'locked_exits' in room_data:
-                room.locked_exits = room_data['locked_exits']
-                self.logger.info(f"[DOOR] Loaded locked_exits for room '{room_id}': {list(room.locked_exits.keys())}")
-                for direction, lock_info in room.locked_exits.items():
-                    self.logger.info(f"[DOOR]   - {direction}: requires '{lock_info.get('required_key')}'")
-
-            # Load barriers (new unified system)
-            if 'barriers' in room_data:
-                room.barriers = room_data['barriers']
-                self.logger.info(f"[BARRIER] Loaded barriers for room '{room_id}': {list(room.barriers.keys())}")
-                for direction, barrier_info in room.barriers.items():
-                    barrier_id = barrier_info.get('barrier_id')
-                    locked = barrier_info.get('locked', True)
-                    self.logger.info(f"[BARRIER]   - {direction}: barrier_id='{barrier_id}', locked={locked}")
-
-            # Store raw data for NPC and item references
-            room._raw_data = room_data
-
+            self._apply_room_data(room, room_data)
             self.rooms[room_id] = room
 
+    def _apply_room_data(self, room: Room, room_data: Dict):
+        """Set a room's properties from its raw data, clearing any the data no longer has."""
+        room_id = room.room_id
+        room.title = room_data.get('title', 'Unknown Room')
+
+        # Set additional properties
+        # Lair properties support both old and new formats
+        # Old format: is_lair, lair_monster, respawn_time
+        for attr in ('area_id', 'is_safe', 'is_starting_room', 'light_level',
+                     'is_lair', 'lair_monster', 'respawn_time'):
+            if attr in room_data:
+                setattr(room, attr, room_data[attr])
+            elif attr in room.__dict__:
+                delattr(room, attr)
+
+        # New format: lairs array with multiple spawns (read from the store via room.lairs)
+        room.lairs = None
+
+        # NPCs will be populated later in _initialize_room_npcs
+        # (don't set room.npcs here, it will be replaced with actual NPC objects)
+
+        # Load locked exits (legacy system)
+        room.locked_exits = room_data.get('locked_exits', {})
+        if room.locked_exits:
+            self.logger.info(f"[DOOR] Loaded locked_exits for room '{room_id}': {list(room.locked_exits.keys())}")
+            for direction, lock_info in room.locked_exits.items():
+                self.logger.info(f"[DOOR]   - {direction}: requires '{lock_info.get('required_key')}'")
+
+        # Unlocking one of its doors changes the routes through it
+        room.on_exits_changed = self.exit_state_changed
+
+        # Load barriers (new unified system)
+        room.barriers = room_data.get('barriers', {})
+        if room.barriers:
+            self.logger.info(f"[BARRIER] Loaded barriers for room '{room_id}': {list(room.barriers.keys())}")
+            for direction, barrier_info in room.barriers.items():
+                barrier_id = barrier_info.get('barrier_id')
+                locked = barrier_info.get('locked', True)
+                self.logger.info(f"[BARRIER]   - {direction}: barrier_id='{barrier_id}', locked={locked}")
+
     def _create_areas(self, areas_data: Dict):
         """Create area objects from data."""
         for area_id, area_data in areas_data.items():
@@ -167,21 +230,20 @@ class WorldManager:
             else:
                 # 2. Otherwise, find rooms by their area_id field
                 for room_id, room in self.rooms.items():
-                    # Get area_id from room's raw data
-                    room_area_id = getattr(room, '_raw_data', {}).get('area_id')
+                    room_area_id = getattr(room, 'area_id', None)
                     if room_area_id == area_id:
                         area.add_room(room)
 
             self.areas[area_id] = area
 
-    def _setup_connections_from_rooms(self, rooms_data: Dict):
+    def _setup_connections_from_rooms(self, rooms_data: RoomStore):
         """Setup connections between rooms from room exit data."""
-        for room_id, room_data in rooms_data.items():
+        for room_id in rooms_data:
             if room_id not in self.rooms:
                 continue
 
             room = self.rooms[room_id]
-            exits = room_data.get('exits', {})
+            exits = rooms_data.get_exits(room_id)
 
             for direction, target_room_id in exits.items():
                 if target_room_id in self.rooms:
@@ -219,15 +281,12 @@ class WorldManager:
 
         self.logger.info(f"Barrier types: {', '.join(f'{k}={v}' for k, v in barrier_types.items())}")
 
-    def _initialize_room_items(self, rooms_data: Dict):
+    def _initialize_room_items(self, rooms_data: RoomStore):
         """Initialize items in rooms from room data."""
         items_placed = 0
 
-        for room_id, room_data in rooms_data.items():
-            if 'items' not in room_data:
-                continue
-
-            items_list = room_data['items']
+        for room_id in rooms_data:
+            items_list = rooms_data.get_field(room_id, 'items')
             if not items_list:
                 continue
 
@@ -273,16 +332,12 @@ class WorldManager:
 
         self.logger.info(f"Initialized {items_placed} items in rooms")
 
-    def _initialize_room_npcs(self, rooms_data: Dict):
+    def _initialize_room_npcs(self, rooms_data: RoomStore):
         """Initialize NPCs in rooms from room data."""
-        from ..npcs.npc import NPC
         npcs_placed = 0
 
-        for room_id, room_data in rooms_data.items():
-            if 'npcs' not in room_data:
-                continue
-
-            npc_ids = room_data['npcs']
+        for room_id in rooms_data:
+            npc_ids = rooms_data.get_field(room_id, 'npcs')
             if not npc_ids:
                 continue
 
@@ -291,40 +346,54 @@ class WorldManager:
                 self.logger.warning(f"Room '{room_id}' not found in self.rooms, skipping NPCs")
                 continue
 
-            # Clear the string list and replace with actual NPC objects
-            room.npcs = []
+            npcs_placed += self._place_room_npcs(room, npc_ids)
 
-            for npc_id in npc_ids:
-                # Look up the full NPC data
-                if npc_id in self.npcs:
-                    npc_data = self.npcs[npc_id]
+        self.logger.info(f"Initialized {npcs_placed} NPCs in rooms")
 
-                    # Get description (check long_description first, then description)
-                    description = npc_data.get('long_description') or npc_data.get('description', 'A mysterious figure.')
+    def _place_room_npcs(self, room: Room, npc_ids: List[str]) -> int:
+        """Replace a room's NPC objects with ones built from the given NPC IDs.
 
-                    # Create NPC object
-                    npc = NPC(
-                        npc_id=npc_data.get('id', npc_id),
-                        name=npc_data.get('name', 'Unknown NPC'),
-                        description=description
-                    )
+        Returns:
+            Number of NPCs placed
+        """
+        from ..npcs.npc import NPC
+        room_id = room.room_id
+        npcs_placed = 0
 
-                    # Set additional properties
-                    npc.room_id = room_id
-                    if 'type' in npc_data:
-                        npc.npc_type = npc_data['type']
-                    if 'dialogue' in npc_data:
-                        npc.dialogue = npc_data.get('dialogue', {})
-                    if 'quests' in npc_data:
-                        npc.quests = npc_data['quests']
-
-                    # Add NPC object to room
-                    room.npcs.append(npc)
-                    npcs_placed += 1
-                else:
-                    self.logger.warning(f"NPC '{npc_id}' referenced in room '{room_id}' not found in self.npcs")
+        # Clear the string list and replace with actual NPC objects
+        room.npcs = []
 
-        self.logger.info(f"Initialized {npcs_placed} NPCs in rooms")
+        for npc_id in npc_ids:
+            # Look up the full NPC data
+            if npc_id in self.npcs:
+                npc_data = self.npcs[npc_id]
+
+                # Get description (check long_description first, then description)
+                description = npc_data.get('long_description') or npc_data.get('description', 'A mysterious figure.')
+
+                # Create NPC object
+                npc = NPC(
+                    npc_id=npc_data.get('id', npc_id),
+                    name=npc_data.get('name', 'Unknown NPC'),
+                    description=description
+                )
+
+                # Set additional properties
+                npc.room_id = room_id
+                if 'type' in npc_data:
+                    npc.npc_type = npc_data['type']
+                if 'dialogue' in npc_data:
+                    npc.dialogue = npc_data.get('dialogue', {})
+                if 'quests' in npc_data:
+                    npc.quests = npc_data['quests']
+
+                # Add NPC object to room
+                room.npcs.append(npc)
+                npcs_placed += 1
+            else:
+                self.logger.warning(f"NPC '{npc_id}' referenced in room '{room_id}' not found in self.npcs")
+
+        return npcs_placed
 
     def _create_default_world(self):
         """Create a minimal default world if loading fails."""
@@ -349,6 +418,155 @@ class WorldManager:
         default_area.add_room(default_room)
         self.areas["default_area"] = default_area
 
+    def apply_room_changes(self, rooms_data: Dict[str, Dict], changed_ids: Iterable[str],
+                           source_hash: Optional[str] = None) -> Dict[str, int]:
+        """Update the loaded world after room files changed, without reloading it.
+
+        The room store is rebuilt, then only the changed rooms are touched:
+        their properties, NPCs, exits and graph edges, plus the exits of other
+        rooms that lead into added or removed rooms. Removed rooms that still
+        have players or mobs in them are kept (unreachable) so nobody is
+        stranded in a room that no longer exists.
+
+        Args:
+            rooms_data: All room data, as loaded from the room files
+            changed_ids: IDs of rooms whose files were added, modified or removed
+            source_hash: Content hash to stamp the room store with
+
+        Returns:
+            Counts of added, changed and removed rooms
+        """
+        changed_ids = set(changed_ids)
+        added = [room_id for room_id in changed_ids if room_id in rooms_data and room_id not in self.rooms]
+        modified = [room_id for room_id in changed_ids if room_id in rooms_data and room_id in self.rooms]
+        removed = [room_id for room_id in changed_ids if room_id not in rooms_data and room_id in self.rooms]
+
+        # Maps of the areas rooms leave, join or change in are laid out again on next use
+        changed_areas = {getattr(self.rooms[room_id], 'area_id', None) for room_id in modified + removed}
+
+        occupied = self._occupied_room_ids()
+        for room_id in removed:
+            if room_id in occupied:
+                # Pin the cold fields before the store forgets them
+                room = self.rooms[room_id]
+                room.description = room.description
+                room.lairs = list(room.lairs)
+                room.store = None
+
+        self.rooms_data.build(rooms_data, source_hash)
+
+        if added:
+            self.room_index.load(rooms_data)
+
+        for room_id in added:
+            self.rooms[room_id] = Room(room_id, rooms_data[room_id].get('title', 'Unknown Room'), None,
+                                       store=self.rooms_data)
+            self.world_graph.add_room(room_id)
+
+        for room_id in added + modified:
+            room = self.rooms[room_id]
+            old_area_id = getattr(room, 'area_id', None) if room_id in modified else None
+            self._apply_room_data(room, rooms_data[room_id])
+            self._place_room_npcs(room, rooms_data[room_id].get('npcs', []))
+
+            new_area_id = getattr(room, 'area_id', None)
+            if room_id in added or new_area_id != old_area_id:
+                if old_area_id in self.areas:
+                    self.areas[old_area_id].rooms.pop(room_id, None)
+                if new_area_id in self.areas:
+                    self.areas[new_area_id].add_room(room)
+
+        for room_id in removed:
+            # Drop the exits of other rooms that lead here
+            for edge in list(self.world_graph.reverse_edges.get(room_id, [])):
+                source = self.rooms.get(edge.from_room)
+                exit_obj = source.exits.get(edge.direction) if source else None
+                if exit_obj and exit_obj.destination_room_id == room_id:
+                    del source.exits[edge.direction]
+                self.world_graph.remove_edge(edge.from_room, room_id)
+
+            if room_id in occupied:
+                # Its own exits stay so whoever is inside can walk out
+                self.logger.warning(f"Room '{room_id}' was removed but is occupied; keeping it until the next restart")
+                continue
+
+            self.world_graph.remove_room(room_id)
+            room = self.rooms.pop(room_id)
+            area = self.areas.get(getattr(room, 'area_id', None))
+            if area:
+                area.rooms.pop(room_id, None)
+
+        for room_id in added + modified:
+            self._connect_room(room_id, self.rooms_data.get_exits(room_id))
+
+        if added:
+            # Exits elsewhere that lead into new rooms were skipped when their rooms were loaded
+            added_ids = set(added)
+            for room_id in self.rooms_data:
+                if room_id in changed_ids or room_id not in self.rooms:
+                    continue
+                for direction, target_room_id in self.rooms_data.get_exits(room_id).items():
+                    if target_room_id in added_ids:
+                        self._add_exit(room_id, direction, target_room_id)
+
+        self.routing.invalidate_rooms(changed_ids)
+        self.pathfinder.invalidate_rooms(changed_ids)
+        self.path_cache.bump_epoch()
+        changed_areas.update(getattr(self.rooms[room_id], 'area_id', None) for room_id in added + modified)
+        for area_id in changed_areas:
+            self.map_layouts.pop(area_id, None)
+
+        self.logger.info(f"Rooms reloaded: {len(added)} added, {len(modified)} changed, {len(removed)} removed")
+        return {'added': len(added), 'changed': len(modified), 'removed': len(removed)}
+
+    def update_npc_definitions(self, npcs_data: Dict[str, Dict], changed_ids: Iterable[str]):
+        """Swap in new NPC definitions and rebuild the NPCs of rooms that contain a changed NPC.
+
+        Args:
+            npcs_data: All NPC definitions, as loaded from the NPC files
+            changed_ids: IDs of NPCs that were added, modified or removed
+        """
+        changed_ids = set(changed_ids)
+        self.npcs = npcs_data
+        for room_id in self.rooms_data:
+            npc_ids = self.rooms_data.get_field(room_id, 'npcs')
+            if npc_ids and room_id in self.rooms and changed_ids.intersection(npc_ids):
+                self._place_room_npcs(self.rooms[room_id], npc_ids)
+
+    def _connect_room(self, room_id: str, exits: Dict[str, str]):
+        """Replace a room's exits and outgoing graph edges."""
+        self.rooms[room_id].exits = {}
+        self.world_graph.remove_edges_from(room_id)
+        for direction, target_room_id in exits.items():
+            if target_room_id in self.rooms:
+                self._add_exit(room_id, direction, target_room_id)
+
+    def _add_exit(self, room_id: str, direction: str, target_room_id: str):
+        """Add an exit to a room and the matching graph edge."""
+        from .exit import Exit
+        self.rooms[room_id].add_exit(direction, Exit(target_room_id, direction))
+        self.world_graph.add_edge(GraphEdge(
+            from_room=room_id,
+            to_room=target_room_id,
+            direction=direction,
+            edge_type=EdgeType.NORMAL,
+            weight=1.0
+        ))
+
+    def _occupied_room_ids(self) -> set:
+        """IDs of rooms that currently hold a player or a mob."""
+        occupied = set()
+        if not self.game_engine:
+            return occupied
+        for player_data in self.game_engine.player_manager.get_all_connected_players().values():
+            character = player_data.get('character')
+            if character and character.get('room_id'):
+                occupied.add(character['room_id'])
+        for room_id, mobs in getattr(self.game_engine, 'room_mobs', {}).items():
+            if mobs:
+                occupied.add(room_id)
+        return occupied
+
     def get_room(self, room_id: str) -> Optional[Room]:
         """Get a room by its ID."""
         return self.rooms.get(room_id)
@@ -456,18 +674,18 @@ class WorldManager:
         # - Dynamic room changes
         pass
 
-    def _build_world_graph_from_rooms(self, rooms_data: Dict):
+    def _build_world_graph_from_rooms(self, rooms_data: RoomStore):
         """Build the world navigation graph from room exit data."""
         # Add all rooms to the graph
         for room_id in self.rooms:
             self.world_graph.add_room(room_id)
 
         # Add connections as graph edges from room exits
-        for room_id, room_data in rooms_data.items():
+        for room_id in rooms_data:
             if room_id not in self.rooms:
                 continue
 
-            exits = room_data.get('exits', {})
+            exits = rooms_data.get_exits(room_id)
             for direction, target_room_id in exits.items():
                 if target_room_id in self.rooms:
                     # Create graph edge
@@ -482,7 +700,7 @@ class WorldManager:
 
             # IMPORTANT: Also add locked exits to the graph so they can be checked during movement
             # The movement command will check if they're locked and handle key logic
-            locked_exits = room_data.get('locked_exits', {})
+            locked_exits = self.rooms[room_id].locked_exits
             if locked_exits:
                 self.logger.info(f"[DOOR] Adding {len(locked_exits)} locked exits to graph for room '{room_id}'")
                 for direction in locked_exits.keys():
@@ -495,8 +713,74 @@ class WorldManager:
                         self.logger.warning(f"[DOOR]   - Locked exit '{direction}' has no matching exit in 'exits'!")
 
     def find_path(self, start: str, goal: str, character: 'Character' = None) -> Optional[List[str]]:
-        """Find a path between two rooms using the world graph."""
-        return self.world_graph.find_path_dijkstra(start, goal, character)
+        """Find a path between two rooms, solving long routes at the area level first.
+
+        Routes are cached per start, goal and the character's keys and abilities.
+        """
+        return self.path_cache.find_path(start, goal, character)
+
+    def exit_state_changed(self, room_id: str):
+        """Drop routes that depend on a room's doors or barriers after one was unlocked.
+
+        Args:
+            room_id: The room whose exit changed
+        """
+        self.routing.invalidate_rooms([room_id])
+        self.path_cache.bump_epoch()
+
+    def can_traverse_exit(self, edge: GraphEdge, character: 'Character') -> bool:
+        """Check if a character can use an exit, given the doors and barriers on it.
+
+        Locked doors need their key. Locked barriers that open with an item
+        need one of those items; barriers opened only by skill are assumed
+        passable, since the character may succeed.
+
+        Args:
+            edge: Graph edge of the exit
+            character: Character dict or object
+        """
+        if not edge.can_traverse(character):
+            return False
+        room = self.rooms.get(edge.from_room)
+        if room is None:
+            return True
+
+        lock = room.locked_exits.get(edge.direction)
+        if lock:
+            key = lock.get('required_key')
+            if not key or key.lower().replace(' ', '_') not in held_item_ids(character):
+                return False
+
+        barrier = room.barriers.get(edge.direction)
+        if barrier and barrier.get('locked', True):
+            keys = self._barrier_keys(barrier.get('barrier_id'))
+            if keys and not keys & held_item_ids(character):
+                return False
+        return True
+
+    def get_exit_keys(self) -> set:
+        """Normalized IDs of every item that opens a locked door or barrier somewhere."""
+        keys = set()
+        for room in self.rooms.values():
+            for lock in room.locked_exits.values():
+                if lock.get('required_key'):
+                    keys.add(lock['required_key'].lower().replace(' ', '_'))
+            for barrier in room.barriers.values():
+                keys.update(self._barrier_keys(barrier.get('barrier_id')))
+        return keys
+
+    def _barrier_keys(self, barrier_id: Optional[str]) -> set:
+        """Normalized IDs of the items that open a barrier (key, rune or rope methods)."""
+        methods = self.barriers.get(barrier_id, {}).get('unlock_methods', {})
+        return {
+            methods[name]['required_item'].lower().replace(' ', '_')
+            for name in ('key', 'rune', 'rope')
+            if methods.get(name, {}).get('enabled') and methods[name].get('required_item')
+        }
+
+    def next_hop(self, start: str, goal: str) -> Optional[str]:
+        """Get the next room a mob should move into to reach a goal (precomputed routes)."""
+        return self.routing.next_hop(start, goal)
 
     def find_shortest_path(self, start: str, goal: str, character: 'Character' = None) -> Optional[List[str]]:
         """Find the shortest path between two rooms."""
@@ -525,6 +809,14 @@ class WorldManager:
         """Get all rooms within a certain distance of a center room."""
         return self.world_graph.get_area_rooms(center, distance, character)
 
+    def get_map_layout(self, area: Area) -> AreaMapLayout:
+        """Get an area's map layout, laying it out if its rooms changed since the last one."""
+        layout = self.map_layouts.get(area.area_id)
+        if layout is None:
+            layout = AreaMapLayout(area, self.rooms_data, self.room_index)
+            self.map_layouts[area.area_id] = layout
+        return layout
+
     def get_world_stats(self) -> Dict:
         """Get statistics about the world."""
         graph_stats = self.world_graph.get_graph_stats()
@@ -683,7 +975,7 @@ class WorldManager:
             return 1.0
 
         # Start with base room light level
-        base_light = getattr(room, '_raw_data', {}).get('light_level', 1.0)
+        base_light = getattr(room, 'light_level', 1.0)
         base_factor = light_level_to_factor(base_light)
 
         # Add brightness from lit light sources
@@ -867,8 +1159,8 @@ class WorldManager:
             # Get NPCs from room data
             if hasattr(room, 'npcs') and room.npcs:
                 room_npcs.extend(room.npcs)
-            if hasattr(room, '_raw_data') and room._raw_data and 'npcs' in room._raw_data:
-                room_npcs.extend(room._raw_data['npcs'])
+            if room.store is not None:
+                room_npcs.extend(room.store.get_field(room.room_id, 'npcs', []))
 
             # Check each NPC
             for npc_id in room_npcs:
@@ -906,21 +1198,7 @@ class WorldManager:
 
     def _matches_target(self, search_term: str, target_name: str) -> bool:
         """Check if search term matches target name (supports partial matching)."""
-        # Exact match
-        if search_term == target_name:
-            return True
-
-        # Partial match from beginning of words
-        words = target_name.split()
-        for word in words:
-            if word.startswith(search_term):
-                return True
-
-        # Check if search term is contained in the full name
-        if search_term in target_name:
-            return True
-
-        return False
+        return match_rank(search_term, (target_name,)) is not None
 
     def _matches_npc_keywords(self, search_term: str, npc_data: dict) -> bool:
         """Check if search term matches any NPC keywords."""
@@ -1,11 +1,13 @@
 """Async connection manager for the MUD server."""
 
 import asyncio
+import functools
 from typing import Dict, List, Optional, Callable
 
 from .async_telnet_server import AsyncTelnetServer
+from .network_thread import LoopEvents, NetworkThread, Outbox
 from ..utils.logger import get_logger
-from ..core.event_system import EventSystem
+from ..core.event_bus import EventBus
 
 
 class AsyncConnection:
@@ -45,23 +47,41 @@ class AsyncConnectionManager:
         self.logger = get_logger()
         self.running = False
 
+        # Set when the telnet server runs on its own thread (see network_thread)
+        self.network_thread = False
+        self.network: Optional[NetworkThread] = None
+        self.outbox: Optional[Outbox] = None
+        self.game_loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Callbacks for higher-level game systems
         self.on_player_connect: Optional[Callable[[int], None]] = None
         self.on_player_disconnect: Optional[Callable[[int], None]] = None
         self.on_player_command: Optional[Callable[[int, str, str], None]] = None
+        self.on_player_quit: Optional[Callable[[int], None]] = None
+        # Called as soon as a command line is read, on the thread that read it
+        self.on_command_received: Optional[Callable[[], None]] = None
 
     def initialize(self, host: str = "localhost", port: int = 4000,
-                  event_system: Optional[EventSystem] = None):
-        """Initialize the telnet server."""
+                  event_bus: Optional[EventBus] = None, network_thread: bool = False):
+        """Initialize the telnet server.
+
+        Args:
+            host: Address to listen on
+            port: Port to listen on
+            event_bus: Event bus to publish connection events to
+            network_thread: Run the telnet server on its own thread and event loop
+        """
         self.telnet_server = AsyncTelnetServer(host, port)
+        self.network_thread = network_thread
 
-        if event_system:
-            self.telnet_server.set_event_system(event_system)
+        if event_bus:
+            self.telnet_server.set_event_bus(event_bus)
 
-        # Set up callbacks
-        self.telnet_server.on_player_connect = self._handle_player_connect
-        self.telnet_server.on_player_disconnect = self._handle_player_disconnect
-        self.telnet_server.on_player_command = self._handle_player_command
+        # Set up callbacks (on the network thread, these hand over to the game loop)
+        self.telnet_server.on_player_connect = functools.partial(self._to_game, self._handle_player_connect)
+        self.telnet_server.on_player_disconnect = functools.partial(self._to_game, self._handle_player_disconnect)
+        self.telnet_server.on_player_command = self._receive_command
+        self.telnet_server.on_player_quit = functools.partial(self._to_game, self._handle_player_quit)
 
         self.logger.info(f"Async connection manager initialized for {host}:{port}")
 
@@ -77,8 +97,20 @@ class AsyncConnectionManager:
         self.running = True
         self.logger.info("Starting async connection manager")
 
-        # Start the telnet server
-        await self.telnet_server.start()
+        if not self.network_thread:
+            # Start the telnet server
+            await self.telnet_server.start()
+            return
+
+        # Serve from a thread of its own; this loop keeps the game
+        self.game_loop = asyncio.get_running_loop()
+        if self.telnet_server.event_bus:
+            self.telnet_server.set_event_bus(LoopEvents(self.telnet_server.event_bus, self.game_loop))
+        self.network = NetworkThread()
+        self.outbox = Outbox(self.network)
+        self.network.start()
+        self.logger.info("Telnet server running on its own network thread")
+        await self.network.run(self.telnet_server.start())
 
     async def stop_server(self):
         """Stop the server."""
@@ -88,7 +120,10 @@ class AsyncConnectionManager:
         self.running = False
         self.logger.info("Stopping async connection manager")
 
-        if self.telnet_server:
+        if self.network:
+            await self.network.run(self.telnet_server.stop())
+            self.network.stop()
+        elif self.telnet_server:
             await self.telnet_server.stop()
 
         # Clear all connections
@@ -119,6 +154,31 @@ class AsyncConnectionManager:
                 # Create a task to handle the async disconnect
                 asyncio.create_task(self.on_player_disconnect(player_id))
 
+    def _handle_player_quit(self, player_id: int):
+        """Handle a player asking to quit (before their connection closes)."""
+        if self.on_player_quit:
+            self.on_player_quit(player_id)
+
+    def _to_game(self, callback: Callable, *args):
+        """Run a telnet server callback on the game loop."""
+        if self.game_loop:
+            self.game_loop.call_soon_threadsafe(callback, *args)
+        else:
+            callback(*args)
+
+    async def _to_network(self, coroutine_function: Callable, *args):
+        """Run a telnet server call on the network loop (queued if that's another thread)."""
+        if self.outbox:
+            self.outbox.put(coroutine_function, *args)
+        else:
+            await coroutine_function(*args)
+
+    def _receive_command(self, player_id: int, command: str, params: str):
+        """Take a command line from the telnet server and pass it to the game."""
+        if self.on_player_command and self.on_command_received:
+            self.on_command_received()
+        self._to_game(self._handle_player_command, player_id, command, params)
+
     def _handle_player_command(self, player_id: int, command: str, params: str):
         """Handle a command from a player."""
         # Notify higher-level systems
@@ -133,28 +193,37 @@ class AsyncConnectionManager:
     async def remove_connection(self, player_id: int):
         """Remove a connection."""
         if player_id in self.connections:
-            connection = self.connections[player_id]
-            await connection.disconnect()
+            await self.disconnect_player(player_id)
+
+    async def disconnect_player(self, player_id: int, message: Optional[str] = None):
+        """Close a player's connection (after sending message, if given)."""
+        if self.telnet_server:
+            await self._to_network(self.telnet_server.disconnect_player, player_id, message)
 
     async def send_message(self, player_id: int, message: str, add_newline: bool = True):
         """Send a message to a specific player."""
         connection = self.get_connection(player_id)
         if connection:
             # Pass through to telnet server
-            await self.telnet_server.send_message(player_id, message, add_newline)
+            await self._to_network(self.telnet_server.send_message, player_id, message, add_newline)
         else:
             self.logger.warning(f"Attempted to send message to non-existent player {player_id}")
 
+    async def flush(self, player_id: int):
+        """Write out a player's buffered output."""
+        if self.telnet_server:
+            await self._to_network(self.telnet_server.flush, player_id)
+
     async def broadcast(self, message: str, exclude_player: Optional[int] = None):
         """Send a message to all connected clients."""
         if self.telnet_server:
-            await self.telnet_server.broadcast_message(message, exclude_player)
+            await self._to_network(self.telnet_server.broadcast_message, message, exclude_player)
 
     async def broadcast_to_room(self, message: str, room_id: str,
                               exclude_player: Optional[int] = None):
         """Send a message to all players in a specific room."""
         if self.telnet_server:
-            await self.telnet_server.send_message_to_room(message, room_id, exclude_player)
+            await self._to_network(self.telnet_server.send_message_to_room, message, room_id, exclude_player)
 
     # Synchronous interface methods for compatibility
     def get_connected_players(self) -> List[int]:
@@ -178,5 +247,7 @@ class AsyncConnectionManager:
 
     def update_player_session(self, player_id: int, **kwargs):
         """Update session data for a player."""
-        if self.telnet_server:
+        if self.network:
+            self.network.call(self.telnet_server.update_player_session, player_id, **kwargs)
+        elif self.telnet_server:
             self.telnet_server.update_player_session(player_id, **kwargs)
\ No newline at end of file
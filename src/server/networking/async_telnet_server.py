@@ -5,7 +5,8 @@ import time
 from typing import Optional, Callable, Dict, Any, List
 
 from ..utils.logger import get_logger
-from ..core.event_system import EventSystem
+from ..core.event_bus import EventBus
+from ..core.events import PlayerCommand, PlayerConnected, PlayerDisconnected
 from shared.constants.game_constants import WELCOME_MESSAGE, GOODBYE_MESSAGE
 
 
@@ -183,20 +184,21 @@ class AsyncTelnetServer:
         self.server: Optional[asyncio.Server] = None
         self.running = False
 
-        # Event system integration
-        self.event_system: Optional[EventSystem] = None
+        # Event bus integration
+        self.event_bus: Optional[EventBus] = None
 
         # Callbacks
         self.on_player_connect: Optional[Callable[[int], None]] = None
         self.on_player_disconnect: Optional[Callable[[int], None]] = None
         self.on_player_command: Optional[Callable[[int, str, str], None]] = None
+        self.on_player_quit: Optional[Callable[[int], None]] = None
 
         # Player session data
         self.player_sessions: Dict[int, Dict[str, Any]] = {}
 
-    def set_event_system(self, event_system: EventSystem):
-        """Set the event system for publishing events."""
-        self.event_system = event_system
+    def set_event_bus(self, event_bus: EventBus):
+        """Set the event bus for publishing connection events."""
+        self.event_bus = event_bus
 
     async def start(self):
         """Start the asyncio telnet server."""
@@ -288,8 +290,8 @@ class AsyncTelnetServer:
             self.on_player_connect(connection_id)
 
         # Publish event
-        if self.event_system:
-            self.event_system.publish('player_connected', {'player_id': connection_id})
+        if self.event_bus and self.event_bus.wants(PlayerConnected):
+            self.event_bus.publish(PlayerConnected(connection_id))
 
         # Start read loop for this connection
         asyncio.create_task(connection.read_loop())
@@ -315,11 +317,9 @@ class AsyncTelnetServer:
             self.on_player_disconnect(connection_id)
 
         # Publish event
-        if self.event_system:
-            self.event_system.publish('player_disconnected', {
-                'player_id': connection_id,
-                'session_duration': time.time() - session.get('connected_at', time.time())
-            })
+        if self.event_bus and self.event_bus.wants(PlayerDisconnected):
+            self.event_bus.publish(PlayerDisconnected(
+                connection_id, time.time() - session.get('connected_at', time.time())))
 
     async def _handle_command(self, connection_id: int, command: str, params: str):
         """Handle a command from a player."""
@@ -333,6 +333,8 @@ class AsyncTelnetServer:
 
         # Handle quit specially
         if command in ['quit', 'exit', 'logout']:
+            if self.on_player_quit:
+                self.on_player_quit(connection_id)
             connection = self.connections.get(connection_id)
             if connection:
                 await connection.send_message(GOODBYE_MESSAGE)
@@ -343,14 +345,9 @@ class AsyncTelnetServer:
         if self.on_player_command:
             self.on_player_command(connection_id, command, params)
 
-        # Publish event
-        if self.event_system:
-            self.event_system.publish('player_command', {
-                'player_id': connection_id,
-                'command': command,
-                'params': params,
-                'timestamp': time.time()
-            })
+        # Publish event (only built if someone listens: this runs for every line)
+        if self.event_bus and self.event_bus.wants(PlayerCommand):
+            self.event_bus.publish(PlayerCommand(connection_id, command, params, time.time()))
 
     async def send_message(self, player_id: int, message: str, add_newline: bool = True):
         """Send a message to a specific player."""
@@ -358,6 +355,12 @@ class AsyncTelnetServer:
         if connection:
             await connection.send_message(message, add_newline)
 
+    async def flush(self, player_id: int):
+        """Write out a player's buffered output."""
+        connection = self.connections.get(player_id)
+        if connection:
+            await connection.flush()
+
     async def broadcast_message(self, message: str, exclude_player: Optional[int] = None):
         """Send a message to all connected players."""
         tasks = []
@@ -0,0 +1,131 @@
+"""Running the network front end on its own thread.
+
+By default the telnet server and the game share one event loop, so a slow
+tick is input latency for every player. With performance.network_thread
+enabled, the telnet server runs on an event loop of its own, on a
+background thread, and the two loops only talk through queues:
+
+- The network thread owns the sockets: the telnet server, its connections
+  and their session data. The game thread may read the connection table
+  (e.g. to check a player is still connected) but never changes it.
+- The game thread owns everything else. Connects, disconnects and command
+  lines are handed to it with call_soon_threadsafe and handled on its loop.
+- Output goes the other way through an Outbox: a deque the game thread
+  appends to and the network thread drains, in order, on its own loop.
+"""
+
+import asyncio
+import functools
+import threading
+from collections import deque
+from typing import Any, Callable, Coroutine
+
+from ..utils.logger import get_logger
+
+
+class NetworkThread:
+    """An event loop on a background thread."""
+
+    def __init__(self, name: str = "network"):
+        """Initialize the thread (not started yet).
+
+        Args:
+            name: Thread name, shown in logs and debuggers
+        """
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        """Start the thread and its event loop."""
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            # Background tasks (e.g. the idle-connection sweep) end with the loop
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+
+    def run(self, coroutine: Coroutine) -> asyncio.Future:
+        """Run a coroutine on this thread's loop.
+
+        Returns:
+            A future that can be awaited from the calling thread's loop
+        """
+        return asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, self.loop))
+
+    def call(self, callback: Callable, *args, **kwargs):
+        """Call a function on this thread's loop, without waiting for it."""
+        self.loop.call_soon_threadsafe(functools.partial(callback, *args, **kwargs))
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the event loop and wait for the thread to finish."""
+        if self.thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout)
+
+
+class Outbox:
+    """Output from the game thread, delivered in order on the network thread."""
+
+    def __init__(self, network: NetworkThread):
+        """Initialize the outbox.
+
+        Args:
+            network: The thread that owns the sockets
+        """
+        self.network = network
+        self.items: deque = deque()
+        self.scheduled = False
+        self.logger = get_logger('network')
+
+    def put(self, coroutine_function: Callable[..., Coroutine], *args):
+        """Queue a network call (e.g. telnet_server.send_message) to run on the network thread."""
+        self.items.append((coroutine_function, args))
+        if not self.scheduled:
+            self.scheduled = True
+            self.network.call(self._schedule)
+
+    def _schedule(self):
+        asyncio.ensure_future(self._drain())
+
+    async def _drain(self):
+        # Cleared before draining: anything put after this either gets drained
+        # below or schedules another drain
+        self.scheduled = False
+        while True:
+            try:
+                coroutine_function, args = self.items.popleft()
+            except IndexError:
+                return
+            try:
+                await coroutine_function(*args)
+            except Exception as e:
+                self.logger.error("Error delivering output: %s", e)
+
+
+class LoopEvents:
+    """Publishes to an EventBus from another thread, on the loop that owns it."""
+
+    def __init__(self, event_bus: Any, loop: asyncio.AbstractEventLoop):
+        """Initialize the proxy.
+
+        Args:
+            event_bus: The game's EventBus
+            loop: The game thread's event loop
+        """
+        self.event_bus = event_bus
+        self.loop = loop
+
+    def wants(self, event_type: type) -> bool:
+        """Check if anyone subscribes to a topic."""
+        return self.event_bus.wants(event_type)
+
+    def publish(self, event: Any):
+        """Publish an event on the game thread."""
+        self.loop.call_soon_threadsafe(self.event_bus.publish, event)
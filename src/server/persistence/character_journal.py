@@ -0,0 +1,134 @@
+"""Character journal deltas.
+
+In journal mode a save appends small change records instead of rewriting
+the whole character blob. This module computes those records by diffing two
+character snapshots and replays them on load.
+
+Record ops:
+    set          {'key', 'value'}            replace a top-level field
+    unset        {'key'}                     remove a top-level field
+    set_in       {'key', 'field', 'value'}   replace one entry of a dict field
+    unset_in     {'key', 'field'}            remove one entry of a dict field
+    list_append  {'key', 'value'}            append to a list field (inventory add)
+    list_remove  {'key', 'value'}            remove the first equal element (inventory remove)
+"""
+
+import copy
+from typing import Any, Dict, List, Tuple
+
+JournalEntry = Tuple[str, Dict[str, Any]]
+
+# List fields where per-element add/remove records beat rewriting the list
+_LIST_DELTA_FIELDS = ('inventory', 'spellbook')
+
+
+def compute_character_delta(old: Dict[str, Any], new: Dict[str, Any]) -> List[JournalEntry]:
+    """Compute the journal entries that turn old into new.
+
+    Args:
+        old: The last persisted character state
+        new: The current character state
+
+    Returns:
+        Ordered journal entries; empty if nothing changed
+    """
+    entries: List[JournalEntry] = []
+
+    for key, new_value in new.items():
+        if key not in old:
+            entries.append(('set', {'key': key, 'value': new_value}))
+            continue
+
+        old_value = old[key]
+        if old_value == new_value:
+            continue
+
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            entries.extend(_dict_delta(key, old_value, new_value))
+        elif (key in _LIST_DELTA_FIELDS and isinstance(old_value, list)
+              and isinstance(new_value, list)):
+            entries.extend(_list_delta(key, old_value, new_value))
+        else:
+            entries.append(('set', {'key': key, 'value': new_value}))
+
+    for key in old:
+        if key not in new:
+            entries.append(('unset', {'key': key}))
+
+    return entries
+
+
+def _dict_delta(key: str, old: Dict[str, Any], new: Dict[str, Any]) -> List[JournalEntry]:
+    """Diff one level into a dict field (quests, equipped, spell_cooldowns...)."""
+    entries: List[JournalEntry] = []
+    for field, value in new.items():
+        if field not in old or old[field] != value:
+            entries.append(('set_in', {'key': key, 'field': field, 'value': value}))
+    for field in old:
+        if field not in new:
+            entries.append(('unset_in', {'key': key, 'field': field}))
+    return entries
+
+
+def _list_delta(key: str, old: List[Any], new: List[Any]) -> List[JournalEntry]:
+    """Diff a list field as element removals followed by appends.
+
+    Falls back to a single 'set' when replaying the removals and appends
+    would not reproduce the new list exactly (e.g. reordering).
+    """
+    remaining = list(old)
+    removals: List[JournalEntry] = []
+    unmatched_new = []
+
+    # Match elements present in both lists, in order
+    for value in new:
+        try:
+            remaining.remove(value)
+        except ValueError:
+            unmatched_new.append(value)
+
+    for value in remaining:
+        removals.append(('list_remove', {'key': key, 'value': value}))
+    appends = [('list_append', {'key': key, 'value': value}) for value in unmatched_new]
+    entries = removals + appends
+
+    # Verify the records replay to exactly the new list
+    replayed = {key: list(old)}
+    for op, payload in entries:
+        apply_journal_entry(replayed, op, payload)
+    if replayed[key] != new or len(entries) >= len(new):
+        return [('set', {'key': key, 'value': new})]
+    return entries
+
+
+def apply_journal_entry(character: Dict[str, Any], op: str, payload: Dict[str, Any]):
+    """Apply one journal entry to a character dict in place.
+
+    Args:
+        character: The character dict to update
+        op: The entry's op name
+        payload: The entry's payload
+    """
+    key = payload['key']
+
+    if op == 'set':
+        character[key] = copy.deepcopy(payload['value'])
+    elif op == 'unset':
+        character.pop(key, None)
+    elif op == 'set_in':
+        if not isinstance(character.get(key), dict):
+            character[key] = {}
+        character[key][payload['field']] = copy.deepcopy(payload['value'])
+    elif op == 'unset_in':
+        if isinstance(character.get(key), dict):
+            character[key].pop(payload['field'], None)
+    elif op == 'list_append':
+        if not isinstance(character.get(key), list):
+            character[key] = []
+        character[key].append(copy.deepcopy(payload['value']))
+    elif op == 'list_remove':
+        values = character.get(key)
+        if isinstance(values, list) and payload['value'] in values:
+            values.remove(payload['value'])
+    else:
+        raise ValueError(f"Unknown journal op '{op}'")
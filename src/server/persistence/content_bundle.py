@@ -0,0 +1,457 @@
+"""Compiled content bundle for fast startup.
+
+Game content lives in hundreds of JSON files under data/. Parsing them on
+every boot (and in several systems parsing the same files twice) makes
+startup slower than it needs to be, so the files are compiled into a single
+bundle: every file's parsed JSON, pickled, plus a hash of the source files.
+While the server runs, refresh() re-parses only the files whose size or
+modification time changed, for hot reloads of game content.
+
+On startup the server hashes the source files and loads the bundle if the
+hash matches, otherwise it rebuilds the bundle from the sources. Rebuilds
+parse the files in a process pool on multi-core machines, using orjson when
+it is installed, and merge the results back in source order. Content
+loaders read files through get_json() and list_json_files(), which serve
+from the bundle when it is loaded and fall back to the filesystem when it
+is not (tools, tests, or content outside data/).
+
+A file that fails to parse stays listed, with no parsed data: reading it
+goes to the filesystem, so the loader that owns it reports the error, and
+every load of the bundle warns about it again.
+
+Content that another store serves once it is built (the room files, served
+by the RoomStore) can be released: its parsed data is dropped from memory,
+the files stay listed and reads of them go to the filesystem. The bundle on
+disk keeps it.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+from ..utils.logger import get_logger
+
+# Bump when the bundle layout changes so old bundles are rebuilt
+BUNDLE_FORMAT_VERSION = 2
+
+# Fewer files than this are parsed serially; a pool costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+# Files sent to a worker at a time
+PARSE_CHUNK_SIZE = 16
+
+PathLike = Union[str, Path]
+
+
+def parse_content_file(path: str) -> Tuple[Optional[bytes], Optional[str]]:
+    """Parse one JSON content file into its pickled form.
+
+    Runs in pool workers, so it only takes and returns picklable values.
+
+    Args:
+        path: Absolute path to the file
+
+    Returns:
+        (pickled data, None) on success, or (None, error message) if the file
+        can't be read or parsed
+    """
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode('utf-8'))
+    except (OSError, ValueError) as e:
+        return None, str(e)
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), None
+
+
+def default_parse_workers() -> int:
+    """Number of parse workers to use: one per core, at most 8."""
+    return max(1, min(os.cpu_count() or 1, 8))
+
+
+class ContentBundle:
+    """Pre-parsed content from the data directory, keyed by a hash of its sources."""
+
+    def __init__(self, data_dir: PathLike = "data", bundle_path: Optional[PathLike] = None,
+                 workers: Optional[int] = None):
+        """Initialize the bundle.
+
+        Args:
+            data_dir: Root of the content files
+            bundle_path: Where the compiled bundle is stored (default: <data_dir>/.build/content_bundle.pkl)
+            workers: Processes used to parse files on a rebuild (default: one per core, at most 8)
+        """
+        self.data_dir = os.path.realpath(data_dir)
+        self.bundle_path = str(bundle_path or os.path.join(data_dir, ".build", "content_bundle.pkl"))
+        self.workers = workers or default_parse_workers()
+        self.logger = get_logger()
+
+        self.source_hash: Optional[str] = None
+        self.loaded = False
+        self.stats: Dict[str, Any] = {}
+        self._files: Dict[str, Optional[bytes]] = {}  # data-relative path -> pickled parsed JSON (None if it failed to parse)
+        self._errors: Dict[str, str] = {}  # data-relative path -> parse error
+        self._released: List[str] = []  # data-relative prefixes whose parsed data was dropped
+        self._stamps: Dict[str, Tuple[int, int]] = {}  # data-relative path -> (mtime_ns, size) when parsed
+
+    def scan_sources(self) -> List[str]:
+        """List the content files that go into the bundle.
+
+        Returns:
+            Data-relative paths of every JSON file under the data directory, in
+            directory listing order (loaders that merge files rely on it)
+        """
+        build_dir = os.path.dirname(os.path.realpath(self.bundle_path))
+        sources = []
+        for root, dirs, files in os.walk(self.data_dir):
+            if os.path.realpath(root) == build_dir:
+                dirs[:] = []
+                continue
+            for filename in files:
+                if filename.endswith('.json'):
+                    sources.append(os.path.relpath(os.path.join(root, filename), self.data_dir).replace(os.sep, '/'))
+        return sources
+
+    def stat_sources(self, sources: List[str]) -> Dict[str, Tuple[int, int]]:
+        """Get the modification time and size of each source file (missing files are left out)."""
+        stamps = {}
+        for relpath in sources:
+            try:
+                st = os.stat(os.path.join(self.data_dir, relpath))
+            except OSError:
+                continue
+            stamps[relpath] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def compute_source_hash(self, sources: List[str]) -> str:
+        """Hash the names and contents of the source files."""
+        digest = hashlib.sha256(f"v{BUNDLE_FORMAT_VERSION}".encode())
+        for relpath in sorted(sources):
+            digest.update(relpath.encode())
+            digest.update(b"\0")
+            with open(os.path.join(self.data_dir, relpath), 'rb') as f:
+                digest.update(f.read())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def load(self, rebuild: bool = True) -> bool:
+        """Load the bundle, rebuilding it first if the sources changed.
+
+        Args:
+            rebuild: Rebuild a missing or stale bundle (otherwise leave it unloaded)
+
+        Returns:
+            True if content is now served from the bundle
+        """
+        start = time.time()
+        sources = self.scan_sources()
+        stamps = self.stat_sources(sources)
+        source_hash = self.compute_source_hash(sources)
+        stages = {'hash': time.time() - start}
+
+        t0 = time.time()
+        bundle = self._read_bundle()
+        stages['read'] = time.time() - t0
+        if bundle and bundle.get('source_hash') == source_hash:
+            self._files = bundle['files']
+            self._errors = bundle['errors']
+            for relpath, error in self._errors.items():
+                self.logger.warning(f"Content file {relpath} failed to parse: {error}")
+            origin = 'loaded'
+        elif rebuild:
+            t0 = time.time()
+            self._files, self._errors = self._compile(sources)
+            stages['parse'] = time.time() - t0
+            t0 = time.time()
+            self._write_bundle(source_hash)
+            stages['write'] = time.time() - t0
+            origin = 'rebuilt'
+        else:
+            self.logger.info("Content bundle is missing or stale; reading content files directly")
+            return False
+
+        self.source_hash = source_hash
+        self._stamps = stamps
+        self._released = []
+        self.loaded = True
+        self.stats = {
+            'origin': origin,
+            'files': len(self._files),
+            'hash_time': stages['hash'],
+            'stages': stages,
+            'load_time': time.time() - start
+        }
+        stage_summary = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in stages.items())
+        self.logger.info(f"Content bundle {origin}: {len(self._files)} files in {self.stats['load_time']:.3f}s "
+                         f"({stage_summary}; source hash {source_hash[:12]})")
+        return True
+
+    def build(self) -> str:
+        """Compile the sources and write the bundle unconditionally.
+
+        Returns:
+            The source hash the bundle was built for
+        """
+        sources = self.scan_sources()
+        stamps = self.stat_sources(sources)
+        source_hash = self.compute_source_hash(sources)
+        self._files, self._errors = self._compile(sources)
+        self._write_bundle(source_hash)
+        self.source_hash = source_hash
+        self._stamps = stamps
+        self._released = []
+        self.loaded = True
+        return source_hash
+
+    def changed_sources(self) -> List[str]:
+        """List source files added, modified or removed since the bundle was loaded.
+
+        Only stats the files, so it is cheap enough to poll.
+
+        Returns:
+            Data-relative paths, in directory listing order with removed files last
+        """
+        stamps = self.stat_sources(self.scan_sources())
+        changed = [relpath for relpath, stamp in stamps.items() if self._stamps.get(relpath) != stamp]
+        removed = [relpath for relpath in self._stamps if relpath not in stamps]
+        return changed + removed
+
+    def refresh(self) -> List[str]:
+        """Re-parse the source files that changed and save the updated bundle.
+
+        Unchanged files are not read again, except to recompute the source hash.
+        If the bundle was never loaded it is loaded (or rebuilt) instead.
+
+        Returns:
+            Data-relative paths of the files that were added, modified or removed
+        """
+        if not self.loaded:
+            self.load()
+            return list(self._files)
+
+        changed = self.changed_sources()
+        if not changed:
+            return []
+
+        sources = self.scan_sources()
+        stamps = self.stat_sources(sources)
+        changed_set = set(changed)
+
+        # Released files are taken from the bundle on disk, or parsed again
+        # if it no longer matches, so the saved bundle still has them
+        previous = self._files
+        reparse = set()
+        if self._released:
+            bundle = self._read_bundle()
+            if bundle and bundle.get('source_hash') == self.source_hash:
+                previous = bundle['files']
+            else:
+                reparse = {relpath for relpath in self._files if relpath.startswith(tuple(self._released))}
+        parsed, errors = self._compile([relpath for relpath in sources if relpath in changed_set or relpath in reparse])
+
+        # Rebuilt in listing order so merge order matches a full build
+        files = {}
+        for relpath in sources:
+            if relpath in parsed:
+                files[relpath] = parsed[relpath]
+            elif relpath not in changed_set and relpath in previous:
+                files[relpath] = previous[relpath]
+
+        source_hash = self.compute_source_hash(sources)
+        self._files = files
+        self._errors = {relpath: error for relpath, error in self._errors.items() if relpath not in changed_set}
+        self._errors.update(errors)
+        self._stamps = stamps
+        self.source_hash = source_hash
+        self._write_bundle(source_hash)
+        for prefix in self._released:
+            self._drop(prefix)
+        self.logger.info(f"Content bundle refreshed: {len(changed)} changed files (source hash {source_hash[:12]})")
+        return changed
+
+    def is_current(self) -> bool:
+        """Check if the bundle on disk matches the current source files."""
+        bundle = self._read_bundle()
+        return bool(bundle) and bundle.get('source_hash') == self.compute_source_hash(self.scan_sources())
+
+    def release(self, directory: PathLike) -> int:
+        """Drop the parsed data of the files under a directory from memory.
+
+        The files stay listed and reading one goes to the filesystem; the
+        bundle on disk keeps them.
+
+        Args:
+            directory: Content directory another store now serves
+
+        Returns:
+            Number of files released
+        """
+        prefix = self._relative(directory)
+        if not self.loaded or prefix is None:
+            return 0
+        prefix = '' if prefix == '.' else prefix + '/'
+        if prefix not in self._released:
+            self._released.append(prefix)
+        return self._drop(prefix)
+
+    def _drop(self, prefix: str) -> int:
+        dropped = 0
+        for relpath, data in self._files.items():
+            if data is not None and relpath.startswith(prefix):
+                self._files[relpath] = None
+                dropped += 1
+        return dropped
+
+    def get_json(self, path: PathLike) -> Any:
+        """Get the parsed contents of a content file.
+
+        Each call returns a fresh copy, so callers may mutate the result.
+
+        Args:
+            path: Path to the JSON file (relative to the working directory, or absolute)
+
+        Returns:
+            The parsed JSON
+
+        Raises:
+            FileNotFoundError: If the file is not in the bundle and does not exist
+            ValueError: If the file is not valid JSON
+        """
+        data = self._files.get(self._relative(path)) if self.loaded else None
+        if data is not None:
+            return pickle.loads(data)
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def exists(self, path: PathLike) -> bool:
+        """Check if a content file exists."""
+        if self.loaded and self._relative(path) in self._files:
+            return True
+        return os.path.exists(path)
+
+    def list_json_files(self, directory: PathLike, recursive: bool = False) -> List[str]:
+        """List the JSON files in a content directory.
+
+        Args:
+            directory: Directory to list (relative to the working directory, or absolute)
+            recursive: Include files in subdirectories
+
+        Returns:
+            File paths joined onto the given directory, in directory listing
+            order like os.listdir()/os.walk()
+        """
+        prefix = self._relative(directory)
+        if self.loaded and prefix is not None:
+            prefix = '' if prefix == '.' else prefix + '/'
+            paths = []
+            for relpath in self._files:
+                if not relpath.startswith(prefix):
+                    continue
+                remainder = relpath[len(prefix):]
+                if recursive or '/' not in remainder:
+                    paths.append(os.path.join(str(directory), *remainder.split('/')))
+            return paths
+
+        if not os.path.isdir(directory):
+            return []
+        if recursive:
+            return [
+                os.path.join(root, filename)
+                for root, _, files in os.walk(directory)
+                for filename in files if filename.endswith('.json')
+            ]
+        return [
+            os.path.join(str(directory), filename)
+            for filename in os.listdir(directory) if filename.endswith('.json')
+        ]
+
+    def _relative(self, path: PathLike) -> Optional[str]:
+        """Map a path to its data-relative bundle key, or None if it is outside the data directory."""
+        relpath = os.path.relpath(os.path.realpath(path), self.data_dir)
+        if relpath == '..' or relpath.startswith('..' + os.sep):
+            return None
+        return relpath.replace(os.sep, '/')
+
+    def _compile(self, sources: List[str]) -> Tuple[Dict[str, Optional[bytes]], Dict[str, str]]:
+        """Parse every source file.
+
+        Results are merged in source order whether or not a pool was used,
+        so the bundle is identical either way.
+
+        Returns:
+            (files, errors): files maps every source to its pickled data, or to
+            None if it failed to parse, and errors maps those to the error
+        """
+        paths = [os.path.join(self.data_dir, relpath) for relpath in sources]
+        results = None
+        if self.workers > 1 and len(paths) >= PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    results = list(pool.map(parse_content_file, paths, chunksize=PARSE_CHUNK_SIZE))
+            except Exception as e:
+                # e.g. no working multiprocessing in a restricted sandbox
+                self.logger.warning(f"Parallel content parse failed, parsing serially: {e}")
+        if results is None:
+            results = [parse_content_file(path) for path in paths]
+
+        files, errors = {}, {}
+        for relpath, (data, error) in zip(sources, results):
+            if data is None:
+                # Still listed, so the owning loader reads the file and reports the error itself
+                self.logger.warning(f"Content file {relpath} failed to parse: {error}")
+                errors[relpath] = error
+            files[relpath] = data
+        return files, errors
+
+    def _read_bundle(self) -> Optional[Dict[str, Any]]:
+        """Read the bundle file, or None if it is missing, corrupt or from another format version."""
+        try:
+            with open(self.bundle_path, 'rb') as f:
+                bundle = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable content bundle {self.bundle_path}: {e}")
+            return None
+        if not isinstance(bundle, dict) or bundle.get('format_version') != BUNDLE_FORMAT_VERSION:
+            return None
+        return bundle
+
+    def _write_bundle(self, source_hash: str):
+        """Write the compiled files atomically; failure only costs the next startup a rebuild."""
+        bundle = {
+            'format_version': BUNDLE_FORMAT_VERSION,
+            'source_hash': source_hash,
+            'built_at': time.time(),
+            'files': self._files,
+            'errors': self._errors
+        }
+        tmp_path = self.bundle_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.bundle_path) or '.', exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.bundle_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write content bundle {self.bundle_path}: {e}")
+
+
+_content_bundle: Optional[ContentBundle] = None
+
+
+def get_content_bundle() -> ContentBundle:
+    """Get the process-wide content bundle (unloaded until load() is called)."""
+    global _content_bundle
+    if _content_bundle is None:
+        _content_bundle = ContentBundle()
+    return _content_bundle
@@ -1,8 +1,11 @@
 """Database connection and management."""
 
 import sqlite3
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
 import json
+from ..utils.tracing import add_db_time
 
 class Database:
     """Handles database operations for the MUD."""
@@ -11,18 +14,23 @@ class Database:
         """Initialize database connection."""
         self.db_path = db_path
         self.connection: Optional[sqlite3.Connection] = None
+        # Serializes access to the connection; saves run on a worker thread
+        self.lock = threading.RLock()
 
     def connect(self):
         """Connect to the database."""
-        self.connection = sqlite3.connect(self.db_path)
+        # The connection is shared with the persistence worker thread, access
+        # is serialized through self.lock instead of sqlite's thread check
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
         self.connection.row_factory = sqlite3.Row
         self.create_tables()
 
     def disconnect(self):
         """Disconnect from the database."""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        with self.lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
 
     def create_tables(self):
         """Create necessary database tables."""
@@ -68,6 +76,21 @@ class Database:
             )
         ''')
 
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS character_journal (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                player_name TEXT NOT NULL,
+                op TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_character_journal_player
+            ON character_journal (player_name, id)
+        ''')
+
         # Add character_data column if it doesn't exist (migration)
         try:
             cursor.execute("ALTER TABLE players ADD COLUMN character_data TEXT")
@@ -80,18 +103,57 @@ class Database:
 
     def execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
         """Execute a SELECT query."""
-        cursor = self.connection.cursor()
-        cursor.execute(query, params)
-        return cursor.fetchall()
+        start = time.perf_counter()
+        try:
+            with self.lock:
+                cursor = self.connection.cursor()
+                cursor.execute(query, params)
+                return cursor.fetchall()
+        finally:
+            add_db_time(time.perf_counter() - start)
 
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute an INSERT/UPDATE/DELETE query."""
-        cursor = self.connection.cursor()
-        cursor.execute(query, params)
-        self.connection.commit()
-        # Store lastrowid for get_last_insert_id()
-        self._last_insert_id = cursor.lastrowid
-        return cursor.rowcount
+        start = time.perf_counter()
+        try:
+            with self.lock:
+                cursor = self.connection.cursor()
+                cursor.execute(query, params)
+                self.connection.commit()
+                # Store lastrowid for get_last_insert_id()
+                self._last_insert_id = cursor.lastrowid
+                return cursor.rowcount
+        finally:
+            add_db_time(time.perf_counter() - start)
+
+    def execute_batch(self, statements: List[Tuple[str, Any]]) -> int:
+        """Execute several statements in a single transaction.
+
+        Each entry is (query, params) for a single execute, or (query, [params, ...])
+        with a list of parameter tuples for executemany. Everything is committed
+        once at the end, so the batch costs a single fsync.
+
+        Returns:
+            Total number of rows affected
+        """
+        start = time.perf_counter()
+        with self.lock:
+            cursor = self.connection.cursor()
+            rowcount = 0
+            try:
+                for query, params in statements:
+                    if isinstance(params, list):
+                        cursor.executemany(query, params)
+                    else:
+                        cursor.execute(query, params)
+                    rowcount += max(cursor.rowcount, 0)
+                self.connection.commit()
+            except Exception:
+                self.connection.rollback()
+                raise
+            finally:
+                add_db_time(time.perf_counter() - start)
+            return rowcount
 
     def get_last_insert_id(self) -> int:
         """Get the last inserted row ID."""
@@ -1,93 +1,103 @@
 """Player and character data storage."""
 
 import json
+import base64
 import hashlib
-from typing import Optional, List, Dict, Any
+import hmac
+import os
+import threading
+import time
+from typing import Optional, List, Dict, Any, Tuple, Union
 from .database import Database
+from .character_journal import compute_character_delta
+from .snapshot import freeze
+from .storage_backend import SQLiteStorageBackend, StorageBackend
 
 class PlayerStorage:
     """Handles saving and loading player data."""
 
-    def __init__(self, database: Database):
-        """Initialize player storage."""
-        self.db = database
+    # Password hashing parameters. Stored hashes record their own iteration
+    # count, so raising this only affects new hashes and rehash-on-login.
+    PASSWORD_SCHEME = "pbkdf2_sha256"
+    PASSWORD_ITERATIONS = 200000
+    PASSWORD_SALT_BYTES = 16
+
+    def __init__(self, storage: Union[Database, StorageBackend], journal_mode: bool = False,
+                 compaction_interval: float = 300.0, compaction_max_entries: int = 200):
+        """Initialize player storage.
+
+        Args:
+            storage: The backend to store players in, or a Database to use
+                through SQLiteStorageBackend
+            journal_mode: Append small change records between full character saves
+            compaction_interval: Seconds between full saves of a journaled character
+            compaction_max_entries: Journal entries that force an early full save
+        """
+        if isinstance(storage, StorageBackend):
+            self.backend = storage
+        else:
+            self.backend = SQLiteStorageBackend(storage)
+        self.journal_mode = journal_mode
+        self.compaction_interval = compaction_interval
+        self.compaction_max_entries = compaction_max_entries
+
+        # Journal state, shared between the game loop and the persistence worker
+        self._journal_lock = threading.RLock()
+        self._journal_buffer: List[Tuple[str, str, str]] = []  # (player_name, op, payload_json)
+        self._journal_base: Dict[str, Dict[str, Any]] = {}      # username -> last persisted state
+        self._journal_counts: Dict[str, int] = {}               # username -> entries since compaction
+        self._last_compaction: Dict[str, float] = {}            # username -> time of last full save
 
     def create_player(self, name: str, password: str, email: str = None) -> int:
         """Create a new player account."""
-        password_hash = self._hash_password(password)
-        query = "INSERT INTO players (name, password_hash, email) VALUES (?, ?, ?)"
-        self.db.execute_update(query, (name, password_hash, email))
-        return self.db.get_last_insert_id()
+        return self.backend.create_account(name, self._hash_password(password), email)
 
     def authenticate_player(self, name: str, password: str) -> Optional[int]:
-        """Authenticate a player login."""
-        password_hash = self._hash_password(password)
-        query = "SELECT id FROM players WHERE name = ? AND password_hash = ?"
-        result = self.db.execute_query(query, (name, password_hash))
-        return result[0]['id'] if result else None
+        """Authenticate a player login.
+
+        Accounts still using the legacy unsalted SHA-256 hash (or an older
+        iteration count) are transparently rehashed on a successful login.
+
+        This runs the key derivation function and blocks for tens of
+        milliseconds; call it from a worker thread, not the game loop.
+        """
+        account = self.backend.get_account(name)
+        if not account:
+            return None
+
+        player_id = account['id']
+        stored_hash = account['password_hash']
+        if not self.verify_password(password, stored_hash):
+            return None
+
+        if self.needs_rehash(stored_hash):
+            self.update_password_hash(player_id, self._hash_password(password))
+        return player_id
+
+    def player_exists(self, name: str) -> bool:
+        """Check if an account with the given name exists."""
+        return self.backend.get_account(name) is not None
+
+    def get_password_hash(self, name: str) -> Optional[str]:
+        """Get the stored password hash for an account."""
+        account = self.backend.get_account(name)
+        return account['password_hash'] if account else None
+
+    def update_password_hash(self, player_id: int, password_hash: str):
+        """Replace a player's stored password hash."""
+        self.backend.set_password_hash(player_id, password_hash)
 
     def get_player(self, player_id: int) -> Optional[Dict[str, Any]]:
         """Get player data by ID."""
-        query = "SELECT * FROM players WHERE id = ?"
-        result = self.db.execute_query(query, (player_id,))
-        return dict(result[0]) if result else None
-
-    def save_character(self, character: 'Character', player_id: int) -> int:
-        """Save character data."""
-        stats_json = json.dumps(character.stats)
-
-        if hasattr(character, 'id') and character.id:
-            query = '''
-                UPDATE characters SET level = ?, experience = ?, health = ?,
-                max_health = ?, mana = ?, max_mana = ?, room_id = ?, stats = ?
-                WHERE id = ?
-            '''
-            params = (character.level, character.experience, character.health,
-                     character.max_health, character.mana, character.max_mana,
-                     character.room_id, stats_json, character.id)
-            self.db.execute_update(query, params)
-            return character.id
-        else:
-            query = '''
-                INSERT INTO characters
-                (player_id, name, level, experience, health, max_health,
-                 mana, max_mana, room_id, stats)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            '''
-            params = (player_id, character.name, character.level, character.experience,
-                     character.health, character.max_health, character.mana,
-                     character.max_mana, character.room_id, stats_json)
-            self.db.execute_update(query, params)
-            return self.db.get_last_insert_id()
-
-    def load_character(self, character_id: int) -> Optional[Dict[str, Any]]:
-        """Load character data by ID."""
-        query = "SELECT * FROM characters WHERE id = ?"
-        result = self.db.execute_query(query, (character_id,))
-        if result:
-            char_data = dict(result[0])
-            char_data['stats'] = json.loads(char_data['stats'])
-            return char_data
-        return None
-
-    def get_player_characters(self, player_id: int) -> List[Dict[str, Any]]:
-        """Get all characters for a player."""
-        query = "SELECT * FROM characters WHERE player_id = ?"
-        results = self.db.execute_query(query, (player_id,))
-        characters = []
-        for row in results:
-            char_data = dict(row)
-            char_data['stats'] = json.loads(char_data['stats'])
-            characters.append(char_data)
-        return characters
-
-    def delete_character(self, character_id: int):
-        """Delete a character."""
-        self.db.execute_update("DELETE FROM character_items WHERE character_id = ?", (character_id,))
-        self.db.execute_update("DELETE FROM characters WHERE id = ?", (character_id,))
+        return self.backend.get_account_by_id(player_id)
 
     def save_character_data(self, username: str, character_data: Dict[str, Any]) -> bool:
-        """Save character data as JSON for a player.
+        """Save character data for a player.
+
+        This is a full save: it replaces the stored snapshot and discards any
+        journal entries for the character, which the new snapshot supersedes.
+        Accounts that don't exist yet are created with an empty password hash
+        (dev mode).
 
         Args:
             username: The player's username
@@ -97,27 +107,19 @@ class PlayerStorage:
             True if save was successful, False otherwise
         """
         try:
-            # Check if database connection is valid
-            if not self.db or not self.db.connection:
+            if not self.backend.is_connected():
                 print(f"Cannot save character for {username}: database not connected")
                 return False
 
-            # Convert character data to JSON
-            # Note: visited_rooms is now always a list, no conversion needed
-            character_json = json.dumps(character_data, indent=2)
-
-            # Check if player exists
-            check_query = "SELECT id FROM players WHERE name = ?"
-            result = self.db.execute_query(check_query, (username,))
+            with self._journal_lock:
+                self.backend.save_characters({username: character_data})
 
-            if result:
-                # Update existing player
-                update_query = "UPDATE players SET character_data = ? WHERE name = ?"
-                self.db.execute_update(update_query, (character_json, username))
-            else:
-                # Insert new player (with empty password hash for dev mode)
-                insert_query = "INSERT INTO players (name, password_hash, character_data) VALUES (?, ?, ?)"
-                self.db.execute_update(insert_query, (username, '', character_json))
+                # Buffered entries are older than this snapshot
+                self._journal_buffer = [entry for entry in self._journal_buffer if entry[0] != username]
+                self._journal_counts[username] = 0
+                self._last_compaction[username] = time.time()
+                if self.journal_mode:
+                    self._journal_base[username] = freeze(character_data)
 
             return True
         except Exception as e:
@@ -126,9 +128,72 @@ class PlayerStorage:
             traceback.print_exc()
             return False
 
+    def journal_character_data(self, username: str, character_data: Dict[str, Any]) -> bool:
+        """Record the changes to a character since it was last persisted.
+
+        The changes are buffered until flush_journal(). Falls back to a full
+        save (compaction) for the first save of a character, when journal mode
+        is off, or when the character's journal is due for compaction.
+
+        Args:
+            username: The player's username
+            character_data: A private copy of the character (e.g. a snapshot's
+                data); it becomes the base for the next delta
+
+        Returns:
+            True if the changes were recorded, False otherwise
+        """
+        if not self.journal_mode:
+            return self.save_character_data(username, character_data)
+
+        with self._journal_lock:
+            base = self._journal_base.get(username)
+            if base is None or self._needs_compaction(username):
+                return self.save_character_data(username, character_data)
+
+            for op, payload in compute_character_delta(base, character_data):
+                self._journal_buffer.append((username, op, json.dumps(payload)))
+                self._journal_counts[username] = self._journal_counts.get(username, 0) + 1
+            self._journal_base[username] = character_data
+        return True
+
+    def flush_journal(self) -> int:
+        """Write all buffered journal entries in a single transaction.
+
+        Returns:
+            Number of entries written
+        """
+        with self._journal_lock:
+            if not self._journal_buffer:
+                return 0
+            if not self.backend.is_connected():
+                print("Cannot flush character journal: database not connected")
+                return 0
+
+            written = self.backend.append_journal(self._journal_buffer)
+            self._journal_buffer = []
+            return written
+
+    def release_journal_state(self, username: str):
+        """Forget the in-memory journal base for a character that logged out."""
+        with self._journal_lock:
+            self._journal_base.pop(username, None)
+            self._journal_counts.pop(username, None)
+            self._last_compaction.pop(username, None)
+
+    def _needs_compaction(self, username: str) -> bool:
+        """Check if a character's journal should be folded into its snapshot."""
+        if self._journal_counts.get(username, 0) >= self.compaction_max_entries:
+            return True
+        last = self._last_compaction.get(username, 0)
+        return time.time() - last >= self.compaction_interval
+
     def load_character_data(self, username: str) -> Optional[Dict[str, Any]]:
         """Load character data for a player.
 
+        The stored snapshot is loaded and any journal entries written since
+        are replayed on top of it.
+
         Args:
             username: The player's username
 
@@ -136,21 +201,21 @@ class PlayerStorage:
             Character data dict or None if not found
         """
         try:
-            # Check if database connection is valid
-            if not self.db or not self.db.connection:
+            if not self.backend.is_connected():
                 print(f"Cannot load character for {username}: database not connected")
                 return None
 
-            query = "SELECT character_data FROM players WHERE name = ?"
-            result = self.db.execute_query(query, (username,))
+            with self._journal_lock:
+                # Make sure buffered entries are visible to the replay
+                self.flush_journal()
 
-            if result and len(result) > 0:
-                char_data = result[0]['character_data']
-                if char_data:
-                    character_data = json.loads(char_data)
-                    # Note: visited_rooms is now always kept as a list
-                    return character_data
-            return None
+                character_data = self.backend.load_character(username)
+                if character_data is None:
+                    return None
+                self._journal_counts[username] = self.backend.journal_length(username)
+                if self.journal_mode:
+                    self._journal_base[username] = freeze(character_data)
+                return character_data
         except Exception as e:
             print(f"Error loading character data for {username}: {e}")
             import traceback
@@ -158,5 +223,44 @@ class PlayerStorage:
             return None
 
     def _hash_password(self, password: str) -> str:
-        """Hash a password for storage."""
-        return hashlib.sha256(password.encode()).hexdigest()
\ No newline at end of file
+        """Hash a password for storage.
+
+        Returns:
+            'pbkdf2_sha256$<iterations>$<salt>$<hash>' with base64 salt and hash
+        """
+        salt = os.urandom(self.PASSWORD_SALT_BYTES)
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, self.PASSWORD_ITERATIONS)
+        return "$".join([
+            self.PASSWORD_SCHEME,
+            str(self.PASSWORD_ITERATIONS),
+            base64.b64encode(salt).decode('ascii'),
+            base64.b64encode(digest).decode('ascii')
+        ])
+
+    def verify_password(self, password: str, stored_hash: str) -> bool:
+        """Check a password against a stored hash (PBKDF2 or legacy SHA-256)."""
+        if not stored_hash:
+            return False
+
+        if stored_hash.startswith(self.PASSWORD_SCHEME + "$"):
+            try:
+                _, iterations, salt, expected = stored_hash.split("$")
+                digest = hashlib.pbkdf2_hmac('sha256', password.encode(),
+                                             base64.b64decode(salt), int(iterations))
+            except (ValueError, TypeError):
+                return False
+            return hmac.compare_digest(base64.b64encode(digest).decode('ascii'), expected)
+
+        # Legacy unsalted SHA-256 hex digest
+        legacy = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, stored_hash)
+
+    def needs_rehash(self, stored_hash: str) -> bool:
+        """Check if a stored hash is weaker than the current parameters."""
+        if not stored_hash.startswith(self.PASSWORD_SCHEME + "$"):
+            return True
+        try:
+            iterations = int(stored_hash.split("$")[1])
+        except (IndexError, ValueError):
+            return True
+        return iterations < self.PASSWORD_ITERATIONS
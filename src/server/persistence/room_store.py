@@ -0,0 +1,373 @@
+"""Memory-mapped room store.
+
+WorldManager used to keep the raw JSON dict of every room resident next to
+its Room object, so long descriptions, lair definitions and other rarely read
+fields were held in memory twice. The room store writes each room's raw data
+to a file instead and maps it into memory; pages the server never reads are
+never faulted in.
+
+Fields read constantly are kept resident in compact arrays: exits, area IDs
+and a bitmask of flags (which also records whether a room has traps, lairs,
+items and so on, so callers can skip decoding rooms that have none). Full
+room dicts are decoded on first access and kept in a bounded LRU cache.
+
+The store file lives next to the content bundle and is keyed by the same
+source hash, so it is only rewritten when the content changes.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+# Bump when the file layout changes so old stores are rebuilt
+ROOM_STORE_FORMAT_VERSION = 1
+
+_MAGIC = b"FDROOMS\0"
+_PREAMBLE = struct.Struct("<8sQ")  # magic, header length
+
+# Boolean room fields stored as flag bits
+FLAG_FIELDS = ('is_safe', 'is_lair', 'is_starting_room')
+
+# Fields whose presence (non-empty value) is stored as a flag bit, so
+# get_field() can answer "none here" without decoding the room
+PRESENCE_FIELDS = ('lairs', 'lair_loot', 'traps', 'items', 'npcs',
+                   'locked_exits', 'barriers', 'special_actions')
+
+_FLAG_BITS = {name: 1 << i for i, name in enumerate(FLAG_FIELDS + PRESENCE_FIELDS)}
+
+_NO_AREA = 0
+
+
+class RoomStore(Mapping):
+    """Read-only mapping of room ID to raw room data, backed by a mapped file.
+
+    Decoded rooms come from a shared cache; treat them as read-only.
+    """
+
+    def __init__(self, path: str, cache_size: int = 512):
+        """Initialize an empty store.
+
+        Args:
+            path: Store file location
+            cache_size: Maximum number of decoded rooms kept in memory
+        """
+        self.path = path
+        self.cache_size = max(1, int(cache_size))
+        self.logger = get_logger()
+
+        self.source_hash: Optional[str] = None
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self._reset()
+
+    def _reset(self):
+        """Clear the index, the resident arrays and the cache."""
+        self._index: Dict[str, int] = {}  # room id -> position
+        self._ids: List[str] = []  # positions -> room id, then exit targets that are not rooms
+        self._offsets = array('Q')
+        self._lengths = array('I')
+        self._areas: List[Optional[str]] = [None]
+        self._area_index = array('I')
+        self._flags = array('H')
+        self._directions: List[str] = []
+        self._exit_start = array('I', [0])
+        self._exit_dirs = array('H')
+        self._exit_targets = array('I')
+        self._cache: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def open(self, source_hash: Optional[str] = None) -> bool:
+        """Map an existing store file.
+
+        Args:
+            source_hash: Content hash the file must have been built for (None accepts any)
+
+        Returns:
+            True if the store is open, False if the file is missing, stale or unreadable
+        """
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            return False
+        try:
+            header = self._read_header(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable room store {self.path}: {e}")
+            f.close()
+            return False
+        if (header.get('format_version') != ROOM_STORE_FORMAT_VERSION or
+                (source_hash is not None and header.get('source_hash') != source_hash)):
+            f.close()
+            return False
+        self._attach(f, header)
+        return True
+
+    def build(self, rooms: Dict[str, Dict[str, Any]], source_hash: Optional[str] = None):
+        """Write a store file for the given rooms and map it.
+
+        If the file can't be written (read-only data directory) the store is
+        built in an anonymous temporary file instead.
+
+        Args:
+            rooms: Mapping of room ID to raw room data
+            source_hash: Content hash to stamp the file with
+        """
+        header, records = self._encode(rooms, source_hash)
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                self._write(f, header, records)
+            os.replace(tmp_path, self.path)
+            f = open(self.path, 'rb')
+        except OSError as e:
+            self.logger.warning(f"Could not write room store {self.path}, keeping it in a temporary file: {e}")
+            f = tempfile.TemporaryFile()
+            self._write(f, header, records)
+        self._attach(f, header)
+
+    def close(self):
+        """Unmap the store file."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._reset()
+
+    # Mapping interface
+
+    def __getitem__(self, room_id: str) -> Dict[str, Any]:
+        room = self._cache.get(room_id)
+        if room is not None:
+            self._cache.move_to_end(room_id)
+            self.hits += 1
+            return room
+
+        position = self._index[room_id]
+        self.misses += 1
+        room = self._decode(position)
+        self._cache[room_id] = room
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return room
+
+    def __contains__(self, room_id: object) -> bool:
+        return room_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over every room, decoding each without filling the cache.
+
+        Rooms already in the cache are returned from it.
+        """
+        for room_id, position in self._index.items():
+            room = self._cache.get(room_id)
+            yield room_id, room if room is not None else self._decode(position)
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over every room's data without filling the cache."""
+        for _, room in self.items():
+            yield room
+
+    # Resident fields
+
+    def get_exits(self, room_id: str) -> Dict[str, str]:
+        """Get a room's exits (direction -> destination room ID) without decoding it."""
+        position = self._index.get(room_id)
+        if position is None:
+            return {}
+        start, end = self._exit_start[position], self._exit_start[position + 1]
+        return {
+            self._directions[self._exit_dirs[i]]: self._ids[self._exit_targets[i]]
+            for i in range(start, end)
+        }
+
+    def get_area_id(self, room_id: str) -> Optional[str]:
+        """Get a room's area ID without decoding it."""
+        position = self._index.get(room_id)
+        if position is None:
+            return None
+        return self._areas[self._area_index[position]]
+
+    def has_flag(self, room_id: str, name: str) -> bool:
+        """Check a flag field, or whether a presence field is set, without decoding the room.
+
+        Args:
+            room_id: The room ID
+            name: One of FLAG_FIELDS or PRESENCE_FIELDS
+        """
+        position = self._index.get(room_id)
+        if position is None:
+            return False
+        return bool(self._flags[position] & _FLAG_BITS[name])
+
+    def get_field(self, room_id: str, key: str, default: Any = None) -> Any:
+        """Get one field of a room's data.
+
+        Exits and area IDs come from the resident arrays, and fields whose
+        presence is tracked return the default without decoding rooms that
+        don't have them.
+
+        Args:
+            room_id: The room ID
+            key: Field name
+            default: Value returned if the room or field is missing
+
+        Returns:
+            The field value (shared; don't mutate it)
+        """
+        if room_id not in self._index:
+            return default
+        if key == 'exits':
+            return self.get_exits(room_id)
+        if key == 'area_id':
+            area_id = self.get_area_id(room_id)
+            return default if area_id is None else area_id
+        if key in PRESENCE_FIELDS and not self.has_flag(room_id, key):
+            return default
+        return self[room_id].get(key, default)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store size and cache statistics."""
+        return {
+            'rooms': len(self._index),
+            'file_bytes': len(self._mm) if self._mm is not None else 0,
+            'cached': len(self._cache),
+            'cache_size': self.cache_size,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    # Internals
+
+    def _decode(self, position: int) -> Dict[str, Any]:
+        """Unpickle a room's record from the mapped file."""
+        offset = self._offsets[position]
+        return pickle.loads(self._mm[offset:offset + self._lengths[position]])
+
+    def _encode(self, rooms: Dict[str, Dict[str, Any]], source_hash: Optional[str]) -> Tuple[Dict[str, Any], List[bytes]]:
+        """Build the header (index and resident arrays) and the pickled room records."""
+        ids = list(rooms)
+        id_index = {room_id: i for i, room_id in enumerate(ids)}
+        areas: List[Optional[str]] = [None]
+        area_lookup: Dict[str, int] = {}
+        directions: List[str] = []
+        direction_lookup: Dict[str, int] = {}
+
+        offsets, lengths = array('Q'), array('I')
+        area_index, flags = array('I'), array('H')
+        exit_start, exit_dirs, exit_targets = array('I', [0]), array('H'), array('I')
+        records = []
+        offset = 0
+
+        for room_id, room_data in rooms.items():
+            record = pickle.dumps(room_data, protocol=pickle.HIGHEST_PROTOCOL)
+            records.append(record)
+            offsets.append(offset)
+            lengths.append(len(record))
+            offset += len(record)
+
+            area_id = room_data.get('area_id')
+            if area_id is None:
+                area_index.append(_NO_AREA)
+            else:
+                if area_id not in area_lookup:
+                    area_lookup[area_id] = len(areas)
+                    areas.append(area_id)
+                area_index.append(area_lookup[area_id])
+
+            bits = 0
+            for name in FLAG_FIELDS + PRESENCE_FIELDS:
+                if room_data.get(name):
+                    bits |= _FLAG_BITS[name]
+            flags.append(bits)
+
+            for direction, target in (room_data.get('exits') or {}).items():
+                if direction not in direction_lookup:
+                    direction_lookup[direction] = len(directions)
+                    directions.append(direction)
+                if target not in id_index:
+                    # Exits to rooms that don't exist are kept so callers see the raw data
+                    id_index[target] = len(ids)
+                    ids.append(target)
+                exit_dirs.append(direction_lookup[direction])
+                exit_targets.append(id_index[target])
+            exit_start.append(len(exit_dirs))
+
+        header = {
+            'format_version': ROOM_STORE_FORMAT_VERSION,
+            'source_hash': source_hash,
+            'room_count': len(rooms),
+            'ids': ids,
+            'offsets': offsets,
+            'lengths': lengths,
+            'areas': areas,
+            'area_index': area_index,
+            'flags': flags,
+            'directions': directions,
+            'exit_start': exit_start,
+            'exit_dirs': exit_dirs,
+            'exit_targets': exit_targets
+        }
+        return header, records
+
+    @staticmethod
+    def _write(f, header: Dict[str, Any], records: Iterable[bytes]):
+        """Write the preamble, header and records; record offsets are relative to the data start."""
+        header_bytes = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+        f.write(_PREAMBLE.pack(_MAGIC, len(header_bytes)))
+        f.write(header_bytes)
+        for record in records:
+            f.write(record)
+        f.flush()
+
+    @staticmethod
+    def _read_header(f) -> Dict[str, Any]:
+        """Read the header of a store file."""
+        f.seek(0)
+        magic, header_length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != _MAGIC:
+            raise ValueError("not a room store file")
+        header = pickle.loads(f.read(header_length))
+        header['data_start'] = _PREAMBLE.size + header_length
+        return header
+
+    def _attach(self, f, header: Dict[str, Any]):
+        """Map the file and take the index and resident arrays from its header."""
+        self.close()
+        data_start = header.get('data_start')
+        if data_start is None:
+            data_start = self._read_header(f)['data_start']
+
+        self._file = f
+        self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.source_hash = header['source_hash']
+
+        room_count = header['room_count']
+        self._ids = header['ids']
+        self._index = {self._ids[i]: i for i in range(room_count)}
+        self._offsets = array('Q', (offset + data_start for offset in header['offsets']))
+        self._lengths = header['lengths']
+        self._areas = header['areas']
+        self._area_index = header['area_index']
+        self._flags = header['flags']
+        self._directions = header['directions']
+        self._exit_start = header['exit_start']
+        self._exit_dirs = header['exit_dirs']
+        self._exit_targets = header['exit_targets']
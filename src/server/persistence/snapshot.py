@@ -0,0 +1,136 @@
+"""Copy-on-write character snapshots for off-loop persistence.
+
+Character data lives in plain dicts that command tasks and the game tick
+mutate freely. Serializing those dicts from another thread would race with
+the game loop, so saves work from snapshots instead: at a tick boundary the
+loop takes a cheap frozen copy of every dirty character and hands the copies
+to the persistence worker, which can take as long as it likes to encode and
+write them.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+# Leaf types that are immutable and can be shared between the live
+# character and its snapshots without copying.
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def freeze(value: Any) -> Any:
+    """Return a copy of value that shares no mutable containers with it.
+
+    Immutable leaves (strings, numbers, None) are shared with the original,
+    only the dict/list structure around them is rebuilt. This is much cheaper
+    than copy.deepcopy (no memo table, no reduce protocol) and is all that is
+    needed for JSON-shaped character data.
+
+    Args:
+        value: The value to freeze
+
+    Returns:
+        A structurally independent copy of the value
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return {key: freeze(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [freeze(item) for item in value]
+    if isinstance(value, set):
+        return [freeze(item) for item in value]
+    # Unknown objects are shared as-is; character data should not contain any
+    return value
+
+
+@dataclass(frozen=True)
+class CharacterSnapshot:
+    """A point-in-time copy of a character taken at a tick boundary."""
+
+    player_id: int
+    username: str
+    version: int
+    data: Dict[str, Any]
+    taken_at: float
+
+
+class SnapshotManager:
+    """Tracks per-character versions and builds snapshots of dirty characters.
+
+    Anything that mutates a character calls mark_dirty(). At the next tick
+    boundary capture_dirty() freezes only the characters whose version moved
+    since their last snapshot, so idle players cost nothing to save.
+    """
+
+    def __init__(self):
+        """Initialize the snapshot manager."""
+        self._versions: Dict[int, int] = {}            # player_id -> current version
+        self._captured: Dict[int, CharacterSnapshot] = {}  # player_id -> last snapshot
+
+    def mark_dirty(self, player_id: int):
+        """Record that a player's character has changed."""
+        self._versions[player_id] = self._versions.get(player_id, 0) + 1
+
+    def get_version(self, player_id: int) -> int:
+        """Get the current version number of a player's character."""
+        return self._versions.get(player_id, 0)
+
+    def is_dirty(self, player_id: int) -> bool:
+        """Check if a character changed since its last snapshot."""
+        last = self._captured.get(player_id)
+        if last is None:
+            return True
+        return self.get_version(player_id) != last.version
+
+    def capture(self, player_id: int, username: str, character: Dict[str, Any]) -> CharacterSnapshot:
+        """Take a snapshot of a character regardless of its dirty state.
+
+        Must be called on the game loop thread so the copy is consistent.
+
+        Args:
+            player_id: The player's connection ID
+            username: The account name the character is saved under
+            character: The live character dict
+
+        Returns:
+            The new snapshot
+        """
+        snapshot = CharacterSnapshot(
+            player_id=player_id,
+            username=username,
+            version=self.get_version(player_id),
+            data=freeze(character),
+            taken_at=time.time()
+        )
+        self._captured[player_id] = snapshot
+        return snapshot
+
+    def capture_dirty(self, connected_players: Dict[int, Dict[str, Any]]) -> List[CharacterSnapshot]:
+        """Snapshot every authenticated character that changed since its last snapshot.
+
+        Args:
+            connected_players: The player manager's connected_players mapping
+
+        Returns:
+            Snapshots of the dirty characters
+        """
+        snapshots = []
+        for player_id, player_data in connected_players.items():
+            character = player_data.get('character')
+            username = player_data.get('username')
+            if not character or not username or not player_data.get('authenticated'):
+                continue
+            if not self.is_dirty(player_id):
+                continue
+            snapshots.append(self.capture(player_id, username, character))
+        return snapshots
+
+    def get_last_snapshot(self, player_id: int) -> Optional[CharacterSnapshot]:
+        """Get the most recent snapshot taken for a player."""
+        return self._captured.get(player_id)
+
+    def forget(self, player_id: int):
+        """Drop all tracking for a player (e.g. after they disconnect)."""
+        self._versions.pop(player_id, None)
+        self._captured.pop(player_id, None)
@@ -0,0 +1,120 @@
+"""Read-only game data shared by every command.
+
+Races, classes and the weapon and armor definitions used to be re-read and
+re-parsed from their JSON files inside commands (train, reroll, level-ups,
+every character creation step, mob equipment). They are now loaded once,
+made read-only, and shared by the whole process.
+
+The tables are immutable (mappings are read-only proxies, lists become
+tuples), so a command can't change them for everybody else by accident.
+A hot reload builds a new snapshot and swaps it in; callers should fetch
+get_static_data() when they need it rather than keep a reference.
+"""
+
+import os
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from .content_bundle import get_content_bundle
+from ..utils.logger import get_logger
+
+# Used when the data files are missing
+DEFAULT_RACES = {
+    "human": {"name": "Human", "description": "Versatile humans",
+              "base_stats": {"strength": 10, "dexterity": 10, "constitution": 10,
+                             "intellect": 10, "wisdom": 10, "charisma": 10}}
+}
+DEFAULT_CLASSES = {
+    "fighter": {"name": "Fighter", "description": "Martial warrior", "stat_modifiers": {},
+                "hp_modifier": 1.0, "mana_modifier": 1.0}
+}
+
+
+def make_readonly(value: Any) -> Any:
+    """Make parsed JSON immutable: dicts become read-only mappings, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: make_readonly(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(make_readonly(item) for item in value)
+    return value
+
+
+def to_mutable(value: Any) -> Any:
+    """Get a mutable deep copy of read-only data, e.g. to store in a character or mob."""
+    if isinstance(value, MappingProxyType):
+        return {key: to_mutable(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [to_mutable(item) for item in value]
+    return value
+
+
+class StaticData:
+    """Read-only races, classes, weapons and armor."""
+
+    def __init__(self, races: Mapping, classes: Mapping, weapons: Mapping, armor: Mapping):
+        """Initialize a snapshot (the tables are made read-only here).
+
+        Args:
+            races: Race ID -> race definition
+            classes: Class ID -> class definition
+            weapons: Weapon item ID -> item definition
+            armor: Armor item ID -> item definition
+        """
+        self.races = make_readonly(dict(races))
+        self.classes = make_readonly(dict(classes))
+        self.weapons = make_readonly(dict(weapons))
+        self.armor = make_readonly(dict(armor))
+
+    @classmethod
+    def load(cls, data_dir: str = "data") -> 'StaticData':
+        """Load the tables through the content bundle.
+
+        Args:
+            data_dir: Root of the content files
+        """
+        content = get_content_bundle()
+        logger = get_logger()
+
+        def read(*relpaths):
+            # First of the candidate files that exists (new location, then legacy)
+            for relpath in relpaths:
+                path = os.path.join(data_dir, relpath)
+                if content.exists(path):
+                    try:
+                        return content.get_json(path)
+                    except Exception as e:
+                        logger.error(f"Error loading {path}: {e}")
+                        return None
+            return None
+
+        races = read("player/races.json", "races.json") or DEFAULT_RACES
+        classes = read("player/classes.json", "classes.json") or DEFAULT_CLASSES
+        weapons = (read("items/weapon.json") or {}).get('items', {})
+        armor = (read("items/armor.json") or {}).get('items', {})
+        return cls(races, classes, weapons, armor)
+
+    def class_uses_magic(self, class_name: str) -> bool:
+        """Check if a character class uses magic (unknown classes don't)."""
+        return bool(self.classes.get(class_name.lower(), {}).get('uses_magic', False))
+
+    def race_modifiers(self, race: str) -> Mapping:
+        """Get a race's stat modifiers (none for unknown races)."""
+        return self.races.get(race, {}).get('stat_modifiers', {})
+
+
+_static_data: Optional[StaticData] = None
+
+
+def get_static_data() -> StaticData:
+    """Get the process-wide static data (loaded on first use)."""
+    global _static_data
+    if _static_data is None:
+        _static_data = StaticData.load()
+    return _static_data
+
+
+def reload_static_data() -> StaticData:
+    """Load a new snapshot from the content files and make it the current one."""
+    global _static_data
+    _static_data = StaticData.load()
+    return _static_data
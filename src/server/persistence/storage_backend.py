@@ -0,0 +1,359 @@
+"""Character storage backends.
+
+A StorageBackend stores accounts, character snapshots and the character
+journal. PlayerStorage keeps the live server's save logic (password hashing,
+journal deltas and compaction) and does all its reads and writes through
+one. Tools that touch many characters at once (admin scans, migrations,
+benchmarks) use the bulk API directly: load and save characters in bulk,
+and stream every stored character without holding them all in memory.
+
+Two implementations are provided: SQLiteStorageBackend on top of the game's
+Database, and MemoryStorageBackend for tests and benchmarks that should not
+touch a database file.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .character_journal import apply_journal_entry
+from .database import Database
+from .snapshot import freeze
+
+# A journal entry: (account name, op, JSON payload)
+JournalEntry = Tuple[str, str, str]
+
+
+class StorageBackend(ABC):
+    """Account, character and journal storage interface."""
+
+    def is_connected(self) -> bool:
+        """Check if the backend can be read and written."""
+        return True
+
+    @abstractmethod
+    def get_account(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get an account (id, name, password_hash, email, created_at) by name, or None."""
+
+    @abstractmethod
+    def get_account_by_id(self, player_id: int) -> Optional[Dict[str, Any]]:
+        """Get an account by ID, or None."""
+
+    @abstractmethod
+    def create_account(self, name: str, password_hash: str, email: Optional[str] = None) -> int:
+        """Create an account.
+
+        Returns:
+            The new account's ID
+        """
+
+    @abstractmethod
+    def set_password_hash(self, player_id: int, password_hash: str):
+        """Replace an account's stored password hash."""
+
+    @abstractmethod
+    def append_journal(self, entries: List[JournalEntry]) -> int:
+        """Append journal entries in one transaction.
+
+        Returns:
+            Number of entries written
+        """
+
+    @abstractmethod
+    def journal_length(self, name: str) -> int:
+        """Count the journal entries stored for a character since its last full save."""
+
+    @abstractmethod
+    def load_characters(self, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Load several characters at once.
+
+        Args:
+            names: Account names to load
+
+        Returns:
+            Mapping of name to character data; names without a saved character are omitted
+        """
+
+    @abstractmethod
+    def save_characters(self, characters: Dict[str, Dict[str, Any]]) -> int:
+        """Save several characters in one transaction (full saves).
+
+        Args:
+            characters: Mapping of account name to character data
+
+        Returns:
+            Number of characters saved
+        """
+
+    @abstractmethod
+    def iter_characters(self, batch_size: int = 500) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream every stored character.
+
+        Characters are fetched batch_size at a time, so a scan over the whole
+        player base never holds more than one batch in memory.
+
+        Yields:
+            (name, character data) pairs
+        """
+
+    @abstractmethod
+    def list_players(self) -> List[Dict[str, Any]]:
+        """List all accounts (id, name, email, created_at), oldest first."""
+
+    @abstractmethod
+    def delete_player(self, name: str) -> bool:
+        """Delete an account and everything stored for it.
+
+        Returns:
+            True if the account existed
+        """
+
+    def load_character(self, name: str) -> Optional[Dict[str, Any]]:
+        """Load a single character."""
+        return self.load_characters([name]).get(name)
+
+    def save_character(self, name: str, character: Dict[str, Any]) -> bool:
+        """Save a single character."""
+        return self.save_characters({name: character}) == 1
+
+
+class SQLiteStorageBackend(StorageBackend):
+    """Storage backend using the game's SQLite database.
+
+    Reads replay each character's journal tail. Writes are full saves and
+    clear the journal, so don't bulk-save characters that are logged in to a
+    running server.
+    """
+
+    # SQLite allows at most 999 bound parameters per statement
+    MAX_PARAMS = 500
+
+    def __init__(self, database: Database):
+        """Initialize the backend.
+
+        Args:
+            database: A connected Database
+        """
+        self.db = database
+
+    def is_connected(self) -> bool:
+        """Check if the database is connected."""
+        return bool(self.db and self.db.connection)
+
+    def get_account(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get an account by name."""
+        rows = self.db.execute_query(
+            "SELECT id, name, password_hash, email, created_at FROM players WHERE name = ?", (name,))
+        return dict(rows[0]) if rows else None
+
+    def get_account_by_id(self, player_id: int) -> Optional[Dict[str, Any]]:
+        """Get an account by ID."""
+        rows = self.db.execute_query(
+            "SELECT id, name, password_hash, email, created_at FROM players WHERE id = ?", (player_id,))
+        return dict(rows[0]) if rows else None
+
+    def create_account(self, name: str, password_hash: str, email: Optional[str] = None) -> int:
+        """Create an account."""
+        self.db.execute_update("INSERT INTO players (name, password_hash, email) VALUES (?, ?, ?)",
+                               (name, password_hash, email))
+        return self.db.get_last_insert_id()
+
+    def set_password_hash(self, player_id: int, password_hash: str):
+        """Replace an account's stored password hash."""
+        self.db.execute_update("UPDATE players SET password_hash = ? WHERE id = ?", (password_hash, player_id))
+
+    def append_journal(self, entries: List[JournalEntry]) -> int:
+        """Append journal entries in one transaction."""
+        if not entries:
+            return 0
+        self.db.execute_batch([
+            ("INSERT INTO character_journal (player_name, op, payload) VALUES (?, ?, ?)", entries)
+        ])
+        return len(entries)
+
+    def journal_length(self, name: str) -> int:
+        """Count a character's journal entries."""
+        rows = self.db.execute_query("SELECT COUNT(*) AS n FROM character_journal WHERE player_name = ?", (name,))
+        return rows[0]['n']
+
+    def load_characters(self, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Load several characters with one query per 500 names."""
+        names = list(dict.fromkeys(names))
+        characters: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(names), self.MAX_PARAMS):
+            chunk = names[start:start + self.MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.db.execute_query(
+                f"SELECT name, character_data FROM players "
+                f"WHERE name IN ({placeholders}) AND character_data <> ''",
+                tuple(chunk)
+            )
+            characters.update(self._decode_rows(rows))
+        return characters
+
+    def save_characters(self, characters: Dict[str, Dict[str, Any]]) -> int:
+        """Upsert every character and clear their journals in a single transaction."""
+        if not characters:
+            return 0
+        rows = [(name, json.dumps(data)) for name, data in characters.items()]
+        self.db.execute_batch([
+            ("INSERT INTO players (name, password_hash, character_data) VALUES (?, '', ?) "
+             "ON CONFLICT(name) DO UPDATE SET character_data = excluded.character_data", rows),
+            ("DELETE FROM character_journal WHERE player_name = ?", [(name,) for name in characters])
+        ])
+        return len(rows)
+
+    def iter_characters(self, batch_size: int = 500) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream characters in id order using a keyset cursor.
+
+        Each batch is a short, separate query, so the database lock is never
+        held while the caller processes rows.
+        """
+        last_id = 0
+        while True:
+            rows = self.db.execute_query(
+                "SELECT id, name, character_data FROM players "
+                "WHERE id > ? AND character_data <> '' ORDER BY id LIMIT ?",
+                (last_id, batch_size)
+            )
+            if not rows:
+                return
+            last_id = rows[-1]['id']
+            yield from self._decode_rows(rows).items()
+            if len(rows) < batch_size:
+                return
+
+    def list_players(self) -> List[Dict[str, Any]]:
+        """List all accounts, oldest first."""
+        rows = self.db.execute_query("SELECT id, name, email, created_at FROM players ORDER BY created_at, id")
+        return [dict(row) for row in rows]
+
+    def delete_player(self, name: str) -> bool:
+        """Delete an account, its legacy characters and its journal in one transaction."""
+        result = self.db.execute_query("SELECT id FROM players WHERE name = ?", (name,))
+        if not result:
+            return False
+        player_id = result[0]['id']
+        self.db.execute_batch([
+            ("DELETE FROM character_items WHERE character_id IN "
+             "(SELECT id FROM characters WHERE player_id = ?)", (player_id,)),
+            ("DELETE FROM characters WHERE player_id = ?", (player_id,)),
+            ("DELETE FROM character_journal WHERE player_name = ?", (name,)),
+            ("DELETE FROM players WHERE id = ?", (player_id,))
+        ])
+        return True
+
+    def _decode_rows(self, rows) -> Dict[str, Dict[str, Any]]:
+        """Decode character rows and replay their journals with one extra query."""
+        characters = {row['name']: json.loads(row['character_data']) for row in rows}
+        if not characters:
+            return characters
+
+        names = list(characters)
+        placeholders = ",".join("?" * len(names))
+        entries = self.db.execute_query(
+            f"SELECT player_name, op, payload FROM character_journal "
+            f"WHERE player_name IN ({placeholders}) ORDER BY id",
+            tuple(names)
+        )
+        for entry in entries:
+            apply_journal_entry(characters[entry['player_name']], entry['op'], json.loads(entry['payload']))
+        return characters
+
+
+class MemoryStorageBackend(StorageBackend):
+    """In-memory storage backend for tests and benchmarks.
+
+    Characters are copied on the way in and out, so callers can't mutate
+    stored data by accident, the same as with a real database.
+    """
+
+    ACCOUNT_FIELDS = ('id', 'name', 'password_hash', 'email', 'created_at')
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._players: Dict[str, Dict[str, Any]] = {}  # name -> account row
+        self._journal: Dict[str, List[Tuple[str, str]]] = {}  # name -> (op, payload JSON)
+        self._next_id = 1
+
+    def get_account(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get an account by name."""
+        player = self._players.get(name)
+        return {key: player[key] for key in self.ACCOUNT_FIELDS} if player else None
+
+    def get_account_by_id(self, player_id: int) -> Optional[Dict[str, Any]]:
+        """Get an account by ID."""
+        for player in self._players.values():
+            if player['id'] == player_id:
+                return {key: player[key] for key in self.ACCOUNT_FIELDS}
+        return None
+
+    def create_account(self, name: str, password_hash: str, email: Optional[str] = None) -> int:
+        """Create an account."""
+        if name in self._players:
+            raise ValueError(f"Account {name} already exists")
+        return self._new_account(name, password_hash, email)['id']
+
+    def set_password_hash(self, player_id: int, password_hash: str):
+        """Replace an account's stored password hash."""
+        for player in self._players.values():
+            if player['id'] == player_id:
+                player['password_hash'] = password_hash
+
+    def append_journal(self, entries: List[JournalEntry]) -> int:
+        """Append journal entries."""
+        for name, op, payload in entries:
+            self._journal.setdefault(name, []).append((op, payload))
+        return len(entries)
+
+    def journal_length(self, name: str) -> int:
+        """Count a character's journal entries."""
+        return len(self._journal.get(name, ()))
+
+    def load_characters(self, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Load several characters, replaying their journals."""
+        characters = {}
+        for name in names:
+            player = self._players.get(name)
+            if player and player['character_data'] is not None:
+                characters[name] = self._replay(name, player['character_data'])
+        return characters
+
+    def save_characters(self, characters: Dict[str, Dict[str, Any]]) -> int:
+        """Save several characters, creating accounts as needed and clearing their journals."""
+        for name, data in characters.items():
+            player = self._players.get(name) or self._new_account(name, '', None)
+            player['character_data'] = freeze(data)
+            self._journal.pop(name, None)
+        return len(characters)
+
+    def iter_characters(self, batch_size: int = 500) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream characters in account creation order."""
+        for player in sorted(self._players.values(), key=lambda p: p['id']):
+            if player['character_data'] is not None:
+                yield player['name'], self._replay(player['name'], player['character_data'])
+
+    def list_players(self) -> List[Dict[str, Any]]:
+        """List all accounts, oldest first."""
+        return [
+            {key: player[key] for key in ('id', 'name', 'email', 'created_at')}
+            for player in sorted(self._players.values(), key=lambda p: p['id'])
+        ]
+
+    def delete_player(self, name: str) -> bool:
+        """Delete an account and its journal."""
+        self._journal.pop(name, None)
+        return self._players.pop(name, None) is not None
+
+    def _new_account(self, name: str, password_hash: str, email: Optional[str]) -> Dict[str, Any]:
+        player = {'id': self._next_id, 'name': name, 'password_hash': password_hash, 'email': email,
+                  'created_at': None, 'character_data': None}
+        self._players[name] = player
+        self._next_id += 1
+        return player
+
+    def _replay(self, name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        character = freeze(data)
+        for op, payload in self._journal.get(name, ()):
+            apply_journal_entry(character, op, json.loads(payload))
+        return character
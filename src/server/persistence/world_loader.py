@@ -4,27 +4,26 @@ import json
 import os
 from typing import Dict, List, Any
 
+from .content_bundle import get_content_bundle
+from ..utils.logger import get_logger
+
 class WorldLoader:
-    """Loads world data from files."""
+    """Loads world data from files (through the content bundle when it is loaded)."""
 
     def __init__(self, data_directory: str = "data"):
         """Initialize the world loader."""
         self.data_dir = data_directory
+        self.content = get_content_bundle()
+        self.logger = get_logger('world')
 
     def load_areas(self) -> Dict[str, Any]:
         """Load all area data."""
         areas = {}
         areas_dir = os.path.join(self.data_dir, "world", "areas")
 
-        if not os.path.exists(areas_dir):
-            return areas
-
-        for filename in os.listdir(areas_dir):
-            if filename.endswith('.json'):
-                area_id = filename[:-5]
-                file_path = os.path.join(areas_dir, filename)
-                with open(file_path, 'r') as f:
-                    areas[area_id] = json.load(f)
+        for file_path in self.content.list_json_files(areas_dir):
+            area_id = os.path.basename(file_path)[:-5]
+            areas[area_id] = self.content.get_json(file_path)
 
         return areas
 
@@ -33,39 +32,15 @@ class WorldLoader:
         rooms = {}
         rooms_dir = os.path.join(self.data_dir, "world", "rooms")
 
-        if not os.path.exists(rooms_dir):
-            return rooms
-
-        # Walk through all files and subdirectories
-        for root, dirs, files in os.walk(rooms_dir):
-            for filename in files:
-                if filename.endswith('.json'):
-                    file_path = os.path.join(root, filename)
-                    try:
-                        with open(file_path, 'r') as f:
-                            room_data = json.load(f)
-                            # Use the 'id' field from the JSON as the key
-                            room_id = room_data.get('id', filename[:-5])
-                            rooms[room_id] = room_data
-
-                            # Debug logging for locked doors
-                            if 'locked_exits' in room_data:
-                                print(f"[DOOR] WorldLoader: Found locked_exits in '{room_id}' from file {filename}")
-                                print(f"[DOOR] WorldLoader: locked_exits data: {room_data['locked_exits']}")
-                    except Exception as e:
-                        print(f"Error loading room file {file_path}: {e}")
-                        continue
-
-        print(f"[DOOR] WorldLoader: Loaded {len(rooms)} total rooms")
-        # Check if dungeon1_1 is in the rooms
-        if 'dungeon1_1' in rooms:
-            print(f"[DOOR] WorldLoader: dungeon1_1 loaded successfully")
-            if 'locked_exits' in rooms['dungeon1_1']:
-                print(f"[DOOR] WorldLoader: dungeon1_1 HAS locked_exits: {rooms['dungeon1_1']['locked_exits']}")
-            else:
-                print(f"[DOOR] WorldLoader: dungeon1_1 MISSING locked_exits!")
-        else:
-            print(f"[DOOR] WorldLoader: dungeon1_1 NOT FOUND in loaded rooms!")
+        for file_path in self.content.list_json_files(rooms_dir, recursive=True):
+            try:
+                room_data = self.content.get_json(file_path)
+                # Use the 'id' field from the JSON as the key
+                room_id = room_data.get('id', os.path.basename(file_path)[:-5])
+                rooms[room_id] = room_data
+            except Exception as e:
+                self.logger.error("Error loading room file %s: %s", file_path, e)
+                continue
 
         return rooms
 
@@ -74,23 +49,17 @@ class WorldLoader:
         items = {}
         items_dir = os.path.join(self.data_dir, "items")
 
-        if not os.path.exists(items_dir):
-            return items
-
-        for filename in os.listdir(items_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(items_dir, filename)
-                with open(file_path, 'r') as f:
-                    item_data = json.load(f)
-                    if isinstance(item_data, list):
-                        for item in item_data:
-                            items[item['id']] = item
-                    elif isinstance(item_data, dict):
-                        # Check if this dict has an 'items' key (nested structure)
-                        if 'items' in item_data:
-                            items.update(item_data['items'])
-                        else:
-                            items.update(item_data)
+        for file_path in self.content.list_json_files(items_dir):
+            item_data = self.content.get_json(file_path)
+            if isinstance(item_data, list):
+                for item in item_data:
+                    items[item['id']] = item
+            elif isinstance(item_data, dict):
+                # Check if this dict has an 'items' key (nested structure)
+                if 'items' in item_data:
+                    items.update(item_data['items'])
+                else:
+                    items.update(item_data)
 
         return items
 
@@ -99,50 +68,70 @@ class WorldLoader:
         npcs = {}
         npcs_dir = os.path.join(self.data_dir, "npcs")
 
-        if not os.path.exists(npcs_dir):
-            return npcs
-
-        for filename in os.listdir(npcs_dir):
+        for file_path in self.content.list_json_files(npcs_dir):
             # Skip monster files (they're now in data/mobs)
-            if filename.startswith('monsters'):
+            if os.path.basename(file_path).startswith('monsters'):
                 continue
-            if filename.endswith('.json'):
-                file_path = os.path.join(npcs_dir, filename)
-                with open(file_path, 'r') as f:
-                    npc_data = json.load(f)
-                    if isinstance(npc_data, list):
-                        for npc in npc_data:
-                            npcs[npc['id']] = npc
-                    elif isinstance(npc_data, dict) and 'id' in npc_data:
-                        # Single NPC file
-                        npcs[npc_data['id']] = npc_data
-                    elif isinstance(npc_data, dict):
-                        # Multiple NPCs in one file
-                        npcs.update(npc_data)
+            npc_data = self.content.get_json(file_path)
+            if isinstance(npc_data, list):
+                for npc in npc_data:
+                    npcs[npc['id']] = npc
+            elif isinstance(npc_data, dict) and 'id' in npc_data:
+                # Single NPC file
+                npcs[npc_data['id']] = npc_data
+            elif isinstance(npc_data, dict):
+                # Multiple NPCs in one file
+                npcs.update(npc_data)
 
         return npcs
 
+    def load_monsters(self) -> Dict[str, Any]:
+        """Load all monsters from the type-specific files in data/mobs.
+
+        Falls back to the legacy data/npcs/monsters.json if there are none.
+
+        Returns:
+            Dictionary mapping monster IDs to monster data
+        """
+        monsters = {}
+        mobs_dir = os.path.join(self.data_dir, "mobs")
+
+        for file_path in self.content.list_json_files(mobs_dir):
+            try:
+                config = self.content.get_json(file_path)
+                for monster in config.get('monsters', []):
+                    monsters[monster['id']] = monster
+            except Exception as e:
+                self.logger.error("Error loading monsters from %s: %s", file_path, e)
+
+        if not monsters:
+            legacy_file = os.path.join(self.data_dir, "npcs", "monsters.json")
+            if self.content.exists(legacy_file):
+                try:
+                    monsters = {m['id']: m for m in self.content.get_json(legacy_file)}
+                except Exception as e:
+                    self.logger.error("Error loading monsters from %s: %s", legacy_file, e)
+
+        return monsters
+
     def load_barriers(self) -> Dict[str, Any]:
         """Load barrier definitions from data/barriers.json."""
         barriers_file = os.path.join(self.data_dir, "barriers.json")
 
-        if not os.path.exists(barriers_file):
+        if not self.content.exists(barriers_file):
             return {}
 
-        with open(barriers_file, 'r') as f:
-            barriers_data = json.load(f)
-            # Return just the barriers dict, not the wrapper
-            return barriers_data.get('barriers', {})
+        # Return just the barriers dict, not the wrapper
+        return self.content.get_json(barriers_file).get('barriers', {})
 
     def load_connections(self) -> Dict[str, Any]:
         """Load room connections data."""
         connections_file = os.path.join(self.data_dir, "world", "connections.json")
 
-        if not os.path.exists(connections_file):
+        if not self.content.exists(connections_file):
             return {}
 
-        with open(connections_file, 'r') as f:
-            return json.load(f)
+        return self.content.get_json(connections_file)
 
     def save_world_data(self, world_type: str, data: Dict[str, Any]):
         """Save world data to files."""
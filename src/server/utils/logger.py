@@ -1,36 +1,155 @@
-"""Logging utilities for the MUD server."""
+"""Logging utilities for the MUD server.
 
+Log calls never touch a file or the console themselves: every logger under
+"forgotten_depths" hands its records to a queue, and a background thread
+(a QueueListener) writes them to stdout and a size-rotated log file. Records
+below a logger's level are dropped before any formatting, so pass arguments
+%-style (logger.debug("Loaded %s rooms", count)) rather than as f-strings
+in hot paths.
+
+Subsystems log through child loggers (get_logger("vendors") is
+"forgotten_depths.vendors"), whose levels can be set in the server config
+or changed at runtime with set_log_level().
+"""
+
+import atexit
 import logging
+import os
+import queue
 import sys
-from datetime import datetime
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+
+ROOT_LOGGER = "forgotten_depths"
+LEVEL_NAMES = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+_listener: Optional[QueueListener] = None
+
+
+def parse_size(size) -> int:
+    """Parse a size such as "10MB" or 1048576 into bytes (0 means no rotation)."""
+    if isinstance(size, (int, float)):
+        return int(size)
+    text = str(size).strip().upper()
+    for suffix, factor in (('GB', 1 << 30), ('MB', 1 << 20), ('KB', 1 << 10), ('B', 1)):
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(text)
+
+
+def _logger_name(subsystem: Optional[str]) -> str:
+    if not subsystem or subsystem in ('all', ROOT_LOGGER):
+        return ROOT_LOGGER
+    if subsystem.startswith(ROOT_LOGGER + '.'):
+        return subsystem
+    return f"{ROOT_LOGGER}.{subsystem}"
+
+
+def configure_logging(level: str = "INFO", file: Optional[str] = "mud_server.log", max_size="10MB",
+                      backup_count: int = 5, console: bool = True, levels: Optional[Dict[str, str]] = None):
+    """Set up (or replace) the logging pipeline.
+
+    Args:
+        level: Level of the root logger
+        file: Log file path (None for no file)
+        max_size: Rotate the file at this size (e.g. "10MB"; 0 never rotates)
+        backup_count: Rotated files to keep
+        console: Whether to write INFO and above to stdout
+        levels: Subsystem -> level overrides (e.g. {"vendors": "WARNING"})
+    """
+    global _listener
+    shutdown_logging()
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = []
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+    if file:
+        directory = os.path.dirname(file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_handler = RotatingFileHandler(file, maxBytes=parse_size(max_size), backupCount=backup_count)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
 
-class MUDLogger:
-    """Custom logger for the MUD server."""
+    records = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(records))
+    root.setLevel(level.upper())
+    root.propagate = False
+    for subsystem, subsystem_level in (levels or {}).items():
+        set_log_level(subsystem, subsystem_level)
 
-    def __init__(self, name: str = "forgotten_depths", level: int = logging.INFO):
-        """Initialize the logger."""
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(level)
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
 
-        if not self.logger.handlers:
-            self._setup_handlers()
 
-    def _setup_handlers(self):
-        """Set up log handlers."""
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+def shutdown_logging():
+    """Stop the writer thread after it has written everything queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
 
-        file_handler = logging.FileHandler('mud_server.log')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+atexit.register(shutdown_logging)
+
+
+def set_log_level(subsystem: Optional[str], level: str) -> str:
+    """Change the level of a subsystem's logger (or of everything, for None/"all").
+
+    Returns:
+        The logger's full name
+
+    Raises:
+        ValueError: If the level is not a known level name
+    """
+    level = level.upper()
+    if level not in LEVEL_NAMES and level != 'DEFAULT':
+        raise ValueError(f"Unknown log level '{level}'")
+    name = _logger_name(subsystem)
+    # DEFAULT makes a subsystem follow the root level again
+    logging.getLogger(name).setLevel(logging.NOTSET if level == 'DEFAULT' else level)
+    return name
+
+
+def get_log_levels() -> Dict[str, str]:
+    """Levels of the root logger and of every subsystem that has its own."""
+    levels = {ROOT_LOGGER: logging.getLevelName(logging.getLogger(ROOT_LOGGER).level)}
+    for name in sorted(logging.root.manager.loggerDict):
+        logger = logging.root.manager.loggerDict[name]
+        if name.startswith(ROOT_LOGGER + '.') and isinstance(logger, logging.Logger) and logger.level:
+            levels[name] = logging.getLevelName(logger.level)
+    return levels
+
+
+class MUDLogger:
+    """Custom logger for the MUD server."""
+
+    def __init__(self, name: str = ROOT_LOGGER, level: Optional[int] = None):
+        """Initialize the logger.
+
+        Args:
+            name: Logger name, or a subsystem name under forgotten_depths
+            level: Level to set (default: leave it, subsystems follow the root)
+        """
+        if _listener is None:
+            configure_logging()
+        self.logger = logging.getLogger(_logger_name(name))
+        if level is not None:
+            self.logger.setLevel(level)
+
+    def is_enabled(self, level: int) -> bool:
+        """Check if a message at this level would be logged (to skip building costly ones)."""
+        return self.logger.isEnabledFor(level)
 
     def debug(self, message: str, *args, **kwargs):
         """Log debug message."""
@@ -73,6 +192,6 @@ class MUDLogger:
             message += f" - {result}"
         self.info(message)
 
-def get_logger(name: str = "forgotten_depths") -> MUDLogger:
-    """Get a logger instance."""
-    return MUDLogger(name)
\ No newline at end of file
+def get_logger(name: str = ROOT_LOGGER) -> MUDLogger:
+    """Get a logger instance (name may be a subsystem, e.g. "vendors")."""
+    return MUDLogger(name)
@@ -0,0 +1,172 @@
+"""Command latency tracing.
+
+Every player command runs inside a span that records its verb, the handler
+that served it, and where the time went: the game logic, flushing the
+output to the client, and database calls made along the way. Spans are
+folded into in-memory histograms (one per phase plus one per verb), which
+cost a few additions per command. Only slow commands and a 1-in-N sample
+are written to the log, as one JSON object per line.
+
+Database time is attributed through a context variable: each command runs
+in its own asyncio task, so Database calls made by that task (or by
+threads started with asyncio.to_thread) add to that command's span, while
+background saves on the persistence worker add to none.
+"""
+
+import bisect
+import json
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+# Upper bounds of the histogram buckets, in milliseconds (the last bucket is open)
+BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Phases recorded for every command
+PHASES = ('total', 'game', 'flush', 'db')
+
+
+class Histogram:
+    """Counts of durations per bucket, with their total and maximum."""
+
+    __slots__ = ('counts', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float):
+        """Add one duration."""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, fraction: float) -> float:
+        """Approximate a percentile by the upper bound of its bucket.
+
+        Args:
+            fraction: 0.5 for the median, 0.95 for p95...
+
+        Returns:
+            Milliseconds (the maximum seen, for the open bucket), 0 if empty
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return min(BUCKET_BOUNDS_MS[index], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        """count, avg_ms, p50_ms, p95_ms, p99_ms and max_ms."""
+        return {
+            'count': self.count,
+            'avg_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self.max_ms,
+        }
+
+
+class Span:
+    """Timing of one command."""
+
+    __slots__ = ('verb', 'handler', 'player_id', 'start', 'game_ms', 'flush_ms', 'db_ms')
+
+    def __init__(self, verb: str, player_id: int):
+        self.verb = verb
+        self.handler = ''
+        self.player_id = player_id
+        self.start = time.perf_counter()
+        self.game_ms = 0.0
+        self.flush_ms = 0.0
+        self.db_ms = 0.0
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+
+
+def current_span() -> Optional[Span]:
+    """The span of the command the calling task is running, if any."""
+    return _current_span.get()
+
+
+def add_db_time(seconds: float):
+    """Charge database time to the current command (no-op outside commands)."""
+    span = _current_span.get()
+    if span is not None:
+        span.db_ms += seconds * 1000
+
+
+class CommandTracer:
+    """Opens command spans and aggregates them into histograms."""
+
+    def __init__(self, logger, slow_ms: float = 500.0, sample_rate: int = 0):
+        """Initialize the tracer.
+
+        Args:
+            logger: Logger the slow and sampled spans are written to
+            slow_ms: Commands taking at least this long are always logged (0 disables)
+            sample_rate: Log one in this many other commands (0 disables sampling)
+        """
+        self.logger = logger
+        self.slow_ms = slow_ms
+        self.sample_rate = sample_rate
+        self.phases: Dict[str, Histogram] = {phase: Histogram() for phase in PHASES}
+        self.verbs: Dict[str, Histogram] = {}  # verb -> total time
+        self._finished = 0
+
+    def start(self, verb: str, player_id: int) -> Span:
+        """Open a span for a command and make it current for the calling task."""
+        span = Span(verb, player_id)
+        _current_span.set(span)
+        return span
+
+    def finish(self, span: Span):
+        """Close a span: add it to the histograms and log it if slow or sampled."""
+        total_ms = (time.perf_counter() - span.start) * 1000
+        _current_span.set(None)
+
+        phases = self.phases
+        phases['total'].observe(total_ms)
+        phases['game'].observe(span.game_ms)
+        phases['flush'].observe(span.flush_ms)
+        phases['db'].observe(span.db_ms)
+        histogram = self.verbs.get(span.verb)
+        if histogram is None:
+            histogram = self.verbs[span.verb] = Histogram()
+        histogram.observe(total_ms)
+
+        self._finished += 1
+        slow = bool(self.slow_ms) and total_ms >= self.slow_ms
+        sampled = bool(self.sample_rate) and self._finished % self.sample_rate == 0
+        if slow or sampled:
+            record = json.dumps({
+                'event': 'command', 'verb': span.verb, 'handler': span.handler,
+                'player_id': span.player_id, 'total_ms': round(total_ms, 2),
+                'game_ms': round(span.game_ms, 2), 'flush_ms': round(span.flush_ms, 2),
+                'db_ms': round(span.db_ms, 2), 'slow': slow,
+            })
+            if slow:
+                self.logger.warning(f"[CMD_TRACE] {record}")
+            else:
+                self.logger.info(f"[CMD_TRACE] {record}")
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Histogram summaries per phase."""
+        return {phase: histogram.summary() for phase, histogram in self.phases.items()}
+
+    def verb_summary(self, verb: str) -> Optional[Dict[str, float]]:
+        """Histogram summary of one verb's total time, or None if it wasn't traced."""
+        histogram = self.verbs.get(verb)
+        return histogram.summary() if histogram else None
@@ -0,0 +1,118 @@
+"""Unit tests for the character journal."""
+
+import unittest
+import sys
+import os
+import copy
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.persistence.character_journal import compute_character_delta, apply_journal_entry
+from server.persistence.database import Database
+from server.persistence.player_storage import PlayerStorage
+
+
+def make_character():
+    """Build a small character dict."""
+    return {
+        'name': 'Tester',
+        'gold': 100,
+        'room_id': 'town_square',
+        'current_hit_points': 20,
+        'inventory': [{'name': 'Torch'}, {'name': 'Bread'}, {'name': 'Rope'}],
+        'quests': {'rat_problem': {'status': 'active', 'kills': 1}},
+    }
+
+
+class TestCharacterDelta(unittest.TestCase):
+    """Test cases for delta computation and replay."""
+
+    def replay(self, old, entries):
+        character = copy.deepcopy(old)
+        for op, payload in entries:
+            apply_journal_entry(character, op, payload)
+        return character
+
+    def test_no_changes(self):
+        """Test that identical characters produce no entries."""
+        self.assertEqual(compute_character_delta(make_character(), make_character()), [])
+
+    def test_roundtrip(self):
+        """Test that replaying the delta reproduces the new state."""
+        old = make_character()
+        new = make_character()
+        new['gold'] = 75
+        new['room_id'] = 'blacksmith_shop'
+        new['inventory'].remove({'name': 'Bread'})
+        new['inventory'].append({'name': 'Iron Sword'})
+        new['quests']['rat_problem']['kills'] = 2
+        new['following'] = 3
+        del new['current_hit_points']
+
+        entries = compute_character_delta(old, new)
+        self.assertEqual(self.replay(old, entries), new)
+
+        ops = [op for op, _ in entries]
+        self.assertIn('list_remove', ops)
+        self.assertIn('list_append', ops)
+        self.assertIn('set_in', ops)
+
+    def test_reordered_list_falls_back_to_set(self):
+        """Test that a reordering is recorded as a full set."""
+        old = make_character()
+        new = make_character()
+        new['inventory'].reverse()
+        entries = compute_character_delta(old, new)
+        self.assertEqual(entries, [('set', {'key': 'inventory', 'value': new['inventory']})])
+
+
+class TestPlayerStorageJournal(unittest.TestCase):
+    """Test cases for PlayerStorage journal mode."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.tmpdir.name, 'journal.db'))
+        self.db.connect()
+        self.storage = PlayerStorage(self.db, journal_mode=True, compaction_max_entries=100)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.db.disconnect()
+        self.tmpdir.cleanup()
+
+    def journal_rows(self):
+        return self.db.execute_query("SELECT COUNT(*) AS n FROM character_journal")[0]['n']
+
+    def test_journal_replayed_on_load(self):
+        """Test that journal entries are replayed on top of the snapshot."""
+        character = make_character()
+        self.assertTrue(self.storage.journal_character_data('Tester', copy.deepcopy(character)))
+        self.assertEqual(self.journal_rows(), 0)  # First save is a full snapshot
+
+        character['gold'] = 42
+        character['inventory'].append({'name': 'Lantern'})
+        self.storage.journal_character_data('Tester', copy.deepcopy(character))
+        self.assertEqual(self.storage.flush_journal(), 2)
+
+        fresh = PlayerStorage(self.db)
+        self.assertEqual(fresh.load_character_data('Tester'), character)
+
+    def test_full_save_discards_journal(self):
+        """Test that a full save supersedes the journal tail."""
+        character = make_character()
+        self.storage.journal_character_data('Tester', copy.deepcopy(character))
+        character['gold'] = 1
+        self.storage.journal_character_data('Tester', copy.deepcopy(character))
+        self.storage.flush_journal()
+
+        character['gold'] = 500
+        self.storage.save_character_data('Tester', character)
+        self.assertEqual(self.journal_rows(), 0)
+        self.assertEqual(self.storage.load_character_data('Tester')['gold'], 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Unit tests for the command registry and table-driven dispatch."""
+
+import asyncio
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.commands.registry import CommandRegistry, ADMIN, LOGGED_IN, NOT_IN_COMBAT
+
+
+async def noop(player_id, character, params):
+    pass
+
+
+class TestCommandRegistry(unittest.TestCase):
+    """Test cases for verb lookup and help generation."""
+
+    def setUp(self):
+        """Register a few commands with overlapping prefixes."""
+        self.registry = CommandRegistry(min_abbreviation=3)
+        self.registry.add('inventory', noop, aliases=('inv', 'i'), help="Show inventory")
+        self.registry.add('north', noop, aliases=('n',), help="Go north", category='Movement')
+        self.registry.add('northeast', noop, aliases=('ne',), help="Go northeast", category='Movement')
+        self.registry.add('teleport', noop, requires=(ADMIN,), help="Teleport", category='Admin')
+        self.registry.add('rent', noop, requires=(NOT_IN_COMBAT,), help="Rent a room")
+
+    def test_resolution(self):
+        """Test exact verbs, aliases and abbreviations."""
+        self.assertEqual(self.registry.resolve('i').name, 'inventory')
+        self.assertIsNone(self.registry.resolve('inve'))
+        self.assertEqual(self.registry.resolve_abbreviation('inve').name, 'inventory')
+        self.assertEqual(self.registry.resolve_abbreviation('northe').name, 'northeast')
+        # Ambiguous, too short, unknown, or admin-only
+        self.assertIsNone(self.registry.resolve_abbreviation('nor'))
+        self.assertIsNone(self.registry.resolve_abbreviation('in'))
+        self.assertIsNone(self.registry.resolve_abbreviation('xyz'))
+        self.assertIsNone(self.registry.resolve_abbreviation('tele'))
+
+        with self.assertRaises(ValueError):
+            self.registry.add('info', noop, aliases=('i',))
+
+    def test_help_sections(self):
+        """Test that help lists only the commands a player may use."""
+        sections = dict(self.registry.help_sections({LOGGED_IN}))
+        self.assertEqual(set(sections), {'General', 'Movement'})
+        self.assertEqual(sections['General'][0], "inventory (inv,i)  - Show inventory")
+        self.assertIn('Admin', dict(self.registry.help_sections({LOGGED_IN, ADMIN})))
+
+
+class TestDispatch(unittest.TestCase):
+    """Test cases for state and arity checks in the command handler."""
+
+    def setUp(self):
+        """Build a command handler on a stub engine."""
+        from server.commands.command_handler import CommandHandler
+
+        self.sent = []
+        self.fatigued = False
+        settings = {('admin', 'open_admin_commands'): False, ('admin', 'admin_users'): ['Root']}
+
+        async def send_message(player_id, message):
+            self.sent.append(message)
+
+        self.player_data = {'username': 'alice', 'character': {'room_id': 'inn'}}
+        engine = SimpleNamespace(
+            logger=None,
+            config_manager=SimpleNamespace(get_setting=lambda *keys, default=None: settings.get(keys, default)),
+            connection_manager=SimpleNamespace(send_message=send_message),
+            player_manager=SimpleNamespace(get_player_data=lambda player_id: self.player_data),
+            combat_system=SimpleNamespace(is_player_fatigued=lambda player_id: self.fatigued,
+                                          get_player_fatigue_remaining=lambda player_id: 3.0),
+            ability_system=SimpleNamespace(get_ability_by_command=lambda character, command: None),
+        )
+        self.handler = CommandHandler(engine)
+        self.calls = []
+
+        async def record(player_id, character, params):
+            self.calls.append(params)
+
+        for name in ('get', 'rent', 'givegold'):
+            self.handler.registry.commands[name].handler = record
+
+    def run_command(self, command, params=''):
+        asyncio.run(self.handler._handle_game_command(1, command, params))
+
+    def test_checks(self):
+        """Test arity, combat and admin requirements."""
+        self.run_command('get')
+        self.assertEqual(self.sent[-1], "What would you like to get?")
+        self.run_command('get', 'sword')
+        self.assertEqual(self.calls, ['sword'])
+
+        self.fatigued = True
+        self.run_command('rent')
+        self.assertIn("too exhausted", self.sent[-1])
+        self.assertEqual(len(self.calls), 1)
+
+        # Admin verbs are plain speech to other players
+        self.handler.game_engine._notify_room_except_player = lambda *args: asyncio.sleep(0)
+        self.run_command('givegold', '100')
+        self.assertEqual(self.sent[-1], "-- Message sent --")
+        self.player_data['username'] = 'root'
+        self.run_command('givegold', '100')
+        self.assertEqual(self.calls, ['sword', '100'])
+        self.assertEqual(self.handler.registry.get_stats()['get']['calls'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""Unit tests for the compiled content bundle."""
+
+import unittest
+import sys
+import os
+import json
+import pickle
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.persistence import content_bundle
+from server.persistence.content_bundle import ContentBundle
+
+
+class TestContentBundle(unittest.TestCase):
+    """Test cases for building, loading and invalidating the bundle."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data_dir = os.path.join(self.tmpdir.name, 'data')
+        self.write('items/weapons.json', {'items': {'sword': {'name': 'Sword'}}})
+        self.write('world/rooms/town/square.json', {'id': 'square'})
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def write(self, relpath, data):
+        path = os.path.join(self.data_dir, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+    def test_rebuilds_then_loads(self):
+        """Test that a missing bundle is rebuilt and then reused."""
+        first = ContentBundle(self.data_dir)
+        self.assertTrue(first.load())
+        self.assertEqual(first.stats['origin'], 'rebuilt')
+
+        second = ContentBundle(self.data_dir)
+        self.assertTrue(second.load())
+        self.assertEqual(second.stats['origin'], 'loaded')
+        self.assertEqual(second.source_hash, first.source_hash)
+
+    def test_source_change_invalidates(self):
+        """Test that editing a source file triggers a rebuild with the new content."""
+        ContentBundle(self.data_dir).load()
+        self.write('items/weapons.json', {'items': {'axe': {'name': 'Axe'}}})
+
+        bundle = ContentBundle(self.data_dir)
+        self.assertFalse(bundle.is_current())
+        bundle.load()
+        self.assertEqual(bundle.stats['origin'], 'rebuilt')
+        self.assertIn('axe', bundle.get_json(os.path.join(self.data_dir, 'items', 'weapons.json'))['items'])
+
+    def test_reads_match_files(self):
+        """Test listing and reading through the bundle, with fresh copies per read."""
+        bundle = ContentBundle(self.data_dir)
+        bundle.load()
+
+        rooms_dir = os.path.join(self.data_dir, 'world', 'rooms')
+        self.assertEqual(bundle.list_json_files(rooms_dir), [])
+        room_files = bundle.list_json_files(rooms_dir, recursive=True)
+        self.assertEqual(room_files, [os.path.join(rooms_dir, 'town', 'square.json')])
+
+        room = bundle.get_json(room_files[0])
+        room['id'] = 'changed'
+        self.assertEqual(bundle.get_json(room_files[0]), {'id': 'square'})
+
+    def test_refresh_reparses_changed_files(self):
+        """Test that a refresh picks up added, modified and removed files only."""
+        bundle = ContentBundle(self.data_dir)
+        bundle.load()
+        old_hash = bundle.source_hash
+        self.assertEqual(bundle.refresh(), [])
+
+        self.write('items/weapons.json', {'items': {'axe': {'name': 'Axe'}}})
+        self.write('world/rooms/town/gate.json', {'id': 'gate'})
+        os.remove(os.path.join(self.data_dir, 'world', 'rooms', 'town', 'square.json'))
+        weapons = os.path.join(self.data_dir, 'items', 'weapons.json')
+        st = os.stat(weapons)
+        os.utime(weapons, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        self.assertEqual(sorted(bundle.changed_sources()),
+                         ['items/weapons.json', 'world/rooms/town/gate.json', 'world/rooms/town/square.json'])
+        self.assertEqual(len(bundle.refresh()), 3)
+        self.assertNotEqual(bundle.source_hash, old_hash)
+        self.assertIn('axe', bundle.get_json(weapons)['items'])
+        rooms_dir = os.path.join(self.data_dir, 'world', 'rooms')
+        self.assertEqual(bundle.list_json_files(rooms_dir, recursive=True),
+                         [os.path.join(rooms_dir, 'town', 'gate.json')])
+
+        # The refreshed bundle was saved, so the next startup loads it as is
+        reloaded = ContentBundle(self.data_dir)
+        reloaded.load()
+        self.assertEqual(reloaded.stats['origin'], 'loaded')
+
+    def test_release(self):
+        """Test that released files are read from disk and kept in the saved bundle."""
+        bundle = ContentBundle(self.data_dir)
+        bundle.load()
+        rooms_dir = os.path.join(self.data_dir, 'world', 'rooms')
+        room_files = bundle.list_json_files(rooms_dir, recursive=True)
+        self.assertEqual(bundle.release(rooms_dir), 1)
+        self.assertIsNone(bundle._files['world/rooms/town/square.json'])
+        self.assertEqual(bundle.list_json_files(rooms_dir, recursive=True), room_files)
+        self.assertEqual(bundle.get_json(room_files[0]), {'id': 'square'})
+
+        self.write('items/weapons.json', {'items': {'axe': {'name': 'Axe'}}})
+        self.assertEqual(bundle.refresh(), ['items/weapons.json'])
+        self.assertIsNone(bundle._files['world/rooms/town/square.json'])
+        reloaded = ContentBundle(self.data_dir)
+        reloaded.load()
+        self.assertEqual(reloaded.stats['origin'], 'loaded')
+        self.assertEqual(pickle.loads(reloaded._files['world/rooms/town/square.json']), {'id': 'square'})
+
+    def test_parallel_parse_matches_serial(self):
+        """Test that a process pool rebuild produces the same bundle as a serial one."""
+        for i in range(5):
+            self.write(f'npcs/npc{i}.json', {'id': f'npc{i}', 'dialogue': {'greeting': 'Hello'}})
+        self.write('broken.json', {})
+        with open(os.path.join(self.data_dir, 'broken.json'), 'w') as f:
+            f.write('{not json')
+
+        serial = ContentBundle(self.data_dir, os.path.join(self.tmpdir.name, 'serial.pkl'), workers=1)
+        serial.build()
+
+        original_min_files = content_bundle.PARALLEL_MIN_FILES
+        content_bundle.PARALLEL_MIN_FILES = 1
+        try:
+            parallel = ContentBundle(self.data_dir, os.path.join(self.tmpdir.name, 'parallel.pkl'), workers=2)
+            parallel.build()
+        finally:
+            content_bundle.PARALLEL_MIN_FILES = original_min_files
+
+        self.assertEqual(list(parallel._files), list(serial._files))
+        for relpath, data in serial._files.items():
+            if data is not None:
+                self.assertEqual(pickle.loads(parallel._files[relpath]), pickle.loads(data))
+        self.assertIsNone(parallel._files['broken.json'])
+        self.assertIn('broken.json', parallel._errors)
+
+    def test_broken_file_stays_listed(self):
+        """Test that a file that fails to parse is still listed on later loads, and reading it fails."""
+        self.write('items/broken.json', {})
+        with open(os.path.join(self.data_dir, 'items', 'broken.json'), 'w') as f:
+            f.write('{not json')
+        ContentBundle(self.data_dir).load()
+
+        bundle = ContentBundle(self.data_dir)
+        bundle.load()
+        self.assertEqual(bundle.stats['origin'], 'loaded')
+        items_dir = os.path.join(self.data_dir, 'items')
+        broken = os.path.join(items_dir, 'broken.json')
+        self.assertIn(broken, bundle.list_json_files(items_dir))
+        self.assertIn('items/broken.json', bundle._errors)
+        with self.assertRaises(ValueError):
+            bundle.get_json(broken)
+
+        with open(broken, 'w') as f:
+            f.write('{"items": {}}')
+        bundle.refresh()
+        self.assertEqual(bundle._errors, {})
+        self.assertEqual(bundle.get_json(broken), {'items': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for the typed event bus."""
+
+import asyncio
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.core.event_bus import EventBus
+from server.core.events import MobKilled, PlayerCommand, PlayerConnected
+
+
+class TestEventBus(unittest.TestCase):
+    """Test cases for publishing and delivering events."""
+
+    def test_immediate_delivery(self):
+        """Test that sync and async subscribers get events soon after publish, in order."""
+        bus = EventBus()
+        seen = []
+
+        async def on_kill(event):
+            await asyncio.sleep(0)
+            seen.append(('async', event.mob_id))
+
+        bus.subscribe(MobKilled, lambda event: seen.append(('sync', event.mob_id)))
+        bus.subscribe(MobKilled, on_kill)
+
+        async def scenario():
+            bus.publish(MobKilled(1, 'rat', 'cellar'))
+            bus.publish(MobKilled(1, 'bat', 'cellar'))
+            self.assertEqual(seen, [])  # publish never runs subscribers itself
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+        asyncio.run(scenario())
+        self.assertEqual(seen, [('sync', 'rat'), ('sync', 'bat'), ('async', 'rat'), ('async', 'bat')])
+
+    def test_batched_delivery(self):
+        """Test that batched subscribers get a list of events on flush()."""
+        bus = EventBus()
+        batches = []
+        bus.subscribe(MobKilled, batches.append, batched=True)
+
+        async def scenario():
+            for mob_id in ('rat', 'bat', 'orc'):
+                bus.publish(MobKilled(2, mob_id, 'cave'))
+            await asyncio.sleep(0)
+            self.assertEqual(batches, [])
+            await bus.flush()
+            await bus.flush()
+
+        asyncio.run(scenario())
+        self.assertEqual([[e.mob_id for e in batch] for batch in batches], [['rat', 'bat', 'orc']])
+        self.assertEqual(bus.stats()['published'], {'MobKilled': 3})
+
+    def test_backpressure(self):
+        """Test that a full queue drops its oldest events and counts them."""
+        bus = EventBus(max_queue=2)
+        batches = []
+        bus.subscribe(MobKilled, batches.append, batched=True)
+        for mob_id in ('a', 'b', 'c', 'd'):
+            bus.publish(MobKilled(3, mob_id, 'room'))  # no event loop: kept for flush()
+        asyncio.run(bus.flush())
+        self.assertEqual([e.mob_id for e in batches[0]], ['c', 'd'])
+        self.assertEqual(bus.stats()['dropped'], {'MobKilled': 2})
+
+    def test_unbounded_subscriber(self):
+        """Test that a max_queue=0 subscriber (quests) gets every kill of a burst while metrics drop."""
+        bus = EventBus(max_queue=4)
+        quest_kills = []
+        metric_batches = []
+
+        async def on_mob_killed(event):
+            quest_kills.append(event.mob_id)
+
+        bus.subscribe(MobKilled, on_mob_killed, max_queue=0)
+        bus.subscribe(MobKilled, metric_batches.append, batched=True)
+
+        async def scenario():
+            # The whole burst is published before the subscribers get a turn
+            for i in range(50):
+                bus.publish(MobKilled(1, f"rat{i}", 'sewer'))
+            await bus.flush()
+
+        asyncio.run(scenario())
+        self.assertEqual(quest_kills, [f"rat{i}" for i in range(50)])
+        self.assertEqual(len(metric_batches[0]), 4)
+        self.assertEqual(bus.stats()['dropped'], {'MobKilled': 46})
+
+    def test_unsubscribed_topics(self):
+        """Test that wants() tracks subscribers and unwanted events are ignored."""
+        bus = EventBus()
+        self.assertFalse(bus.wants(PlayerCommand))
+        bus.publish(PlayerCommand(1, 'look', '', 0.0))
+        self.assertEqual(bus.stats(), {'published': {}, 'dropped': {}})
+
+        handler = lambda event: None
+        bus.subscribe(PlayerConnected, handler)
+        self.assertTrue(bus.wants(PlayerConnected))
+        bus.unsubscribe(PlayerConnected, handler)
+        self.assertFalse(bus.wants(PlayerConnected))
+
+    def test_handler_errors(self):
+        """Test that a failing subscriber doesn't stop delivery to the others."""
+        bus = EventBus()
+        seen = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(PlayerConnected, broken)
+        bus.subscribe(PlayerConnected, lambda event: seen.append(event.player_id))
+        bus.publish(PlayerConnected(7))
+        bus.publish(PlayerConnected(8))
+        asyncio.run(bus.flush())
+        self.assertEqual(seen, [7, 8])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Unit tests for command lists, speedwalks and aliases."""
+
+import asyncio
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.commands.expander import CommandExpander, parse_speedwalk
+from server.core.timeslice import TimeSlicer
+
+
+class TestExpander(unittest.TestCase):
+    """Test cases for expanding one input line."""
+
+    def setUp(self):
+        self.expander = CommandExpander(max_commands=10)
+
+    def test_speedwalk(self):
+        """Test counts, two-letter directions and words that aren't speedwalks."""
+        self.assertEqual(parse_speedwalk('2n1ne'), ['north', 'north', 'northeast'])
+        self.assertEqual(parse_speedwalk('3U'), ['up', 'up', 'up'])
+        self.assertIsNone(parse_speedwalk('news'))
+        self.assertIsNone(parse_speedwalk('2x'))
+        with self.assertRaises(ValueError):
+            parse_speedwalk('50n', max_steps=10)
+
+    def test_expand(self):
+        """Test command lists, aliases with and without $*, and the batch limit."""
+        aliases = {'k': 'kill $*', 'home': '2s;w;look', 'gs': 'get'}
+        self.assertFalse(self.expander.needs_expansion('look', 'sword', aliases))
+        self.assertTrue(self.expander.needs_expansion('k', 'rat', aliases))
+        self.assertEqual(self.expander.expand('get', 'sword; 2n ;k rat', aliases),
+                         [('get', 'sword'), ('north', ''), ('north', ''), ('kill', 'rat')])
+        self.assertEqual(self.expander.expand('home', '', aliases),
+                         [('south', ''), ('south', ''), ('w', ''), ('look', '')])
+        self.assertEqual(self.expander.expand('gs', 'all', aliases), [('get', 'all')])
+        # Alias text isn't expanded again, and empty segments are skipped
+        self.assertEqual(self.expander.expand('n;;k', '', {'n': 'k', 'k': 'kill'}), [('k', ''), ('kill', '')])
+        with self.assertRaises(ValueError):
+            self.expander.expand('5n;5s;e', '')
+
+    def test_free_text(self):
+        """Test that ';' isn't split after a free-text verb, so aliases can hold command lists."""
+        known = {'alias', 'a', 'b', 'get', 'look', 'sw'}
+        free_text = lambda verb: verb == 'alias' or verb not in known
+        self.assertEqual(self.expander.expand('alias', 'x a;b', None, free_text), [('alias', 'x a;b')])
+        self.assertEqual(self.expander.expand('x', '', {'x': 'a;b'}, free_text), [('a', ''), ('b', '')])
+        self.assertEqual(self.expander.expand('x', '', {'x': 'sw;look'}, free_text), [('sw', ''), ('look', '')])
+        # Unknown verbs are speech, which keeps the rest of the line
+        self.assertEqual(self.expander.expand('hello;', 'there', None, free_text), [('hello;', 'there')])
+        self.assertEqual(self.expander.expand('get', 'coin;2n;hi; all', None, free_text),
+                         [('get', 'coin'), ('north', ''), ('north', ''), ('hi;', 'all')])
+
+
+class TestBatch(unittest.TestCase):
+    """Test that an expanded line runs in order and is flushed once."""
+
+    def test_batch(self):
+        from server.commands.command_handler import CommandHandler
+
+        events = []
+
+        async def send_message(player_id, message):
+            events.append(('send', message))
+
+        async def flush():
+            events.append(('flush',))
+
+        player_data = {'username': 'alice', 'authenticated': True,
+                       'character': {'room_id': 'inn', 'aliases': {'go': '2e;look $*'}}}
+        engine = SimpleNamespace(
+            logger=None,
+            config_manager=SimpleNamespace(get_setting=lambda *keys, default=None: default),
+            connection_manager=SimpleNamespace(
+                send_message=send_message,
+                flush=lambda player_id: flush()),
+            ability_system=SimpleNamespace(get_ability_by_command=lambda character, command: None),
+            _notify_room_except_player=lambda room_id, player_id, message: send_message(room_id, message),
+            player_manager=SimpleNamespace(get_player_data=lambda player_id: player_data,
+                                           is_player_connected=lambda player_id: True),
+            snapshot_manager=SimpleNamespace(mark_dirty=lambda player_id: None),
+            timeslicer=TimeSlicer(),
+        )
+        handler = CommandHandler(engine)
+
+        def recorder(name):
+            async def record(player_id, character, params):
+                events.append((name, params))
+            return record
+
+        for name in ('east', 'look', 'get'):
+            handler.registry.commands[name].handler = recorder(name)
+
+        asyncio.run(handler._process_player_command(1, 'go', 'fountain;get coin'))
+        self.assertEqual(events, [('east', ''), ('east', ''), ('look', 'fountain'), ('get', 'coin'), ('flush',)])
+
+        events.clear()
+        asyncio.run(handler._process_player_command(1, 'alias', 'k kill $*'))
+        self.assertEqual(player_data['character']['aliases']['k'], 'kill $*')
+
+        # An alias holding a command list is stored whole and expanded when used
+        asyncio.run(handler._process_player_command(1, 'alias', 'home 2e;look'))
+        self.assertEqual(player_data['character']['aliases']['home'], '2e;look')
+        events.clear()
+        asyncio.run(handler._process_player_command(1, 'home', ''))
+        self.assertEqual(events, [('east', ''), ('east', ''), ('look', ''), ('flush',)])
+
+        # Speech keeps its semicolons
+        events.clear()
+        asyncio.run(handler._process_player_command(1, 'hello;', 'there'))
+        self.assertEqual(events, [('send', 'From alice: hello; there\n'), ('send', '-- Message sent --'), ('flush',)])
+
+
+if __name__ == '__main__':
+    unittest.main()
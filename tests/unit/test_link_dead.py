@@ -0,0 +1,172 @@
+"""Unit tests for link-dead sessions."""
+
+import asyncio
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.game.player.player_manager import PlayerManager
+from server.persistence.snapshot import SnapshotManager
+
+
+class FakeStorage:
+    """Player storage that records database calls and saved characters."""
+
+    journal_mode = False
+
+    def __init__(self):
+        self.db_calls = []
+        self.saved = []
+
+    def verify_password(self, password, password_hash):
+        return password_hash == f"hash:{password}"
+
+    def authenticate_player(self, username, password):
+        self.db_calls.append(('authenticate_player', username))
+        return 1
+
+    def get_password_hash(self, username):
+        self.db_calls.append(('get_password_hash', username))
+        return "hash:secret"
+
+    def load_character_data(self, username):
+        self.db_calls.append(('load_character_data', username))
+        return None
+
+    def save_character_data(self, username, data):
+        self.saved.append((username, data))
+        return True
+
+    def release_journal_state(self, username):
+        pass
+
+
+class TestLinkDead(unittest.TestCase):
+    """Test cases for dropping, resuming and expiring link-dead sessions."""
+
+    def setUp(self):
+        """Build a player manager on a stub engine with two logged-in players in a party."""
+        self.storage = FakeStorage()
+        self.sent = []
+        self.settings = {'link_dead_grace': 300, 'link_dead_max_sessions': 100}
+
+        async def send_message(player_id, message, add_newline=True):
+            self.sent.append((player_id, message))
+
+        async def notify_room(room_id, player_id, message):
+            pass
+
+        self.engine = SimpleNamespace(
+            config_manager=SimpleNamespace(
+                get_setting=lambda section, key, default=None: self.settings.get(key, default)),
+            running=True,
+            player_storage=self.storage,
+            connection_manager=SimpleNamespace(send_message=send_message),
+            snapshot_manager=SnapshotManager(),
+            persistence_executor=None,
+            room_mobs={},
+            _notify_room_except_player=notify_room,
+        )
+        self.manager = PlayerManager(self.engine)
+        self.addCleanup(self.manager.auth_executor.shutdown)
+
+        # alice (1) leads a party with bob (2), who follows her
+        self.alice = self.login(1, 'alice', {'name': 'Alice', 'room_id': 'inn', 'party_leader': 1,
+                                             'party_members': [1, 2], 'followers': [2]})
+        self.bob = self.login(2, 'bob', {'name': 'Bob', 'room_id': 'inn', 'party_leader': 1, 'following': 1})
+
+    def login(self, player_id, username, character):
+        self.manager.connected_players[player_id] = {
+            'player_id': player_id, 'username': username, 'authenticated': True,
+            'login_state': 'authenticated', 'character': character,
+        }
+        self.manager.logged_in_usernames[username] = player_id
+        self.manager._password_hashes[username] = "hash:secret"
+        return character
+
+    def test_reattach_without_database(self):
+        """Test that a reconnect within the grace period re-attaches without touching the database."""
+        async def scenario():
+            await self.manager.handle_player_disconnect(1)
+            self.assertNotIn(1, self.manager.connected_players)
+            self.assertIn('alice', self.manager.link_dead_sessions)
+            self.storage.db_calls.clear()
+
+            self.assertTrue(await self.manager.authenticate_player_async('alice', 'secret'))
+            self.assertTrue(await self.manager.resume_link_dead_session(5, 'alice'))
+
+        asyncio.run(scenario())
+        self.assertEqual(self.storage.db_calls, [])
+        self.assertIs(self.manager.connected_players[5]['character'], self.alice)
+        self.assertEqual(self.manager.logged_in_usernames['alice'], 5)
+        self.assertEqual(self.manager.link_dead_sessions, {})
+
+    def test_party_survives_remap(self):
+        """Test that party membership and followers point at the new connection after a resume."""
+        async def scenario():
+            await self.manager.handle_player_disconnect(1)
+            await self.manager.resume_link_dead_session(5, 'alice')
+
+        asyncio.run(scenario())
+        self.assertEqual(self.alice['party_leader'], 5)
+        self.assertEqual(self.alice['party_members'], [5, 2])
+        self.assertEqual(self.alice['followers'], [2])
+        self.assertEqual(self.bob['party_leader'], 5)
+        self.assertEqual(self.bob['following'], 5)
+
+        # A member who dropped and came back is remapped the same way
+        async def member():
+            await self.manager.handle_player_disconnect(2)
+            await self.manager.resume_link_dead_session(6, 'bob')
+
+        asyncio.run(member())
+        self.assertEqual(self.alice['party_members'], [5, 6])
+        self.assertEqual(self.alice['followers'], [6])
+        self.assertEqual(self.bob['party_leader'], 5)
+
+    def test_expiry_saves_then_disbands(self):
+        """Test that an expired session is saved and its party disbanded."""
+        async def scenario():
+            await self.manager.handle_player_disconnect(1)
+            self.assertEqual(len(self.storage.saved), 1)  # saved when the link dropped
+            await self.manager.expire_link_dead_sessions()
+            self.assertIn('alice', self.manager.link_dead_sessions)  # grace not over yet
+
+            self.manager.link_dead_sessions['alice']['expires_at'] = 0
+            await self.manager.expire_link_dead_sessions()
+
+        asyncio.run(scenario())
+        self.assertEqual(self.manager.link_dead_sessions, {})
+        self.assertEqual(len(self.storage.saved), 2)
+        username, saved = self.storage.saved[-1]
+        self.assertEqual(username, 'alice')
+        self.assertNotIn('party_members', saved)
+        self.assertEqual(saved['followers'], [])
+        self.assertEqual(self.bob['party_leader'], 2)
+        self.assertIsNone(self.bob['following'])
+        self.assertIn((2, "Alice has left the game. The party has been disbanded."), self.sent)
+
+    def test_lru_eviction(self):
+        """Test that the least recently dropped session is ended when the cache is full."""
+        self.settings['link_dead_max_sessions'] = 1
+        self.manager = PlayerManager(self.engine)
+        self.addCleanup(self.manager.auth_executor.shutdown)
+        self.login(1, 'alice', self.alice)
+        self.login(2, 'bob', self.bob)
+
+        async def scenario():
+            await self.manager.handle_player_disconnect(1)
+            await self.manager.handle_player_disconnect(2)
+
+        asyncio.run(scenario())
+        self.assertEqual(list(self.manager.link_dead_sessions), ['bob'])
+        self.assertEqual([username for username, _ in self.storage.saved], ['alice', 'bob', 'alice'])
+        self.assertNotIn('party_members', self.alice)
+
+
+if __name__ == '__main__':
+    unittest.main()
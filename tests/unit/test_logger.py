@@ -0,0 +1,53 @@
+"""Unit tests for the queued logging pipeline and runtime log levels."""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.utils import logger as mud_logger
+from server.utils.logger import configure_logging, get_logger, get_log_levels, parse_size, set_log_level
+
+
+class TestLogger(unittest.TestCase):
+    """Test cases for the background writer and subsystem levels."""
+
+    def tearDown(self):
+        set_log_level('vendors', 'default')
+        configure_logging(console=False)
+
+    def test_pipeline(self):
+        """Test that records reach the file through the writer thread, filtered per subsystem."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'logs', 'server.log')
+            configure_logging(file=path, console=False, levels={'vendors': 'warning'})
+            vendors = get_logger('vendors')
+            vendors.info("hidden %s", 'info')
+            vendors.warning("shown %d", 42)
+            get_logger().info("root %s", 'info')
+            self.assertEqual(get_log_levels()['forgotten_depths.vendors'], 'WARNING')
+
+            set_log_level('vendors', 'debug')
+            self.assertTrue(vendors.is_enabled(10))
+            with self.assertRaises(ValueError):
+                set_log_level('vendors', 'loud')
+
+            mud_logger.shutdown_logging()  # flushes the queue
+            with open(path) as f:
+                text = f.read()
+        self.assertIn("forgotten_depths.vendors - WARNING - shown 42", text)
+        self.assertIn("root info", text)
+        self.assertNotIn("hidden", text)
+
+    def test_parse_size(self):
+        """Test size strings from the server config."""
+        self.assertEqual(parse_size("10MB"), 10 * 1024 * 1024)
+        self.assertEqual(parse_size("512 KB"), 512 * 1024)
+        self.assertEqual(parse_size(2048), 2048)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Unit tests for cached area map layouts."""
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.game.world.area import Area
+from server.game.world.room import Room
+from server.game.world.map_layout import AreaMapLayout
+
+
+class FakeStore:
+    """Exit table in place of a RoomStore."""
+
+    def __init__(self, exits):
+        self.exits = exits
+
+    def get_exits(self, room_id):
+        return self.exits.get(room_id, {})
+
+
+class TestAreaMapLayout(unittest.TestCase):
+    """Test cases for rendering a laid out area."""
+
+    def setUp(self):
+        """Lay out a row a-b-c with d south of b."""
+        self.area = Area('town', 'Town', '')
+        for room_id in 'abcd':
+            self.area.add_room(Room(room_id, room_id, ''))
+        self.store = FakeStore({
+            'a': {'east': 'b'},
+            'b': {'west': 'a', 'east': 'c', 'south': 'd'},
+            'c': {'west': 'b'},
+            'd': {'north': 'b'},
+        })
+        self.layout = AreaMapLayout(self.area, self.store)
+
+    def test_full_map(self):
+        """Test the revealed map and the player marker."""
+        self.assertEqual(self.layout.render(), ['     *--*--*', '        |', '        *'])
+        self.assertEqual(self.layout.render(None, 'd'), ['     *--*--*', '        |', '        @'])
+        # The cached map isn't changed by the marker
+        self.assertEqual(self.layout.base_lines[2], '        *')
+
+    def test_explored_mask(self):
+        """Test that unexplored rooms and their connections are hidden."""
+        self.assertEqual(self.layout.render({'b', 'd'}, 'b'), ['     @', '     |', '     *'])
+        self.assertEqual(self.layout.render({'a', 'b', 'c', 'd'}), self.layout.base_lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
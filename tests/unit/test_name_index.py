@@ -0,0 +1,74 @@
+"""Unit tests for name resolution and the keyword index."""
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.game.name_index import (
+    NameIndex, parse_ordinal, resolve, EXACT, WORD, PREFIX, SUBSTRING
+)
+
+
+class TestResolve(unittest.TestCase):
+    """Test cases for ranking the contents of a room or inventory."""
+
+    def setUp(self):
+        """Items whose names overlap in different ways."""
+        self.items = [
+            {'name': 'Swordfish'},
+            {'name': 'Broadsword'},
+            {'name': 'Long Sword'},
+            {'name': 'Sword'},
+            {'name': 'Short Sword'},
+        ]
+
+    def test_ranking(self):
+        """Test exact > word > prefix > substring, ties in list order."""
+        self.assertEqual(resolve(self.items, 'sword')[:2], (self.items[3], 3))
+        self.assertEqual(resolve(self.items, 'SWORD')[2], EXACT)
+        self.assertEqual(resolve(self.items, '2.sword')[1], 2)
+        self.assertEqual(resolve(self.items, '3.sword')[1], 4)
+        self.assertEqual(resolve(self.items, '4.sword')[1], 0)
+        self.assertEqual(resolve(self.items, '5.sword')[2], SUBSTRING)
+        self.assertEqual(resolve(self.items, '6.sword'), (None, -1, None))
+        self.assertEqual(resolve(self.items, 'long sw')[2], PREFIX)
+        self.assertEqual(resolve(self.items, 'nothing'), (None, -1, None))
+
+    def test_parse_ordinal(self):
+        """Test that only a positive number before a dot is an ordinal."""
+        self.assertEqual(parse_ordinal('2.sword'), (2, 'sword'))
+        self.assertEqual(parse_ordinal(' Sword '), (1, 'sword'))
+        self.assertEqual(parse_ordinal('0.sword'), (1, '0.sword'))
+        self.assertEqual(parse_ordinal('st. george'), (1, 'st. george'))
+
+
+class TestNameIndex(unittest.TestCase):
+    """Test cases for the catalog index."""
+
+    def test_index_matches_resolve(self):
+        """Test that the index ranks a catalog the same way and updates incrementally."""
+        index = NameIndex()
+        index.add('scroll_novadi', ('Scroll of Novadi',))
+        index.add('novadi_staff', ('Novadi Staff',))
+        index.add('nova', ('Supernova Shard',))
+
+        self.assertEqual(index.search('novadi'), [(WORD, 'scroll_novadi'), (WORD, 'novadi_staff')])
+        self.assertEqual(index.search('nova'), [(PREFIX, 'scroll_novadi'), (PREFIX, 'novadi_staff'),
+                                                (SUBSTRING, 'nova')])
+        self.assertEqual(index.find('2.novadi'), 'novadi_staff')
+        self.assertEqual(index.find('scroll of novadi'), 'scroll_novadi')
+        self.assertIsNone(index.find('3.novadi'))
+
+        index.remove('scroll_novadi')
+        self.assertEqual(index.find('novadi'), 'novadi_staff')
+        self.assertEqual(len(index), 2)
+        index.add('novadi_staff', ('Oak Staff',))
+        self.assertIsNone(index.find('novadi'))
+        self.assertEqual(index.find('staff'), 'novadi_staff')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Unit tests for running the network front end on its own thread."""
+
+import asyncio
+import threading
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.core.events import PlayerConnected
+from server.networking.network_thread import LoopEvents, NetworkThread, Outbox
+
+
+class TestNetworkThread(unittest.TestCase):
+    """Test cases for handing work between the game and network loops."""
+
+    def setUp(self):
+        self.network = NetworkThread()
+        self.network.start()
+
+    def tearDown(self):
+        self.network.stop()
+
+    def test_outbox_order(self):
+        """Test that output queued on the game loop is delivered in order on the network thread."""
+        delivered = []
+        threads = set()
+        outbox = Outbox(self.network)
+
+        async def send(message):
+            threads.add(threading.current_thread().name)
+            delivered.append(message)
+
+        async def game():
+            for n in range(200):
+                outbox.put(send, n)
+                if n % 50 == 0:
+                    await asyncio.sleep(0.001)
+            # Anything queued after this is delivered after it
+            await self.network.run(asyncio.sleep(0.01))
+
+        asyncio.run(game())
+        self.assertEqual(delivered, list(range(200)))
+        self.assertEqual(threads, {'network'})
+        self.assertFalse(outbox.items)
+
+    def test_events_hop_to_game_loop(self):
+        """Test that events published on the network thread are handled on the game thread."""
+        handled = []
+
+        class Events:
+            def publish(self, event):
+                handled.append((event, threading.current_thread() is threading.main_thread()))
+
+        async def game():
+            events = LoopEvents(Events(), asyncio.get_running_loop())
+            self.network.call(events.publish, PlayerConnected(1))
+            for _ in range(100):
+                if handled:
+                    break
+                await asyncio.sleep(0.01)
+
+        asyncio.run(game())
+        self.assertEqual(handled, [(PlayerConnected(1), True)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Unit tests for rendering command output off the event loop."""
+
+import asyncio
+import threading
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.core.offload import Offloader
+from server.commands.handlers.magic_handler import render_spellbook
+from server.commands.handlers.vendor_handler import render_vendor_list
+
+SPELLBOOK = (
+    ('spark', {'name': 'Spark', 'level': 1, 'mana_cost': 3, 'type': 'damage', 'damage': '1d6',
+               'damage_type': 'lightning', 'description': 'A small spark.'}, 2),
+    ('lost', None, 0),
+)
+
+
+def render_thread(snapshot):
+    return f"{snapshot} on {threading.current_thread().name}"
+
+
+class TestOffload(unittest.TestCase):
+    """Test cases for the offloader and offloadable commands."""
+
+    def test_modes(self):
+        """Test that every mode renders the same text, and unknown modes are refused."""
+        expected = render_spellbook(SPELLBOOK)
+        self.assertIn("Spark (Level 1) - 3 mana [COOLDOWN: 2 rounds]", expected)
+        self.assertIn("lost (spell data not found)", expected)
+        for mode in ('off', 'thread', 'process'):
+            offloader = Offloader(mode, workers=1)
+            try:
+                self.assertEqual(asyncio.run(offloader.run(render_spellbook, SPELLBOOK)), expected)
+            finally:
+                offloader.shutdown()
+        self.assertEqual(render_spellbook(()), "Your spellbook is empty. You haven't learned any spells yet.")
+        with self.assertRaises(ValueError):
+            Offloader('gpu')
+
+    def test_dispatch(self):
+        """Test that a command's snapshot is rendered on the pool and sent, and None sends nothing."""
+        from server.commands.command_handler import CommandHandler
+
+        sent = []
+
+        async def send_message(player_id, message):
+            sent.append(message)
+
+        engine = SimpleNamespace(
+            logger=None,
+            config_manager=SimpleNamespace(get_setting=lambda *keys, default=None: default),
+            connection_manager=SimpleNamespace(send_message=send_message),
+            offloader=Offloader('thread', workers=1),
+        )
+        handler = CommandHandler(engine)
+
+        async def wares(player_id, character, params):
+            return None if params == 'nobody' else ('Bob', (('sword', 'Sword', 12), ('rock', None, 0)))
+
+        spec = handler.registry.add('testlist', wares, render=render_vendor_list)
+        player_data = {'character': {}}
+        asyncio.run(handler._run_command(spec, 1, player_data, ''))
+        asyncio.run(handler._run_command(spec, 1, player_data, 'nobody'))
+        self.assertEqual(sent, ["Bob has the following items for sale:\n  1. Sword - 12 gold\n"
+                                "  2. rock (unknown item) - 0 gold\n"])
+
+        spec.render = render_thread
+        asyncio.run(handler._run_command(spec, 1, player_data, ''))
+        self.assertIn("on offload", sent[-1])
+        engine.offloader.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
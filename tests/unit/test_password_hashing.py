@@ -0,0 +1,68 @@
+"""Unit tests for password hashing and login authentication."""
+
+import unittest
+import sys
+import os
+import hashlib
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.persistence.database import Database
+from server.persistence.player_storage import PlayerStorage
+
+
+class TestPasswordHashing(unittest.TestCase):
+    """Test cases for PlayerStorage password handling."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.tmpdir.name, 'auth.db'))
+        self.db.connect()
+        self.storage = PlayerStorage(self.db)
+        self.storage.PASSWORD_ITERATIONS = 1000  # keep the tests fast
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.db.disconnect()
+        self.tmpdir.cleanup()
+
+    def stored_hash(self, name):
+        return self.db.execute_query("SELECT password_hash FROM players WHERE name = ?", (name,))[0]['password_hash']
+
+    def test_hashes_are_salted(self):
+        """Test that the same password hashes differently each time."""
+        first = self.storage._hash_password("secret")
+        second = self.storage._hash_password("secret")
+        self.assertNotEqual(first, second)
+        self.assertTrue(self.storage.verify_password("secret", first))
+        self.assertFalse(self.storage.verify_password("wrong", first))
+
+    def test_authenticate(self):
+        """Test login against a new account."""
+        player_id = self.storage.create_player("Alice", "secret")
+        self.assertEqual(self.storage.authenticate_player("Alice", "secret"), player_id)
+        self.assertIsNone(self.storage.authenticate_player("Alice", "wrong"))
+        self.assertIsNone(self.storage.authenticate_player("Nobody", "secret"))
+        self.assertTrue(self.storage.player_exists("Alice"))
+        self.assertFalse(self.storage.player_exists("Nobody"))
+
+    def test_legacy_hash_rehashed_on_login(self):
+        """Test that a legacy SHA-256 hash is upgraded after a successful login."""
+        legacy = hashlib.sha256("secret".encode()).hexdigest()
+        self.db.execute_update("INSERT INTO players (name, password_hash) VALUES (?, ?)", ("Bob", legacy))
+
+        self.assertIsNone(self.storage.authenticate_player("Bob", "wrong"))
+        self.assertEqual(self.stored_hash("Bob"), legacy)
+
+        self.assertIsNotNone(self.storage.authenticate_player("Bob", "secret"))
+        upgraded = self.stored_hash("Bob")
+        self.assertTrue(upgraded.startswith("pbkdf2_sha256$"))
+        self.assertFalse(self.storage.needs_rehash(upgraded))
+        self.assertIsNotNone(self.storage.authenticate_player("Bob", "secret"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Unit tests for the per-character path cache."""
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.game.world.world_manager import WorldManager
+from server.game.world.graph import GraphEdge
+from server.game.world.room import Room
+
+
+class TestPathCache(unittest.TestCase):
+    """Test cases for cached routes that depend on keys held."""
+
+    def setUp(self):
+        """Build a-b-c with a shortcut a-c behind a door that needs the iron key."""
+        self.world = WorldManager()
+        for room_id in 'abc':
+            room = Room(room_id, room_id, "")
+            room.area_id = 'town'
+            room.on_exits_changed = self.world.exit_state_changed
+            self.world.rooms[room_id] = room
+            self.world.world_graph.add_room(room_id)
+        for a, direction, b, back in (('a', 'east', 'b', 'west'), ('b', 'east', 'c', 'west'),
+                                      ('a', 'north', 'c', 'south')):
+            self.world.world_graph.add_edge(GraphEdge(from_room=a, to_room=b, direction=direction))
+            self.world.world_graph.add_edge(GraphEdge(from_room=b, to_room=a, direction=back))
+        self.world.rooms['a'].locked_exits = {'north': {'required_key': 'Iron Key'}}
+        self.cache = self.world.path_cache
+
+    def test_keys_change_the_route(self):
+        """Test that only characters holding the key are routed through the door."""
+        self.assertEqual(self.world.find_path('a', 'c', {'inventory': []}), ['a', 'b', 'c'])
+        self.assertEqual(self.world.find_path('a', 'c', {'inventory': [{'id': 'iron_key'}]}), ['a', 'c'])
+
+        # Loot that opens nothing shares the keyless entry
+        self.assertEqual(self.world.find_path('a', 'c', {'inventory': [{'id': 'rusty_dagger'}]}), ['a', 'b', 'c'])
+        self.assertEqual(self.cache.get_stats()['hits'], 1)
+
+    def test_unlock_bumps_epoch(self):
+        """Test that unlocking the door makes cached routes stale."""
+        character = {'inventory': []}
+        self.world.find_path('a', 'c', character)
+        epoch = self.cache.epoch
+
+        self.world.rooms['a'].unlock_exit('north')
+        self.assertGreater(self.cache.epoch, epoch)
+        self.assertEqual(self.world.find_path('a', 'c', character), ['a', 'c'])
+        self.assertEqual(self.cache.get_stats()['misses'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
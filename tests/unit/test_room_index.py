@@ -0,0 +1,56 @@
+"""Unit tests for room indices and explored-room bitsets."""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.game.world.room_index import RoomIndex
+
+
+class TestRoomIndex(unittest.TestCase):
+    """Test cases for the index registry and bitset operations."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'room_index.txt')
+        self.rooms = [f'room_{i:02d}' for i in range(20)]
+        self.index = RoomIndex(self.path)
+        self.index.load(self.rooms)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmpdir.cleanup()
+
+    def test_indices_survive_world_changes(self):
+        """Test that existing rooms keep their index when rooms are added or removed."""
+        explored = self.index.encode_explored(['room_03', 'room_17'])
+
+        reloaded = RoomIndex(self.path)
+        reloaded.load(['new_room'] + self.rooms[5:])
+        self.assertEqual(reloaded.index_of('room_17'), self.index.index_of('room_17'))
+        self.assertEqual(reloaded.index_of('new_room'), 20)
+        self.assertTrue(reloaded.is_explored(explored, 'room_17'))
+        self.assertFalse(reloaded.is_explored(explored, 'new_room'))
+
+    def test_mark_and_intersect(self):
+        """Test marking rooms explored and intersecting with an area mask."""
+        explored = ''
+        for room_id in ('room_00', 'room_07', 'room_19', 'room_07'):
+            explored = self.index.mark_explored(explored, room_id)
+        self.assertEqual(explored, self.index.encode_explored(['room_19', 'room_00', 'room_07']))
+        self.assertEqual(self.index.mark_explored(explored, 'room_07'), explored)
+        self.assertFalse(self.index.is_explored(explored, 'room_08'))
+        self.assertFalse(self.index.is_explored(explored, 'unknown'))
+
+        area_mask = self.index.mask(self.rooms[5:10])
+        self.assertEqual(self.index.explored_in(explored, area_mask), {'room_07'})
+        self.assertEqual(RoomIndex.from_mask(RoomIndex.to_mask(explored)), explored)
+
+
+if __name__ == '__main__':
+    unittest.main()
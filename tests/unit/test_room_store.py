@@ -0,0 +1,88 @@
+"""Unit tests for the memory-mapped room store."""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.persistence.room_store import RoomStore
+from server.game.world.room import Room
+
+
+ROOMS = {
+    'square': {'id': 'square', 'title': 'Town Square', 'area_id': 'town', 'is_safe': True,
+               'description': 'A busy square.', 'exits': {'north': 'gate', 'down': 'missing'}},
+    'gate': {'id': 'gate', 'title': 'Gate', 'area_id': 'town', 'description': 'A tall gate.',
+             'exits': {'south': 'square'}, 'lairs': [{'mob_id': 'rat', 'max_mobs': 2}]},
+    'cave': {'id': 'cave', 'title': 'Cave', 'traps': [{'type': 'pit'}]}
+}
+
+
+class TestRoomStore(unittest.TestCase):
+    """Test cases for building, reopening and reading the room store."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'rooms.dat')
+        self.store = RoomStore(self.path, cache_size=2)
+        self.store.build(ROOMS, 'hash1')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def test_reads_match_source(self):
+        """Test that decoded rooms and resident fields match the source data."""
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(list(self.store), ['square', 'gate', 'cave'])
+        self.assertEqual(self.store['gate'], ROOMS['gate'])
+        self.assertEqual(dict(self.store.items()), ROOMS)
+        self.assertNotIn('missing', self.store)
+
+        self.assertEqual(self.store.get_exits('square'), {'north': 'gate', 'down': 'missing'})
+        self.assertEqual(self.store.get_area_id('gate'), 'town')
+        self.assertIsNone(self.store.get_area_id('cave'))
+        self.assertTrue(self.store.has_flag('square', 'is_safe'))
+        self.assertEqual(self.store.get_field('cave', 'traps'), [{'type': 'pit'}])
+
+    def test_absent_fields_skip_decoding(self):
+        """Test that fields the flags say are absent don't decode the room."""
+        self.assertEqual(self.store.get_field('square', 'traps', []), [])
+        self.assertEqual(self.store.get_field('square', 'exits'), ROOMS['square']['exits'])
+        self.assertEqual(self.store.get_stats()['misses'], 0)
+
+    def test_cache_is_bounded(self):
+        """Test that the decoded-room cache evicts the least recently used room."""
+        for room_id in ('square', 'gate', 'square', 'cave'):
+            self.store[room_id]
+        stats = self.store.get_stats()
+        self.assertEqual(stats['cached'], 2)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(list(self.store._cache), ['square', 'cave'])
+
+    def test_reopen_checks_source_hash(self):
+        """Test that an existing file is reused only for the same content hash."""
+        reopened = RoomStore(self.path)
+        self.assertFalse(reopened.open('hash2'))
+        self.assertTrue(reopened.open('hash1'))
+        self.assertEqual(reopened.get_exits('gate'), {'south': 'square'})
+        reopened.close()
+
+    def test_room_reads_cold_fields_from_store(self):
+        """Test that rooms built without descriptions and lairs read them lazily."""
+        room = Room('gate', 'Gate', None, store=self.store)
+        self.assertEqual(room.description, 'A tall gate.')
+        self.assertEqual(room.lairs[0]['mob_id'], 'rat')
+        self.assertEqual(Room('cave', 'Cave', None, store=self.store).lairs, [])
+
+        room.description = 'A broken gate.'
+        self.assertEqual(room.description, 'A broken gate.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Unit tests for precomputed mob routing and area-level pathfinding."""
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.game.world.graph import WorldGraph, GraphEdge
+from server.game.world.room import Room
+from server.game.world.routing import RoutingService
+from server.game.world.hierarchy import HierarchicalPathfinder
+
+
+class FakeWorld:
+    """The parts of WorldManager the routing services read."""
+
+    def __init__(self):
+        self.rooms = {}
+        self.world_graph = WorldGraph()
+        self.routing = RoutingService(self)
+        self.pathfinder = HierarchicalPathfinder(self)
+
+    def can_traverse_exit(self, edge, character):
+        return edge.can_traverse(character)
+
+    def add_room(self, room_id, area_id):
+        room = Room(room_id, room_id, "")
+        room.area_id = area_id
+        room.on_exits_changed = lambda room_id: self.routing.invalidate_rooms([room_id])
+        self.rooms[room_id] = room
+        self.world_graph.add_room(room_id)
+
+    def link(self, a, direction, b, back):
+        self.world_graph.add_edge(GraphEdge(from_room=a, to_room=b, direction=direction))
+        self.world_graph.add_edge(GraphEdge(from_room=b, to_room=a, direction=back))
+
+
+class TestRoutingService(unittest.TestCase):
+    """Test cases for next-hop lookups and their invalidation."""
+
+    def setUp(self):
+        """Build two areas: a-b-c-d in 'town' with a shortcut a-d behind a door, e in 'forest'."""
+        self.world = FakeWorld()
+        for room_id in 'abcd':
+            self.world.add_room(room_id, 'town')
+        self.world.add_room('e', 'forest')
+        self.world.link('a', 'east', 'b', 'west')
+        self.world.link('b', 'east', 'c', 'west')
+        self.world.link('c', 'east', 'd', 'west')
+        self.world.link('a', 'south', 'd', 'north')
+        self.world.link('d', 'down', 'e', 'up')
+        self.world.rooms['a'].locked_exits = {'south': {'required_key': 'brass_key'}}
+        self.routing = self.world.routing
+
+    def test_routes_around_locked_door_until_unlocked(self):
+        """Test that a locked door is avoided and unlocking it rebuilds the area's routes."""
+        self.assertEqual(self.routing.find_path('a', 'd'), ['a', 'b', 'c', 'd'])
+        self.assertEqual(self.routing.next_hop('d', 'a'), 'a')
+
+        self.world.rooms['a'].unlock_exit('south')
+        self.assertEqual(self.routing.find_path('a', 'd'), ['a', 'd'])
+        self.assertEqual(self.routing.get_stats()['area_builds'], 2)
+
+    def test_cross_area_and_unreachable(self):
+        """Test routes into another area, and that safe rooms and missing rooms can't be routed to."""
+        self.assertEqual(self.routing.find_path('b', 'e'), ['b', 'c', 'd', 'e'])
+        self.assertEqual(self.routing.next_hop('e', 'b'), 'd')
+        self.assertIsNone(self.routing.next_hop('a', 'a'))
+        self.assertIsNone(self.routing.next_hop('a', 'nowhere'))
+
+        self.world.rooms['c'].is_safe = True
+        self.routing.invalidate_rooms(['c'])
+        self.assertIsNone(self.routing.next_hop('b', 'e'))
+        self.assertIsNone(self.routing.next_hop('b', 'c'))
+
+    def test_barrier_blocks_until_unlocked(self):
+        """Test that locked barriers block routes and unlocked ones don't."""
+        self.world.rooms['d'].barriers = {'down': {'barrier_id': 'gate', 'locked': True}}
+        self.routing.invalidate_rooms(['d'])
+        self.assertIsNone(self.routing.next_hop('c', 'e'))
+
+        self.world.rooms['d'].barriers['down']['locked'] = False
+        self.routing.invalidate_rooms(['d'])
+        self.assertEqual(self.routing.next_hop('c', 'e'), 'd')
+
+
+class TestHierarchicalPathfinder(unittest.TestCase):
+    """Test cases for routes solved at the area level."""
+
+    def setUp(self):
+        """Build three areas in a line: town (a-b-c), road (d-e), forest (f)."""
+        self.world = FakeWorld()
+        for room_id, area_id in zip('abcdef', ['town'] * 3 + ['road'] * 2 + ['forest']):
+            self.world.add_room(room_id, area_id)
+        self.world.link('a', 'east', 'b', 'west')
+        self.world.link('b', 'east', 'c', 'west')
+        self.world.link('c', 'east', 'd', 'west')
+        self.world.link('d', 'east', 'e', 'west')
+        self.world.link('e', 'east', 'f', 'west')
+        self.pathfinder = self.world.pathfinder
+
+    def test_matches_shortest_path(self):
+        """Test that routes across areas match Dijkstra and only use boundary rooms between areas."""
+        graph = self.world.world_graph
+        for start in 'abcdef':
+            for goal in 'abcdef':
+                self.assertEqual(self.pathfinder.find_path(start, goal), graph.find_path_dijkstra(start, goal))
+        self.assertEqual(self.pathfinder.get_stats()['boundary_rooms'], 4)
+        self.assertIsNone(self.pathfinder.find_path('a', 'nowhere'))
+
+    def test_rebuilds_changed_areas(self):
+        """Test that a new exit between areas is used once its rooms are invalidated."""
+        self.assertEqual(len(self.pathfinder.find_path('a', 'f')), 6)
+        self.world.link('a', 'portal', 'f', 'portal')
+        self.pathfinder.invalidate_rooms(['a', 'f'])
+        self.assertEqual(self.pathfinder.find_path('a', 'f'), ['a', 'f'])
+        self.assertEqual(self.pathfinder.find_path('b', 'e'), ['b', 'c', 'd', 'e'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Unit tests for character snapshots."""
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.persistence.snapshot import SnapshotManager, freeze
+
+
+class TestFreeze(unittest.TestCase):
+    """Test cases for freeze()."""
+
+    def test_copies_containers(self):
+        """Test that nested containers are not shared with the original."""
+        character = {'inventory': [{'name': 'Torch'}], 'spell_cooldowns': {'heal': 3}}
+        frozen = freeze(character)
+
+        character['inventory'][0]['name'] = 'Lantern'
+        character['inventory'].append({'name': 'Rope'})
+        character['spell_cooldowns']['heal'] = 2
+
+        self.assertEqual(frozen['inventory'], [{'name': 'Torch'}])
+        self.assertEqual(frozen['spell_cooldowns'], {'heal': 3})
+
+    def test_shares_immutable_leaves(self):
+        """Test that strings are shared rather than copied."""
+        description = "A long description " * 10
+        frozen = freeze({'description': description})
+        self.assertIs(frozen['description'], description)
+
+
+class TestSnapshotManager(unittest.TestCase):
+    """Test cases for SnapshotManager."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = SnapshotManager()
+        self.players = {
+            1: {'authenticated': True, 'username': 'Alice', 'character': {'gold': 10}},
+            2: {'authenticated': True, 'username': 'Bob', 'character': {'gold': 20}},
+            3: {'authenticated': False, 'username': 'Eve', 'character': {'gold': 0}},
+        }
+
+    def test_first_capture_includes_all_authenticated(self):
+        """Test that characters never snapshotted are considered dirty."""
+        snapshots = self.manager.capture_dirty(self.players)
+        self.assertEqual(sorted(s.username for s in snapshots), ['Alice', 'Bob'])
+
+    def test_only_dirty_characters_are_captured(self):
+        """Test that unchanged characters are skipped."""
+        self.manager.capture_dirty(self.players)
+        self.assertEqual(self.manager.capture_dirty(self.players), [])
+
+        self.players[2]['character']['gold'] = 25
+        self.manager.mark_dirty(2)
+        snapshots = self.manager.capture_dirty(self.players)
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[0].data['gold'], 25)
+        self.assertEqual(snapshots[0].version, 1)
+
+    def test_forget(self):
+        """Test that forgetting a player resets its tracking."""
+        self.manager.capture_dirty(self.players)
+        self.manager.forget(1)
+        self.assertTrue(self.manager.is_dirty(1))
+        self.assertIsNone(self.manager.get_last_snapshot(1))
+
+    def test_regen_marks_only_changed_characters(self):
+        """Test that the regeneration tick only dirties characters whose vitals changed."""
+        import asyncio
+        from types import SimpleNamespace
+        from server.core.async_game_engine import AsyncGameEngine
+
+        async def send_message(player_id, message):
+            pass
+
+        # Alice is starving at 1 HP with full mana (nothing can change); Bob is getting hungry
+        self.players[1]['character'].update({'current_hit_points': 1, 'max_hit_points': 100,
+                                             'current_mana': 50, 'max_mana': 50, 'hunger': 0, 'thirst': 0})
+        self.players[2]['character'].update({'current_hit_points': 100, 'max_hit_points': 100,
+                                             'current_mana': 50, 'max_mana': 50, 'hunger': 50, 'thirst': 50})
+        engine = SimpleNamespace(
+            player_manager=SimpleNamespace(connected_players={1: self.players[1], 2: self.players[2]}),
+            config_manager=SimpleNamespace(get_setting=lambda *keys, default=None: default),
+            connection_manager=SimpleNamespace(send_message=send_message),
+            snapshot_manager=self.manager,
+        )
+        self.manager.capture_dirty(self.players)
+
+        asyncio.run(AsyncGameEngine._regenerate_players(engine))
+        self.assertFalse(self.manager.is_dirty(1))
+        self.assertTrue(self.manager.is_dirty(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
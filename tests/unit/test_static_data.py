@@ -0,0 +1,46 @@
+"""Unit tests for the shared static game data."""
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.persistence.static_data import StaticData, to_mutable
+
+
+class TestStaticData(unittest.TestCase):
+    """Test cases for the read-only lookup tables."""
+
+    def setUp(self):
+        """Build a snapshot from small tables."""
+        self.races = {'elf': {'name': 'Elf', 'stat_modifiers': {'dexterity': 2}}}
+        self.classes = {'sorcerer': {'name': 'Sorcerer', 'uses_magic': True}}
+        self.weapons = {'dagger': {'name': 'Dagger', 'properties': {'allowed_classes': ['rogue']}}}
+        self.data = StaticData(self.races, self.classes, self.weapons, {})
+
+    def test_lookups(self):
+        """Test the class and race helpers."""
+        self.assertTrue(self.data.class_uses_magic('Sorcerer'))
+        self.assertFalse(self.data.class_uses_magic('fighter'))
+        self.assertEqual(self.data.race_modifiers('elf')['dexterity'], 2)
+        self.assertEqual(dict(self.data.race_modifiers('dwarf')), {})
+
+    def test_tables_are_immutable(self):
+        """Test that commands can't change the shared tables."""
+        with self.assertRaises(TypeError):
+            self.data.races['elf']['stat_modifiers']['dexterity'] = 5
+        with self.assertRaises(TypeError):
+            self.data.classes['fighter'] = {}
+        # The source dicts aren't shared either
+        self.races['elf']['name'] = 'High Elf'
+        self.assertEqual(self.data.races['elf']['name'], 'Elf')
+
+        properties = to_mutable(self.data.weapons['dagger']['properties'])
+        properties['allowed_classes'].append('fighter')
+        self.assertEqual(self.data.weapons['dagger']['properties']['allowed_classes'], ('rogue',))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""Unit tests for the character storage backends."""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.persistence.database import Database
+from server.persistence.player_storage import PlayerStorage
+from server.persistence.storage_backend import SQLiteStorageBackend, MemoryStorageBackend
+
+
+class BackendContract:
+    """Tests every backend must pass; mixed into a TestCase per backend."""
+
+    def test_bulk_save_and_load(self):
+        """Test saving and loading many characters at once."""
+        characters = {f"Player{i}": {'gold': i, 'inventory': [{'id': 'torch'}]} for i in range(5)}
+        self.assertEqual(self.backend.save_characters(characters), 5)
+
+        loaded = self.backend.load_characters(["Player1", "Player3", "Nobody"])
+        self.assertEqual(set(loaded), {"Player1", "Player3"})
+        self.assertEqual(loaded["Player3"]['gold'], 3)
+
+        # Loaded data is a copy
+        loaded["Player1"]['inventory'].clear()
+        self.assertEqual(len(self.backend.load_character("Player1")['inventory']), 1)
+
+    def test_stream_in_batches(self):
+        """Test that streaming returns every character across batch boundaries."""
+        self.backend.save_characters({f"Player{i}": {'gold': i} for i in range(7)})
+        streamed = dict(self.backend.iter_characters(batch_size=3))
+        self.assertEqual(len(streamed), 7)
+        self.assertEqual(streamed["Player6"], {'gold': 6})
+
+    def test_delete_player(self):
+        """Test deleting an account."""
+        self.backend.save_character("Alice", {'gold': 1})
+        self.assertTrue(self.backend.delete_player("Alice"))
+        self.assertFalse(self.backend.delete_player("Alice"))
+        self.assertIsNone(self.backend.load_character("Alice"))
+        self.assertEqual(self.backend.list_players(), [])
+
+    def test_accounts(self):
+        """Test creating accounts and replacing password hashes."""
+        player_id = self.backend.create_account("Carol", "hash1", "carol@example.com")
+        self.assertEqual(self.backend.get_account("Carol")['id'], player_id)
+        self.assertEqual(self.backend.get_account_by_id(player_id)['email'], "carol@example.com")
+        self.assertIsNone(self.backend.get_account("Nobody"))
+
+        self.backend.set_password_hash(player_id, "hash2")
+        self.assertEqual(self.backend.get_account("Carol")['password_hash'], "hash2")
+
+    def test_stream_replays_journal(self):
+        """Test that streamed characters include journaled changes."""
+        storage = PlayerStorage(self.backend, journal_mode=True)
+        storage.save_character_data("Bob", {'gold': 1, 'inventory': []})
+        storage.journal_character_data("Bob", {'gold': 5, 'inventory': [{'id': 'sword'}]})
+        storage.flush_journal()
+
+        self.assertEqual(dict(self.backend.iter_characters())["Bob"],
+                         {'gold': 5, 'inventory': [{'id': 'sword'}]})
+        self.assertEqual(self.backend.journal_length("Bob"), 2)
+
+        # A full save folds the journal into the snapshot
+        storage.save_character_data("Bob", {'gold': 6, 'inventory': []})
+        self.assertEqual(self.backend.journal_length("Bob"), 0)
+
+
+class TestMemoryStorageBackend(BackendContract, unittest.TestCase):
+    """Test cases for the in-memory backend."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.backend = MemoryStorageBackend()
+
+
+class TestSQLiteStorageBackend(BackendContract, unittest.TestCase):
+    """Test cases for the SQLite backend."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.tmpdir.name, 'backend.db'))
+        self.db.connect()
+        self.backend = SQLiteStorageBackend(self.db)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.db.disconnect()
+        self.tmpdir.cleanup()
+
+
+class TestPlayerStorageOnMemory(unittest.TestCase):
+    """Test cases for running the live server's PlayerStorage on the in-memory backend."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.backend = MemoryStorageBackend()
+        self.storage = PlayerStorage(self.backend, journal_mode=True)
+
+    def test_account_login(self):
+        """Test creating an account and logging in."""
+        player_id = self.storage.create_player("Dave", "secret")
+        self.assertTrue(self.storage.player_exists("Dave"))
+        self.assertEqual(self.storage.authenticate_player("Dave", "secret"), player_id)
+        self.assertIsNone(self.storage.authenticate_player("Dave", "wrong"))
+        self.assertEqual(self.storage.get_player(player_id)['name'], "Dave")
+
+    def test_journal_round_trip(self):
+        """Test that a reload replays journaled changes and picks up the journal length."""
+        self.storage.save_character_data("Erin", {'gold': 1, 'room_id': 'inn'})
+        self.storage.journal_character_data("Erin", {'gold': 2, 'room_id': 'inn'})
+        self.storage.journal_character_data("Erin", {'gold': 2, 'room_id': 'market'})
+        self.storage.release_journal_state("Erin")
+
+        # load_character_data flushes the buffer before replaying
+        self.assertEqual(self.storage.load_character_data("Erin"), {'gold': 2, 'room_id': 'market'})
+        self.assertEqual(self.storage._journal_counts["Erin"], 2)
+
+        # The first save after a reload compacts, then changes are journaled again
+        self.storage.journal_character_data("Erin", {'gold': 3, 'room_id': 'market'})
+        self.assertEqual(self.backend.journal_length("Erin"), 0)
+        self.storage.journal_character_data("Erin", {'gold': 4, 'room_id': 'market'})
+        self.storage.flush_journal()
+        self.assertEqual(self.backend.journal_length("Erin"), 1)
+        self.assertEqual(self.backend.load_character("Erin"), {'gold': 4, 'room_id': 'market'})
+        self.assertIsNone(self.storage.load_character_data("Nobody"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Unit tests for cooperative time-slicing of long loops."""
+
+import asyncio
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.core.timeslice import TimeSlicer
+
+
+class TestTimeSlicer(unittest.TestCase):
+    """Test cases for yielding on budget and giving way to commands."""
+
+    def test_yields_when_slice_used(self):
+        """Test that a long loop lets other tasks run, and a short one doesn't."""
+        slicer = TimeSlicer(slice_ms=0)
+        events = []
+
+        async def background():
+            async for n in slicer.iterate(range(6), every=2):
+                events.append(n)
+
+        async def other():
+            events.append('other')
+
+        async def run():
+            task = asyncio.create_task(background())
+            asyncio.create_task(other())
+            await task
+
+        asyncio.run(run())
+        self.assertEqual(events, [0, 1, 'other', 2, 3, 4, 5])
+        self.assertEqual(slicer.stats(reset=True)['yields'], 2)
+        self.assertEqual(slicer.stats()['yields'], 0)
+
+        slicer = TimeSlicer(slice_ms=10000)
+        asyncio.run(run())
+        self.assertEqual(slicer.stats()['yields'], 0)
+
+    def test_commands_preempt(self):
+        """Test that a queued command starts before the rest of the loop, even within the slice."""
+        slicer = TimeSlicer(slice_ms=10000)
+        events = []
+
+        async def command():
+            await asyncio.sleep(0)  # a few loop turns before it starts
+            await asyncio.sleep(0)
+            slicer.command_started()
+            events.append('command')
+
+        async def background():
+            async for n in slicer.iterate(range(4), every=1):
+                if n == 1:
+                    slicer.command_queued()
+                    asyncio.create_task(command())
+                events.append(n)
+
+        asyncio.run(background())
+        self.assertEqual(events, [0, 1, 'command', 2, 3])
+        self.assertEqual(slicer.pending_commands, 0)
+        self.assertGreater(slicer.stats()['deferrals'], 0)
+
+    def test_snapshot(self):
+        """Test that the source may change while the loop is suspended."""
+        slicer = TimeSlicer(slice_ms=0)
+        rooms = {'a': 1, 'b': 2, 'c': 3}
+
+        async def run():
+            seen = []
+            async for room_id in slicer.iterate(rooms, every=1):
+                seen.append(room_id)
+                rooms.pop('c', None)
+            return seen
+
+        self.assertEqual(asyncio.run(run()), ['a', 'b', 'c'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Unit tests for command latency tracing."""
+
+import asyncio
+import json
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.utils import tracing
+from server.utils.tracing import CommandTracer, Histogram
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.lines = []
+
+    def info(self, message):
+        self.lines.append(('info', message))
+
+    def warning(self, message):
+        self.lines.append(('warning', message))
+
+
+class TestTracing(unittest.TestCase):
+    """Test cases for histograms, sampling and DB time attribution."""
+
+    def test_histogram(self):
+        """Test bucketed percentiles."""
+        histogram = Histogram()
+        for ms in [0.3] * 90 + [40] * 9 + [7000]:
+            histogram.observe(ms)
+        self.assertEqual(histogram.percentile(0.5), 0.5)
+        self.assertEqual(histogram.percentile(0.95), 50)
+        self.assertEqual(histogram.percentile(1.0), 7000)
+        self.assertEqual(histogram.summary()['count'], 100)
+        self.assertEqual(Histogram().percentile(0.5), 0.0)
+
+    def test_spans(self):
+        """Test that only slow and sampled spans are logged, with their DB time."""
+        logger = RecordingLogger()
+        tracer = CommandTracer(logger, slow_ms=1000, sample_rate=3)
+
+        async def command(verb, slow=False):
+            span = tracer.start(verb, 7)
+            tracing.add_db_time(0.002)
+            if slow:
+                span.start -= 2  # pretend it took two seconds
+            tracer.finish(span)
+
+        async def run():
+            # Each command in its own task, as the server runs them
+            for verb in ('look', 'look', 'get'):
+                await asyncio.create_task(command(verb))
+            await asyncio.create_task(command('save', slow=True))
+
+        asyncio.run(run())
+        tracing.add_db_time(1.0)  # outside any command: ignored
+
+        self.assertEqual([level for level, _ in logger.lines], ['info', 'warning'])
+        sampled = json.loads(logger.lines[0][1].split(' ', 1)[1])
+        self.assertEqual((sampled['verb'], sampled['db_ms'], sampled['slow']), ('get', 2.0, False))
+        self.assertIn('"slow": true', logger.lines[1][1])
+        self.assertEqual(tracer.verb_summary('look')['count'], 2)
+        self.assertEqual(tracer.summary()['db']['max_ms'], 2.0)
+        self.assertIsNone(tracer.verb_summary('quit'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Unit tests for the world lint and its validation stamp."""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from server.game.world import world_lint
+from server.persistence.room_store import RoomStore
+
+
+class TestWorldLint(unittest.TestCase):
+    """Test cases for the world checks."""
+
+    def setUp(self):
+        """Build a small world with one of each problem."""
+        self.rooms = {
+            'inn': {'id': 'inn', 'is_starting_room': True, 'exits': {'east': 'road'}},
+            'road': {'id': 'road', 'exits': {'west': 'inn', 'north': 'gate', 'south': 'nowhere'},
+                     'locked_exits': {'north': {'required_key': 'Iron Key'}}},
+            'gate': {'id': 'gate', 'exits': {'south': 'road', 'east': 'cliff'},
+                     'barriers': {'east': {'barrier_id': 'rune_door'}},
+                     'lairs': [{'mob_id': 'troll'}, {'mob_id': 'ghost'}]},
+            'cliff': {'id': 'cliff', 'exits': {}},
+            'island': {'id': 'island', 'exits': {}},
+        }
+        self.items = {'iron_key': {}}
+        self.barriers = {'rune_door': {'unlock_methods': {'rune': {'enabled': True, 'required_item': 'red_rune'}}}}
+        self.monsters = {'troll': {}}
+
+    def test_checks(self):
+        """Test that every check reports its issue, and only that."""
+        report = world_lint.lint_world(self.rooms, self.items, self.barriers, self.monsters, source_hash='abc')
+        found = {(issue['check'], issue['room_id']) for issue in report['errors'] + report['warnings']}
+        self.assertEqual(found, {
+            ('dangling_exit', 'road'),
+            ('asymmetric_exit', 'gate'),
+            ('missing_key', 'gate'),
+            ('unknown_lair_mob', 'gate'),
+            ('unreachable_room', 'island'),
+        })
+        self.assertEqual(len(report['errors']), 3)
+        self.assertEqual(report['counts']['unreachable_room'], 1)
+
+        self.rooms['road']['locked_exits']['north']['required_key'] = 'Brass Key'
+        report = world_lint.lint_world(self.rooms, self.items, {}, self.monsters)
+        checks = {issue['check'] for issue in report['errors']}
+        self.assertIn('unknown_barrier', checks)
+        self.assertIn('missing_key', checks)
+
+    def test_room_store(self):
+        """Test that linting a RoomStore gives the same report as linting the dicts."""
+        expected = world_lint.lint_world(self.rooms, self.items, self.barriers, self.monsters)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = RoomStore(os.path.join(tmpdir, 'rooms.dat'), cache_size=1)
+            store.build(self.rooms)
+            try:
+                report = world_lint.lint_world(store, self.items, self.barriers, self.monsters)
+            finally:
+                store.close()
+        for key in ('rooms', 'counts', 'errors', 'warnings'):
+            self.assertEqual(report[key], expected[key])
+
+    def test_stamp(self):
+        """Test that a stamp is only reused for the same content."""
+        report = world_lint.lint_world(self.rooms, self.items, self.barriers, self.monsters, source_hash='abc')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = world_lint.stamp_path(tmpdir)
+            self.assertTrue(world_lint.write_stamp(path, report))
+            self.assertEqual(world_lint.read_stamp(path, 'abc'), report)
+            self.assertIsNone(world_lint.read_stamp(path, 'def'))
+            self.assertIsNone(world_lint.read_stamp(path, None))
+
+
+if __name__ == '__main__':
+    unittest.main()